@@ -0,0 +1,46 @@
+"""
+설정(AppConfig) 조회 비용 측정 스크립트
+
+page object 메서드가 호출될 때마다 설정을 읽는 비용을 방식별로 비교합니다.
+
+    python -m benchmarks.bench_config [--calls 2000]
+
+- read_config: .env와 환경 변수를 매번 다시 읽음 (이전 load_config의 동작)
+- load_config: 프로세스에서 한 번 읽은 설정을 반환
+- BasePage.config: page object 생성 시 주입받은 설정의 속성 조회
+"""
+import argparse
+import timeit
+
+from src.config.settings import load_config, read_config
+from src.pages.base_page import BasePage
+
+
+class _Driver:
+    """명령을 보내지 않는 가짜 드라이버 (BasePage는 생성 시 드라이버별 대기 스케줄러만 만듦)"""
+
+
+def _per_call(function, calls):
+    """function 한 번의 평균 소요 시간(초)을 반환합니다. (3회 반복 중 최솟값)"""
+    return min(timeit.repeat(function, number=calls, repeat=3)) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000, help="방식별 호출 수")
+    args = parser.parse_args()
+
+    page = BasePage(_Driver(), load_config())
+    results = {
+        "read_config": _per_call(lambda: read_config().app_package, args.calls),
+        "load_config": _per_call(lambda: load_config().app_package, args.calls),
+        "BasePage.config": _per_call(lambda: page.config.app_package, args.calls),
+    }
+    baseline = results["read_config"]
+    print(f"[설정 조회] 호출 {args.calls}회")
+    for name, seconds in results.items():
+        print(f"  {name:<16} 호출당 {seconds * 1_000_000:9.3f}us  (read_config 대비 {baseline / seconds:8.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
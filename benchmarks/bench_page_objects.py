@@ -0,0 +1,350 @@
+"""
+page object 메서드별 Appium 명령 왕복 측정 스크립트
+
+fake Appium 서버(tests/page_sources의 화면)에서 page object 메서드를 시나리오별로 실행하고,
+메서드 한 번에 보낸 HTTP 명령 수와 디바이스 응답 지연을 적용한 예상 소요 시간을 기록합니다.
+locator 후보(fallback)를 추가했을 때 명령 수가 늘었는지를 baseline과 비교하여 확인하며,
+명령 수가 baseline보다 많은 경우가 하나라도 있으면 실패(종료 코드 1)로 끝납니다.
+
+    python -m benchmarks.bench_page_objects [--output PATH] [--baseline PATH] [--update-baseline]
+
+- hit: 대상 화면이 이미 표시된 상태
+- late_hit: 메서드 실행 후 명령 LATE_COMMANDS개가 처리된 뒤에 대상 화면이 나타남
+- miss: 대상 화면이 끝까지 나타나지 않음
+
+대기(polling 간격, time.sleep)는 VirtualClock으로 실제로 기다리지 않고 가상 시간만 진행하므로,
+timeout이 긴 miss 시나리오도 빠르게 끝나며 실행할 때마다 같은 명령 수가 측정됩니다.
+"""
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+import warnings
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from pytest_check import check_log
+
+from benchmarks.fake_appium import FakeAppiumServer, Scenario, Transition
+from src.driver import create_driver
+from src.pages.base_page import BasePage
+from src.pages.login_page import LoginPage
+from src.pages.login_page_by_email import LoginPageByEmail
+from src.pages.main_home_page import MainHomePage
+from src.pages.playstore_page import PlayStorePage
+from src.pages.search_results_page import SearchResultsPage
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+BENCHMARKS = Path(__file__).resolve().parent
+BASELINE = BENCHMARKS / "page_objects_baseline.json"
+RESULTS = BENCHMARKS / "results" / "page_objects.json"
+
+APP_PACKAGE = "net.bucketplace"
+PLAYSTORE_PACKAGE = "com.android.vending"
+KEYCODE_ENTER = 66
+# late_hit 시나리오에서 대상 화면이 나타나기 전까지 처리되는 명령 수
+LATE_COMMANDS = 3
+# 명령별 디바이스 응답 지연 (초, UiAutomator2 실기기 기준의 대략적인 값)
+DEVICE_LATENCY = {
+    "getPageSource": 0.25,
+    "findElement": 0.06,
+    "findElements": 0.06,
+    "findChildElement": 0.05,
+    "findChildElements": 0.05,
+    "execute": 0.08,
+    "click": 0.12,
+    "sendKeys": 0.15,
+    "clear": 0.08,
+}
+DEFAULT_LATENCY = 0.03
+
+
+class VirtualClock:
+    """
+    time.sleep을 즉시 반환하고 잠든 시간만큼 time.monotonic을 진행시키는 가상 시계
+
+    모든 스레드가 하나의 가상 시간을 공유합니다. 클라이언트가 응답을 기다리는 동안에만
+    fake 서버 스레드가 (응답 지연으로) 잠들므로, 명령 지연과 page object의 대기가 하나의 시간축에 순서대로 쌓입니다.
+    실제 경과 시간은 가상 시간에 더하지 않으므로 측정 결과가 실행 환경의 속도와 관계없이 일정합니다.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self._lock = threading.Lock()
+        self._originals = None
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.now += max(0.0, seconds)
+        # 다른 스레드에 실행 기회를 줌
+        self._originals[0](0)
+
+    def monotonic(self):
+        return self.now
+
+    def __enter__(self):
+        self._originals = (time.sleep, time.monotonic)
+        time.sleep, time.monotonic = self.sleep, self.monotonic
+        return self
+
+    def __exit__(self, *exc_info):
+        time.sleep, time.monotonic = self._originals
+
+
+@dataclass
+class Case:
+    """
+    측정 케이스 (page object 메서드 하나 x 시나리오 하나)
+
+    Attributes:
+        method: page object 메서드 이름
+        scenario: "hit", "late_hit", "miss" 중 하나
+        call: driver를 받아 메서드를 실행하는 함수
+        start: 세션 시작 시 화면 이름
+        late: 메서드 실행 후 LATE_COMMANDS개의 명령 뒤에 전환될 화면 이름
+        prepare: 화면 구성(Scenario)을 케이스에 맞게 바꾸는 함수
+    """
+    method: str
+    scenario: str
+    call: Callable
+    start: str
+    late: str | None = None
+    prepare: Callable | None = None
+
+    @property
+    def name(self):
+        return f"{self.method}/{self.scenario}"
+
+
+@dataclass
+class CaseResult:
+    """
+    측정 결과
+
+    Attributes:
+        name: 케이스 이름 ("<메서드>/<시나리오>")
+        commands: 보낸 HTTP 명령 수
+        commands_by_name: 명령 이름별 명령 수
+        simulated_seconds: 디바이스 응답 지연(DEVICE_LATENCY)과 대기를 적용한 예상 소요 시간 (초)
+        outcome: 반환값의 repr 또는 발생한 예외 이름
+    """
+    name: str
+    commands: int
+    commands_by_name: dict = field(default_factory=dict)
+    simulated_seconds: float = 0.0
+    outcome: str = ""
+
+
+def app_scenario():
+    """오늘의집 앱과 플레이 스토어의 화면 전환을 정의한 기본 화면 구성"""
+    return (
+        Scenario.from_directory()
+        .on_launch(APP_PACKAGE, "login_page")
+        .on_launch(PLAYSTORE_PACKAGE, "playstore_home")
+        .on_click("login_page", "net.bucketplace:id/emailLogInText", "email_login_page")
+        .on_click("playstore_home", "검색 탭", "playstore_search")
+        .on_click("playstore_search", "앱 및 게임 검색", "playstore_search_input")
+        .on_key("playstore_search_input", KEYCODE_ENTER, "playstore_search_results")
+        .on_click("playstore_search_results", "오늘의집 - 라이프스타일 슈퍼앱 BUCKETPLACE ", "playstore_app_detail")
+        .on_click("main_home_page", "마이페이지", "my_page")
+        .on_click("my_page", "Gear icon", "setting_page")
+        .on_click("setting_page", "로그아웃", "login_page")
+    )
+
+
+def _cases():
+    login = lambda driver: LoginPage(driver).is_login_page_loaded()
+    login_elements = lambda driver: LoginPage(driver).are_login_elements_present()
+    email_elements = lambda driver: LoginPageByEmail(driver).are_email_login_elements_present()
+    search = lambda driver: PlayStorePage(driver).search_app("오늘의집")
+    select = lambda driver: SearchResultsPage(driver).select_ohous()
+    install = lambda driver: SearchResultsPage(driver).install_app()
+    logout = lambda driver: BasePage(driver).logout_in_main_home_page(MainHomePage(driver))
+    terminate = lambda driver: BasePage(driver).terminate_all_apps(APP_PACKAGE)
+
+    def late_search(scenario):
+        scenario.on_key("playstore_search_input", KEYCODE_ENTER, "playstore_search_results", after_commands=LATE_COMMANDS)
+
+    def late_mypage(scenario):
+        scenario.on_click("main_home_page", "마이페이지", "my_page", after_commands=LATE_COMMANDS)
+
+    return [
+        Case("is_login_page_loaded", "hit", login, "login_page"),
+        Case("is_login_page_loaded", "late_hit", login, "home", late="login_page"),
+        Case("is_login_page_loaded", "miss", login, "home"),
+        Case("are_login_elements_present", "hit", login_elements, "login_page"),
+        Case("are_login_elements_present", "late_hit", login_elements, "home", late="login_page"),
+        # 같은 앱의 다른 화면: 모든 요소가 스냅샷에 없어 live 조회로 fallback
+        Case("are_login_elements_present", "miss", login_elements, "email_login_page"),
+        Case("are_email_login_elements_present", "hit", email_elements, "email_login_page"),
+        Case("are_email_login_elements_present", "late_hit", email_elements, "home", late="email_login_page"),
+        Case("are_email_login_elements_present", "miss", email_elements, "login_page"),
+        Case("search_app", "hit", search, "playstore_home"),
+        Case("search_app", "late_hit", search, "playstore_home", prepare=late_search),
+        # 검색 탭을 눌러도 검색 화면이 열리지 않음 (재시도 후 실패)
+        Case("search_app", "miss", search, "playstore_home",
+             prepare=lambda scenario: scenario.clicks.pop(("playstore_home", "검색 탭"))),
+        Case("select_ohous", "hit", select, "playstore_search_results"),
+        Case("select_ohous", "late_hit", select, "playstore_search_input", late="playstore_search_results"),
+        Case("select_ohous", "miss", select, "playstore_search_input"),
+        Case("install_app", "hit", install, "playstore_app_detail"),
+        Case("install_app", "late_hit", install, "playstore_search_results", late="playstore_app_detail"),
+        Case("install_app", "miss", install, "playstore_search_results"),
+        Case("logout_in_main_home_page", "hit", logout, "main_home_page"),
+        Case("logout_in_main_home_page", "late_hit", logout, "main_home_page", prepare=late_mypage),
+        # 마이페이지 버튼을 눌러도 마이페이지가 열리지 않음
+        Case("logout_in_main_home_page", "miss", logout, "main_home_page",
+             prepare=lambda scenario: scenario.clicks.pop(("main_home_page", "마이페이지"))),
+        Case("terminate_all_apps", "hit", terminate, "login_page"),
+        # terminate_app 후 프로세스가 늦게 종료됨
+        Case("terminate_all_apps", "late_hit", terminate, "login_page",
+             prepare=lambda scenario: scenario.on_terminate(APP_PACKAGE, LATE_COMMANDS)),
+        # terminate_app으로 종료되지 않음 (force-stop, killall 단계까지 진행)
+        Case("terminate_all_apps", "miss", terminate, "login_page",
+             prepare=lambda scenario: scenario.on_terminate(APP_PACKAGE, None)),
+    ]
+
+
+CASES = _cases()
+
+
+def run_case(case, latency=None):
+    """
+    케이스 하나를 새 fake 서버와 세션에서 실행합니다.
+
+    Args:
+        case: 측정 케이스
+        latency: 명령 이름별 응답 지연 (None이면 DEVICE_LATENCY)
+
+    Returns:
+        CaseResult: 측정 결과
+    """
+    scenario = app_scenario()
+    scenario.start = case.start
+    if case.prepare is not None:
+        case.prepare(scenario)
+    latency = DEVICE_LATENCY if latency is None else latency
+    server = FakeAppiumServer(scenario, latency=DEFAULT_LATENCY, command_latency=latency).start()
+    try:
+        with VirtualClock() as clock:
+            driver = create_driver(server.config(), skip_app_launch=True)
+            try:
+                if case.late is not None:
+                    server.device.schedule(Transition(case.late, after_commands=LATE_COMMANDS))
+                server.reset_counts()
+                started = clock.monotonic()
+                try:
+                    outcome = repr(case.call(driver))
+                except Exception as e:
+                    outcome = type(e).__name__
+                elapsed = clock.monotonic() - started
+                requests = Counter(server.requests)
+            finally:
+                driver.quit()
+    finally:
+        server.stop()
+        # miss 시나리오에서 기록된 check 실패는 측정 대상의 정상 동작이므로 테스트 결과에 남기지 않음
+        check_log.clear_failures()
+    return CaseResult(
+        name=case.name,
+        commands=sum(requests.values()),
+        commands_by_name=dict(sorted(requests.items())),
+        simulated_seconds=round(elapsed, 3),
+        outcome=outcome,
+    )
+
+
+def run_suite(cases=None):
+    """모든 케이스를 순서대로 실행하고 결과 목록을 반환합니다."""
+    return [run_case(case) for case in (CASES if cases is None else cases)]
+
+
+def load_baseline(path=BASELINE):
+    """
+    baseline 파일을 읽습니다.
+
+    Returns:
+        dict: 케이스 이름 → 기준 명령 수 (파일이 없으면 빈 dict)
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {name: entry["commands"] for name, entry in data["cases"].items()}
+
+
+def compare(results, baseline):
+    """
+    측정 결과를 baseline과 비교합니다.
+
+    Returns:
+        tuple: (명령 수가 늘어난 케이스 설명 목록, 명령 수가 줄어든 케이스 설명 목록)
+    """
+    regressions, improvements = [], []
+    for result in results:
+        expected = baseline.get(result.name)
+        if expected is None:
+            continue
+        if result.commands > expected:
+            regressions.append(f"{result.name}: 명령 {expected}개 → {result.commands}개")
+        elif result.commands < expected:
+            improvements.append(f"{result.name}: 명령 {expected}개 → {result.commands}개")
+    return regressions, improvements
+
+
+def write_results(results, path):
+    """측정 결과를 JSON 파일로 저장합니다. (baseline 파일과 같은 형식)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "latency": {"default": DEFAULT_LATENCY, **DEVICE_LATENCY},
+        "late_commands": LATE_COMMANDS,
+        "cases": {result.name: {key: value for key, value in asdict(result).items() if key != "name"} for result in results},
+    }
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def summary_lines(results):
+    """콘솔 출력용 요약 줄 목록을 반환합니다."""
+    lines = [f"{'케이스':<44} {'명령':>5} {'예상 시간':>10}  결과"]
+    for result in results:
+        lines.append(f"{result.name:<44} {result.commands:>5} {result.simulated_seconds:>9.2f}s  {result.outcome}")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=str(RESULTS), help="측정 결과 JSON 경로")
+    parser.add_argument("--baseline", default=str(BASELINE), help="비교할 baseline JSON 경로")
+    parser.add_argument("--update-baseline", action="store_true", help="측정 결과로 baseline을 갱신")
+    args = parser.parse_args()
+
+    # RemoteConnection 생성자의 deprecated 경고는 측정과 관계없으므로 숨김
+    warnings.simplefilter("ignore", DeprecationWarning)
+    # page object의 로그는 측정 결과 출력과 섞이지 않도록 숨김 (실패 원인은 결과 열에 표시)
+    logging.disable(logging.WARNING)
+    results = run_suite()
+    print("\n".join(summary_lines(results)))
+    print(f"결과 저장: {write_results(results, args.output)}")
+
+    if args.update_baseline:
+        print(f"baseline 갱신: {write_results(results, args.baseline)}")
+        return 0
+
+    regressions, improvements = compare(results, load_baseline(args.baseline))
+    for line in improvements:
+        print(f"[개선] {line} (--update-baseline으로 baseline 갱신)")
+    for line in regressions:
+        print(f"[회귀] {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
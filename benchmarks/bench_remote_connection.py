@@ -0,0 +1,117 @@
+"""
+Appium 명령 연결 측정 스크립트
+
+기존 연결(AppiumConnection)과 PooledAppiumConnection의 명령별 왕복 시간과 새 TCP 연결 수를 로컬 stub 서버로 비교합니다.
+
+    python -m benchmarks.bench_remote_connection [--commands 500] [--latency 0.002]
+
+- sequential: 메인 스레드에서만 명령을 보냄
+- background: 메인 스레드가 명령을 보내는 동안 백그라운드 스레드(병렬 조회 등)도 명령을 보냄
+- parallel: 서로 독립적인 조회 명령 3개를 순서대로 보낼 때와 execute_parallel로 동시에 보낼 때 비교
+"""
+import argparse
+import statistics
+import threading
+import time
+import warnings
+from types import SimpleNamespace
+
+from appium.webdriver.appium_connection import AppiumConnection
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.stub_server import SESSION_ID, StubAppiumServer
+from src.remote_connection import PooledAppiumConnection, execute_parallel
+
+READ_ONLY_COMMANDS = (Command.GET_TIMEOUTS, Command.GET_PAGE_SOURCE, Command.GET_WINDOW_RECT)
+
+
+def _timed(connection, command=Command.GET_TIMEOUTS):
+    started = time.perf_counter()
+    connection.execute(command, {"sessionId": SESSION_ID})
+    return time.perf_counter() - started
+
+
+def _summary(name, latencies, connections):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    return (
+        f"{name:<28} 평균 {statistics.mean(latencies) * 1000:7.3f}ms  "
+        f"p95 {p95 * 1000:7.3f}ms  새 연결 {connections:4d}개"
+    )
+
+
+def bench_sequential(server, connection, commands):
+    server.reset_counts()
+    latencies = [_timed(connection) for _ in range(commands)]
+    return latencies, server.connections
+
+
+def bench_background(server, connection, commands):
+    server.reset_counts()
+    stopped = threading.Event()
+
+    def background():
+        while not stopped.is_set():
+            connection.execute(Command.GET_TIMEOUTS, {"sessionId": SESSION_ID})
+
+    thread = threading.Thread(target=background, daemon=True)
+    thread.start()
+    try:
+        latencies = [_timed(connection) for _ in range(commands)]
+    finally:
+        stopped.set()
+        thread.join()
+    return latencies, server.connections
+
+
+def bench_parallel(connection, rounds):
+    driver = SimpleNamespace(
+        command_executor=connection,
+        execute=lambda command, params: connection.execute(command, {**params, "sessionId": SESSION_ID}),
+    )
+    sequential, parallel = [], []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for command in READ_ONLY_COMMANDS:
+            driver.execute(command, {})
+        sequential.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        execute_parallel(driver, [(command, {}) for command in READ_ONLY_COMMANDS])
+        parallel.append(time.perf_counter() - started)
+    return sequential, parallel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commands", type=int, default=500, help="시나리오별 명령 수")
+    parser.add_argument("--latency", type=float, default=0.002, help="stub 서버의 명령별 응답 지연 (초)")
+    args = parser.parse_args()
+
+    # RemoteConnection 생성자의 deprecated 경고는 측정과 관계없으므로 숨김
+    warnings.simplefilter("ignore", DeprecationWarning)
+    server = StubAppiumServer(latency=args.latency).start()
+    try:
+        connections = {
+            "AppiumConnection": lambda: AppiumConnection(server.url, keep_alive=True),
+            "PooledAppiumConnection": lambda: PooledAppiumConnection(server.url),
+        }
+        for scenario, bench in (("sequential", bench_sequential), ("background", bench_background)):
+            print(f"[{scenario}] 명령 {args.commands}개, 응답 지연 {args.latency * 1000:.1f}ms")
+            for name, factory in connections.items():
+                connection = factory()
+                latencies, opened = bench(server, connection, args.commands)
+                connection.close()
+                print("  " + _summary(name, latencies, opened))
+
+        print(f"[parallel] 조회 명령 {len(READ_ONLY_COMMANDS)}개 x {args.commands // 10}회")
+        connection = PooledAppiumConnection(server.url)
+        sequential, parallel = bench_parallel(connection, args.commands // 10)
+        print("  " + _summary("순서대로", sequential, 0))
+        print("  " + _summary("execute_parallel", parallel, connection.stats.opened))
+        connection.close()
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,598 @@
+"""
+디바이스 없이 page object를 실행하기 위한 로컬 fake Appium 서버입니다.
+
+프로젝트가 사용하는 WebDriver/Appium 프로토콜의 일부만 구현합니다.
+    - 세션 생성/종료, timeouts(implicit wait)
+    - 요소 조회(find element(s), 하위 요소 조회), click, send keys, clear, text, attribute, displayed/enabled
+    - page source, window rect, W3C actions(swipe, 무시)
+    - mobile: getCurrentPackage / getCurrentActivity / pressKey / activateApp / terminateApp /
+      queryAppState / backgroundApp / replaceElementValue / shell
+
+화면은 tests/page_sources의 XML 덤프(Screen)로 구성하며, 요소 클릭/키 입력/앱 실행에 따라 Scenario에 정의한 화면으로 전환됩니다.
+요소 조회는 src.hierarchy의 로컬 locator 평가기로 처리하고, 명령별 응답 지연을 설정하여 실제 디바이스의 왕복 시간을 흉내 낼 수 있습니다.
+명령 이름별 요청 수를 기록하므로 page object 메서드의 왕복 횟수를 측정하는 데 사용합니다.
+"""
+import json
+import logging
+import re
+import threading
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import cached_property
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+from src.config.settings import AppConfig
+from src.hierarchy import PageSnapshot, UnsupportedLocator
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+PAGE_SOURCES = Path(__file__).resolve().parent.parent / "tests" / "page_sources"
+# W3C WebElement 참조 키
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+# 홈 화면(런처)
+LAUNCHER_PACKAGE = "com.google.android.apps.nexuslauncher"
+HOME_SCREEN = "home"
+# Android 키 코드
+KEYCODE_HOME = 3
+KEYCODE_BACK = 4
+# queryAppState 값
+APP_NOT_RUNNING = 1
+APP_RUNNING_IN_BACKGROUND = 3
+APP_RUNNING_IN_FOREGROUND = 4
+
+_HOME_SOURCE = (
+    "<?xml version='1.0' encoding='UTF-8' standalone='yes' ?>\n"
+    '<hierarchy index="0" class="hierarchy" rotation="0" width="1080" height="2400">\n'
+    f'  <android.widget.FrameLayout index="0" package="{LAUNCHER_PACKAGE}" class="android.widget.FrameLayout" '
+    'text="" resource-id="" clickable="false" enabled="true" bounds="[0,0][1080,2400]" displayed="true" />\n'
+    "</hierarchy>\n"
+)
+
+# (HTTP 메서드, 경로 정규식) → 명령 이름. 명령 이름은 요청 수 집계와 명령별 지연 설정에 사용
+_ROUTES = [
+    ("POST", r"/session", "newSession"),
+    ("GET", r"/status", "status"),
+    ("DELETE", r"/session/(?P<sid>[^/]+)", "deleteSession"),
+    ("GET", r"/session/(?P<sid>[^/]+)/timeouts", "getTimeouts"),
+    ("POST", r"/session/(?P<sid>[^/]+)/timeouts", "setTimeouts"),
+    ("POST", r"/session/(?P<sid>[^/]+)/element", "findElement"),
+    ("POST", r"/session/(?P<sid>[^/]+)/elements", "findElements"),
+    ("POST", r"/session/(?P<sid>[^/]+)/element/(?P<eid>[^/]+)/element", "findChildElement"),
+    ("POST", r"/session/(?P<sid>[^/]+)/element/(?P<eid>[^/]+)/elements", "findChildElements"),
+    ("POST", r"/session/(?P<sid>[^/]+)/element/(?P<eid>[^/]+)/click", "click"),
+    ("POST", r"/session/(?P<sid>[^/]+)/element/(?P<eid>[^/]+)/value", "sendKeys"),
+    ("POST", r"/session/(?P<sid>[^/]+)/element/(?P<eid>[^/]+)/clear", "clear"),
+    ("GET", r"/session/(?P<sid>[^/]+)/element/(?P<eid>[^/]+)/text", "getText"),
+    ("GET", r"/session/(?P<sid>[^/]+)/element/(?P<eid>[^/]+)/attribute/(?P<name>[^/]+)", "getAttribute"),
+    ("GET", r"/session/(?P<sid>[^/]+)/element/(?P<eid>[^/]+)/displayed", "isDisplayed"),
+    ("GET", r"/session/(?P<sid>[^/]+)/element/(?P<eid>[^/]+)/enabled", "isEnabled"),
+    ("GET", r"/session/(?P<sid>[^/]+)/element/(?P<eid>[^/]+)/rect", "getRect"),
+    ("GET", r"/session/(?P<sid>[^/]+)/source", "getPageSource"),
+    ("GET", r"/session/(?P<sid>[^/]+)/window/rect", "getWindowRect"),
+    ("POST", r"/session/(?P<sid>[^/]+)/actions", "performActions"),
+    ("DELETE", r"/session/(?P<sid>[^/]+)/actions", "releaseActions"),
+    ("POST", r"/session/(?P<sid>[^/]+)/execute/sync", "execute"),
+]
+_COMPILED_ROUTES = [(method, re.compile(f"^{pattern}$"), name) for method, pattern, name in _ROUTES]
+
+
+class WebDriverError(Exception):
+    """W3C WebDriver 오류 응답으로 변환되는 예외"""
+
+    def __init__(self, error, message, status=404):
+        super().__init__(message)
+        self.error = error
+        self.status = status
+
+
+@dataclass
+class Screen:
+    """
+    화면 하나 (page_source XML 덤프)
+
+    Attributes:
+        name: 화면 이름 (덤프 파일 이름)
+        source: page_source XML
+        activity: 화면의 Activity 이름 (current_activity 응답)
+    """
+    name: str
+    source: str
+    activity: str = ""
+
+    @cached_property
+    def package(self):
+        return PageSnapshot(self.source).package or ""
+
+
+@dataclass
+class Transition:
+    """
+    화면 전환
+
+    Attributes:
+        target: 전환될 화면 이름
+        after_commands: 동작 후 이 수만큼 명령이 더 처리된 뒤에 화면이 바뀜 (늦게 나타나는 화면 재현)
+        delay: 동작 후 이 시간(초)이 지난 뒤에 화면이 바뀜
+    """
+    target: str
+    after_commands: int = 0
+    delay: float = 0.0
+
+
+@dataclass
+class Scenario:
+    """
+    fake 디바이스의 화면 구성
+
+    Attributes:
+        screens: 화면 이름별 Screen
+        start: 세션 시작 시 화면 이름
+        clicks: (화면 이름, 요소 키) → 클릭 시 Transition. 요소 키는 resource-id, text, content-desc 중 하나
+        keys: (화면 이름, 키 코드) → 키 입력 시 Transition
+        launches: 앱 패키지 → activate_app 시 Transition
+        terminations: 앱 패키지 → terminate_app 후 프로세스가 종료되기까지 처리되는 명령 수 (None이면 종료되지 않음)
+    """
+    screens: dict = field(default_factory=dict)
+    start: str = HOME_SCREEN
+    clicks: dict = field(default_factory=dict)
+    keys: dict = field(default_factory=dict)
+    launches: dict = field(default_factory=dict)
+    terminations: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.screens.setdefault(HOME_SCREEN, Screen(HOME_SCREEN, _HOME_SOURCE, ".NexusLauncherActivity"))
+
+    @classmethod
+    def from_directory(cls, directory=PAGE_SOURCES, activities=None, start=HOME_SCREEN):
+        """
+        디렉토리의 XML 덤프로 화면을 구성합니다.
+
+        Args:
+            directory: *.xml 덤프가 있는 디렉토리
+            activities: 화면 이름별 Activity 이름
+            start: 세션 시작 시 화면 이름
+        """
+        activities = activities or {}
+        screens = {
+            path.stem: Screen(path.stem, path.read_text(encoding="utf-8"), activities.get(path.stem, ""))
+            for path in sorted(Path(directory).glob("*.xml"))
+        }
+        return cls(screens=screens, start=start)
+
+    def on_click(self, screen, element_key, target, after_commands=0, delay=0.0):
+        """screen에서 element_key 요소를 클릭하면 target 화면으로 전환되도록 설정합니다."""
+        self.clicks[(screen, element_key)] = Transition(target, after_commands, delay)
+        return self
+
+    def on_key(self, screen, keycode, target, after_commands=0, delay=0.0):
+        """screen에서 keycode 키를 누르면 target 화면으로 전환되도록 설정합니다. (HOME/BACK 키의 기본 동작보다 우선)"""
+        self.keys[(screen, keycode)] = Transition(target, after_commands, delay)
+        return self
+
+    def on_launch(self, package, target, after_commands=0, delay=0.0):
+        """package 앱을 실행하면 target 화면으로 전환되도록 설정합니다."""
+        self.launches[package] = Transition(target, after_commands, delay)
+        return self
+
+    def on_terminate(self, package, after_commands=0):
+        """
+        terminate_app 후 package 앱의 프로세스가 after_commands만큼 명령이 더 처리된 뒤에 종료되도록 설정합니다.
+        after_commands가 None이면 terminate_app으로 종료되지 않습니다. (포그라운드 서비스 등)
+        """
+        self.terminations[package] = after_commands
+        return self
+
+
+class FakeDevice:
+    """
+    Scenario에 따라 화면을 전환하는 fake 디바이스 상태 (세션 하나)
+
+    Args:
+        scenario: 화면 구성
+    """
+
+    def __init__(self, scenario):
+        self.scenario = scenario
+        self.implicit_wait = 0.0
+        self.commands = 0
+        self.running = set()
+        self.history = []
+        self._screen_name = None
+        self._pending = None
+        self._stopping = {}
+        self._generation = 0
+        self._source = None
+        self._snapshot = None
+        self._positions = {}
+        self.show(scenario.start)
+
+    @property
+    def screen(self):
+        return self.scenario.screens[self._screen_name]
+
+    @property
+    def package(self):
+        return self.screen.package
+
+    def show(self, name, remember=True):
+        """화면을 전환합니다. 이전 화면의 요소 참조는 모두 stale이 됩니다."""
+        if name not in self.scenario.screens:
+            raise WebDriverError("unknown error", f"정의되지 않은 화면입니다: {name}", 500)
+        if remember and self._screen_name is not None:
+            self.history.append(self._screen_name)
+        self._screen_name = name
+        self._source = self.screen.source
+        self._snapshot = None
+        self._generation += 1
+        self._pending = None
+        if self.package and self.package != LAUNCHER_PACKAGE:
+            self.running.add(self.package)
+
+    def schedule(self, transition):
+        """transition의 조건(명령 수, 시간)이 충족되면 화면이 바뀌도록 예약합니다."""
+        if transition.after_commands == 0 and transition.delay == 0:
+            self.show(transition.target)
+            return
+        self._pending = (transition, self.commands + transition.after_commands, time.monotonic() + transition.delay)
+
+    def tick(self):
+        """명령 하나를 처리하기 전에 호출되며, 예약된 화면 전환과 앱 종료의 조건이 충족되었으면 반영합니다."""
+        self.commands += 1
+        for package, at_command in list(self._stopping.items()):
+            if self.commands > at_command:
+                self._stop(package)
+        if self._pending is None:
+            return
+        transition, at_command, at_time = self._pending
+        if self.commands > at_command and time.monotonic() >= at_time:
+            self.show(transition.target)
+
+    def snapshot(self):
+        if self._snapshot is None:
+            self._snapshot = PageSnapshot(self._source)
+            self._positions = {id(node): position for position, node in enumerate(self._snapshot.nodes)}
+        return self._snapshot
+
+    def source(self):
+        return self._source
+
+    # 요소 (요소 id는 "<화면 전환 횟수>-<문서 순서>")
+    def element_ref(self, node):
+        element_id = f"{self._generation}-{self._positions[id(node)]}"
+        return {ELEMENT_KEY: element_id, "ELEMENT": element_id}
+
+    def element(self, element_id):
+        generation, _, position = element_id.partition("-")
+        if not generation.isdigit() or not position.isdigit():
+            raise WebDriverError("no such element", f"알 수 없는 요소입니다: {element_id}")
+        if int(generation) != self._generation:
+            raise WebDriverError("stale element reference", f"화면이 바뀌어 요소를 사용할 수 없습니다: {element_id}")
+        return self.snapshot().nodes[int(position)]
+
+    def find_all(self, using, value, parent=None):
+        try:
+            nodes = self.snapshot().find_all((using, value))
+        except UnsupportedLocator:
+            nodes = self._find_scrollable(using, value)
+        if parent is not None:
+            descendants = {id(node) for node in parent.iter()} - {id(parent)}
+            nodes = [node for node in nodes if id(node) in descendants]
+        return nodes
+
+    def _find_scrollable(self, using, value):
+        """UiScrollable 조회는 스크롤 없이 현재 화면에서 대상 텍스트 또는 스크롤 가능한 요소를 찾습니다."""
+        if using != AppiumBy.ANDROID_UIAUTOMATOR or not value.startswith("new UiScrollable"):
+            raise WebDriverError("invalid selector", f"지원하지 않는 locator입니다: {using}={value}", 400)
+        text = re.search(r'scrollTextIntoView\("(?P<text>[^"]*)"\)', value)
+        if text:
+            return [node for node in self.snapshot().nodes if text.group("text") in PageSnapshot.text_of(node)]
+        return [node for node in self.snapshot().nodes if node.get("scrollable") == "true"]
+
+    def set_text(self, node, text):
+        """요소의 text를 바꾸고 page_source에 반영합니다. (화면이 바뀌지 않으므로 요소 참조는 유지)"""
+        node.set("text", text)
+        self._source = (
+            "<?xml version='1.0' encoding='UTF-8' standalone='yes' ?>\n"
+            + ET.tostring(self.snapshot().root, encoding="unicode")
+        )
+        self._snapshot = None
+
+    def click(self, node):
+        for key in (node.get("resource-id"), node.get("text"), node.get("content-desc")):
+            transition = self.scenario.clicks.get((self._screen_name, key)) if key else None
+            if transition is not None:
+                self.schedule(transition)
+                return
+
+    # 앱
+    def press_key(self, keycode):
+        transition = self.scenario.keys.get((self._screen_name, keycode))
+        if transition is not None:
+            self.schedule(transition)
+        elif keycode == KEYCODE_HOME:
+            self.show(HOME_SCREEN)
+        elif keycode == KEYCODE_BACK and self.history:
+            self.show(self.history.pop(), remember=False)
+
+    def activate_app(self, package):
+        transition = self.scenario.launches.get(package)
+        if transition is None:
+            raise WebDriverError("unknown error", f"설치되지 않은 앱입니다: {package}", 500)
+        self.running.add(package)
+        if self.package != package:
+            self.schedule(transition)
+
+    def terminate_app(self, package):
+        was_running = package in self.running
+        if not was_running or package not in self.scenario.terminations:
+            self._stop(package)
+        elif self.scenario.terminations[package] is not None:
+            self._stopping.setdefault(package, self.commands + self.scenario.terminations[package])
+        return was_running
+
+    def _stop(self, package):
+        self._stopping.pop(package, None)
+        self.running.discard(package)
+        if self.package == package:
+            self.show(HOME_SCREEN)
+
+    def app_state(self, package):
+        if self.package == package:
+            return APP_RUNNING_IN_FOREGROUND
+        return APP_RUNNING_IN_BACKGROUND if package in self.running else APP_NOT_RUNNING
+
+
+class FakeAppiumServer:
+    """
+    Scenario로 화면을 흉내 내는 로컬 fake Appium 서버
+
+    Args:
+        scenario: 화면 구성 (None이면 tests/page_sources의 덤프와 홈 화면)
+        latency: 모든 명령의 응답 지연 (초)
+        command_latency: 명령 이름별 응답 지연 (초, 예: {"getPageSource": 0.3})
+        host: 바인딩할 주소
+        port: 바인딩할 포트 (0이면 임의의 빈 포트)
+    """
+
+    def __init__(self, scenario=None, latency=0.0, command_latency=None, host="127.0.0.1", port=0):
+        self.scenario = scenario or Scenario.from_directory()
+        self.latency = latency
+        self.command_latency = dict(command_latency or {})
+        self.requests = Counter()
+        self.device = None
+        self._sessions = {}
+        self._lock = threading.RLock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def total_requests(self):
+        return sum(self.requests.values())
+
+    def config(self, app_package="net.bucketplace", app_activity=""):
+        """이 서버로 세션을 만드는 AppConfig를 반환합니다. (create_driver에 전달)"""
+        return AppConfig(
+            appium_server_url=self.url,
+            platform_name="Android",
+            platform_version="",
+            device_name="fake-device",
+            automation_name="UiAutomator2",
+            app_package=app_package,
+            app_activity=app_activity,
+            # adb 명령이 실제 디바이스로 전달되지 않도록 존재하지 않는 시리얼 사용
+            udid="fake-device",
+        )
+
+    def start(self):
+        # 케이스마다 서버를 새로 띄우는 측정에서 stop이 오래 걸리지 않도록 shutdown 확인 간격을 줄임
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        log.info(f"fake Appium 서버 시작: {self.url}")
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        log.info(f"fake Appium 서버 종료 (요청 {self.total_requests}개)")
+
+    def reset_counts(self):
+        with self._lock:
+            self.requests.clear()
+
+    def _route(self, method, path):
+        for route_method, pattern, name in _COMPILED_ROUTES:
+            if route_method != method:
+                continue
+            match = pattern.match(path)
+            if match:
+                return name, match.groupdict()
+        raise WebDriverError("unknown command", f"지원하지 않는 명령입니다: {method} {path}")
+
+    def handle(self, method, path, body):
+        """요청 하나를 처리하고 (HTTP 상태 코드, 응답 value)를 반환합니다."""
+        name, args = self._route(method, path)
+        with self._lock:
+            self.requests[name] += 1
+        delay = self.command_latency.get(name, self.latency)
+        if delay:
+            time.sleep(delay)
+        if name == "newSession":
+            return 200, self._new_session(body)
+        if name == "status":
+            return 200, {"ready": True, "message": "fake appium"}
+        with self._lock:
+            device = self._sessions.get(args["sid"])
+            if device is None:
+                raise WebDriverError("invalid session id", f"세션이 없습니다: {args['sid']}")
+            device.tick()
+        return 200, getattr(self, f"_cmd_{name}")(device, body, args)
+
+    def _new_session(self, body):
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self.device = self._sessions[session_id] = FakeDevice(self.scenario)
+        # Appium 서버처럼 응답의 capability 이름에서 "appium:" 접두사를 제거
+        capabilities = {
+            name.removeprefix("appium:"): value
+            for name, value in body.get("capabilities", {}).get("alwaysMatch", {}).items()
+        }
+        return {"sessionId": session_id, "capabilities": {**capabilities, "platformName": "Android"}}
+
+    # 세션
+    def _cmd_deleteSession(self, device, body, args):
+        self._sessions.pop(args["sid"], None)
+
+    def _cmd_getTimeouts(self, device, body, args):
+        return {"implicit": int(device.implicit_wait * 1000), "pageLoad": 300000, "script": 30000}
+
+    def _cmd_setTimeouts(self, device, body, args):
+        if "implicit" in body:
+            device.implicit_wait = body["implicit"] / 1000
+
+    # 요소 조회 (implicit wait 동안 예약된 화면 전환을 기다림)
+    def _find(self, device, body, parent=None):
+        deadline = time.monotonic() + device.implicit_wait
+        while True:
+            with self._lock:
+                nodes = device.find_all(body["using"], body["value"], parent)
+                if nodes or time.monotonic() >= deadline:
+                    return [device.element_ref(node) for node in nodes]
+                device.tick()
+            time.sleep(0.05)
+
+    def _cmd_findElement(self, device, body, args):
+        found = self._find(device, body)
+        if not found:
+            raise WebDriverError("no such element", f"요소를 찾을 수 없습니다: {body['using']}={body['value']}")
+        return found[0]
+
+    def _cmd_findElements(self, device, body, args):
+        return self._find(device, body)
+
+    def _cmd_findChildElement(self, device, body, args):
+        found = self._find(device, body, device.element(args["eid"]))
+        if not found:
+            raise WebDriverError("no such element", f"요소를 찾을 수 없습니다: {body['using']}={body['value']}")
+        return found[0]
+
+    def _cmd_findChildElements(self, device, body, args):
+        return self._find(device, body, device.element(args["eid"]))
+
+    # 요소 동작
+    def _cmd_click(self, device, body, args):
+        with self._lock:
+            device.click(device.element(args["eid"]))
+
+    def _cmd_sendKeys(self, device, body, args):
+        with self._lock:
+            node = device.element(args["eid"])
+            device.set_text(node, (node.get("text") or "") + body.get("text", ""))
+
+    def _cmd_clear(self, device, body, args):
+        with self._lock:
+            device.set_text(device.element(args["eid"]), "")
+
+    def _cmd_getText(self, device, body, args):
+        return device.element(args["eid"]).get("text", "")
+
+    def _cmd_getAttribute(self, device, body, args):
+        node = device.element(args["eid"])
+        name = {"contentDescription": "content-desc", "resourceId": "resource-id", "className": "class"}.get(
+            args["name"], args["name"]
+        )
+        return node.get(name)
+
+    def _cmd_isDisplayed(self, device, body, args):
+        return PageSnapshot.is_displayed(device.element(args["eid"]))
+
+    def _cmd_isEnabled(self, device, body, args):
+        return device.element(args["eid"]).get("enabled", "true") == "true"
+
+    def _cmd_getRect(self, device, body, args):
+        bounds = re.findall(r"\d+", device.element(args["eid"]).get("bounds", "[0,0][0,0]"))
+        left, top, right, bottom = (int(value) for value in bounds)
+        return {"x": left, "y": top, "width": right - left, "height": bottom - top}
+
+    # 화면
+    def _cmd_getPageSource(self, device, body, args):
+        return device.source()
+
+    def _cmd_getWindowRect(self, device, body, args):
+        return {"x": 0, "y": 0, "width": 1080, "height": 2400}
+
+    def _cmd_performActions(self, device, body, args):
+        return None
+
+    def _cmd_releaseActions(self, device, body, args):
+        return None
+
+    # mobile: 명령
+    def _cmd_execute(self, device, body, args):
+        script = body.get("script", "")
+        params = (body.get("args") or [{}])[0] or {}
+        with self._lock:
+            if script == "mobile: getCurrentPackage":
+                return device.package
+            if script == "mobile: getCurrentActivity":
+                return device.screen.activity
+            if script == "mobile: pressKey":
+                device.press_key(int(params["keycode"]))
+                return None
+            if script == "mobile: activateApp":
+                device.activate_app(params.get("appId") or params.get("bundleId"))
+                return None
+            if script == "mobile: terminateApp":
+                return device.terminate_app(params.get("appId") or params.get("bundleId"))
+            if script == "mobile: queryAppState":
+                return device.app_state(params.get("appId") or params.get("bundleId"))
+            if script == "mobile: backgroundApp":
+                return None
+            if script == "mobile: replaceElementValue":
+                device.set_text(device.element(params["elementId"]), params.get("text", ""))
+                return None
+            if script == "mobile: shell":
+                return ""
+        raise WebDriverError("unknown method", f"지원하지 않는 명령입니다: {script}")
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+                path = self.path.split("?", 1)[0].rstrip("/")
+                path = path[len("/wd/hub"):] if path.startswith("/wd/hub") else path
+                try:
+                    status, value = server.handle(self.command, path, body)
+                except WebDriverError as e:
+                    status, value = e.status, {"error": e.error, "message": str(e), "stacktrace": ""}
+                payload = json.dumps({"value": value}, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_DELETE = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
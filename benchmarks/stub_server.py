@@ -0,0 +1,107 @@
+"""
+Appium 명령 연결 측정용 로컬 stub 서버입니다.
+
+WebDriver 프로토콜의 응답 형식만 흉내 내며, 모든 명령에 고정된 응답을 돌려줍니다.
+Appium 서버(Node.js)처럼 HTTP/1.1 keep-alive로 연결을 유지하고, 새 TCP 연결 수를 기록하여
+클라이언트의 연결 재사용 여부를 서버 쪽에서도 확인할 수 있습니다.
+"""
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+SESSION_ID = "stub-session"
+
+
+class StubAppiumServer:
+    """
+    고정 응답을 돌려주는 WebDriver stub 서버
+
+    Args:
+        latency: 모든 명령의 응답 지연 (초)
+        path_latency: 경로 끝부분별 응답 지연 (초, 예: {"/source": 0.05})
+        host: 바인딩할 주소
+        port: 바인딩할 포트 (0이면 임의의 빈 포트)
+    """
+
+    def __init__(self, latency=0.0, path_latency=None, host="127.0.0.1", port=0):
+        self.latency = latency
+        self.path_latency = dict(path_latency or {})
+        self.requests = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_counts(self):
+        with self._lock:
+            self.requests = 0
+            self.connections = 0
+
+    def _delay(self, path):
+        for suffix, seconds in self.path_latency.items():
+            if path.endswith(suffix):
+                return seconds
+        return self.latency
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Appium 서버처럼 응답 후에도 연결을 유지
+            protocol_version = "HTTP/1.1"
+            # 응답 헤더와 본문을 나눠 쓰므로 Nagle 알고리즘을 끄지 않으면 응답마다 delayed ACK(약 40ms)만큼 늦어짐
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                with server._lock:
+                    server.requests += 1
+                delay = server._delay(self.path)
+                if delay:
+                    time.sleep(delay)
+                if self.command == "POST" and self.path.endswith("/session"):
+                    value = {"sessionId": SESSION_ID, "capabilities": {"platformName": "Android"}}
+                elif self.path.endswith("/timeouts"):
+                    value = {"implicit": 0, "pageLoad": 300000, "script": 30000}
+                else:
+                    value = None
+                payload = json.dumps({"value": value}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_DELETE = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,226 @@
+"""
+ADB 명령 실행 모듈입니다.
+
+명령마다 `adb -s <serial> shell ...` 프로세스를 새로 띄우는 대신 디바이스별로 `adb shell` 프로세스 하나를 유지하고,
+명령 뒤에 구분자(marker)를 출력하게 하여 명령별 출력과 종료 코드를 나눠 읽습니다.
+여러 명령은 run_batch로 한 번에 보내 왕복 한 번으로 실행합니다.
+asyncio 코드에서는 run_async / run_batch_async를 사용합니다.
+"""
+import asyncio
+import atexit
+import logging
+import queue
+import subprocess
+import threading
+import time
+import uuid
+import weakref
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+DEFAULT_SERIAL = 'emulator-5554'
+
+# 드라이버별 디바이스 시리얼 캐시
+_serials = weakref.WeakKeyDictionary()
+
+
+def device_serial(driver):
+    """
+    Appium 세션의 디바이스 시리얼(UDID)을 반환합니다. 드라이버별로 한 번만 조회합니다.
+
+    Args:
+        driver: Appium WebDriver
+
+    Returns:
+        str: 디바이스 시리얼
+    """
+    try:
+        return _serials[driver]
+    except (KeyError, TypeError):
+        pass
+    capabilities = driver.capabilities
+    serial = capabilities.get('udid') or capabilities.get('deviceName', DEFAULT_SERIAL)
+    try:
+        _serials[driver] = serial
+    except TypeError:
+        pass
+    return serial
+
+
+@dataclass(frozen=True)
+class ShellResult:
+    """
+    shell 명령 실행 결과
+
+    Attributes:
+        output: 표준 출력과 표준 에러를 합친 출력 (앞뒤 공백 제거)
+        exit_code: 명령의 종료 코드
+    """
+    output: str
+    exit_code: int
+
+    @property
+    def ok(self):
+        return self.exit_code == 0
+
+
+class AdbShell:
+    """
+    디바이스 하나에 연결된 영구 `adb shell` 세션
+
+    Args:
+        serial: 디바이스 시리얼
+        adb_path: adb 실행 파일 경로
+    """
+
+    # 시리얼별로 공유되는 세션
+    _shells = {}
+    _shells_lock = threading.Lock()
+
+    def __init__(self, serial, adb_path='adb'):
+        self.serial = serial
+        self.adb_path = adb_path
+        self._process = None
+        self._lines = None
+        self._lock = threading.Lock()
+        # 실행한 명령 수와 adb shell 프로세스를 띄운 횟수 (배치/재사용 효과 확인용)
+        self.commands = 0
+        self.spawns = 0
+
+    @classmethod
+    def for_serial(cls, serial):
+        """시리얼별로 공유되는 AdbShell을 반환합니다."""
+        with cls._shells_lock:
+            shell = cls._shells.get(serial)
+            if shell is None:
+                shell = cls._shells[serial] = cls(serial)
+            return shell
+
+    @classmethod
+    def close_all(cls):
+        """공유 중인 모든 AdbShell을 종료합니다."""
+        with cls._shells_lock:
+            shells = list(cls._shells.values())
+            cls._shells.clear()
+        for shell in shells:
+            shell.close()
+
+    def _popen(self):
+        return subprocess.Popen(
+            [self.adb_path, '-s', self.serial, 'shell'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+
+    def _ensure_started(self):
+        if self._process is not None and self._process.poll() is None:
+            return
+        self._process = self._popen()
+        self.spawns += 1
+        self._lines = queue.Queue()
+        # 출력을 별도 스레드에서 읽어 명령별 timeout을 적용할 수 있도록 함
+        threading.Thread(target=self._pump, args=(self._process, self._lines), daemon=True).start()
+        log.debug(f"[{self.serial}] adb shell 세션 시작")
+
+    @staticmethod
+    def _pump(process, lines):
+        for line in process.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def run(self, command, timeout=5):
+        """
+        명령 하나를 실행합니다.
+
+        Args:
+            command: shell 명령 문자열
+            timeout: 최대 실행 시간 (초)
+
+        Returns:
+            ShellResult: 실행 결과
+        """
+        return self.run_batch([command], timeout=timeout)[0]
+
+    def run_batch(self, commands, timeout=5):
+        """
+        여러 명령을 한 번에 보내 순서대로 실행합니다.
+
+        Args:
+            commands: shell 명령 문자열 목록
+            timeout: 모든 명령의 최대 실행 시간 (초)
+
+        Returns:
+            list[ShellResult]: 명령별 실행 결과
+
+        Raises:
+            TimeoutError: timeout 안에 모든 명령이 끝나지 않았을 때 (세션은 종료되고 다음 호출에서 다시 시작)
+        """
+        if not commands:
+            return []
+        with self._lock:
+            self._ensure_started()
+            marker = f"__ADB_DONE_{uuid.uuid4().hex}__"
+            script = ''.join(f"{command}\necho \"{marker}:$?\"\n" for command in commands)
+            try:
+                self._process.stdin.write(script)
+                self._process.stdin.flush()
+                results = self._read_results(marker, len(commands), timeout)
+            except Exception:
+                # 출력 경계가 어긋난 세션은 재사용하지 않음
+                self.close()
+                raise
+            self.commands += len(commands)
+            return results
+
+    def _read_results(self, marker, count, timeout):
+        results = []
+        output = []
+        deadline = time.monotonic() + timeout
+        while len(results) < count:
+            try:
+                line = self._lines.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise TimeoutError(f"[{self.serial}] adb shell 명령이 {timeout}초 안에 끝나지 않았습니다.")
+            if line is None:
+                raise ConnectionError(f"[{self.serial}] adb shell 세션이 종료되었습니다: {''.join(output).strip()}")
+            index = line.find(marker)
+            if index < 0:
+                output.append(line)
+                continue
+            # 명령 출력이 개행 없이 끝나면 marker가 같은 줄에 붙어서 출력됨
+            output.append(line[:index])
+            exit_code = line[index + len(marker) + 1:].strip()
+            results.append(ShellResult(''.join(output).strip(), int(exit_code) if exit_code.isdigit() else -1))
+            output = []
+        return results
+
+    async def run_async(self, command, timeout=5):
+        """run의 asyncio 버전입니다."""
+        return await asyncio.to_thread(self.run, command, timeout)
+
+    async def run_batch_async(self, commands, timeout=5):
+        """run_batch의 asyncio 버전입니다."""
+        return await asyncio.to_thread(self.run_batch, commands, timeout)
+
+    def close(self):
+        """adb shell 세션을 종료합니다."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except Exception:
+            pass
+        try:
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        log.debug(f"[{self.serial}] adb shell 세션 종료 (명령 {self.commands}개)")
+
+
+atexit.register(AdbShell.close_all)
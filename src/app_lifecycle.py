@@ -0,0 +1,246 @@
+"""
+앱 실행/종료 상태를 관리하는 모듈입니다.
+
+current_package를 1초 간격으로 확인하거나 고정 sleep을 두는 대신 query_app_state로 앱 상태를 직접 확인하며,
+짧은 간격으로 polling하여 앱이 목표 상태(포그라운드 실행, 종료)에 도달하는 즉시 반환합니다.
+앱 종료는 terminate_app부터 시도하고, 앱이 종료되지 않은 경우에만 force-stop, killall 순서로 단계를 올립니다.
+앱 실행은 `am start -W` 한 번으로 수행하며, 출력에서 cold/warm start 여부와 실행 시간을 읽어옵니다.
+"""
+import logging
+import re
+import shlex
+import subprocess
+import time
+from dataclasses import dataclass
+
+from appium.webdriver.applicationstate import ApplicationState
+
+from src.adb import device_serial
+from src.screen import ScreenTracker
+from src.wait import WaitScheduler
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+# 앱 상태 확인 polling 간격의 상한 (초)
+APP_STATE_POLL_INTERVAL = 0.25
+
+STOPPED_STATES = (ApplicationState.NOT_INSTALLED, ApplicationState.NOT_RUNNING)
+
+# am start -W 출력의 "Key: value" 형식 줄
+_AM_START_FIELD = re.compile(r"^(Status|LaunchState|Activity|ThisTime|TotalTime|WaitTime):\s*(.+)$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class LaunchResult:
+    """
+    `am start -W` 실행 결과
+
+    Attributes:
+        status: 실행 상태 ("ok"이면 성공)
+        launch_state: "COLD", "WARM", "HOT" 등 (Android 10 미만 또는 알 수 없으면 None)
+        activity: 실행된 Activity
+        total_time_ms: Activity 실행에 걸린 시간 (ms)
+        wait_time_ms: am 명령이 기다린 전체 시간 (ms)
+    """
+    status: str | None
+    launch_state: str | None = None
+    activity: str | None = None
+    total_time_ms: int | None = None
+    wait_time_ms: int | None = None
+
+    @property
+    def ok(self):
+        return self.status == "ok"
+
+
+def parse_am_start_output(output):
+    """
+    `am start -W` 출력을 LaunchResult로 변환합니다.
+
+    Args:
+        output: am start -W의 표준 출력
+
+    Returns:
+        LaunchResult: 파싱 결과 (Status 줄이 없으면 status가 None)
+    """
+    fields = {key: value.strip() for key, value in _AM_START_FIELD.findall(output)}
+
+    def millis(key):
+        value = fields.get(key)
+        return int(value) if value and value.isdigit() else None
+
+    return LaunchResult(
+        status=fields.get("Status"),
+        launch_state=fields.get("LaunchState"),
+        activity=fields.get("Activity"),
+        total_time_ms=millis("TotalTime") or millis("ThisTime"),
+        wait_time_ms=millis("WaitTime"),
+    )
+
+
+class AppLifecycle:
+    """
+    query_app_state 기반의 앱 실행/종료 서비스
+
+    Args:
+        driver: Appium WebDriver
+        waits: 대기에 사용할 WaitScheduler (None이면 드라이버의 공용 스케줄러)
+    """
+
+    def __init__(self, driver, waits=None):
+        self.driver = driver
+        self.waits = waits or WaitScheduler.for_driver(driver)
+        # 마지막 am start -W 실행 결과 (cold/warm start 시간 확인용)
+        self.last_launch = None
+
+    def _device_serial(self):
+        return device_serial(self.driver)
+
+    def state(self, app_package):
+        """
+        앱의 현재 상태를 반환합니다.
+
+        Returns:
+            int: ApplicationState 값
+        """
+        return self.driver.query_app_state(app_package)
+
+    def is_foreground(self, app_package):
+        """앱이 포그라운드에서 실행 중인지 확인합니다."""
+        return self.state(app_package) == ApplicationState.RUNNING_IN_FOREGROUND
+
+    def wait_for_state(self, app_package, states, timeout, name="wait_for_app_state"):
+        """
+        앱이 states 중 하나의 상태가 될 때까지 대기합니다.
+
+        Args:
+            app_package: 앱 패키지 이름
+            states: 목표 ApplicationState 값들
+            timeout: 최대 대기 시간 (초)
+            name: 대기 통계를 기록할 조건 이름
+
+        Returns:
+            bool: timeout 안에 목표 상태가 되었으면 True
+        """
+        return bool(self.waits.until(
+            lambda: self.state(app_package) in states,
+            timeout, name=name, max_interval=APP_STATE_POLL_INTERVAL,
+        ))
+
+    def wait_for_foreground(self, app_package, timeout=10):
+        """앱이 포그라운드에서 실행될 때까지 대기합니다."""
+        return self.wait_for_state(
+            app_package, (ApplicationState.RUNNING_IN_FOREGROUND,), timeout, name="wait_for_app_foreground"
+        )
+
+    def wait_for_stopped(self, app_package, timeout=3):
+        """앱 프로세스가 종료될 때까지 대기합니다."""
+        return self.wait_for_state(app_package, STOPPED_STATES, timeout, name="wait_for_app_stopped")
+
+    def terminate(self, app_package, timeout=3):
+        """
+        앱을 종료합니다. 앞 단계로 앱이 종료되면 이후 단계는 수행하지 않습니다.
+        1) terminate_app  2) am force-stop  3) killall
+
+        Args:
+            app_package: 종료할 앱의 패키지 이름
+            timeout: 단계별로 앱이 종료되기를 기다리는 최대 시간 (초)
+
+        Returns:
+            bool: 앱이 종료되었으면 True
+        """
+        started = time.monotonic()
+        steps = (
+            ("terminate_app", lambda: self.driver.terminate_app(app_package)),
+            ("force-stop", lambda: self._adb_shell('am', 'force-stop', app_package)),
+            ("killall", lambda: self._adb_shell('killall', app_package)),
+        )
+        for step_name, step in steps:
+            try:
+                step()
+            except Exception as e:
+                log.debug(f"앱 종료 단계 '{step_name}' 실패: {e}")
+            try:
+                if self.wait_for_stopped(app_package, timeout=timeout):
+                    log.debug(f"앱 종료 완료 ({step_name}): {app_package}, {time.monotonic() - started:.2f}초")
+                    return True
+            except Exception as e:
+                log.debug(f"앱 상태 확인 실패: {e}")
+        log.warning(f"앱을 종료하지 못했습니다: {app_package}")
+        return False
+
+    def start_activity(self, app_package, app_activity, force_stop=False, timeout=30):
+        """
+        `am start -W`로 앱을 실행하고 첫 화면이 그려질 때까지 대기합니다.
+        앱 서랍을 거치지 않으므로 한 번의 명령으로 앱이 실행됩니다.
+
+        Args:
+            app_package: 앱 패키지 이름
+            app_activity: 실행할 Activity (AppConfig.app_activity)
+            force_stop: True이면 실행 전에 앱을 종료하여 cold start로 실행 (am start -S)
+            timeout: 명령 최대 실행 시간 (초)
+
+        Returns:
+            LaunchResult: 실행 결과
+        """
+        args = ['am', 'start', '-W']
+        if force_stop:
+            args.append('-S')
+        args += ['-n', f"{app_package}/{app_activity}"]
+        result = parse_am_start_output(self._adb_shell(*args, timeout=timeout))
+        self.last_launch = result
+        log.info(
+            f"앱 실행 ({result.launch_state or '알 수 없음'}): {result.activity or app_package}, "
+            f"TotalTime={result.total_time_ms}ms, WaitTime={result.wait_time_ms}ms"
+        )
+        return result
+
+    def open_uri(self, app_package, uri, timeout=30):
+        """
+        `am start -W`로 앱의 deep link를 열고 화면이 그려질 때까지 대기합니다.
+
+        Args:
+            app_package: deep link를 처리할 앱 패키지 이름
+            uri: 열 deep link (예: ohouseapp://mypage)
+            timeout: 명령 최대 실행 시간 (초)
+
+        Returns:
+            LaunchResult: 실행 결과 (앱이 처리하지 않는 URI이면 status가 None)
+        """
+        args = ['am', 'start', '-W', '-a', 'android.intent.action.VIEW', '-d', shlex.quote(uri), app_package]
+        result = parse_am_start_output(self._adb_shell(*args, timeout=timeout))
+        self.last_launch = result
+        log.info(f"deep link 실행 ({result.status or '실패'}): {uri}, TotalTime={result.total_time_ms}ms")
+        return result
+
+    def launch(self, app_package, app_activity, force_stop=False, timeout=30):
+        """
+        앱을 실행합니다. `am start -W`가 실패하면 activate_app 후 포그라운드 상태를 기다립니다.
+
+        Returns:
+            bool: 앱이 포그라운드에서 실행되었으면 True
+        """
+        try:
+            result = self.start_activity(app_package, app_activity, force_stop=force_stop, timeout=timeout)
+            if result.ok:
+                return True
+            log.warning(f"am start 실패 (Status: {result.status}), activate_app으로 실행합니다.")
+        except Exception as e:
+            log.warning(f"am start 실행 실패, activate_app으로 실행합니다: {e}")
+
+        if force_stop:
+            self.terminate(app_package)
+        self.driver.activate_app(app_package)
+        return self.wait_for_foreground(app_package, timeout=timeout)
+
+    def _adb_shell(self, *args, timeout=5):
+        # am start, force-stop 등 adb로 실행한 동작은 드라이버 명령으로 감지되지 않으므로 화면 식별 캐시를 직접 무효화
+        ScreenTracker.invalidate_driver(self.driver)
+        result = subprocess.run(
+            ['adb', '-s', self._device_serial(), 'shell', *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+        return result.stdout
@@ -0,0 +1,214 @@
+"""
+로그인 상태 스냅샷 모듈입니다.
+
+로그아웃이 필요한 테스트는 메인 홈 → 마이페이지 → 설정 → 스크롤 → 로그아웃까지 다섯 화면을 거쳐야 합니다.
+이 모듈은 로그아웃 상태의 앱 데이터 디렉터리(shared_prefs, databases 등)를 디바이스의 임시 디렉터리에 tar로 저장해 두고,
+이후에는 앱을 멈추고 저장한 파일을 되돌리는 것으로 상태를 복원합니다.
+복원은 AdbShell의 배치 명령 한 번으로 끝나므로 UI 조작 없이 수백 ms 안에 끝납니다.
+로그인 상태는 저장하지 않습니다. 저장한 뒤 다른 테스트가 로그아웃하면 서버에서 토큰이 만료될 수 있기 때문입니다.
+
+`run-as`를 사용하므로 디버그 빌드(debuggable=true)에서만 동작합니다.
+릴리즈 빌드에서는 is_supported()가 False를 반환하며, 테스트는 기존 UI 흐름으로 로그인/로그아웃합니다.
+스냅샷에는 로그인 토큰이 들어 있으므로 테스트 세션이 끝나면 discard_all()로 삭제합니다.
+"""
+import logging
+import shlex
+import weakref
+
+from src.adb import AdbShell, device_serial
+from src.app_lifecycle import AppLifecycle
+from src.config.settings import load_config
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+# 스냅샷을 저장할 디바이스 경로 (shell 사용자가 쓸 수 있는 위치)
+SNAPSHOT_DIR = "/data/local/tmp/auth_state"
+# 로그인 상태가 저장되는 앱 데이터 디렉터리 (cache, code_cache는 제외)
+STATE_PATHS = ("shared_prefs", "databases", "files", "no_backup")
+
+LOGGED_OUT = "logged_out"
+
+
+class AuthStateStore:
+    """
+    디바이스 하나의 앱 로그인 상태 스냅샷 저장소
+
+    Args:
+        serial: 디바이스 시리얼
+        app_package: 상태를 저장할 앱 패키지
+        shell: 명령을 실행할 AdbShell (None이면 시리얼별 공용 shell)
+    """
+
+    # (시리얼, 패키지)별로 공유되는 저장소
+    _stores = {}
+
+    def __init__(self, serial, app_package, shell=None):
+        self.serial = serial
+        self.app_package = app_package
+        self.shell = shell or AdbShell.for_serial(serial)
+        self.directory = f"{SNAPSHOT_DIR}/{app_package}"
+        # 이 세션에서 저장한 스냅샷 이름
+        self.snapshots = set()
+        self._supported = None
+
+    @classmethod
+    def for_serial(cls, serial, app_package):
+        """시리얼과 패키지별로 공유되는 저장소를 반환합니다."""
+        key = (serial, app_package)
+        store = cls._stores.get(key)
+        if store is None:
+            store = cls._stores[key] = cls(serial, app_package)
+        return store
+
+    @classmethod
+    def discard_all(cls):
+        """모든 저장소의 스냅샷을 디바이스에서 삭제합니다."""
+        stores = list(cls._stores.values())
+        cls._stores.clear()
+        for store in stores:
+            try:
+                store.discard()
+            except Exception as e:
+                log.warning(f"[{store.serial}] 로그인 상태 스냅샷 삭제 실패: {e}")
+
+    def _path(self, name):
+        return f"{self.directory}/{name}.tar"
+
+    def _run_as(self, command):
+        return f"run-as {self.app_package} sh -c {shlex.quote(command)}"
+
+    def is_supported(self):
+        """
+        앱 데이터 디렉터리에 접근할 수 있는지(run-as 사용 가능 여부) 확인합니다. 결과는 캐시됩니다.
+
+        Returns:
+            bool: 디버그 빌드라서 스냅샷을 저장/복원할 수 있으면 True
+        """
+        if self._supported is None:
+            self._supported = self.shell.run(f"run-as {self.app_package} id").ok
+            if not self._supported:
+                log.info(f"[{self.serial}] {self.app_package}는 run-as를 지원하지 않아 로그인 상태 스냅샷을 사용하지 않습니다.")
+        return self._supported
+
+    def has(self, name):
+        """이 세션에서 저장한 스냅샷이 있는지 확인합니다."""
+        return name in self.snapshots
+
+    def capture(self, name):
+        """
+        앱을 멈추고 현재 앱 데이터를 스냅샷으로 저장합니다. 앱은 종료된 상태로 남습니다.
+
+        Args:
+            name: 스냅샷 이름 (LOGGED_OUT 등)
+
+        Returns:
+            bool: 저장에 성공하면 True
+        """
+        if not self.is_supported():
+            return False
+        paths = " ".join(STATE_PATHS)
+        results = self.shell.run_batch([
+            f"am force-stop {self.app_package}",
+            f"mkdir -p {self.directory}",
+            # 없는 디렉터리는 tar 대상에서 제외
+            f"{self._run_as(f'tar -cf - $(ls -d {paths} 2>/dev/null)')} > {self._path(name)}",
+        ], timeout=30)
+        if not all(result.ok for result in results):
+            log.warning(f"[{self.serial}] 로그인 상태 '{name}' 저장 실패: {[result.output for result in results]}")
+            self.snapshots.discard(name)
+            return False
+        self.snapshots.add(name)
+        log.debug(f"[{self.serial}] 로그인 상태 '{name}' 저장")
+        return True
+
+    def restore(self, name):
+        """
+        앱을 멈추고 앱 데이터를 스냅샷으로 되돌립니다. 앱은 종료된 상태로 남습니다.
+
+        Args:
+            name: 스냅샷 이름
+
+        Returns:
+            bool: 복원에 성공하면 True (스냅샷이 없으면 False)
+        """
+        if not self.has(name):
+            return False
+        results = self.shell.run_batch([
+            f"am force-stop {self.app_package}",
+            self._run_as(f"rm -rf {' '.join(STATE_PATHS)}"),
+            f"{self._run_as('tar -xf -')} < {self._path(name)}",
+        ], timeout=30)
+        if not all(result.ok for result in results):
+            log.warning(f"[{self.serial}] 로그인 상태 '{name}' 복원 실패: {[result.output for result in results]}")
+            return False
+        log.debug(f"[{self.serial}] 로그인 상태 '{name}' 복원")
+        return True
+
+    def discard(self):
+        """저장한 스냅샷을 디바이스에서 삭제합니다."""
+        self.snapshots.clear()
+        self.shell.run(f"rm -rf {self.directory}")
+
+
+class AuthState:
+    """
+    드라이버 단위의 로그인 상태 저장/복원 helper
+    스냅샷을 저장하거나 복원한 뒤 앱을 다시 실행하여 테스트가 바로 다음 화면을 확인할 수 있게 합니다.
+
+    Args:
+        driver: Appium WebDriver
+        config: 앱 패키지/Activity를 읽을 AppConfig (None이면 프로세스 공용 설정)
+        store: 스냅샷 저장소 (None이면 디바이스 시리얼별 공용 저장소)
+    """
+
+    # 드라이버별 helper
+    _helpers = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver, config=None, store=None):
+        self.driver = driver
+        self.config = config or load_config()
+        self.store = store or AuthStateStore.for_serial(device_serial(driver), self.config.app_package)
+        self.lifecycle = AppLifecycle(driver)
+
+    @classmethod
+    def for_driver(cls, driver):
+        """드라이버별로 공유되는 helper를 반환합니다."""
+        helper = cls._helpers.get(driver)
+        if helper is None:
+            helper = cls._helpers[driver] = cls(driver)
+        return helper
+
+    def _launch(self):
+        return self.lifecycle.launch(self.config.app_package, self.config.app_activity)
+
+    def capture(self, name):
+        """
+        현재 로그인 상태를 저장하고 앱을 다시 실행합니다.
+
+        Returns:
+            bool: 저장에 성공하면 True (run-as를 지원하지 않으면 앱을 멈추지 않고 False)
+        """
+        captured = self.store.capture(name)
+        if self.store.is_supported():
+            # 저장 중 앱을 멈췄으므로 실패한 경우에도 다시 실행
+            self._launch()
+        return captured
+
+    def restore(self, name):
+        """
+        저장한 로그인 상태로 되돌리고 앱을 실행합니다.
+
+        Returns:
+            bool: 복원 후 앱이 실행되었으면 True. 스냅샷이 없거나 복원에 실패하면 False이며,
+                  이 경우 호출한 쪽에서 UI로 로그인/로그아웃합니다.
+        """
+        if not self.store.restore(name):
+            return False
+        return self._launch()
+
+    def capture_logged_out(self):
+        return self.capture(LOGGED_OUT)
+
+    def restore_logged_out(self):
+        return self.restore(LOGGED_OUT)
@@ -1,9 +1,18 @@
+"""
+환경 변수(.env) 설정 모듈입니다.
+
+.env와 환경 변수는 프로세스에서 처음 load_config()를 호출할 때 한 번만 읽어 변경할 수 없는 AppConfig로 만들고,
+이후 호출은 같은 객체를 반환합니다. page object는 생성 시 설정을 주입받아(BasePage.config) 메서드마다 다시 읽지 않습니다.
+    - override_config: 현재 프로세스(xdist 워커)의 설정 일부를 바꿈 (워커별 디바이스 등)
+    - reload_config: 환경 변수를 바꾼 뒤 설정을 다시 읽음
+"""
 import os
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, replace
 from dotenv import load_dotenv
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     appium_server_url: str
     platform_name: str
@@ -14,9 +23,23 @@ class AppConfig:
     app_activity: str
     login_id: str | None = None
     login_password: str | None = None
+    # 병렬 실행 시 워커별로 할당되는 디바이스 정보 (src/device_farm.py)
+    udid: str | None = None
+    system_port: int | None = None
+    mjpeg_server_port: int | None = None
 
 
-def load_config() -> AppConfig:
+# 프로세스 전역 설정 (load_config가 처음 호출될 때 생성)
+_lock = threading.Lock()
+_config: AppConfig | None = None
+_overrides = {}
+
+
+def read_config() -> AppConfig:
+    """
+    .env와 환경 변수를 읽어 새 AppConfig를 만듭니다. (캐시하지 않음)
+    이미 설정된 환경 변수는 .env의 값보다 우선합니다.
+    """
     load_dotenv()
 
     return AppConfig(
@@ -29,9 +52,67 @@ def load_config() -> AppConfig:
         app_activity=os.getenv("APP_ACTIVITY", "se.ohou.screen.splash.SplashActivity"),
         login_id=os.getenv("LOGIN_ID"),
         login_password=os.getenv("LOGIN_PASSWORD"),
+        udid=os.getenv("UDID") or None,
+        system_port=int(os.getenv("SYSTEM_PORT")) if os.getenv("SYSTEM_PORT") else None,
+        mjpeg_server_port=int(os.getenv("MJPEG_SERVER_PORT")) if os.getenv("MJPEG_SERVER_PORT") else None,
     )
 
 
+def load_config() -> AppConfig:
+    """
+    현재 프로세스의 설정을 반환합니다. 처음 호출될 때만 .env와 환경 변수를 읽습니다.
+
+    Returns:
+        AppConfig: override_config로 바꾼 값이 반영된 설정 (호출마다 같은 객체)
+    """
+    config = _config
+    if config is not None:
+        return config
+    return reload_config()
+
+
+def override_config(**changes) -> AppConfig:
+    """
+    현재 프로세스의 설정 일부를 바꿉니다. 이후 load_config()와 새로 만든 page object는 바뀐 설정을 사용합니다.
+    병렬 실행 시 워커마다 임대한 디바이스 정보를 반영하는 데 사용합니다.
+
+    Args:
+        **changes: 바꿀 AppConfig 필드와 값 (예: udid="emulator-5556", system_port=8201)
+
+    Returns:
+        AppConfig: 바뀐 설정
+
+    Raises:
+        TypeError: AppConfig에 없는 필드를 지정했을 때
+    """
+    global _config
+    with _lock:
+        base = _config or read_config()
+        config = replace(base, **changes)
+        _overrides.update(changes)
+        _config = config
+    return config
+
+
+def reload_config(keep_overrides=True) -> AppConfig:
+    """
+    .env와 환경 변수를 다시 읽어 설정을 새로 만듭니다. 환경 변수를 바꾼 뒤 호출합니다.
+    이미 만들어진 page object는 생성 시 주입받은 이전 설정을 계속 사용합니다.
+
+    Args:
+        keep_overrides: False이면 override_config로 바꾼 값도 초기화
+
+    Returns:
+        AppConfig: 새 설정
+    """
+    global _config
+    with _lock:
+        if not keep_overrides:
+            _overrides.clear()
+        _config = replace(read_config(), **_overrides)
+        return _config
+
+
 def build_capabilities(cfg: AppConfig, skip_app_launch: bool = False) -> dict:
     """
     Appium desired capabilities를 생성합니다.
@@ -47,6 +128,13 @@ def build_capabilities(cfg: AppConfig, skip_app_launch: bool = False) -> dict:
         "noReset": True,  # 앱 데이터 유지
         "uiautomator2ServerLaunchTimeout": 90000,  # UiAutomator2 서버 초기화 타임아웃 (90초)
     }
+    # 여러 디바이스를 동시에 사용할 때 디바이스와 UiAutomator2 서버/MJPEG 포트가 워커끼리 겹치지 않도록 지정
+    if cfg.udid:
+        caps["udid"] = cfg.udid
+    if cfg.system_port:
+        caps["systemPort"] = cfg.system_port
+    if cfg.mjpeg_server_port:
+        caps["mjpegServerPort"] = cfg.mjpeg_server_port
     # platformVersion이 비어있지 않을 때만 추가 (비어있으면 Appium이 자동 감지), Android 버전을 뜻함.
     if cfg.platform_version:
         caps["platformVersion"] = cfg.platform_version
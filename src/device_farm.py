@@ -0,0 +1,225 @@
+"""
+병렬 실행(pytest-xdist)을 위한 디바이스 할당 모듈입니다.
+
+디바이스 풀(udid, Appium 서버 URL, systemPort, mjpegServerPort 목록)을 정의하고,
+lock 파일에 건 OS 파일 잠금(POSIX flock, Windows msvcrt.locking)으로 각 xdist 워커가 디바이스 하나를 독점하도록 임대(lease)합니다.
+잠금은 파일을 연 프로세스가 종료되면 OS가 해제하므로, 비정상 종료한 워커의 lock 파일을 정리할 필요가 없습니다.
+임대한 디바이스 정보는 device_overrides로 워커의 설정(override_config)에 반영되어 build_capabilities가 워커별 capabilities를 만듭니다.
+
+디바이스 풀 파일 형식 (DEVICE_POOL_FILE 환경 변수로 경로 지정):
+    [
+        {"udid": "emulator-5554", "appium_server_url": "http://127.0.0.1:4723", "system_port": 8200, "mjpeg_server_port": 7810},
+        {"udid": "emulator-5556", "appium_server_url": "http://127.0.0.1:4723", "system_port": 8201, "mjpeg_server_port": 7811}
+    ]
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from src.config.settings import AppConfig
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+# UiAutomator2 드라이버의 기본 포트
+DEFAULT_SYSTEM_PORT = 8200
+DEFAULT_MJPEG_SERVER_PORT = 7810
+
+# 디바이스 lock 파일을 두는 디렉토리 (같은 호스트의 모든 워커가 공유)
+DEFAULT_LOCK_DIR = Path(tempfile.gettempdir()) / "appium-device-locks"
+
+
+@dataclass(frozen=True)
+class Device:
+    """
+    디바이스 풀의 디바이스 한 대
+
+    Attributes:
+        udid: adb 시리얼 (예: emulator-5554)
+        appium_server_url: 이 디바이스를 담당하는 Appium 서버 URL
+        system_port: UiAutomator2 서버 포트 (디바이스마다 달라야 함)
+        mjpeg_server_port: MJPEG 스크린 스트리밍 포트 (디바이스마다 달라야 함)
+    """
+    udid: str
+    appium_server_url: str
+    system_port: int
+    mjpeg_server_port: int
+
+
+def load_device_pool(cfg: AppConfig, path=None):
+    """
+    디바이스 풀을 읽어옵니다.
+    path(또는 DEVICE_POOL_FILE 환경 변수)가 없으면 AppConfig의 디바이스 한 대로 구성된 풀을 반환합니다.
+
+    Args:
+        cfg: 기본 AppConfig
+        path: 디바이스 풀 JSON 파일 경로
+
+    Returns:
+        list[Device]: 디바이스 목록
+    """
+    path = path or os.getenv("DEVICE_POOL_FILE")
+    if not path:
+        return [Device(
+            udid=cfg.udid or cfg.device_name,
+            appium_server_url=cfg.appium_server_url,
+            system_port=cfg.system_port or DEFAULT_SYSTEM_PORT,
+            mjpeg_server_port=cfg.mjpeg_server_port or DEFAULT_MJPEG_SERVER_PORT,
+        )]
+
+    entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    devices = []
+    for index, entry in enumerate(entries):
+        devices.append(Device(
+            udid=entry["udid"],
+            appium_server_url=entry.get("appium_server_url", cfg.appium_server_url),
+            system_port=entry.get("system_port", DEFAULT_SYSTEM_PORT + index),
+            mjpeg_server_port=entry.get("mjpeg_server_port", DEFAULT_MJPEG_SERVER_PORT + index),
+        ))
+    if len({d.udid for d in devices}) != len(devices):
+        raise ValueError(f"디바이스 풀에 중복된 udid가 있습니다: {path}")
+    return devices
+
+
+def device_overrides(device: Device) -> dict:
+    """임대한 디바이스 정보로 바꿀 AppConfig 필드를 반환합니다. (override_config에 전달)"""
+    return {
+        "device_name": device.udid,
+        "udid": device.udid,
+        "appium_server_url": device.appium_server_url,
+        "system_port": device.system_port,
+        "mjpeg_server_port": device.mjpeg_server_port,
+    }
+
+
+def config_for_device(cfg: AppConfig, device: Device) -> AppConfig:
+    """임대한 디바이스 정보를 반영한 AppConfig를 반환합니다."""
+    return replace(cfg, **device_overrides(device))
+
+
+def worker_index(worker_id):
+    """xdist 워커 id("gw0", "gw1", ...)를 숫자로 변환합니다. 워커가 아니면 0을 반환합니다."""
+    if worker_id and worker_id.startswith("gw") and worker_id[2:].isdigit():
+        return int(worker_id[2:])
+    return 0
+
+
+class DeviceLease:
+    """
+    lock 파일의 잠금으로 디바이스 한 대를 독점 임대합니다.
+
+    Args:
+        device: 임대한 디바이스
+        lock_path: 임대를 표시하는 lock 파일 경로
+        fd: 잠금을 유지하는 lock 파일 descriptor (반납할 때까지 열어 둠)
+    """
+
+    def __init__(self, device, lock_path, fd=None):
+        self.device = device
+        self.lock_path = lock_path
+        self.fd = fd
+
+    def release(self):
+        """
+        임대를 반납합니다.
+        lock 파일은 삭제하지 않습니다. (삭제하면 이미 파일을 연 다른 워커가 삭제된 파일을 잠그고,
+        그 사이 새 파일을 만든 워커와 같은 디바이스를 임대할 수 있음)
+        """
+        if self.fd is None:
+            return
+        _unlock(self.fd)
+        os.close(self.fd)
+        self.fd = None
+        log.info(f"디바이스 반납: {self.device.udid}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+def _lock(fd):
+    """fd의 파일을 기다리지 않고 잠급니다. 다른 프로세스(또는 다른 fd)가 잠그고 있으면 False를 반환합니다."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _try_lock(lock_path):
+    """
+    lock 파일을 잠급니다. 파일이 비어 있거나 다른 프로세스의 pid가 남아 있어도 잠금만으로 판단합니다.
+
+    Returns:
+        int | None: 잠금을 유지하는 fd, 다른 워커가 임대 중이면 None
+    """
+    fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
+    if not _lock(fd):
+        os.close(fd)
+        return None
+    # pid는 사람이 확인하기 위한 정보일 뿐 임대 판단에는 사용하지 않음 (Windows는 잠근 첫 바이트 뒤에 기록)
+    offset = 0 if fcntl is not None else 1
+    os.ftruncate(fd, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    os.write(fd, str(os.getpid()).encode())
+    return fd
+
+
+def lease_device(devices, worker_id=None, timeout=600, poll_interval=1.0, lock_dir=DEFAULT_LOCK_DIR):
+    """
+    디바이스 풀에서 사용 중이지 않은 디바이스 한 대를 임대합니다.
+    워커 번호에 해당하는 디바이스(gw1 → 두 번째 디바이스)부터 시도하여 워커마다 고정된 디바이스를 쓰도록 합니다.
+
+    Args:
+        devices: 디바이스 목록
+        worker_id: xdist 워커 id (예: "gw0")
+        timeout: 모든 디바이스가 사용 중일 때 기다리는 최대 시간 (초)
+        poll_interval: 재시도 간격 (초)
+        lock_dir: lock 파일 디렉토리
+
+    Returns:
+        DeviceLease: 임대 정보
+
+    Raises:
+        TimeoutError: timeout 안에 디바이스를 임대하지 못했을 때
+    """
+    lock_dir = Path(lock_dir)
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    start = worker_index(worker_id) % len(devices)
+    ordered = devices[start:] + devices[:start]
+
+    deadline = time.monotonic() + timeout
+    while True:
+        for device in ordered:
+            lock_path = lock_dir / f"{device.udid.replace(':', '_')}.lock"
+            fd = _try_lock(lock_path)
+            if fd is not None:
+                log.info(f"디바이스 임대: {device.udid} (워커: {worker_id or 'master'})")
+                return DeviceLease(device, lock_path, fd)
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"{timeout}초 이내에 사용 가능한 디바이스가 없습니다: {[d.udid for d in devices]}")
+        time.sleep(poll_interval)
@@ -2,6 +2,8 @@ from appium import webdriver
 from appium.options.android import UiAutomator2Options
 
 from src.config.settings import AppConfig, build_capabilities, load_config
+from src.implicit_wait import DEFAULT_IMPLICIT_WAIT, set_implicit_wait
+from src.remote_connection import PooledAppiumConnection
 
 
 def create_driver(cfg: AppConfig | None = None, skip_app_launch: bool = False) -> webdriver.Remote:
@@ -16,7 +18,9 @@ def create_driver(cfg: AppConfig | None = None, skip_app_launch: bool = False) -
     caps = build_capabilities(config, skip_app_launch=skip_app_launch)
     options = UiAutomator2Options().load_capabilities(caps)
 
-    driver = webdriver.Remote(command_executor=config.appium_server_url, options=options)
-    driver.implicitly_wait(10)
+    # 백그라운드 스레드의 명령과 겹쳐도 연결을 재사용하도록 풀 크기를 늘린 연결 사용
+    driver = webdriver.Remote(command_executor=PooledAppiumConnection(config.appium_server_url), options=options)
+    # implicit wait은 src.implicit_wait을 통해 설정해야 BasePage의 probe 조회가 현재 값을 추적할 수 있음
+    set_implicit_wait(driver, DEFAULT_IMPLICIT_WAIT)
     return driver
 
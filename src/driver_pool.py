@@ -0,0 +1,120 @@
+"""
+Appium WebDriver 세션 풀 모듈입니다.
+
+UiAutomator2 세션 생성(수~수십 초)을 테스트마다 반복하지 않도록 세션을 테스트 간에 재사용합니다.
+테스트에 세션을 넘겨주기 전에 세션이 살아있는지 확인하고(health-check), 죽은 세션만 새로 생성하며,
+등록된 reset hook으로 이전 테스트가 남긴 상태(실행 중인 앱, 끊긴 네트워크 등)를 정리합니다.
+"""
+import logging
+import time
+
+from selenium.webdriver.remote.command import Command
+
+from src.driver import create_driver
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+
+class DriverPool:
+    """
+    테스트 간에 재사용되는 WebDriver 세션 풀
+
+    Args:
+        factory: 새 세션을 만드는 함수 (skip_app_launch 키워드 인자를 받음)
+        reset_hooks: 세션을 넘겨주기 전에 실행할 함수 목록. hook(driver, keep_app_state) 형태로 호출됨
+    """
+
+    def __init__(self, factory=create_driver, reset_hooks=()):
+        self.factory = factory
+        self.reset_hooks = list(reset_hooks)
+        self._idle = {}
+        self.created = 0
+        self.reused = 0
+        self.recreated = 0
+
+    def acquire(self, skip_app_launch=True, fresh=False, keep_app_state=False):
+        """
+        세션을 하나 가져옵니다.
+
+        Args:
+            skip_app_launch: create_driver에 전달할 값 (같은 값으로 만든 세션끼리만 재사용)
+            fresh: True이면 기존 세션을 종료하고 새 세션을 생성
+            keep_app_state: True이면 reset hook이 앱 상태를 유지 (이전 테스트의 화면에서 이어지는 테스트용)
+
+        Returns:
+            webdriver.Remote: 사용할 세션
+        """
+        idle = self._idle.setdefault(skip_app_launch, [])
+        driver = None
+
+        if fresh:
+            # 한 디바이스에는 UiAutomator2 세션이 하나만 동작하므로 새 세션을 만들기 전에 기존 세션을 종료
+            while idle:
+                self._quit(idle.pop())
+        while idle and driver is None:
+            candidate = idle.pop()
+            if self.is_alive(candidate):
+                driver = candidate
+                self.reused += 1
+            else:
+                log.warning("세션이 종료되어 새 세션을 생성합니다.")
+                self._quit(candidate)
+                self.recreated += 1
+
+        if driver is None:
+            started = time.monotonic()
+            driver = self.factory(skip_app_launch=skip_app_launch)
+            self.created += 1
+            log.info(f"새 세션 생성: {driver.session_id} ({time.monotonic() - started:.1f}초)")
+        else:
+            self._reset(driver, keep_app_state)
+        return driver
+
+    def release(self, driver, skip_app_launch=True, discard=False):
+        """
+        사용이 끝난 세션을 풀에 반환합니다.
+
+        Args:
+            driver: 반환할 세션
+            skip_app_launch: acquire할 때 사용한 값
+            discard: True이면 재사용하지 않고 종료
+        """
+        if discard:
+            self._quit(driver)
+            return
+        self._idle.setdefault(skip_app_launch, []).append(driver)
+
+    def close(self):
+        """풀에 남아있는 모든 세션을 종료합니다."""
+        for idle in self._idle.values():
+            while idle:
+                self._quit(idle.pop())
+        log.info(f"세션 풀 종료: 생성 {self.created}회, 재사용 {self.reused}회, 재생성 {self.recreated}회")
+
+    @staticmethod
+    def is_alive(driver):
+        """
+        세션이 살아있는지 확인합니다.
+        디바이스와 통신하지 않는 timeouts 조회로 확인하므로 비용이 작습니다.
+        """
+        try:
+            driver.execute(Command.GET_TIMEOUTS)
+            return True
+        except Exception as e:
+            log.debug(f"세션 health-check 실패: {e}")
+            return False
+
+    def _reset(self, driver, keep_app_state):
+        for hook in self.reset_hooks:
+            try:
+                hook(driver, keep_app_state)
+            except Exception as e:
+                log.warning(f"세션 reset hook '{getattr(hook, '__name__', hook)}' 실패: {e}")
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            log.debug(f"세션 종료 실패 (무시): {e}")
@@ -0,0 +1,499 @@
+"""
+Appium page_source(XML)를 한 번만 가져와 메모리 상의 요소 트리로 파싱하고,
+page object에서 사용하는 locator를 디바이스에 보내지 않고 로컬에서 평가하는 모듈입니다.
+
+지원 범위:
+    - UiSelector: resourceId, text, textContains, description, descriptionContains,
+      className, instance, scrollable
+    - XPath: 절대/상대 경로(/, //), 태그 이름 또는 *, 위치 predicate([n]),
+      속성 비교([@attr="value"]), contains(@attr, "value"), and 조건, (경로)[n]
+
+지원하지 않는 locator는 UnsupportedLocator 예외를 발생시키며,
+호출 측에서 실제 WebDriver 조회(live lookup)로 fallback 합니다.
+"""
+import re
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+
+class UnsupportedLocator(ValueError):
+    """로컬 평가기가 해석할 수 없는 locator일 때 발생하는 예외"""
+
+
+# 색인을 만드는 XML 속성 (resource-id, text, content-desc, class)
+INDEXED_ATTRIBUTES = ("resource-id", "text", "content-desc", "class")
+
+
+def _parse_string_literal(source, pos):
+    """
+    source[pos]에서 시작하는 따옴표 문자열을 읽습니다.
+
+    Returns:
+        tuple: (문자열 값, 닫는 따옴표 다음 위치)
+    """
+    quote = source[pos]
+    pos += 1
+    chars = []
+    while pos < len(source):
+        ch = source[pos]
+        if ch == "\\" and pos + 1 < len(source):
+            chars.append(source[pos + 1])
+            pos += 2
+            continue
+        if ch == quote:
+            return "".join(chars), pos + 1
+        chars.append(ch)
+        pos += 1
+    raise UnsupportedLocator(f"닫히지 않은 문자열입니다: {source}")
+
+
+def parse_uiselector(selector):
+    """
+    'new UiSelector().resourceId("...").text("...")' 형태의 문자열을 (메서드, 인자) 리스트로 변환합니다.
+    인자 안에 괄호가 포함되어도(예: '비밀번호을(를)') 올바르게 파싱합니다.
+
+    Args:
+        selector: UiSelector 문자열
+
+    Returns:
+        list: [(method_name, argument), ...]
+    """
+    source = selector.strip().rstrip(";").strip()
+    prefix = "new UiSelector()"
+    if not source.startswith(prefix):
+        raise UnsupportedLocator(f"UiSelector 체인이 아닙니다: {selector}")
+
+    calls = []
+    pos = len(prefix)
+    while pos < len(source):
+        match = re.compile(r"\s*\.\s*(\w+)\s*\(\s*").match(source, pos)
+        if not match:
+            raise UnsupportedLocator(f"UiSelector 체인을 해석할 수 없습니다: {selector}")
+        method = match.group(1)
+        pos = match.end()
+        if pos < len(source) and source[pos] in "\"'":
+            argument, pos = _parse_string_literal(source, pos)
+        else:
+            end = source.find(")", pos)
+            if end < 0:
+                raise UnsupportedLocator(f"UiSelector 체인을 해석할 수 없습니다: {selector}")
+            argument = source[pos:end].strip()
+            pos = end
+        closing = re.compile(r"\s*\)").match(source, pos)
+        if not closing:
+            raise UnsupportedLocator(f"UiSelector 체인을 해석할 수 없습니다: {selector}")
+        pos = closing.end()
+        calls.append((method, argument))
+    return calls
+
+
+def _split_outside(source, separator):
+    """따옴표와 대괄호/소괄호 바깥에 있는 separator를 기준으로 문자열을 분리합니다."""
+    parts = []
+    quote = None
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(source):
+        ch = source[i]
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        elif depth == 0 and source.startswith(separator, i):
+            parts.append(source[start:i])
+            i += len(separator)
+            start = i
+            continue
+        i += 1
+    parts.append(source[start:])
+    return parts
+
+
+def _split_predicates(step):
+    """'tag[a][b]' 형태의 step을 (tag, [a, b])로 분리합니다."""
+    bracket = step.find("[")
+    if bracket < 0:
+        return step.strip(), []
+    name = step[:bracket].strip()
+    predicates = []
+    quote = None
+    depth = 0
+    start = None
+    for i in range(bracket, len(step)):
+        ch = step[i]
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "[":
+            if depth == 0:
+                start = i + 1
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+            if depth == 0:
+                predicates.append(step[start:i].strip())
+        elif depth == 0 and not ch.isspace():
+            raise UnsupportedLocator(f"지원하지 않는 XPath step입니다: {step}")
+    if depth != 0:
+        raise UnsupportedLocator(f"대괄호가 닫히지 않았습니다: {step}")
+    return name, predicates
+
+
+_XPATH_EQUALS = re.compile(r"""^@([\w-]+)\s*=\s*(["'])(.*)\2$""", re.S)
+_XPATH_CONTAINS = re.compile(r"""^contains\(\s*@([\w-]+)\s*,\s*(["'])(.*)\2\s*\)$""", re.S)
+_XPATH_HAS_ATTRIBUTE = re.compile(r"^@([\w-]+)$")
+_XPATH_NAME = re.compile(r"^(?:[\w.$-]+|\*)$")
+
+
+def _compile_condition(condition):
+    """XPath 조건식 하나를 (node → bool) 함수로 변환합니다."""
+    match = _XPATH_EQUALS.match(condition)
+    if match:
+        attribute, expected = match.group(1), match.group(3)
+        return lambda node: node.get(attribute) == expected, (attribute, expected)
+    match = _XPATH_CONTAINS.match(condition)
+    if match:
+        attribute, expected = match.group(1), match.group(3)
+        return lambda node: expected in (node.get(attribute) or ""), None
+    match = _XPATH_HAS_ATTRIBUTE.match(condition)
+    if match:
+        attribute = match.group(1)
+        return lambda node: node.get(attribute) is not None, None
+    raise UnsupportedLocator(f"지원하지 않는 XPath 조건입니다: {condition}")
+
+
+class _XPathStep:
+    """XPath location step 하나 (axis, 이름, predicate 목록)"""
+
+    def __init__(self, descendant, step):
+        self.descendant = descendant
+        name, predicates = _split_predicates(step)
+        if not _XPATH_NAME.match(name):
+            raise UnsupportedLocator(f"지원하지 않는 XPath step입니다: {step}")
+        self.name = name
+        # predicate: ("position", n) 또는 ("filter", [함수...], [색인 가능한 (속성, 값)...])
+        self.predicates = []
+        for predicate in predicates:
+            if predicate.isdigit():
+                self.predicates.append(("position", int(predicate)))
+                continue
+            functions = []
+            equalities = []
+            for condition in _split_outside(predicate, " and "):
+                function, equality = _compile_condition(condition.strip())
+                functions.append(function)
+                if equality:
+                    equalities.append(equality)
+            self.predicates.append(("filter", functions, equalities))
+
+    def matches_name(self, node):
+        return self.name == "*" or node.tag == self.name
+
+
+def parse_xpath(xpath):
+    """
+    프로젝트에서 사용하는 XPath 부분집합을 파싱합니다.
+
+    Returns:
+        tuple: (step 리스트, 전체 결과에 적용할 위치 인덱스 또는 None)
+    """
+    source = xpath.strip()
+    position = None
+    grouped = re.match(r"^\((.*)\)\s*\[(\d+)\]$", source, re.S)
+    if grouped:
+        source, position = grouped.group(1).strip(), int(grouped.group(2))
+    if not source.startswith("/"):
+        raise UnsupportedLocator(f"지원하지 않는 XPath입니다: {xpath}")
+
+    steps = []
+    parts = _split_outside(source, "/")
+    # 선행 '/' 때문에 첫 요소는 항상 빈 문자열
+    descendant = False
+    for part in parts[1:]:
+        if part == "":
+            if descendant:
+                raise UnsupportedLocator(f"지원하지 않는 XPath입니다: {xpath}")
+            descendant = True
+            continue
+        steps.append(_XPathStep(descendant, part))
+        descendant = False
+    if not steps or descendant:
+        raise UnsupportedLocator(f"지원하지 않는 XPath입니다: {xpath}")
+    return steps, position
+
+
+def compile_uiselector(selector):
+    """
+    UiSelector 체인을 로컬 평가용 조건으로 변환합니다.
+
+    Returns:
+        tuple: (정확히 일치해야 하는 (속성, 값) 리스트, 추가 필터 함수 리스트, instance 또는 None)
+    """
+    equalities = []
+    filters = []
+    instance = None
+    for method, argument in parse_uiselector(selector):
+        if method == "resourceId":
+            equalities.append(("resource-id", argument))
+        elif method == "text":
+            equalities.append(("text", argument))
+        elif method == "description":
+            equalities.append(("content-desc", argument))
+        elif method == "className":
+            equalities.append(("class", argument))
+        elif method == "textContains":
+            filters.append(lambda node, value=argument: value in (node.get("text") or ""))
+        elif method == "descriptionContains":
+            filters.append(lambda node, value=argument: value in (node.get("content-desc") or ""))
+        elif method == "scrollable":
+            expected = argument.strip().lower() or "true"
+            filters.append(lambda node, value=expected: node.get("scrollable", "false") == value)
+        elif method == "instance":
+            try:
+                instance = int(argument)
+            except ValueError:
+                raise UnsupportedLocator(f"instance 인자가 정수가 아닙니다: {selector}")
+        else:
+            raise UnsupportedLocator(f"지원하지 않는 UiSelector 메서드입니다: {method}")
+    return equalities, filters, instance
+
+
+_SIMPLE_STRATEGIES = (AppiumBy.ID, AppiumBy.ACCESSIBILITY_ID, AppiumBy.CLASS_NAME)
+
+
+def is_supported(locator):
+    """
+    locator를 로컬 스냅샷에서 평가할 수 있는지 확인합니다.
+
+    Args:
+        locator: (by, value) 형태의 locator
+
+    Returns:
+        bool: 로컬 평가가 가능하면 True
+    """
+    if not isinstance(locator, tuple) or len(locator) != 2:
+        return False
+    by, value = locator
+    try:
+        if by == AppiumBy.ANDROID_UIAUTOMATOR:
+            compile_uiselector(value)
+        elif by == AppiumBy.XPATH:
+            parse_xpath(value)
+        elif by not in _SIMPLE_STRATEGIES:
+            return False
+    except UnsupportedLocator:
+        return False
+    return True
+
+
+class PageSnapshot:
+    """
+    driver.page_source 한 번으로 만든 화면 계층 구조의 스냅샷입니다.
+    resource-id, text, content-desc, class 속성별 색인을 만들어 두므로
+    스냅샷 생성 이후의 조회는 디바이스와 통신하지 않고 빠르게 처리됩니다.
+    """
+
+    def __init__(self, page_source):
+        self.page_source = page_source
+        self.root = ET.fromstring(page_source)
+        # 최상위 <hierarchy> 노드를 제외한 모든 노드 (문서 순서)
+        self.nodes = []
+        self._order = {}
+        self._parent = {}
+        self._index = {attribute: defaultdict(list) for attribute in INDEXED_ATTRIBUTES}
+        for node in self.root.iter():
+            self._order[id(node)] = len(self._order)
+            for child in node:
+                self._parent[id(child)] = node
+            if node is self.root:
+                continue
+            self.nodes.append(node)
+            for attribute in INDEXED_ATTRIBUTES:
+                value = node.get(attribute)
+                # 대부분의 노드가 갖는 빈 값은 색인하지 않음 (빈 값 조회는 전체 노드에서 찾음)
+                if value:
+                    self._index[attribute][value].append(node)
+
+    @classmethod
+    def capture(cls, driver):
+        """드라이버에서 page_source를 한 번 가져와 스냅샷을 생성합니다."""
+        return cls(driver.page_source)
+
+    @property
+    def package(self):
+        """스냅샷이 캡처된 화면의 앱 패키지 이름 (알 수 없으면 None)"""
+        for node in self.nodes:
+            package = node.get("package")
+            if package:
+                return package
+        return None
+
+    def resource_ids(self):
+        """스냅샷에 존재하는 resource-id 집합을 반환합니다."""
+        return set(self._index["resource-id"])
+
+    def lookup(self, attribute, value):
+        """색인을 이용해 속성 값이 정확히 일치하는 노드들을 문서 순서대로 반환합니다."""
+        # 빈 값은 색인하지 않으므로 (예: text="") 전체 노드에서 찾음
+        if attribute not in self._index or not value:
+            return [node for node in self.nodes if node.get(attribute) == value]
+        return list(self._index[attribute].get(value, ()))
+
+    @staticmethod
+    def text_of(node):
+        """WebElement.text 또는 content-desc와 동일한 방식으로 노드의 텍스트를 반환합니다."""
+        return node.get("text") or node.get("content-desc") or ""
+
+    @staticmethod
+    def is_displayed(node):
+        """노드가 화면에 표시되는지 확인합니다. displayed 속성이 없으면 표시된 것으로 간주합니다."""
+        return node.get("displayed", "true") == "true"
+
+    def find_all(self, locator):
+        """
+        locator와 일치하는 모든 노드를 문서 순서대로 반환합니다.
+
+        Args:
+            locator: (by, value) 형태의 locator
+
+        Returns:
+            list: 일치하는 노드 리스트
+
+        Raises:
+            UnsupportedLocator: 로컬에서 평가할 수 없는 locator인 경우
+        """
+        if not isinstance(locator, tuple) or len(locator) != 2:
+            raise UnsupportedLocator(f"Invalid locator format: {locator}")
+        by, value = locator
+        if by == AppiumBy.ANDROID_UIAUTOMATOR:
+            return self._find_by_uiselector(value)
+        if by == AppiumBy.XPATH:
+            return self._find_by_xpath(value)
+        if by == AppiumBy.ID:
+            return self.lookup("resource-id", value)
+        if by == AppiumBy.ACCESSIBILITY_ID:
+            return self.lookup("content-desc", value)
+        if by == AppiumBy.CLASS_NAME:
+            return self.lookup("class", value)
+        raise UnsupportedLocator(f"지원하지 않는 locator 전략입니다: {by}")
+
+    def find(self, locator, displayed_only=True):
+        """
+        locator와 일치하는 첫 번째 노드를 반환합니다.
+
+        Args:
+            locator: (by, value) 형태의 locator
+            displayed_only: True이면 화면에 표시된 노드만 대상으로 함
+
+        Returns:
+            Element | None: 일치하는 노드, 없으면 None
+        """
+        for node in self.find_all(locator):
+            if not displayed_only or self.is_displayed(node):
+                return node
+        return None
+
+    def is_present(self, locator, displayed_only=False):
+        """locator와 일치하는 노드가 스냅샷에 있는지 확인합니다."""
+        return self.find(locator, displayed_only=displayed_only) is not None
+
+    def _candidates(self, equalities):
+        """
+        정확히 일치해야 하는 (속성, 값) 조건 중 가장 선택적인 색인으로 후보 노드를 좁힙니다.
+        빈 값 조건(예: text(""), [@text=""])은 색인에 없으므로 후보를 좁히는 데 사용하지 않습니다.
+        """
+        best = None
+        for attribute, value in equalities:
+            if attribute in self._index and value:
+                candidates = self._index[attribute].get(value, ())
+                if best is None or len(candidates) < len(best):
+                    best = candidates
+        return self.nodes if best is None else best
+
+    def _find_by_uiselector(self, selector):
+        equalities, filters, instance = compile_uiselector(selector)
+        matches = [
+            node for node in self._candidates(equalities)
+            if all(node.get(attribute) == value for attribute, value in equalities)
+            and all(function(node) for function in filters)
+        ]
+        if instance is not None:
+            # UiSelector의 instance는 0부터 시작
+            return matches[instance:instance + 1]
+        return matches
+
+    def _children(self, node):
+        return [self.root] if node is None else list(node)
+
+    def _descendants_or_self(self, node):
+        if node is None:
+            return [None] + [self.root] + self.nodes
+        return list(node.iter())
+
+    def _find_by_xpath(self, xpath):
+        steps, position = parse_xpath(xpath)
+
+        # None은 문서 노드(최상위 <hierarchy>의 부모)를 의미
+        context = [None]
+        for index, step in enumerate(steps):
+            results = []
+            seen = set()
+            if step.descendant and index == 0 and step.predicates and step.predicates[0][0] == "filter":
+                # '//tag[@resource-id="..."]' 형태는 색인으로 후보를 좁혀서 부모별로 묶음
+                groups = self._group_by_parent(self._candidates(step.predicates[0][2]), step)
+            else:
+                groups = []
+                for context_node in context:
+                    parents = self._descendants_or_self(context_node) if step.descendant else [context_node]
+                    for parent in parents:
+                        groups.append([child for child in self._children(parent) if step.matches_name(child)])
+            for group in groups:
+                for node in self._apply_predicates(group, step.predicates):
+                    if id(node) not in seen:
+                        seen.add(id(node))
+                        results.append(node)
+            context = sorted(results, key=lambda node: self._order[id(node)])
+
+        if position is not None:
+            # XPath의 위치 인덱스는 1부터 시작
+            return context[position - 1:position]
+        return context
+
+    def _group_by_parent(self, candidates, step):
+        """
+        색인 후보 노드들을 부모 기준으로 묶습니다.
+        위치 predicate는 같은 부모의 형제들 사이에서 평가되어야 하므로
+        부모의 전체 자식 목록에서 이름이 일치하는 노드들을 그룹으로 사용합니다.
+        """
+        if not any(kind == "position" for kind, *_ in step.predicates):
+            return [[node for node in candidates if step.matches_name(node)]]
+        groups = []
+        visited = set()
+        for node in candidates:
+            parent = self._parent.get(id(node))
+            key = id(parent)
+            if key in visited:
+                continue
+            visited.add(key)
+            groups.append([child for child in self._children(parent) if step.matches_name(child)])
+        return groups
+
+    @staticmethod
+    def _apply_predicates(nodes, predicates):
+        for predicate in predicates:
+            if predicate[0] == "position":
+                nodes = nodes[predicate[1] - 1:predicate[1]]
+            else:
+                functions = predicate[1]
+                nodes = [node for node in nodes if all(function(node) for function in functions)]
+        return nodes
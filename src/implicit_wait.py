@@ -0,0 +1,164 @@
+"""
+WebDriver implicit wait 상태를 관리하는 모듈입니다.
+
+implicit wait은 요소가 없을 때 find_element(s)를 그 시간만큼 블로킹시키므로,
+create_driver는 세션을 implicit wait 0으로 만들고 요소 대기는 page object의 명시적 대기(WebDriverWait, WaitScheduler)로만 수행합니다.
+(implicit wait이 0보다 크면 probe 조회마다 implicit wait을 0으로 바꿨다가 되돌리는 setTimeouts 왕복이 두 번씩 필요함)
+이 모듈은 드라이버별 implicit wait 값을 추적하여 값이 바뀔 때만 명령을 보내고,
+블록을 벗어나면 이전 값으로 안전하게 복원합니다. 세션 값이 0이면 probe의 implicit_wait(driver, 0)은 명령을 보내지 않습니다.
+
+측정 모드(ImplicitWaitMeter)는 측정하는 동안 세션에 이전 기본값(10초)의 implicit wait을 적용하고,
+각 테스트가 implicit wait 때문에 블로킹된 시간을 기록합니다. (기본값 0에서는 블로킹이 생기지 않으므로
+probe 등 implicit wait을 0으로 두지 않는 조회 경로가 남아 있는지 확인하는 용도)
+"""
+import logging
+import time
+import weakref
+from contextlib import contextmanager
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.command import Command
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+# create_driver에서 설정하는 기본 implicit wait (초). 요소 대기는 명시적 대기로만 수행
+DEFAULT_IMPLICIT_WAIT = 0
+
+# 측정 모드에서 세션에 적용하는 implicit wait (초). implicit wait 관리 계층 도입 전 create_driver의 값
+MEASURE_IMPLICIT_WAIT = 10
+
+# 드라이버별 현재 implicit wait 값 (초)
+_implicit_waits = weakref.WeakKeyDictionary()
+
+_FIND_COMMANDS = (
+    Command.FIND_ELEMENT,
+    Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT,
+    Command.FIND_CHILD_ELEMENTS,
+)
+
+
+def get_implicit_wait(driver):
+    """
+    추적 중인 드라이버의 implicit wait 값을 반환합니다.
+
+    Returns:
+        float | None: implicit wait (초), 이 모듈을 통해 설정된 적이 없으면 None
+    """
+    return _implicit_waits.get(driver)
+
+
+def set_implicit_wait(driver, seconds):
+    """드라이버의 implicit wait을 설정하고 값을 기록합니다. 값이 같으면 명령을 보내지 않습니다."""
+    if _implicit_waits.get(driver) == seconds:
+        return
+    driver.implicitly_wait(seconds)
+    _implicit_waits[driver] = seconds
+
+
+@contextmanager
+def implicit_wait(driver, seconds):
+    """
+    블록 안에서만 implicit wait을 seconds로 변경하고, 블록을 벗어나면 이전 값으로 복원합니다.
+    이미 같은 값이면 아무 명령도 보내지 않으므로 중첩해서 사용해도 추가 비용이 없습니다.
+
+    Example:
+        with implicit_wait(driver, 0):
+            elements = driver.find_elements(*locator)
+    """
+    previous = get_implicit_wait(driver)
+    if previous == seconds:
+        yield
+        return
+
+    set_implicit_wait(driver, seconds)
+    try:
+        yield
+    finally:
+        restore_to = DEFAULT_IMPLICIT_WAIT if previous is None else previous
+        try:
+            set_implicit_wait(driver, restore_to)
+        except Exception as e:
+            # 세션이 종료된 경우 등: 다음 설정 시 다시 명령을 보내도록 추적 값을 제거
+            _implicit_waits.pop(driver, None)
+            log.warning(f"implicit wait 복원 실패 ({restore_to}초): {e}")
+
+
+class ImplicitWaitMeter:
+    """
+    implicit wait 때문에 블로킹된 시간을 측정합니다.
+
+    세션의 implicit wait은 기본값 0이므로, 측정하는 동안 세션에 implicit_wait을 적용하고 detach 시 되돌립니다.
+    드라이버의 execute를 감싸서, implicit wait이 0보다 큰 상태에서 실행된 요소 조회 명령이
+    요소를 찾지 못한 경우(NoSuchElement 또는 빈 리스트) 그 소요 시간을 블로킹 시간으로 기록합니다.
+
+    Args:
+        implicit_wait: 측정하는 동안 세션에 적용할 implicit wait (초)
+    """
+
+    def __init__(self, implicit_wait=MEASURE_IMPLICIT_WAIT):
+        self.implicit_wait = implicit_wait
+        self.blocked_seconds = 0.0
+        self.blocked_calls = 0
+        self.find_calls = 0
+        self._driver = None
+        self._original_execute = None
+        self._had_own_execute = False
+        self._previous_implicit_wait = None
+
+    def attach(self, driver):
+        """드라이버에 측정기를 연결하고 측정용 implicit wait을 적용합니다."""
+        self._driver = driver
+        self._previous_implicit_wait = get_implicit_wait(driver)
+        set_implicit_wait(driver, self.implicit_wait)
+        self._original_execute = driver.execute
+        # 이미 다른 계층이 execute를 감싸고 있으면 detach 시 그 래퍼를 되돌려 놓음
+        self._had_own_execute = "execute" in vars(driver)
+
+        def execute(driver_command, params=None):
+            if driver_command not in _FIND_COMMANDS:
+                return self._original_execute(driver_command, params)
+
+            wait_seconds = get_implicit_wait(driver)
+            started = time.monotonic()
+            missed = False
+            try:
+                response = self._original_execute(driver_command, params)
+                missed = not (response or {}).get("value")
+                return response
+            except NoSuchElementException:
+                missed = True
+                raise
+            finally:
+                self.find_calls += 1
+                if missed and wait_seconds:
+                    self.blocked_seconds += time.monotonic() - started
+                    self.blocked_calls += 1
+
+        driver.execute = execute
+        return self
+
+    def detach(self):
+        """드라이버의 execute와 implicit wait을 원래대로 되돌립니다."""
+        if self._driver is None:
+            return
+        driver, self._driver = self._driver, None
+        if self._had_own_execute:
+            driver.execute = self._original_execute
+        else:
+            del driver.execute
+        restore_to = DEFAULT_IMPLICIT_WAIT if self._previous_implicit_wait is None else self._previous_implicit_wait
+        try:
+            set_implicit_wait(driver, restore_to)
+        except Exception as e:
+            # 세션이 종료된 경우 등: 다음 설정 시 다시 명령을 보내도록 추적 값을 제거
+            _implicit_waits.pop(driver, None)
+            log.warning(f"implicit wait 복원 실패 ({restore_to}초): {e}")
+
+    def summary(self):
+        """측정 결과를 사람이 읽을 수 있는 문자열로 반환합니다."""
+        return (
+            f"implicit wait({self.implicit_wait}초) 블로킹 {self.blocked_seconds:.2f}초 "
+            f"(요소 조회 {self.find_calls}회 중 {self.blocked_calls}회 블로킹)"
+        )
@@ -0,0 +1,433 @@
+"""
+테스트 step 단위 시간 측정 모듈입니다.
+
+테스트 시간이 요소 조회, 클릭, sleep, implicit wait, adb 호출, Appium 명령 왕복 중 어디에 쓰였는지 확인할 수 있도록
+page object(BasePage와 하위 클래스)의 public 메서드 호출을 step으로, 드라이버의 execute 호출을 Appium 명령으로 기록합니다.
+
+- step: page object 메서드 한 번의 호출 (가장 바깥 호출만 기록하며, 안쪽 호출의 시간과 명령은 바깥 step에 포함)
+- sleep: 메인 스레드의 time.sleep 시간 (WaitScheduler의 polling 간격은 sleep이 아니라 대기 시간으로 집계)
+- wait: WaitScheduler 대기 시간 + implicit wait 때문에 블로킹된 요소 조회 시간
+- adb: 메인 스레드에서 AdbShell로 보낸 batch 왕복 횟수와 시간
+
+측정은 perf_counter 호출과 카운터 증가만 하므로 항상 켜둘 수 있습니다.
+"""
+import json
+import logging
+import sys
+import threading
+import time
+import weakref
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from pathlib import Path
+
+from src.adb import AdbShell
+from src.implicit_wait import _FIND_COMMANDS, get_implicit_wait
+from src.wait import WaitScheduler
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+# 요약 표에 표시할 가장 느린 step 수
+SLOWEST_STEPS = 10
+
+# install_hooks에서 교체하는 함수의 원본
+_original_sleep = time.sleep
+_original_run_batch = AdbShell.run_batch
+# 현재 테스트를 측정 중인 Tracer (메인 스레드의 sleep을 이 Tracer에 기록)
+_current = None
+
+
+@dataclass
+class StepRecord:
+    """
+    step 한 번의 측정 결과
+
+    Attributes:
+        name: "<클래스>.<메서드>" 형식의 step 이름
+        locator: 첫 번째 인자로 전달된 locator (없으면 None)
+        started: 테스트 시작 기준 step 시작 시각 (초)
+        seconds: step 소요 시간 (초)
+        commands: step 안에서 실행된 Appium 명령 수
+        command_seconds: Appium 명령 왕복에 걸린 시간 합계 (초)
+        retries: 요소를 찾지 못했거나 실패한 명령 수 (polling으로 다시 시도된 횟수)
+        sleep_seconds: step 안의 time.sleep 시간 합계 (초)
+        wait_seconds: step 안의 WaitScheduler 대기 + implicit wait 블로킹 시간 (초)
+        adb_calls: step 안의 adb shell batch 왕복 횟수
+        adb_seconds: step 안의 adb shell 왕복 시간 합계 (초)
+        error: step이 예외로 끝났으면 예외 클래스 이름
+    """
+    name: str
+    locator: str | None
+    started: float
+    seconds: float = 0.0
+    commands: int = 0
+    command_seconds: float = 0.0
+    retries: int = 0
+    sleep_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    adb_calls: int = 0
+    adb_seconds: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class Trace:
+    """
+    테스트 하나의 측정 결과
+
+    Attributes:
+        name: 테스트 이름 (nodeid)
+        seconds: 측정 시간 (begin_test ~ end_test, 초)
+        commands: Appium 명령 수 (병렬 조회 등 다른 스레드의 명령 포함)
+        command_seconds: Appium 명령 왕복에 걸린 시간 합계 (초)
+        commands_by_name: 명령 이름별 실행 횟수
+        sleep_seconds: 메인 스레드의 time.sleep 시간 합계 (초)
+        wait_seconds: WaitScheduler 대기 시간 합계 (초)
+        implicit_wait_seconds: implicit wait 때문에 블로킹된 요소 조회 시간 합계 (초)
+        adb_calls: 메인 스레드의 adb shell batch 왕복 횟수
+        adb_seconds: adb shell 왕복 시간 합계 (초)
+        connections_opened: Appium 서버에 새 연결을 만든 요청 수 (PooledAppiumConnection 사용 시)
+        connections_reused: 기존 연결을 재사용한 요청 수 (PooledAppiumConnection 사용 시)
+        steps: 기록된 step 목록
+    """
+    name: str
+    seconds: float = 0.0
+    commands: int = 0
+    command_seconds: float = 0.0
+    commands_by_name: Counter = field(default_factory=Counter)
+    sleep_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    implicit_wait_seconds: float = 0.0
+    adb_calls: int = 0
+    adb_seconds: float = 0.0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    steps: list = field(default_factory=list)
+
+    def slowest(self, count=SLOWEST_STEPS):
+        return sorted(self.steps, key=lambda step: step.seconds, reverse=True)[:count]
+
+    def to_dict(self):
+        data = asdict(self)
+        data['commands_by_name'] = dict(self.commands_by_name.most_common())
+        for key, value in data.items():
+            if isinstance(value, float):
+                data[key] = round(value, 4)
+        data['steps'] = [
+            {key: round(value, 4) if isinstance(value, float) else value for key, value in step.items()}
+            for step in data['steps']
+        ]
+        return data
+
+
+def _locator_of(args, kwargs):
+    """step의 첫 번째 인자가 locator(또는 locator 리스트)이면 문자열로 반환합니다."""
+    candidate = kwargs.get('locator', kwargs.get('locators', args[0] if args else None))
+    if isinstance(candidate, tuple) and len(candidate) == 2 and isinstance(candidate[1], str):
+        return f"{candidate[0]}={candidate[1]}"
+    if isinstance(candidate, list) and candidate and all(isinstance(loc, tuple) for loc in candidate):
+        return " | ".join(f"{loc[0]}={loc[1]}" for loc in candidate if len(loc) == 2)
+    return None
+
+
+class Tracer:
+    """
+    드라이버 하나의 Appium 명령과 page object step을 테스트 단위로 기록하는 측정기
+
+    드라이버의 execute를 감싸서 연결되며, 세션이 재사용되는 동안 계속 연결된 상태로 테스트마다 begin_test로 기록을 전환합니다.
+
+    Args:
+        driver: Appium WebDriver
+        on_step: step이 시작될 때 step 이름으로 호출할 함수 (예: LogcatCollector.mark)
+    """
+
+    # 드라이버별로 연결된 Tracer
+    _attached = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver, on_step=None):
+        self.driver = driver
+        self.on_step = on_step
+        self.trace = Trace('setup')
+        self._started = time.perf_counter()
+        self._wait_baseline = 0.0
+        self._connection_baseline = None
+        self._step = None
+        self._depth = 0
+        self._thread = threading.get_ident()
+        self._original_execute = None
+
+    @classmethod
+    def attach(cls, driver, on_step=None):
+        """드라이버에 Tracer를 연결합니다. 이미 연결되어 있으면 기존 Tracer를 반환합니다."""
+        tracer = cls._attached.get(driver)
+        if tracer is None:
+            tracer = cls._attached[driver] = cls(driver, on_step)._wrap_execute()
+        elif on_step is not None:
+            tracer.on_step = on_step
+        return tracer
+
+    @classmethod
+    def for_driver(cls, driver):
+        """드라이버에 연결된 Tracer를 반환합니다. 없으면 None"""
+        try:
+            return cls._attached.get(driver)
+        except TypeError:
+            # weakref를 만들 수 없는 객체 (page object 테스트용 가짜 드라이버 등)
+            return None
+
+    def _wrap_execute(self):
+        driver = self.driver
+        self._original_execute = original = driver.execute
+
+        def execute(driver_command, params=None):
+            started = time.perf_counter()
+            # 예외로 끝난 명령(NoSuchElement 등)은 실패로 기록
+            failed = True
+            try:
+                response = original(driver_command, params)
+                failed = driver_command in _FIND_COMMANDS and not (response or {}).get('value')
+                return response
+            finally:
+                self._record_command(driver_command, time.perf_counter() - started, failed)
+
+        driver.execute = execute
+        return self
+
+    def _record_command(self, driver_command, elapsed, failed):
+        trace = self.trace
+        trace.commands += 1
+        trace.command_seconds += elapsed
+        trace.commands_by_name[driver_command] += 1
+        on_main_thread = threading.get_ident() == self._thread
+        if failed and on_main_thread and driver_command in _FIND_COMMANDS and get_implicit_wait(self.driver):
+            trace.implicit_wait_seconds += elapsed
+            if self._step is not None:
+                self._step.wait_seconds += elapsed
+        step = self._step
+        if step is not None and on_main_thread:
+            step.commands += 1
+            step.command_seconds += elapsed
+            if failed:
+                step.retries += 1
+
+    def _record_sleep(self, seconds):
+        self.trace.sleep_seconds += seconds
+        if self._step is not None:
+            self._step.sleep_seconds += seconds
+
+    def _record_adb(self, seconds):
+        self.trace.adb_calls += 1
+        self.trace.adb_seconds += seconds
+        if self._step is not None:
+            self._step.adb_calls += 1
+            self._step.adb_seconds += seconds
+
+    def _scheduler_wait_seconds(self):
+        stats = WaitScheduler.for_driver(self.driver).stats
+        return sum(stat.total_seconds for stat in stats.values())
+
+    def _connection_stats(self):
+        stats = getattr(getattr(self.driver, 'command_executor', None), 'stats', None)
+        return stats.snapshot() if stats is not None else None
+
+    def begin_test(self, name):
+        """
+        새 테스트의 기록으로 전환하고 메인 스레드의 sleep 기록 대상으로 설정합니다.
+
+        Returns:
+            Trace: 이전 기록
+        """
+        global _current
+        previous = self.trace
+        self.trace = Trace(name)
+        self._started = time.perf_counter()
+        self._wait_baseline = self._scheduler_wait_seconds()
+        self._connection_baseline = self._connection_stats()
+        self._step = None
+        self._depth = 0
+        self._thread = threading.get_ident()
+        _current = self
+        return previous
+
+    def end_test(self):
+        """
+        현재 테스트의 기록을 마무리합니다. (WaitScheduler 통계가 초기화되기 전에 호출해야 함)
+
+        Returns:
+            Trace: 현재 테스트의 기록
+        """
+        global _current
+        trace = self.trace
+        trace.seconds = time.perf_counter() - self._started
+        trace.wait_seconds = self._scheduler_wait_seconds() - self._wait_baseline
+        connections = self._connection_stats()
+        if connections is not None and self._connection_baseline is not None:
+            trace.connections_opened = connections.opened - self._connection_baseline.opened
+            trace.connections_reused = connections.reused - self._connection_baseline.reused
+        if _current is self:
+            _current = None
+        return trace
+
+    def run_step(self, name, locator, function, *args, **kwargs):
+        """function을 step으로 기록하며 실행합니다. 이미 step 안이면 기록 없이 실행합니다."""
+        if self._depth or threading.get_ident() != self._thread:
+            return function(*args, **kwargs)
+        step = StepRecord(name, locator, time.perf_counter() - self._started)
+        if self.on_step is not None:
+            self.on_step(name)
+        wait_before = self._scheduler_wait_seconds()
+        self._step = step
+        self._depth += 1
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except BaseException as e:
+            step.error = type(e).__name__
+            raise
+        finally:
+            step.seconds = time.perf_counter() - started
+            step.wait_seconds += self._scheduler_wait_seconds() - wait_before
+            self._depth -= 1
+            self._step = None
+            self.trace.steps.append(step)
+
+
+def _traced(cls_name, function):
+    @wraps(function)
+    def step(self, *args, **kwargs):
+        tracer = Tracer.for_driver(getattr(self, 'driver', None))
+        if tracer is None:
+            return function(self, *args, **kwargs)
+        return tracer.run_step(f"{cls_name}.{function.__name__}", _locator_of(args, kwargs), function, self, *args, **kwargs)
+
+    step.__traced__ = True
+    return step
+
+
+def instrument_pages(base=None):
+    """
+    base 클래스(기본 BasePage)와 현재 import된 모든 하위 클래스의 public 메서드를 step 기록 함수로 감쌉니다.
+    이미 감싼 메서드는 건너뛰므로 테스트마다 호출해도 새로 import된 page object만 처리합니다.
+
+    Returns:
+        int: 새로 감싼 메서드 수
+    """
+    if base is None:
+        from src.pages.base_page import BasePage
+        base = BasePage
+    wrapped = 0
+    classes = [base]
+    while classes:
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith('_') or not callable(value) or isinstance(value, type):
+                continue
+            if getattr(value, '__traced__', False) or not hasattr(value, '__code__'):
+                continue
+            setattr(cls, attr, _traced(cls.__name__, value))
+            wrapped += 1
+    return wrapped
+
+
+def _sleep(seconds):
+    tracer = _current
+    if tracer is None or threading.get_ident() != tracer._thread:
+        return _original_sleep(seconds)
+    # WaitScheduler.until의 polling 간격은 대기 시간으로 집계되므로 sleep에서 제외
+    caller = sys._getframe(1).f_code
+    started = time.perf_counter()
+    try:
+        return _original_sleep(seconds)
+    finally:
+        if caller is not WaitScheduler.until.__code__:
+            tracer._record_sleep(time.perf_counter() - started)
+
+
+def _run_batch(shell, commands, timeout=5):
+    tracer = _current
+    if tracer is None or threading.get_ident() != tracer._thread:
+        return _original_run_batch(shell, commands, timeout)
+    started = time.perf_counter()
+    try:
+        return _original_run_batch(shell, commands, timeout)
+    finally:
+        tracer._record_adb(time.perf_counter() - started)
+
+
+def install_hooks():
+    """time.sleep과 AdbShell.run_batch를 메인 스레드의 sleep/adb 시간을 기록하는 함수로 교체합니다."""
+    time.sleep = _sleep
+    AdbShell.run_batch = _run_batch
+
+
+def uninstall_hooks():
+    time.sleep = _original_sleep
+    AdbShell.run_batch = _original_run_batch
+
+
+def summary_lines(traces, slowest=SLOWEST_STEPS):
+    """
+    테스트별 합계와 가장 느린 step을 표 형식의 문자열 목록으로 반환합니다.
+
+    Args:
+        traces: Trace 목록
+        slowest: 표시할 가장 느린 step 수
+    """
+    lines = [f"{'시간':>8} {'명령':>5} {'명령시간':>8} {'sleep':>7} {'대기':>7} {'implicit':>8} {'adb':>7}  테스트"]
+    for trace in sorted(traces, key=lambda t: t.seconds, reverse=True):
+        lines.append(
+            f"{trace.seconds:7.2f}s {trace.commands:5d} {trace.command_seconds:7.2f}s "
+            f"{trace.sleep_seconds:6.2f}s {trace.wait_seconds:6.2f}s {trace.implicit_wait_seconds:7.2f}s "
+            f"{trace.adb_seconds:6.2f}s  {trace.name}"
+        )
+    lines.append(
+        f"합계: {sum(t.seconds for t in traces):.2f}s, 명령 {sum(t.commands for t in traces)}회, "
+        f"sleep {sum(t.sleep_seconds for t in traces):.2f}s, 대기 {sum(t.wait_seconds for t in traces):.2f}s, "
+        f"implicit wait {sum(t.implicit_wait_seconds for t in traces):.2f}s, "
+        f"연결 생성 {sum(t.connections_opened for t in traces)}회 / 재사용 {sum(t.connections_reused for t in traces)}회"
+    )
+    steps = sorted(
+        ((step, trace.name) for trace in traces for step in trace.steps),
+        key=lambda item: item[0].seconds,
+        reverse=True,
+    )[:slowest]
+    if steps:
+        lines.append(f"가장 느린 step {len(steps)}개:")
+        for step, test_name in steps:
+            target = f" [{step.locator}]" if step.locator else ""
+            lines.append(
+                f"{step.seconds:7.2f}s {step.commands:4d}회 재시도 {step.retries:3d}  "
+                f"{step.name}{target}  ({test_name})"
+            )
+    return lines
+
+
+def write_report(traces, path):
+    """
+    테스트별 측정 결과를 추세 비교용 JSON 파일로 저장합니다.
+
+    Returns:
+        Path: 저장한 파일 경로
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        'generated': time.time(),
+        'totals': {
+            'tests': len(traces),
+            'seconds': round(sum(t.seconds for t in traces), 4),
+            'commands': sum(t.commands for t in traces),
+            'sleep_seconds': round(sum(t.sleep_seconds for t in traces), 4),
+            'wait_seconds': round(sum(t.wait_seconds for t in traces), 4),
+            'implicit_wait_seconds': round(sum(t.implicit_wait_seconds for t in traces), 4),
+            'adb_seconds': round(sum(t.adb_seconds for t in traces), 4),
+            'connections_opened': sum(t.connections_opened for t in traces),
+            'connections_reused': sum(t.connections_reused for t in traces),
+        },
+        'tests': [trace.to_dict() for trace in traces],
+    }
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    return path
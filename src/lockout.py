@@ -0,0 +1,276 @@
+"""
+로그인 제한(lockout) 시간 추상화 모듈입니다.
+
+LOGIN_011은 로그인 10회 실패 후 10분 제한이 풀리기를 실제로 기다리므로 테스트 하나가 디바이스를 10분간 점유합니다.
+이 모듈은 대기 방식을 두 가지 모드로 나눕니다.
+- real: 지금처럼 실제 시간만큼 세션을 유지하며 대기 (릴리즈 검증용)
+- fast: 로그인 API를 대신하는 로컬 mock 백엔드(MockLoginBackend)의 시계를 앞당겨 즉시 제한을 해제
+
+fast 모드는 앱의 로그인 요청이 mock 백엔드로 향할 때만 의미가 있습니다.
+mock 백엔드는 `adb reverse`로 디바이스의 localhost:<port>에 노출되며,
+앱의 API 주소를 해당 주소로 바꿀 수 있는 빌드(디버그/스테이징 빌드 등)가 필요합니다.
+앱이 mock 백엔드로 로그인 요청을 한 번도 보내지 않았다면(프로덕션 빌드 등) 실제 백엔드의 10분 제한이 그대로 남아 있으므로
+LockoutTimer.wait는 시계를 앞당기지 않고 MockBackendNotUsed를 발생시킵니다.
+"""
+import json
+import logging
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+MODE_REAL = "real"
+MODE_FAST = "fast"
+
+# 오늘의집 로그인 제한 정책: 10회 연속 실패 시 10분간 로그인 제한
+LOCKOUT_MAX_FAILURES = 10
+LOCKOUT_SECONDS = 600
+
+
+class MockBackendNotUsed(RuntimeError):
+    """fast 모드인데 앱의 로그인 요청이 mock 백엔드에 도착하지 않았을 때 발생하는 예외"""
+
+
+class FakeClock:
+    """테스트에서 시간을 앞당길 수 있는 시계 (초 단위 monotonic 값)"""
+
+    def __init__(self, start=0.0):
+        self._now = start
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            return self._now
+
+    def advance(self, seconds):
+        with self._lock:
+            self._now += seconds
+            return self._now
+
+
+@dataclass(frozen=True)
+class LoginAttempt:
+    """
+    로그인 시도 결과
+
+    Attributes:
+        result: "success", "failed", "locked" 중 하나
+        failures: 현재 연속 실패 횟수
+        retry_after: 제한이 풀리기까지 남은 시간 (초, 제한 상태가 아니면 0)
+    """
+    result: str
+    failures: int
+    retry_after: float = 0
+
+    def to_json(self):
+        return {
+            "result": self.result,
+            "failures": self.failures,
+            "max_failures": LOCKOUT_MAX_FAILURES,
+            "retry_after": int(self.retry_after + 0.999),
+        }
+
+
+class LockoutPolicy:
+    """
+    계정별 연속 로그인 실패 횟수와 제한 시간을 관리합니다.
+    로그인에 성공하면 실패 횟수가 초기화되고, max_failures회 연속 실패하면 lock_seconds 동안 로그인이 제한됩니다.
+
+    Args:
+        clock: 현재 시간을 반환하는 함수 (FakeClock이면 시간을 앞당길 수 있음)
+        max_failures: 제한이 걸리는 연속 실패 횟수
+        lock_seconds: 제한 시간 (초)
+    """
+
+    def __init__(self, clock=time.monotonic, max_failures=LOCKOUT_MAX_FAILURES, lock_seconds=LOCKOUT_SECONDS):
+        self.clock = clock
+        self.max_failures = max_failures
+        self.lock_seconds = lock_seconds
+        self._failures = {}
+        self._locked_until = {}
+        self._lock = threading.Lock()
+
+    def attempt(self, account, password_ok):
+        """
+        로그인 시도를 기록하고 결과를 반환합니다.
+
+        Args:
+            account: 계정 (이메일)
+            password_ok: 비밀번호 일치 여부
+
+        Returns:
+            LoginAttempt: 시도 결과
+        """
+        with self._lock:
+            now = self.clock()
+            locked_until = self._locked_until.get(account)
+            if locked_until is not None:
+                if now < locked_until:
+                    return LoginAttempt("locked", self._failures.get(account, 0), locked_until - now)
+                # 제한 시간이 지나면 실패 횟수를 초기화
+                del self._locked_until[account]
+                self._failures[account] = 0
+
+            if password_ok:
+                self._failures[account] = 0
+                return LoginAttempt("success", 0)
+
+            failures = self._failures.get(account, 0) + 1
+            self._failures[account] = failures
+            if failures >= self.max_failures:
+                self._locked_until[account] = now + self.lock_seconds
+                return LoginAttempt("locked", failures, self.lock_seconds)
+            return LoginAttempt("failed", failures)
+
+
+class MockLoginBackend:
+    """
+    로그인 API를 대신하는 로컬 HTTP 서버
+
+    POST /login            {"email": ..., "password": ...} → LoginAttempt JSON (성공 200, 실패 401, 제한 429)
+    POST /__clock/advance  {"seconds": ...}                → 시계를 앞당김
+    GET  /__state                                           → 현재 시계 값
+
+    Args:
+        accounts: 가입된 계정 {이메일: 비밀번호}
+        host: 바인딩할 주소
+        port: 바인딩할 포트 (0이면 임의의 빈 포트)
+    """
+
+    def __init__(self, accounts, host="127.0.0.1", port=0):
+        self.accounts = dict(accounts)
+        self.clock = FakeClock()
+        self.policy = LockoutPolicy(clock=self.clock)
+        # 도착한 POST /login 요청 수 (앱이 mock 백엔드를 사용하는지 확인)
+        self.login_requests = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread = None
+        self._reversed_serial = None
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def url(self):
+        return f"http://{self._server.server_address[0]}:{self.port}"
+
+    def start(self):
+        """서버를 백그라운드 스레드에서 시작합니다."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        log.info(f"mock 로그인 백엔드 시작: {self.url}")
+        return self
+
+    def stop(self):
+        """서버를 종료하고 adb reverse 설정을 제거합니다."""
+        if self._reversed_serial:
+            subprocess.run(
+                ['adb', '-s', self._reversed_serial, 'reverse', '--remove', f"tcp:{self.port}"],
+                capture_output=True, timeout=5,
+            )
+            self._reversed_serial = None
+        self._server.shutdown()
+        self._server.server_close()
+        log.info("mock 로그인 백엔드 종료")
+
+    def expose_to_device(self, serial):
+        """`adb reverse`로 디바이스의 localhost:<port>를 이 서버로 연결합니다."""
+        subprocess.run(
+            ['adb', '-s', serial, 'reverse', f"tcp:{self.port}", f"tcp:{self.port}"],
+            check=True, capture_output=True, timeout=5,
+        )
+        self._reversed_serial = serial
+
+    def advance(self, seconds):
+        """백엔드의 시계를 seconds만큼 앞당깁니다."""
+        now = self.clock.advance(seconds)
+        log.info(f"mock 로그인 백엔드 시계 {seconds}초 앞당김 (현재: {now}초)")
+
+    def login(self, email, password):
+        self.login_requests += 1
+        return self.policy.attempt(email, self.accounts.get(email) == password)
+
+    def _handler_class(self):
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _read_json(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def _send_json(self, status, body):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):
+                if self.path == "/login":
+                    body = self._read_json()
+                    attempt = backend.login(body.get("email"), body.get("password"))
+                    status = {"success": 200, "failed": 401, "locked": 429}[attempt.result]
+                    self._send_json(status, attempt.to_json())
+                elif self.path == "/__clock/advance":
+                    backend.advance(float(self._read_json().get("seconds", 0)))
+                    self._send_json(200, {"now": backend.clock()})
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def do_GET(self):
+                if self.path == "/__state":
+                    self._send_json(200, {"now": backend.clock()})
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def log_message(self, format, *args):
+                log.debug(f"mock 로그인 백엔드: {format % args}")
+
+        return Handler
+
+
+class LockoutTimer:
+    """
+    로그인 제한 시간 경과를 모드에 따라 처리합니다.
+
+    Args:
+        mode: MODE_REAL 또는 MODE_FAST
+        backend: fast 모드에서 시계를 앞당길 MockLoginBackend
+    """
+
+    def __init__(self, mode=MODE_REAL, backend=None):
+        if mode == MODE_FAST and backend is None:
+            raise ValueError("fast 모드에는 MockLoginBackend가 필요합니다.")
+        self.mode = mode
+        self.backend = backend
+
+    def wait(self, seconds, page):
+        """
+        seconds만큼 시간이 지나도록 합니다.
+        real 모드는 세션을 유지하며 실제로 대기하고, fast 모드는 백엔드 시계만 앞당기고 즉시 반환합니다.
+
+        Args:
+            seconds: 경과시킬 시간 (초)
+            page: real 모드에서 세션을 유지할 page object
+
+        Returns:
+            bool: 대기 중 세션이 유지되었으면 True
+
+        Raises:
+            MockBackendNotUsed: fast 모드인데 앱의 로그인 요청이 mock 백엔드에 한 번도 도착하지 않았을 때
+        """
+        if self.mode == MODE_FAST:
+            if not self.backend.login_requests:
+                raise MockBackendNotUsed(
+                    f"앱의 로그인 요청이 mock 로그인 백엔드({self.backend.url})에 도착하지 않았습니다. "
+                    "앱이 실제 백엔드를 사용하는 빌드이면 --lockout-mode=real로 실행하세요."
+                )
+            self.backend.advance(seconds)
+            return True
+        return page.wait_with_session_keepalive(seconds)
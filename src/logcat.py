@@ -0,0 +1,306 @@
+"""
+디바이스 logcat 수집 모듈입니다.
+
+디바이스마다 `adb logcat` 프로세스 하나를 유지하고 백그라운드 스레드에서 읽어,
+앱 프로세스(APP_PACKAGE의 pid)와 Activity 관리 로그(ActivityManager 등)만 테스트별 저장소(LogStore)에 기록합니다.
+각 로그에는 수집 시각(time.time)을 함께 기록하여 Python 쪽 step 시각(mark)과 같은 기준으로 정렬됩니다.
+저장소는 태그별 색인을 가지며, wait_for로 특정 로그가 나타날 때까지 push 방식으로 대기할 수 있어
+"Displayed <Activity>" 로그를 화면 polling 대신 준비 완료 신호로 사용할 수 있습니다.
+"""
+import json
+import logging
+import re
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from src.adb import AdbShell
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+# 앱 pid와 관계없이 수집하는 시스템 태그 (Activity 실행/표시, 앱 크래시)
+SYSTEM_TAGS = frozenset({'ActivityManager', 'ActivityTaskManager', 'AndroidRuntime'})
+# 테스트 하나에 기록하는 최대 로그 수
+MAX_ENTRIES_PER_TEST = 50000
+# Python 쪽 step 기록에 사용하는 태그
+STEP_TAG = 'STEP'
+
+# `logcat -v epoch` 형식 (예: "  1697612345.123  1234  5678 I ActivityTaskManager: Displayed ...")
+_EPOCH_LINE = re.compile(
+    r"^\s*(?P<time>\d+\.\d+)\s+(?P<pid>\d+)\s+(?P<tid>\d+)\s+(?P<level>[VDIWEFS])\s+(?P<tag>.*?)\s*:\s(?P<message>.*)$"
+)
+# ActivityManager의 프로세스 시작 로그 (예: "Start proc 4321:net.bucketplace/u0a123 for ...")
+_START_PROC = re.compile(r"Start proc (?P<pid>\d+):(?P<process>[\w.]+)")
+
+
+@dataclass(frozen=True)
+class LogEntry:
+    """
+    logcat 한 줄
+
+    Attributes:
+        host_time: 수집 시각 (time.time, Python 쪽 step 시각과 같은 기준)
+        device_time: 디바이스에 기록된 시각 (epoch 초)
+        pid: 프로세스 id
+        level: 로그 레벨 (V/D/I/W/E/F, step 기록은 S)
+        tag: 로그 태그
+        message: 로그 메시지
+    """
+    host_time: float
+    device_time: float
+    pid: int
+    level: str
+    tag: str
+    message: str
+
+
+def parse_logcat_line(line, host_time=None):
+    """
+    `logcat -v epoch` 한 줄을 LogEntry로 변환합니다.
+
+    Returns:
+        LogEntry: 변환 결과 (형식이 다르면 None)
+    """
+    match = _EPOCH_LINE.match(line.rstrip('\n'))
+    if not match:
+        return None
+    return LogEntry(
+        host_time=time.time() if host_time is None else host_time,
+        device_time=float(match.group('time')),
+        pid=int(match.group('pid')),
+        level=match.group('level'),
+        tag=match.group('tag'),
+        message=match.group('message'),
+    )
+
+
+class LogStore:
+    """
+    테스트 하나의 logcat 저장소 (태그별 색인 포함)
+
+    Args:
+        name: 테스트 이름 (nodeid)
+        max_entries: 최대 로그 수 (초과하면 이후 로그는 개수만 집계)
+    """
+
+    def __init__(self, name, max_entries=MAX_ENTRIES_PER_TEST):
+        self.name = name
+        self.started = time.time()
+        self.max_entries = max_entries
+        self.entries = []
+        self.by_tag = defaultdict(list)
+        self.dropped = 0
+
+    def add(self, entry):
+        if len(self.entries) >= self.max_entries:
+            self.dropped += 1
+            return
+        self.entries.append(entry)
+        self.by_tag[entry.tag].append(entry)
+
+    def find(self, tag=None, pattern=None, since=None):
+        """
+        조건에 맞는 첫 번째 로그를 찾습니다.
+
+        Args:
+            tag: 로그 태그 또는 태그 목록 (None이면 모든 태그)
+            pattern: 메시지에서 찾을 정규식 (None이면 메시지 조건 없음)
+            since: 이 시각(time.time) 이후의 로그만 확인
+
+        Returns:
+            LogEntry: 찾은 로그 (없으면 None)
+        """
+        if isinstance(tag, (tuple, list, set, frozenset)):
+            found = [self.find(one_tag, pattern, since) for one_tag in tag]
+            found = [entry for entry in found if entry is not None]
+            return min(found, key=lambda entry: entry.host_time) if found else None
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        for entry in (self.by_tag.get(tag, ()) if tag is not None else self.entries):
+            if since is not None and entry.host_time < since:
+                continue
+            if regex is None or regex.search(entry.message):
+                return entry
+        return None
+
+    def write(self, path):
+        """
+        저장소를 JSON Lines 파일로 저장합니다.
+        첫 줄은 테스트 정보와 태그별 로그 수이고, 이후 줄의 t는 테스트 시작 기준 경과 시간(초)입니다.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open('w', encoding='utf-8') as file:
+            header = {
+                'test': self.name,
+                'started': self.started,
+                'entries': len(self.entries),
+                'dropped': self.dropped,
+                'tags': {tag: len(entries) for tag, entries in self.by_tag.items()},
+            }
+            file.write(json.dumps(header, ensure_ascii=False) + '\n')
+            for entry in self.entries:
+                record = asdict(entry)
+                record['t'] = round(record.pop('host_time') - self.started, 3)
+                file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        return path
+
+
+class LogcatCollector:
+    """
+    디바이스 하나의 logcat을 계속 읽어 현재 테스트의 LogStore에 기록하는 수집기
+
+    Args:
+        serial: 디바이스 시리얼
+        app_package: 로그를 수집할 앱 패키지 (이 앱의 pid 로그와 SYSTEM_TAGS 로그만 기록)
+        adb_path: adb 실행 파일 경로
+    """
+
+    # 시리얼별로 공유되는 수집기
+    _collectors = {}
+
+    def __init__(self, serial, app_package, adb_path='adb'):
+        self.serial = serial
+        self.app_package = app_package
+        self.adb_path = adb_path
+        self.app_pids = set()
+        self.store = LogStore('setup')
+        self._changed = threading.Condition()
+        self._process = None
+
+    @classmethod
+    def for_serial(cls, serial, app_package):
+        """시리얼별로 공유되는 수집기를 반환합니다. 처음 호출될 때 수집을 시작합니다."""
+        collector = cls._collectors.get(serial)
+        if collector is None:
+            collector = cls._collectors[serial] = cls(serial, app_package).start()
+        return collector
+
+    @classmethod
+    def stop_all(cls):
+        collectors = list(cls._collectors.values())
+        cls._collectors.clear()
+        for collector in collectors:
+            collector.stop()
+
+    def start(self):
+        """앱 pid를 확인하고 `adb logcat`을 시작합니다."""
+        self.app_pids.update(self._pidof())
+        # -T 1: 시작 이전의 로그는 건너뛰고 새 로그만 읽음
+        self._process = subprocess.Popen(
+            [self.adb_path, '-s', self.serial, 'logcat', '-v', 'epoch', '-T', '1'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+        )
+        threading.Thread(target=self._pump, name="logcat-collector", daemon=True).start()
+        log.debug(f"[{self.serial}] logcat 수집 시작 (앱 pid: {sorted(self.app_pids)})")
+        return self
+
+    def stop(self):
+        process, self._process = self._process, None
+        if process is not None:
+            process.kill()
+            process.wait(timeout=5)
+        log.debug(f"[{self.serial}] logcat 수집 종료")
+
+    def _pidof(self):
+        try:
+            result = AdbShell.for_serial(self.serial).run(f"pidof {self.app_package}")
+        except Exception as e:
+            log.debug(f"앱 pid 확인 실패: {e}")
+            return set()
+        return {int(pid) for pid in result.output.split() if pid.isdigit()}
+
+    def _pump(self):
+        for line in self._process.stdout:
+            self.feed(line)
+
+    def feed(self, line, host_time=None):
+        """
+        logcat 한 줄을 처리합니다. 앱 pid 또는 SYSTEM_TAGS 로그이면 현재 저장소에 기록합니다.
+
+        Returns:
+            LogEntry: 기록된 로그 (기록하지 않았으면 None)
+        """
+        entry = parse_logcat_line(line, host_time)
+        if entry is None:
+            return None
+        if entry.tag == 'ActivityManager':
+            # 앱이 다시 시작되면 새 pid로 수집
+            started = _START_PROC.search(entry.message)
+            if started and started.group('process') == self.app_package:
+                self.app_pids.add(int(started.group('pid')))
+        if entry.pid not in self.app_pids and entry.tag not in SYSTEM_TAGS:
+            return None
+        with self._changed:
+            self.store.add(entry)
+            self._changed.notify_all()
+        return entry
+
+    def begin_test(self, name):
+        """
+        새 테스트의 저장소로 전환합니다.
+
+        Returns:
+            LogStore: 이전 테스트의 저장소
+        """
+        with self._changed:
+            previous, self.store = self.store, LogStore(name)
+        return previous
+
+    def mark(self, step):
+        """Python 쪽 step 시작을 같은 시각 기준으로 저장소에 기록합니다."""
+        now = time.time()
+        with self._changed:
+            self.store.add(LogEntry(now, now, 0, 'S', STEP_TAG, step))
+
+    def wait_for(self, tag=None, pattern=None, timeout=10, since=None):
+        """
+        조건에 맞는 로그가 나타날 때까지 대기합니다. 로그가 들어오는 즉시 깨어나므로 polling 간격이 없습니다.
+
+        Args:
+            tag: 로그 태그 또는 태그 목록
+            pattern: 메시지에서 찾을 정규식
+            timeout: 최대 대기 시간 (초)
+            since: 이 시각(time.time) 이후의 로그만 인정 (None이면 현재 테스트의 모든 로그)
+
+        Returns:
+            LogEntry: 찾은 로그 (timeout 안에 나타나지 않으면 None)
+        """
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                entry = self.store.find(tag=tag, pattern=regex, since=since)
+                if entry is not None:
+                    return entry
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._changed.wait(remaining)
+
+    def wait_for_displayed(self, activity, timeout=10, since=None):
+        """
+        Activity가 화면에 표시되었다는 로그("Displayed <package>/<activity>")가 나타날 때까지 대기합니다.
+
+        Args:
+            activity: Activity 이름 (일부만 포함해도 매칭, 예: "MainActivity")
+            timeout: 최대 대기 시간 (초)
+            since: 이 시각(time.time) 이후의 로그만 인정
+
+        Returns:
+            LogEntry: 찾은 로그 (timeout 안에 나타나지 않으면 None)
+        """
+        # Android 10부터 ActivityTaskManager, 그 이전은 ActivityManager가 기록
+        return self.wait_for(
+            tag=('ActivityTaskManager', 'ActivityManager'),
+            pattern=re.compile(rf"Displayed \S*{re.escape(activity)}"),
+            timeout=timeout,
+            since=since,
+        )
@@ -0,0 +1,221 @@
+"""
+화면 이동(navigation) 모듈입니다.
+
+설정 페이지까지 이동하려면 메인 홈 → [마이페이지] 탭 → 로드 확인 → [설정] 아이콘 탭 → 로드 확인을 차례로 거쳐야 합니다.
+Navigator는 page object 클래스(MainHomePage, MyPage, SettingPage)를 목적지로 받아
+앱이 deep link를 처리하면 `am start -d <uri>` 한 번으로 바로 이동하고, 그렇지 않으면 기존 탭 경로로 이동합니다.
+이동할 때마다 사용한 경로(deep_link, tap)와 걸린 시간을 history에 기록합니다.
+
+앱이 처리하지 못한 deep link(am start 실패, 또는 실행되었지만 목적지가 아닌 화면이 열린 경우)는 기억해 두고
+같은 드라이버에서는 다시 시도하지 않습니다. 다른 화면이 열린 경우에는 탭 경로를 앱 재실행부터 시작합니다.
+"""
+import logging
+import time
+import weakref
+from dataclasses import dataclass
+
+from src.app_lifecycle import AppLifecycle
+from src.config.settings import load_config
+from src.pages.main_home_page import MainHomePage
+from src.pages.my_page import MyPage
+from src.pages.setting_page import SettingPage
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+DEEP_LINK_SCHEME = "ohouseapp"
+
+ROUTE_DEEP_LINK = "deep_link"
+ROUTE_TAP = "tap"
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    page object 하나로 이동하는 경로
+
+    Attributes:
+        name: 로그와 기록에 사용할 화면 이름
+        loaded: 도착 확인에 사용할 page object 메서드 이름 (is_*_loaded)
+        deep_link: 화면을 바로 여는 deep link (None이면 탭 경로만 사용)
+        parent: 탭 경로의 출발 화면 (page object 클래스, None이면 앱 실행이 출발점)
+        tap: 출발 화면에서 탭할 locator 속성 이름
+    """
+    name: str
+    loaded: str
+    deep_link: str | None = None
+    parent: type | None = None
+    tap: str | None = None
+
+
+@dataclass(frozen=True)
+class NavigationRecord:
+    """
+    이동 한 번의 기록
+
+    Attributes:
+        destination: 목적지 화면 이름
+        route: 사용한 경로 (ROUTE_DEEP_LINK, ROUTE_TAP)
+        seconds: 이동과 도착 확인에 걸린 시간 (초)
+        error: 실패한 경우 오류 메시지 (성공이면 None)
+    """
+    destination: str
+    route: str
+    seconds: float
+    error: str | None = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+ROUTES = {
+    MainHomePage: Route("메인 홈페이지", "is_main_home_page_loaded"),
+    MyPage: Route(
+        "마이페이지", "is_my_page_loaded",
+        deep_link=f"{DEEP_LINK_SCHEME}://mypage", parent=MainHomePage, tap="MYPAGE_BOTTOM_BUTTON",
+    ),
+    SettingPage: Route(
+        "설정 페이지", "is_setting_page_loaded",
+        deep_link=f"{DEEP_LINK_SCHEME}://settings", parent=MyPage, tap="GEAR_ICON_BUTTON",
+    ),
+}
+
+
+class Navigator:
+    """
+    page object 클래스를 목적지로 받는 화면 이동 서비스
+
+    Args:
+        driver: Appium WebDriver
+        config: 앱 패키지/Activity를 읽을 AppConfig (None이면 프로세스 공용 설정)
+        routes: page object 클래스별 Route (None이면 ROUTES)
+    """
+
+    # 드라이버별 navigator
+    _navigators = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver, config=None, routes=None):
+        self.driver = driver
+        self.config = config or load_config()
+        self.routes = dict(ROUTES if routes is None else routes)
+        self.lifecycle = AppLifecycle(driver)
+        self.history = []
+        # 앱이 처리하지 못한 deep link
+        self._unsupported = set()
+
+    @classmethod
+    def for_driver(cls, driver):
+        """드라이버별로 공유되는 navigator를 반환합니다."""
+        navigator = cls._navigators.get(driver)
+        if navigator is None:
+            navigator = cls._navigators[driver] = cls(driver)
+        return navigator
+
+    @property
+    def last(self):
+        """마지막 이동 기록 (없으면 None)"""
+        return self.history[-1] if self.history else None
+
+    def go_to(self, page_class, timeout=10, start=None, deep_link=True):
+        """
+        page_class의 화면으로 이동합니다.
+        deep link가 있으면 먼저 시도하고, 실패하면 탭 경로로 이동합니다.
+
+        Args:
+            page_class: 목적지 page object 클래스
+            timeout: 단계별 최대 대기 시간 (초)
+            start: 현재 화면의 page object 클래스 (탭 경로가 이 화면부터 시작, None이면 앱 실행부터)
+            deep_link: False이면 deep link를 사용하지 않고 탭 경로로만 이동 (탭 동작 자체를 검증하는 테스트용)
+
+        Returns:
+            BasePage: 도착한 화면의 page object (실패하면 None, 오류 메시지는 last.error)
+        """
+        route = self.routes[page_class]
+        page = page_class(self.driver, self.config)
+        started = time.monotonic()
+        used, error = ROUTE_TAP, None
+        relaunch = False
+        if deep_link and self._open_deep_link(route):
+            # 로그인 상태 등에 따라 다른 화면이 열릴 수 있으므로 도착 화면을 확인
+            if getattr(page, route.loaded)(timeout=timeout):
+                used = ROUTE_DEEP_LINK
+            else:
+                log.info(f"deep link가 {route.name}를 열지 않았습니다. 이후에는 탭 경로로 이동합니다: {route.deep_link}")
+                self._unsupported.add(route.deep_link)
+                # 현재 화면을 알 수 없으므로 탭 경로는 앱을 다시 실행하여 시작
+                start, relaunch = None, True
+        if used == ROUTE_TAP:
+            error = self._tap(page_class, page, timeout, start, relaunch)
+        record = NavigationRecord(route.name, used, time.monotonic() - started, error)
+        self.history.append(record)
+        if error:
+            log.warning(f"{route.name} 이동 실패 ({used}, {record.seconds:.2f}초): {error}")
+            return None
+        log.info(f"{route.name} 이동 ({used}, {record.seconds:.2f}초)")
+        return page
+
+    def _open_deep_link(self, route):
+        """deep link를 엽니다. 앱이 처리하지 못하면 기억해 두고 False를 반환합니다."""
+        if route.deep_link is None or route.deep_link in self._unsupported:
+            return False
+        try:
+            result = self.lifecycle.open_uri(self.config.app_package, route.deep_link)
+        except Exception as e:
+            log.debug(f"deep link 실행 실패: {e}")
+            result = None
+        if result is None or not result.ok:
+            log.info(f"앱이 처리하지 않는 deep link입니다. 이후에는 탭 경로로 이동합니다: {route.deep_link}")
+            self._unsupported.add(route.deep_link)
+            return False
+        return True
+
+    def _tap(self, page_class, page, timeout, start, relaunch=False):
+        """
+        탭 경로로 이동합니다. 성공하면 None, 실패하면 오류 메시지를 반환합니다.
+
+        Args:
+            relaunch: True이면 앱을 종료한 뒤 다시 실행하여 시작 (현재 화면을 알 수 없을 때)
+        """
+        if page_class is start:
+            return None
+        route = self.routes[page_class]
+        if route.parent is None:
+            if not self.lifecycle.launch(self.config.app_package, self.config.app_activity, force_stop=relaunch):
+                return "앱을 실행하지 못했습니다."
+        else:
+            parent = route.parent(self.driver, self.config)
+            error = self._tap(route.parent, parent, timeout, start, relaunch)
+            if error:
+                return error
+            try:
+                # 출발 화면(start)은 로드를 확인하지 않았으므로 timeout까지 대기하고,
+                # 경로 중간 화면은 로드를 이미 확인했으므로 기본 대기 시간만 사용
+                if route.parent is start:
+                    parent.click(getattr(parent, route.tap), timeout=timeout)
+                else:
+                    parent.click(getattr(parent, route.tap))
+            except Exception as e:
+                return f"{route.tap} 클릭 실패: {e}"
+        if not getattr(page, route.loaded)(timeout=timeout):
+            return f"{route.name}가 로드되지 않았습니다."
+        return None
+
+    def report(self, clear=False):
+        """
+        이동 기록을 사람이 읽을 수 있는 문자열로 반환합니다.
+
+        Args:
+            clear: True이면 기록을 반환한 뒤 비움 (세션 재사용 시 테스트 단위 기록)
+
+        Returns:
+            str: 이동 기록 (기록이 없으면 빈 문자열)
+        """
+        lines = [
+            f"  {record.destination:<10} {record.route:<9} {record.seconds:6.2f}초"
+            + ("" if record.ok else f"  실패: {record.error}")
+            for record in self.history
+        ]
+        if clear:
+            self.history.clear()
+        return "\n".join(lines)
@@ -10,9 +10,15 @@ class AppDrawerPage(BasePage):
     APP_DRAWER_BUTTON = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("앱")')
     # 오늘의집 앱 아이콘 locator
     OHOUS_APP_ICON = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("오늘의집")')
+
+    # 앱 실행 방식
+    # LAUNCH_BY_DRAWER: 앱 서랍을 열고 아이콘을 탭 (런처 동작을 검증하는 테스트용: LOGIN_001, 002, 013)
+    # LAUNCH_BY_INTENT: am start -W로 APP_ACTIVITY를 직접 실행 (앱이 열리기만 하면 되는 전처리용)
+    LAUNCH_BY_DRAWER = "drawer"
+    LAUNCH_BY_INTENT = "intent"
     
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, config=None):
+        super().__init__(driver, config)
     
     def wait_for_app_installed(self, timeout=10):
         """
@@ -26,14 +32,12 @@ class AppDrawerPage(BasePage):
         """
         try:
             # 앱 패키지가 설치되어 있는지 확인
-            from src.config.settings import load_config
-            config = load_config()
-            app_package = config.app_package
+            app_package = self.config.app_package
             
-            # adb를 통해 앱 설치 여부 확인
+            # adb를 통해 앱 설치 여부 확인 (여러 디바이스가 연결되어 있어도 세션의 디바이스를 조회하도록 -s 지정)
             import subprocess
             result = subprocess.run(
-                ['adb', 'shell', 'pm', 'list', 'packages', app_package],
+                ['adb', '-s', self._get_device_serial(), 'shell', 'pm', 'list', 'packages', app_package],
                 capture_output=True,
                 text=True,
                 timeout=timeout
@@ -56,14 +60,20 @@ class AppDrawerPage(BasePage):
             # 앱 서랍 버튼을 찾을 수 없으면 홈 화면에서 위로 스와이프
             self.driver.swipe(500, 1500, 500, 500, 300)
     
-    def launch_ohous_app(self):
+    def launch_ohous_app(self, strategy=LAUNCH_BY_DRAWER):
         """
         오늘의집 앱을 실행합니다.
-        앱 서랍을 열고 오늘의집 앱 아이콘을 클릭합니다.
+        기본적으로 앱 서랍을 열고 오늘의집 앱 아이콘을 클릭합니다.
+        
+        Args:
+            strategy: 앱 실행 방식 (LAUNCH_BY_DRAWER 또는 LAUNCH_BY_INTENT)
         
         Returns:
             bool: 앱 실행에 성공했으면 True, 실패했으면 False
         """
+        if strategy == self.LAUNCH_BY_INTENT:
+            return self._launch_by_intent()
+
         try:
             # 앱 서랍 열기
             self.open_app_drawer()
@@ -77,30 +87,47 @@ class AppDrawerPage(BasePage):
             print(f"오늘의집 앱 실행 실패: {e}")
             return False
     
-    def pre_processing_launch_ohous_app(self):
+    def _launch_by_intent(self, force_stop=False):
+        """
+        am start -W로 APP_ACTIVITY를 직접 실행합니다. 첫 화면이 그려질 때까지 한 번의 명령으로 대기하며,
+        cold/warm start 여부와 실행 시간은 self.lifecycle.last_launch에 기록됩니다.
+        
+        Args:
+            force_stop: True이면 이미 실행 중인 앱을 종료한 뒤 처음부터 실행
+        """
+        try:
+            return self.lifecycle.launch(self.config.app_package, self.config.app_activity, force_stop=force_stop)
+        except Exception as e:
+            print(f"오늘의집 앱 실행 실패: {e}")
+            return False
+
+    def pre_processing_launch_ohous_app(self, strategy=LAUNCH_BY_INTENT):
         """
         오늘의집 앱을 실행하기 위한 전처리 작업을 수행합니다.
 
         이미 앱이 실행되어 있다면 먼저 종료한 후 실행합니다.
-        앱 서랍을 열고 오늘의집 앱 아이콘을 클릭합니다.
-        앱이 정상적으로 실행되었는지 확인합니다.
+        기본(LAUNCH_BY_INTENT)은 am start -W -S 한 번으로 종료와 실행을 함께 수행하며,
+        LAUNCH_BY_DRAWER는 앱 서랍을 열고 오늘의집 앱 아이콘을 클릭한 뒤 앱이 정상적으로 실행되었는지 확인합니다.
+        
+        Args:
+            strategy: 앱 실행 방식 (LAUNCH_BY_INTENT 또는 LAUNCH_BY_DRAWER)
         
         Returns:
             bool: 앱 실행에 성공했으면 True, 실패했으면 False
         """
+        if strategy == self.LAUNCH_BY_INTENT:
+            return self._launch_by_intent(force_stop=True)
+
         try:
             # Step 1: 이미 오늘의집 앱이 실행되어 있는지 확인하고 종료
-            from src.config.settings import load_config
-            config = load_config()
-            app_package = config.app_package
+            app_package = self.config.app_package
             
             try:
-                current_package = self.driver.current_package
-                if current_package == app_package:
+                if self.lifecycle.is_foreground(app_package):
                     # 오늘의집 앱이 이미 실행 중이면 종료
                     self.terminate_all_apps(app_package)
             except Exception:
-                # current_package를 확인할 수 없어도 계속 진행
+                # 앱 상태를 확인할 수 없어도 계속 진행
                 pass
             
             # Step 2: 앱 서랍 열기
@@ -127,26 +154,12 @@ class AppDrawerPage(BasePage):
         Returns:
             bool: 앱이 실행 중이면 True
         """
-        import time
-        from src.config.settings import load_config
-        
         try:
-            config = load_config()
-            app_package = config.app_package
+            app_package = self.config.app_package
             
-            # 앱이 실행될 때까지 대기 (current_package가 앱 패키지로 변경될 때까지)
-            for _ in range(timeout):
-                try:
-                    current_package = self.driver.current_package
-                    if current_package == app_package:
-                        # 앱이 실행되었으므로 추가로 앱의 메인 화면이 로드될 때까지 짧은 대기
-                        time.sleep(2)
-                        return True
-                except Exception:
-                    pass
-                time.sleep(1)
-            
-            return False
+            # 앱이 포그라운드에서 실행될 때까지 대기 (query_app_state로 확인하여 상태가 바뀌는 즉시 반환)
+            # 메인 화면 로드는 호출한 쪽의 is_*_loaded가 polling으로 확인하므로 고정 대기를 두지 않음
+            return self.lifecycle.wait_for_foreground(app_package, timeout=timeout)
         except Exception:
             return False
 
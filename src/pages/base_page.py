@@ -1,49 +1,264 @@
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from appium.webdriver.common.appiumby import AppiumBy
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.command import Command
 from src.config.settings import load_config
+from src.adb import AdbShell, device_serial
+from src.hierarchy import PageSnapshot, UnsupportedLocator, is_supported
+from src.app_lifecycle import AppLifecycle
+from src.implicit_wait import implicit_wait
+from src.screen import ScreenTracker
+from src.toast import TOAST_LONG_DURATION, ToastListener
+from src.wait import WaitScheduler
+from dataclasses import dataclass
+import pytest_check as check
 import logging
+import re
 import time
-import subprocess
+import weakref
 
 log = logging.getLogger(__name__)
 log.setLevel(logging.DEBUG)
 
+# 네트워크 연결/해제 후 상태 변경을 기다리는 최대 시간과 polling 간격 상한 (초)
+NETWORK_TOGGLE_TIMEOUT = 15
+NETWORK_POLL_INTERVAL = 0.5
+NETWORK_SETTINGS = ('airplane_mode_on', 'wifi_on', 'mobile_data')
+# 기본 네트워크 id와 네트워크별 capability 줄만 가져옴 (전체 dumpsys 출력은 수백 줄)
+CONNECTIVITY_COMMAND = "dumpsys connectivity | grep -E 'Active default network|NetworkAgentInfo'"
+_ACTIVE_DEFAULT_NETWORK = re.compile(r"Active default network: (\d+)")
+_VALIDATED = re.compile(r"\bVALIDATED\b")
+
+# 긴 대기 중 세션 유지 명령 간격 (초). capabilities의 newCommandTimeout보다 짧아야 함
+KEEPALIVE_INTERVAL = 60
+
+# mobile: shell을 사용할 수 없는 세션 (키 이벤트를 adb shell로 전송)
+_MOBILE_SHELL_UNSUPPORTED = weakref.WeakSet()
+# Appium 서버가 adb_shell 기능을 허용하지 않았을 때의 오류 메시지
+# (예: "Potentially insecure feature 'uiautomator2:adb_shell' has not been enabled")
+_ADB_SHELL_NOT_ENABLED = re.compile(r"insecure feature '(?:[\w-]+:)?adb_shell' has not been enabled")
+
+
+@dataclass(frozen=True)
+class ElementSpec:
+    """
+    페이지 검증 엔진(BasePage.verify_elements)이 사용하는 요소 명세입니다.
+
+    Attributes:
+        name: 검증 결과 메시지에 사용할 요소 이름
+        locators: 우선순위 순서의 locator 옵션들
+        expected_text: 요소의 텍스트(또는 content-desc) 기대값 (None이면 존재 여부만 확인)
+    """
+    name: str
+    locators: tuple
+    expected_text: str | None = None
+
+
+def default_network_validated(output):
+    """
+    `dumpsys connectivity` 출력에서 기본 네트워크가 인터넷 검증(VALIDATED capability)을 통과했는지 확인합니다.
+
+    Args:
+        output: CONNECTIVITY_COMMAND의 출력
+
+    Returns:
+        bool: 기본 네트워크가 있고 검증되었으면 True (기본 네트워크가 none이면 False)
+    """
+    match = _ACTIVE_DEFAULT_NETWORK.search(output)
+    if match is None:
+        return False
+    network = f"network{{{match.group(1)}}}"
+    return any(
+        network in line and _VALIDATED.search(line)
+        for line in output.splitlines() if "NetworkAgentInfo" in line
+    )
+
+
 class BasePage:
     """모든 페이지에서 사용되는 반복적인 요소들을 모아둔 클래스"""
-    def __init__(self, driver):
+    def __init__(self, driver, config=None):
         self.driver = driver
+        # 프로세스 전역 설정을 생성 시 한 번 주입받아 메서드마다 .env를 다시 읽지 않음
+        self.config = config or load_config()
+        # 같은 드라이버를 사용하는 page object들이 전역 deadline과 대기 통계를 공유
+        self.waits = WaitScheduler.for_driver(driver)
+        self.lifecycle = AppLifecycle(driver, self.waits)
     
     def find(self, locator, timeout=10):
         """
-        요소를 찾습니다. 여러 locator 옵션이 제공되면 순차적으로 시도합니다.
+        요소를 찾습니다. 여러 locator 옵션이 제공되면 find_first로 모든 옵션을 동시에 확인합니다.
         
         Args:
             locator: 단일 locator (tuple) 또는 locator 리스트
-            timeout: 각 locator를 시도할 때의 최대 대기 시간 (초)
+            timeout: 최대 대기 시간 (초). locator 리스트인 경우 모든 옵션이 이 시간을 공유합니다.
             
         Returns:
             WebElement: 찾은 요소
         """
-        # locator가 리스트인 경우 여러 옵션을 시도
+        # locator가 리스트인 경우 여러 옵션을 하나의 deadline 안에서 동시에 확인
         if isinstance(locator, list):
-            for loc in locator:
-                try:
-                    if isinstance(loc, tuple) and len(loc) == 2:
-                        return WebDriverWait(self.driver, timeout).until(
-                            EC.presence_of_element_located(loc)
-                        )
-                except Exception:
-                    continue
-            raise ValueError(f"모든 locator 옵션을 시도했지만 요소를 찾을 수 없습니다: {locator}")
+            options = [loc for loc in locator if isinstance(loc, tuple) and len(loc) == 2]
+            try:
+                element, _ = self.find_first(options, timeout=timeout)
+                return element
+            except TimeoutException:
+                raise ValueError(f"모든 locator 옵션을 시도했지만 요소를 찾을 수 없습니다: {locator}")
         
         # 단일 locator인 경우
         if not isinstance(locator, tuple) or len(locator) != 2:
             raise ValueError(f"Invalid locator format. Expected tuple of (by, value), got: {type(locator)} - {locator}")
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(locator)
-        )
+        return self._wait_until(EC.presence_of_element_located(locator), timeout, name="find")
+
+    def _wait_until(self, condition, timeout, name="wait_until"):
+        """
+        implicit wait을 0으로 둔 상태에서 expected_conditions 조건을 backoff polling으로 대기합니다.
+        implicit wait이 남아있으면 polling 한 번이 최대 implicit wait만큼 블로킹되어 timeout을 넘길 수 있습니다.
+
+        Raises:
+            TimeoutException: timeout(또는 전역 deadline) 안에 조건을 만족하지 못했을 때
+        """
+        with implicit_wait(self.driver, 0):
+            result = self.waits.until(lambda: condition(self.driver), timeout, name=name)
+        if not result:
+            raise TimeoutException(f"{timeout}초 이내에 조건을 만족하지 못했습니다: {name}")
+        return result
+
+    def probe(self, locator, displayed_only=False):
+        """
+        implicit wait 없이 디바이스에서 locator를 한 번만 조회합니다.
+        요소가 없어도 즉시 반환하므로 존재하지 않음을 확인하는 용도(부재 확인, 팝업 확인 등)에 사용합니다.
+
+        Args:
+            locator: 조회할 locator (tuple)
+            displayed_only: True이면 화면에 표시된 요소만 반환
+
+        Returns:
+            list: 조회된 WebElement 목록 (조회 실패 시 빈 리스트)
+        """
+        try:
+            with implicit_wait(self.driver, 0):
+                elements = self.driver.find_elements(*locator)
+                if displayed_only:
+                    elements = [element for element in elements if element.is_displayed()]
+                return elements
+        except Exception as e:
+            log.debug(f"probe 조회 실패: {locator} - {e}")
+            return []
+
+    def is_absent(self, locator, displayed_only=True):
+        """
+        요소가 현재 화면에 없는지 즉시 확인합니다. (implicit wait만큼 블로킹되지 않음)
+
+        Returns:
+            bool: 요소가 없으면 True
+        """
+        return not self.probe(locator, displayed_only=displayed_only)
+
+    def wait_for_absent(self, locator, timeout=10, name="wait_for_absent"):
+        """
+        요소가 화면에서 사라질 때까지 대기합니다.
+        로컬에서 평가 가능한 locator는 polling마다 page_source 스냅샷 한 번으로 확인하고,
+        그 외의 locator는 implicit wait 없이 디바이스에서 조회합니다.
+
+        Args:
+            locator: 사라지기를 기다릴 요소의 locator
+            timeout: 최대 대기 시간 (초)
+            name: 대기 통계를 기록할 조건 이름
+
+        Returns:
+            bool: timeout 안에 요소가 사라졌으면 True
+        """
+        def absent():
+            snapshot = self.take_snapshot() if is_supported(locator) else None
+            if snapshot is not None:
+                return snapshot.find(locator) is None
+            return self.is_absent(locator)
+
+        with implicit_wait(self.driver, 0):
+            return bool(self.waits.until(absent, timeout, name=name))
+
+    @staticmethod
+    def _node_meets_condition(node, condition):
+        """스냅샷 노드가 find_first의 조건(present/visible/clickable)을 만족하는지 확인합니다."""
+        if condition == "present":
+            return True
+        if not PageSnapshot.is_displayed(node):
+            return False
+        if condition == "clickable":
+            return node.get("enabled", "true") == "true"
+        return True
+
+    @staticmethod
+    def _element_meets_condition(element, condition):
+        """WebElement가 find_first의 조건(present/visible/clickable)을 만족하는지 확인합니다."""
+        if condition == "present":
+            return True
+        if not element.is_displayed():
+            return False
+        if condition == "clickable":
+            return element.is_enabled()
+        return True
+
+    def _find_live_first(self, locator, condition):
+        """디바이스에서 locator를 한 번 조회하여 조건을 만족하는 첫 번째 요소를 반환합니다."""
+        for element in self.probe(locator):
+            try:
+                if self._element_meets_condition(element, condition):
+                    return element
+            except Exception:
+                continue
+        return None
+
+    def find_first(self, locators, timeout=10, condition="present", poll_interval=None, name="find_first"):
+        """
+        여러 locator 후보 중 가장 먼저 일치하는 요소를 찾습니다.
+        모든 후보가 하나의 deadline을 공유하며, 매 polling마다 page_source 스냅샷 한 번으로
+        모든 후보를 로컬에서 평가한 뒤 일치한 locator로만 실제 요소를 가져옵니다.
+        같은 polling에서 여러 후보가 일치하면 리스트의 앞쪽 locator가 우선합니다.
+
+        Args:
+            locators: locator 후보 리스트 (우선순위 순서)
+            timeout: 모든 후보가 공유하는 최대 대기 시간 (초)
+            condition: "present"(존재), "visible"(표시), "clickable"(표시 및 활성화) 중 하나
+            poll_interval: polling 간격의 상한 (초, None이면 스케줄러 기본값)
+            name: 대기 통계를 기록할 조건 이름
+
+        Returns:
+            tuple: (WebElement, 일치한 locator)
+
+        Raises:
+            TimeoutException: timeout 안에 어떤 후보도 일치하지 않을 때
+        """
+        with implicit_wait(self.driver, 0):
+            result = self.waits.until(
+                lambda: self._poll_first(locators, condition),
+                timeout, name=name, max_interval=poll_interval,
+            )
+        if result is None:
+            raise TimeoutException(f"{timeout}초 이내에 locator 후보 중 일치하는 요소를 찾을 수 없습니다: {locators}")
+        return result
+
+    def _poll_first(self, locators, condition):
+        """
+        find_first의 polling 한 번입니다. implicit wait 0 상태에서 호출되어야 합니다.
+
+        Returns:
+            tuple | None: (WebElement, 일치한 locator), 일치하는 후보가 없으면 None
+        """
+        snapshot = self.take_snapshot()
+        for index, locator in enumerate(locators):
+            if snapshot is not None and is_supported(locator):
+                matched = any(
+                    self._node_meets_condition(node, condition)
+                    for node in snapshot.find_all(locator)
+                )
+                if not matched:
+                    continue
+            element = self._find_live_first(locator, condition)
+            if element is not None:
+                log.debug(f"find_first: {index + 1}번째 locator 후보로 요소를 찾았습니다: {locator}")
+                return element, locator
+        return None
 
     def click(self, locator, timeout=10):
         clickable_element = self.wait_for_clickable(locator, timeout)
@@ -63,24 +278,16 @@ class BasePage:
         element.send_keys(text)
 
     def wait_for_visible(self, locator, timeout=10):
-        return WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(locator)
-        )
+        return self._wait_until(EC.visibility_of_element_located(locator), timeout, name="wait_for_visible")
 
     def wait_for_clickable(self, locator, timeout=10):
-        return WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable(locator)
-        )
+        return self._wait_until(EC.element_to_be_clickable(locator), timeout, name="wait_for_clickable")
 
     def wait_for_present(self, locator, timeout=10):
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(locator)
-        )
+        return self._wait_until(EC.presence_of_element_located(locator), timeout, name="wait_for_present")
 
     def wait_for_not_present(self, locator, timeout=10):
-        return WebDriverWait(self.driver, timeout).until(
-            EC.invisibility_of_element_located(locator)
-        )
+        return self._wait_until(EC.invisibility_of_element_located(locator), timeout, name="wait_for_not_present")
 
     def scroll_to_text(self, text):
         return self.driver.find_element(
@@ -101,11 +308,12 @@ class BasePage:
         )
     
     def wait_for_toast_message(self, toast_text: str, timeout: int = 5) -> bool:
-        
-        # TODO 토스트 팝업이 노출되지 않았더라도 성공으로 간주하고 있는 러프한 기준을 사용하고 있는 부분을 수정해야함.
         """
         주어진 텍스트를 포함하는 토스트 메시지가 나타날 때까지 대기합니다.
         toast_text가 토스트 메시지의 일부만 포함해도 매칭됩니다.
+        드라이버에 ToastListener가 연결되어 있으면 수집된 토스트로 확인하고, 없으면 화면에서 android.widget.Toast를 polling합니다.
+        어느 경우든 timeout 안에 확인하지 못하면 실패입니다.
+        "로그인 중입니다." 같은 로딩 팝업은 토스트가 아니므로 화면 요소로 확인해야 합니다.
         
         Args:
             toast_text: 토스트 메시지에 포함될 텍스트 (예: "이메일을 입력해주세요." 또는 "10번 실패하면 10분간 로그인이 제한돼요.")
@@ -115,6 +323,16 @@ class BasePage:
             bool: 토스트 메시지가 성공적으로 감지되면 True, 아니면 False
         """
         
+        # 0. 토스트 리스너가 연결되어 있으면 수집된 토스트에서 확인 (화면 polling 없음)
+        listener = ToastListener.for_driver(self.driver)
+        if listener is not None:
+            event = listener.wait_for(toast_text, timeout=timeout)
+            if event is None:
+                log.debug(f"{timeout}초 이내에 토스트 메시지 '{toast_text}'가 수집되지 않았습니다.")
+                return False
+            log.debug(f"토스트 메시지 '{event.text}' 수집 확인.")
+            return True
+        
         # 1. 토스트 메시지를 찾기 위한 범용적인 XPath 구성
         # contains() 함수를 사용하여 부분 문자열 매칭 지원
         # 예: toast_text="10번 실패하면 10분간 로그인이 제한돼요."는
@@ -127,32 +345,16 @@ class BasePage:
         # 2. WebDriver Wait 및 EC.presence_of_element_located 사용
         # presence_of_element_located는 해당 요소가 페이지 소스에 포함될 때까지 기다립니다.
         # 토스트는 잠깐 나타났다 사라지므로, 짧은 시간 내에 감지해야 합니다.
+        # 화면에서 놓칠 수 있는 짧은 토스트는 --toast-listener로 실행하여 logcat에서 수집합니다.
         locator = (AppiumBy.XPATH, TOAST_XPATH)
         
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            self._wait_until(EC.presence_of_element_located(locator), timeout, name="wait_for_toast_message")
             log.debug(f"토스트 메시지 '{toast_text}' 감지 성공.")
             return True
         except TimeoutException:
-            # 타임아웃 발생 시, 토스트가 나타나지 않았거나 너무 빨리 사라진 경우
-            # 이미 사라진 경우도 성공으로 간주 (토스트가 나타났다가 사라진 것으로 간주)
-            try:
-                elements = self.driver.find_elements(*locator)
-                visible_elements = [e for e in elements if e.is_displayed()]
-                if len(visible_elements) == 0:
-                    # 토스트가 화면에 없으면 이미 나타났다가 사라진 것으로 간주
-                    log.debug(f"토스트 메시지 '{toast_text}'가 타임아웃 전에 이미 사라진 것으로 간주 (성공).")
-                    return True
-                else:
-                    # 토스트가 여전히 보이면 실패
-                    log.debug(f"{timeout}초 이내에 토스트 메시지 '{toast_text}'를 감지하지 못했습니다.")
-                    return False
-            except Exception:
-                # 요소를 찾을 수 없으면 이미 사라진 것으로 간주
-                log.debug(f"토스트 메시지 '{toast_text}'가 타임아웃 전에 이미 사라진 것으로 간주 (성공).")
-                return True
+            log.debug(f"{timeout}초 이내에 토스트 메시지 '{toast_text}'를 감지하지 못했습니다.")
+            return False
         except Exception as e:
             # 기타 예외 처리
             log.debug(f"토스트 감지 중 예상치 못한 오류 발생: {e}")
@@ -171,6 +373,14 @@ class BasePage:
             bool: 토스트 메시지가 성공적으로 사라지면 True, 타임아웃되면 False
         """
         
+        # 0. 토스트 리스너에 기록된 토스트가 최대 노출 시간을 지났으면 화면을 확인하지 않고 사라진 것으로 판단
+        listener = ToastListener.for_driver(self.driver)
+        if listener is not None:
+            event = listener.find(toast_text, latest=True)
+            if event is not None and time.time() - event.timestamp >= TOAST_LONG_DURATION:
+                log.debug(f"토스트 메시지 '{toast_text}' 노출 시간 경과로 사라짐 확인.")
+                return True
+        
         # 1. 토스트 메시지를 찾기 위한 XPath 구성
         # contains() 함수를 사용하여 부분 문자열 매칭 지원
         # toast_text에 따옴표가 포함될 수 있으므로 XPath에서 안전하게 처리
@@ -181,9 +391,7 @@ class BasePage:
         
         try:
             # 2. EC.invisibility_of_element_located를 사용하여 요소가 사라질 때까지 대기
-            WebDriverWait(self.driver, timeout).until(
-                EC.invisibility_of_element_located(locator)
-            )
+            self._wait_until(EC.invisibility_of_element_located(locator), timeout, name="wait_for_toast_to_disappear")
             log.debug(f"토스트 메시지 '{toast_text}' 사라짐 확인 성공.")
             return True
         except TimeoutException:
@@ -196,26 +404,227 @@ class BasePage:
             return False
 
     def is_element_present(self, locator, timeout=3):
+        """
+        요소가 존재하는지 확인합니다.
+        로컬에서 평가 가능한 locator는 page_source 스냅샷으로 확인하고,
+        그 외의 locator는 backoff polling으로 디바이스에서 확인합니다.
+        """
+        if is_supported(locator):
+            return self.wait_for_any_present(
+                [(str(locator), locator)], timeout=timeout, displayed_only=False, name="is_element_present"
+            ) is not None
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            self._wait_until(EC.presence_of_element_located(locator), timeout, name="is_element_present")
             return True
         except:
             return False
 
+    def _is_present_live(self, locator, displayed_only=True):
+        """로컬에서 평가할 수 없는 locator를 디바이스에서 implicit wait 없이 한 번 조회합니다."""
+        try:
+            return len(self.probe(locator, displayed_only=displayed_only)) > 0
+        except Exception:
+            return False
+
+    def wait_for_any_present(self, named_locators, timeout=10, poll_interval=None, displayed_only=True, name="wait_for_any_present"):
+        """
+        여러 요소 중 하나라도 나타날 때까지 대기합니다.
+        매 polling마다 page_source 스냅샷을 한 번만 가져와 모든 locator를 로컬에서 평가하며,
+        로컬에서 평가할 수 없는 locator만 디바이스에서 조회합니다.
+
+        Args:
+            named_locators: [(요소 이름, locator), ...]
+            timeout: 최대 대기 시간 (초)
+            poll_interval: polling 간격의 상한 (초, None이면 스케줄러 기본값)
+            displayed_only: True이면 화면에 표시된 요소만 인정
+            name: 대기 통계를 기록할 조건 이름 (예: "is_login_page_loaded")
+
+        Returns:
+            str | None: 처음 찾은 요소의 이름, 타임아웃되면 None
+        """
+        # 대기 전체를 implicit wait 0으로 실행하여 live 조회마다 implicit wait을 변경하지 않음
+        with implicit_wait(self.driver, 0):
+            return self.waits.until(
+                lambda: self._poll_any_present(named_locators, displayed_only),
+                timeout, name=name, max_interval=poll_interval,
+            )
+
+    def _poll_any_present(self, named_locators, displayed_only):
+        """
+        wait_for_any_present의 polling 한 번입니다. implicit wait 0 상태에서 호출되어야 합니다.
+
+        Returns:
+            str | None: 찾은 요소의 이름, 없으면 None
+        """
+        snapshot = self.take_snapshot()
+        for element_name, locator in named_locators:
+            if snapshot is not None:
+                try:
+                    if snapshot.find(locator, displayed_only=displayed_only) is not None:
+                        return element_name
+                    continue
+                except UnsupportedLocator:
+                    pass
+            if self._is_present_live(locator, displayed_only=displayed_only):
+                return element_name
+        return None
+
+    def take_snapshot(self):
+        """
+        현재 화면의 page_source를 한 번 가져와 로컬 요소 트리(PageSnapshot)로 만듭니다.
+
+        Returns:
+            PageSnapshot | None: 스냅샷, page_source를 가져오거나 파싱하지 못하면 None
+        """
+        screens = self.screens
+        generation = screens.generation
+        try:
+            snapshot = PageSnapshot.capture(self.driver)
+        except Exception as e:
+            log.debug(f"page_source 스냅샷 생성 실패: {e}")
+            return None
+        # 가져온 스냅샷으로 현재 화면 식별 캐시도 갱신 (추가 명령 없음)
+        screens.observe(snapshot, generation)
+        return snapshot
+
+    @property
+    def screens(self):
+        """드라이버의 현재 화면 식별 서비스 (ScreenTracker)"""
+        return ScreenTracker.for_driver(self.driver)
+
+    def is_current_screen(self):
+        """
+        명령 없이 화면 식별 캐시만으로 현재 화면이 이 page object의 화면인지 확인합니다.
+        마지막 스냅샷 이후 클릭, 뒤로 가기, 앱 실행 등의 동작이 없었을 때만 True가 될 수 있습니다.
+
+        Returns:
+            bool: 캐시된 현재 화면이 이 page object의 화면이면 True
+        """
+        return self.screens.cached() is type(self)
+
+    def wait_for_screen(self, page_class, timeout=10):
+        """
+        화면이 page_class의 화면으로 바뀔 때까지 대기합니다. polling마다 page_source 한 번으로 화면을 식별합니다.
+
+        Args:
+            page_class: 기다릴 page object 클래스
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 시간 안에 화면이 바뀌었으면 True
+        """
+        return self.screens.wait_for(page_class, timeout=timeout)
+
+    def _find_in_snapshot(self, snapshot, locators):
+        """
+        스냅샷에서 locator 옵션들을 순서대로 평가하여 처음 일치한 locator의 노드를 반환합니다.
+        텍스트 일치 여부는 호출한 쪽에서 expected_text로 판단합니다.
+
+        Returns:
+            Element | None: 찾은 노드, 없으면 None
+        """
+        for locator in locators:
+            try:
+                node = snapshot.find(locator)
+            except UnsupportedLocator:
+                continue
+            if node is not None:
+                return node
+        return None
+
+    def _find_live_text(self, locators):
+        """
+        스냅샷에서 찾지 못한 요소를 실제 WebDriver 조회로 다시 확인합니다.
+        각 locator 옵션은 최대 1초씩 대기하며, 호출한 쪽의 전역 deadline을 넘기지 않습니다.
+
+        Returns:
+            tuple: (찾았는지 여부, 요소의 텍스트)
+        """
+        # 스냅샷에서 찾지 못한 경우에만 호출되므로, 이때만 implicit wait을 0으로 변경
+        with implicit_wait(self.driver, 0):
+            for locator in locators:
+                if self.waits.clamp(1) <= 0:
+                    break
+                try:
+                    element = self.wait_for_visible(locator, timeout=1)
+                    return True, element.text or element.get_attribute("content-desc") or ""
+                except Exception:
+                    continue
+        return False, None
+
+    def verify_elements(self, specs, timeout=5, app_package=None):
+        """
+        ElementSpec 목록을 한 번의 page_source 스냅샷으로 검증합니다.
+        스냅샷에서 찾지 못한 요소만 실제 WebDriver 조회로 fallback 하므로,
+        페이지가 정상이라면 전체 검증에 한 번의 round-trip만 사용됩니다.
+        check 방식을 사용하여 실패해도 다음 step을 수행할 수 있습니다.
+
+        Args:
+            specs: 검증할 ElementSpec 목록
+            timeout: 스냅샷에서 찾지 못한 요소들의 live 조회에 사용할 전체 최대 대기 시간 (초)
+            app_package: 지정하면 스냅샷의 패키지가 이 앱인지 먼저 확인
+
+        Returns:
+            bool: 모든 요소가 존재하고 기대 텍스트와 일치하면 True
+        """
+        snapshot = self.take_snapshot()
+
+        # 앱이 실행 중인지 확인 (스냅샷의 패키지로 확인하고, 알 수 없을 때만 current_package 조회)
+        if app_package is not None:
+            try:
+                current_package = snapshot.package if snapshot else None
+                if current_package != app_package:
+                    current_package = self.driver.current_package
+                if current_package != app_package:
+                    check.fail(f"앱이 실행 중이 아닙니다. 현재 패키지: {current_package}, 예상 패키지: {app_package}")
+                    return False
+            except Exception as e:
+                check.fail(f"앱 실행 상태 확인 실패: {e}")
+                return False
+
+        all_passed = True
+
+        # 스냅샷에서 찾지 못한 요소들의 live 조회가 모두 하나의 deadline을 공유
+        with self.waits.deadline(timeout):
+            for spec in specs:
+                node = self._find_in_snapshot(snapshot, spec.locators) if snapshot else None
+                if node is not None:
+                    found, text = True, PageSnapshot.text_of(node)
+                else:
+                    log.debug(f"{spec.name} 요소를 스냅샷에서 찾지 못해 live 조회로 확인합니다.")
+                    found, text = self._find_live_text(spec.locators)
+
+                check.is_true(found, f"{spec.name} 요소가 존재하지 않습니다.")
+                if not found:
+                    all_passed = False
+                    continue
+
+                if spec.expected_text is not None:
+                    check.equal(text, spec.expected_text, f"{spec.name}의 텍스트가 '{spec.expected_text}'이(가) 아닙니다. 실제 텍스트: '{text}'")
+                    if text != spec.expected_text:
+                        all_passed = False
+
+        return all_passed
+
     def app_background(self, seconds=3):
         self.driver.background_app(seconds)
     
     def _get_device_serial(self):
-        """Appium capabilities에서 디바이스 시리얼(UDID)을 가져옵니다."""
-        # 'deviceName' 대신 'udid'나 'device.serial' 등을 사용하면 더 정확할 수 있습니다.
-        return self.driver.capabilities.get('udid') or self.driver.capabilities.get('deviceName', 'emulator-5554')
+        """Appium capabilities에서 디바이스 시리얼(UDID)을 가져옵니다. 드라이버별로 한 번만 조회합니다."""
+        return device_serial(self.driver)
     
-    def disable_network(self):
+    def _adb(self):
+        """현재 디바이스의 영구 adb shell 세션을 반환합니다."""
+        return AdbShell.for_serial(self._get_device_serial())
+    
+    def disable_network(self, timeout=NETWORK_TOGGLE_TIMEOUT):
         """
         인터넷 네트워크 연결을 확실하게 끊습니다.
         (모바일 데이터 및 Wi-Fi를 명시적으로 비활성화)
+        고정 시간 대기 대신 네트워크 설정이 꺼지고 기본 네트워크가 해제될 때까지 polling합니다.
+        
+        Args:
+            timeout: 네트워크가 끊기기를 기다리는 최대 시간 (초)
         
         Returns:
             bool: 네트워크를 성공적으로 끊었으면 True
@@ -225,61 +634,53 @@ class BasePage:
         try:
             log.info(f"[{device_serial}] 네트워크 연결 차단 시작...")
 
-            # 1. 모바일 데이터 (Data) 비활성화
-            # 'svc data disable' 명령어는 모바일 데이터 연결을 즉시 끊습니다.
-            subprocess.run(
-                ['adb', '-s', device_serial, 'shell', 'svc', 'data', 'disable'],
-                check=True,  # 오류 발생 시 예외 발생
-                capture_output=True,
-                timeout=5
-            )
-            log.debug(f"[{device_serial}] 모바일 데이터 비활성화 완료.")
-
-            # 2. Wi-Fi 비활성화
-            # 'svc wifi disable' 명령어는 Wi-Fi 연결을 즉시 끊습니다.
-            subprocess.run(
-                ['adb', '-s', device_serial, 'shell', 'svc', 'wifi', 'disable'],
-                check=True,
-                capture_output=True,
-                timeout=5
-            )
-            log.debug(f"[{device_serial}] Wi-Fi 비활성화 완료.")
+            # 모바일 데이터와 Wi-Fi 비활성화를 adb 왕복 한 번으로 실행
+            results = self._adb().run_batch(['svc data disable', 'svc wifi disable'])
+            failed = [result.output for result in results if not result.ok]
+            if failed:
+                log.error(f"[{device_serial}] ADB 명령 실행 실패: {failed}")
+                return False
+            log.debug(f"[{device_serial}] 모바일 데이터 및 Wi-Fi 비활성화 완료.")
             
-            # 네트워크 상태 변경을 기다림 (충분히 줌)
-            time.sleep(3)
+            if not self.wait_for_network(connected=False, timeout=timeout):
+                log.error(f"[{device_serial}] {timeout}초 안에 네트워크가 끊기지 않았습니다.")
+                return False
 
             log.info(f"[{device_serial}] 네트워크 끊기 성공.")
             return True
             
-        except subprocess.CalledProcessError as e:
-            # ADB 명령어 실행 중 오류가 발생한 경우 (check=True 때문)
-            log.error(f"[{device_serial}] ADB 명령 실행 실패. Stderr: {e.stderr.decode().strip()}")
-            return False
         except Exception as e:
-            # 기타 예외 처리
             log.error(f"[{device_serial}] 네트워크 끊기 실패: {e}")
             return False
     
-    def enable_network(self):
+    def enable_network(self, timeout=NETWORK_TOGGLE_TIMEOUT):
         """
         네트워크 연결을 복원합니다.
         (모바일 데이터 및 Wi-Fi 활성화)
+        고정 시간 대기 대신 라디오가 다시 연결되어 기본 네트워크가 인터넷 검증(VALIDATED)을 통과할 때까지 polling합니다.
+        
+        Args:
+            timeout: 네트워크가 연결되기를 기다리는 최대 시간 (초)
+        
+        Returns:
+            bool: 네트워크가 연결되었으면 True
         """
         device_serial = self._get_device_serial()
 
         try:
             log.info(f"[{device_serial}] 네트워크 연결 복원 시작...")
             
-            # 1. 모바일 데이터 (Data) 활성화
-            subprocess.run(['adb', '-s', device_serial, 'shell', 'svc', 'data', 'enable'], check=True, timeout=5)
-            log.debug(f"[{device_serial}] 모바일 데이터 활성화 완료.")
-
-            # 2. Wi-Fi 활성화
-            subprocess.run(['adb', '-s', device_serial, 'shell', 'svc', 'wifi', 'enable'], check=True, timeout=5)
-            log.debug(f"[{device_serial}] Wi-Fi 활성화 완료.")
+            results = self._adb().run_batch(['svc data enable', 'svc wifi enable'])
+            failed = [result.output for result in results if not result.ok]
+            if failed:
+                log.error(f"[{device_serial}] ADB 명령 실행 실패: {failed}")
+                return False
+            log.debug(f"[{device_serial}] 모바일 데이터 및 Wi-Fi 활성화 완료.")
             
             # 네트워크 연결이 복구될 때까지 대기
-            time.sleep(5) 
+            if not self.wait_for_network(connected=True, timeout=timeout):
+                log.error(f"[{device_serial}] {timeout}초 안에 네트워크가 연결되지 않았습니다.")
+                return False
             
             log.info(f"[{device_serial}] 네트워크 복원 성공.")
             return True
@@ -288,6 +689,61 @@ class BasePage:
             log.error(f"[{device_serial}] 네트워크 복원 실패: {e}")
             return False
     
+    def wait_for_network(self, connected, timeout=NETWORK_TOGGLE_TIMEOUT):
+        """
+        네트워크가 connected 상태가 될 때까지 대기합니다.
+        svc 명령은 네트워크 설정을 즉시 바꾸므로, 설정(is_network_connected와 같은 기준)과 함께
+        `dumpsys connectivity`의 기본 네트워크가 인터넷 검증(VALIDATED)을 통과했는지 확인합니다.
+        ICMP가 막힌 CI 네트워크가 있으므로 ping은 사용하지 않습니다.
+        
+        Args:
+            connected: True이면 연결될 때까지, False이면 끊길 때까지 대기
+            timeout: 최대 대기 시간 (초)
+        
+        Returns:
+            bool: timeout 안에 목표 상태가 되었으면 True
+        """
+        def reached():
+            state = self._network_state(connectivity=True)
+            if connected:
+                # 설정이 켜진 뒤에도 라디오가 다시 연결되고 인터넷이 검증될 때까지 시간이 걸림
+                return self._is_connected(state) and state['validated']
+            # 에뮬레이터는 가상 WiFi가 항상 연결되어 있으므로 설정만 확인
+            return not self._is_connected(state) and (not state['validated'] or self._is_emulator())
+        
+        name = "wait_for_network_connected" if connected else "wait_for_network_disconnected"
+        return bool(self.waits.until(reached, timeout, name=name, max_interval=NETWORK_POLL_INTERVAL))
+    
+    def _network_state(self, connectivity=False):
+        """
+        비행기 모드, Wi-Fi, 모바일 데이터 설정을 adb 왕복 한 번으로 읽어옵니다.
+        
+        Args:
+            connectivity: True이면 같은 왕복에서 기본 네트워크의 인터넷 검증 여부('validated')도 읽음
+        
+        Returns:
+            dict: 설정 이름별 활성화 여부
+        """
+        commands = [f"settings get global {key}" for key in NETWORK_SETTINGS]
+        if connectivity:
+            commands.append(CONNECTIVITY_COMMAND)
+        results = self._adb().run_batch(commands)
+        state = {key: result.output == '1' for key, result in zip(NETWORK_SETTINGS, results)}
+        if connectivity:
+            state['validated'] = default_network_validated(results[-1].output)
+        return state
+    
+    def _is_emulator(self):
+        return self._get_device_serial().startswith('emulator-')
+    
+    def _is_connected(self, state):
+        # 비행기 모드가 최우선 조건, 에뮬레이터는 WiFi가 항상 켜져있으므로 모바일 데이터만 확인
+        if state['airplane_mode_on']:
+            return False
+        if self._is_emulator():
+            return state['mobile_data']
+        return state['wifi_on'] or state['mobile_data']
+    
     def is_network_connected(self):
         """
         인터넷 네트워크 연결 상태를 확인합니다.
@@ -300,68 +756,22 @@ class BasePage:
         """
         
         try:
-            # 현재 디바이스 정보 가져오기
-            device_name = self.driver.capabilities.get('deviceName', 'emulator-5554')
-            
-            # Step 1: 최우선 조건 - 비행기 모드가 켜져있는지 확인
-            airplane_mode_result = subprocess.run(
-                ['adb', '-s', device_name, 'shell', 'settings', 'get', 'global', 'airplane_mode_on'],
-                capture_output=True,
-                text=True,
-                timeout=5
+            state = self._network_state()
+            connected = self._is_connected(state)
+            log.debug(
+                f"네트워크 상태 확인: 비행기 모드={state['airplane_mode_on']}, "
+                f"WiFi={state['wifi_on']}, 모바일 데이터={state['mobile_data']} -> {'연결' if connected else '연결 없음'}"
             )
-            
-            airplane_mode_on = airplane_mode_result.stdout.strip() == '1'
-            
-            if airplane_mode_on:
-                log.debug("비행기 모드가 활성화되어 있어 네트워크 연결 없음")
-                return False
-            
-            # Step 2: 비행기 모드가 꺼져있으면 WiFi/모바일 데이터 상태 확인
-            # 에뮬레이터인지 확인 (deviceName이 'emulator-'로 시작하는지 확인)
-            is_emulator = device_name.startswith('emulator-')
-            
-            if is_emulator:
-                # 에뮬레이터인 경우: 모바일 데이터 상태만 확인 (WiFi는 항상 켜져있으므로)
-                data_result = subprocess.run(
-                    ['adb', '-s', device_name, 'shell', 'settings', 'get', 'global', 'mobile_data'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                data_on = data_result.stdout.strip() == '1'
-                log.debug(f"에뮬레이터 네트워크 상태 확인: 모바일 데이터={'활성화' if data_on else '비활성화'}")
-                return data_on
-            else:
-                # 실제 디바이스인 경우: WiFi 또는 모바일 데이터 중 하나라도 활성화되어 있으면 True
-                wifi_result = subprocess.run(
-                    ['adb', '-s', device_name, 'shell', 'settings', 'get', 'global', 'wifi_on'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                data_result = subprocess.run(
-                    ['adb', '-s', device_name, 'shell', 'settings', 'get', 'global', 'mobile_data'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                wifi_on = wifi_result.stdout.strip() == '1'
-                data_on = data_result.stdout.strip() == '1'
-                
-                log.debug(f"실제 디바이스 네트워크 상태 확인: WiFi={'활성화' if wifi_on else '비활성화'}, 모바일 데이터={'활성화' if data_on else '비활성화'}")
-                return wifi_on or data_on
+            return connected
         except Exception as e:
-            print(f"네트워크 상태 확인 실패: {e}")
+            log.error(f"네트워크 상태 확인 실패: {e}")
             return False
     
     def terminate_all_apps(self, app_package: str = None):
         """
         현재 실행 중인 앱을 완전히 종료하고 홈 화면으로 이동합니다.
         앱을 완전히 종료하여 다음 실행 시 처음부터 시작하도록 합니다.
+        terminate_app으로 앱이 종료되면 force-stop, killall 단계는 수행하지 않습니다.
         
         Args:
             app_package: 종료할 앱의 패키지 이름 (None이면 설정에서 로드)
@@ -372,64 +782,17 @@ class BasePage:
         
         try:
             if app_package is None:
-                config = load_config()
-                app_package = config.app_package
-            
-            device_name = self.driver.capabilities.get('deviceName', 'emulator-5554')
-            
-            # 1) 홈 화면으로 이동 (앱을 백그라운드로 전환)
-            self.driver.press_keycode(3)  # KEYCODE_HOME
-            time.sleep(0.5)
-            
-            # 2) Appium의 terminate_app 사용
-            try:
-                self.driver.terminate_app(app_package)
-                time.sleep(0.5)
-            except Exception:
-                pass
-            
-            # 3) ADB를 통한 강제 종료 (force-stop)
-            try:
-                subprocess.run(
-                    ['adb', '-s', device_name, 'shell', 'am', 'force-stop', app_package],
-                    capture_output=True,
-                    timeout=5
-                )
-                time.sleep(0.5)
-            except Exception:
-                pass
-            
-            # 4) 앱 프로세스 완전 종료 (killall)
-            try:
-                # 앱의 메인 프로세스 이름 찾기 (일반적으로 패키지 이름과 동일)
-                subprocess.run(
-                    ['adb', '-s', device_name, 'shell', 'killall', app_package],
-                    capture_output=True,
-                    timeout=5
-                )
-                time.sleep(0.5)
-            except Exception:
-                pass
+                app_package = self.config.app_package
             
-            # 5) 앱이 완전히 종료되었는지 확인
-            max_retries = 5
-            for _ in range(max_retries):
-                try:
-                    current_package = self.driver.current_package
-                    if current_package != app_package:
-                        # 앱이 종료되었음
-                        break
-                except Exception:
-                    # current_package를 확인할 수 없으면 종료된 것으로 간주
-                    break
-                time.sleep(0.5)
+            # 1) 앱 종료 (query_app_state로 종료를 확인하는 즉시 반환)
+            terminated = self.lifecycle.terminate(app_package)
             
-            # 6) 최종 확인: 홈 화면으로 이동
+            # 2) 홈 화면으로 이동
             self.driver.press_keycode(3)  # KEYCODE_HOME
-            time.sleep(0.5)
             
-            log.debug(f"앱 완전 종료 성공: {app_package}")
-            return True
+            if terminated:
+                log.debug(f"앱 완전 종료 성공: {app_package}")
+            return terminated
         except Exception as e:
             log.debug(f"앱 종료 실패: {e}")
             # 실패 시 홈 버튼만 누르기
@@ -452,17 +815,14 @@ class BasePage:
             (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("앱 닫기")'),
         ]
         
+        # probe는 implicit wait 없이 조회하므로 팝업이 없을 때 locator마다 implicit wait만큼 블로킹되지 않음
         for locator in quick_check_locators:
-            try:
-                elements = self.driver.find_elements(*locator)
-                for element in elements:
-                    try:
-                        if element and element.is_displayed():
-                            return True, element
-                    except Exception:
-                        continue
-            except Exception:
-                continue
+            for element in self.probe(locator):
+                try:
+                    if element and element.is_displayed():
+                        return True, element
+                except Exception:
+                    continue
         
         return False, None
     
@@ -527,9 +887,57 @@ class BasePage:
 
         return before_activity == after_activity
 
+    def press_keycodes(self, keycodes):
+        """
+        여러 키 이벤트를 한 번의 명령으로 보냅니다. (`input keyevent <code> <code> ...`)
+        1) mobile: shell (Appium 서버가 adb_shell 기능을 허용한 경우)
+        2) 영구 adb shell 세션 (src/adb.py)
+        3) press_keycode 반복 (위 방법을 모두 사용할 수 없을 때)
+        
+        Args:
+            keycodes: Android keycode 목록
+        
+        Returns:
+            str: 키 이벤트를 보낸 방법 ("mobile_shell", "adb_shell", "press_keycode")
+        
+        Raises:
+            WebDriverException: adb_shell 기능 미허용 외의 이유(timeout 등)로 mobile: shell이 실패했을 때
+                (키 이벤트 일부가 이미 전송되었을 수 있으므로 다른 방법으로 다시 보내지 않음)
+        """
+        keycodes = [str(keycode) for keycode in keycodes]
+        if not keycodes:
+            return None
+        
+        if self.driver not in _MOBILE_SHELL_UNSUPPORTED:
+            try:
+                self.driver.execute_script('mobile: shell', {'command': 'input', 'args': ['keyevent', *keycodes]})
+                return "mobile_shell"
+            except WebDriverException as e:
+                if not _ADB_SHELL_NOT_ENABLED.search(str(e)):
+                    raise
+                # 같은 세션에서 다시 시도하지 않도록 기록 (--allow-insecure adb_shell 없이 실행된 Appium 서버)
+                _MOBILE_SHELL_UNSUPPORTED.add(self.driver)
+                log.debug(f"mobile: shell을 사용할 수 없어 adb shell로 키 이벤트를 보냅니다: {e}")
+        
+        try:
+            # adb shell로 보낸 키 이벤트는 드라이버 명령으로 감지되지 않으므로 화면 식별 캐시를 직접 무효화
+            self.screens.invalidate()
+            result = self._adb().run(f"input keyevent {' '.join(keycodes)}")
+            if result.ok:
+                return "adb_shell"
+            log.debug(f"adb shell 키 이벤트 실패: {result.output}")
+        except Exception as e:
+            log.debug(f"adb shell 키 이벤트 실패: {e}")
+        
+        for keycode in keycodes:
+            self.driver.press_keycode(int(keycode))
+        return "press_keycode"
+    
     def clear_text_android(self, locator, max_backspace=50):
         """
         특정 입력 필드의 기존 텍스트를 완전히 삭제하는 공용 함수.
+        커서를 끝으로 옮기고(KEYCODE_MOVE_END) 백스페이스를 필요한 만큼 한 번의 명령으로 보내므로
+        텍스트 길이와 관계없이 명령 수가 일정합니다.
 
         Args:
             locator (tuple): (By.ID, "xxx") 형태의 locator
@@ -557,11 +965,10 @@ class BasePage:
             except:
                 text = ""
 
-            # 4) 텍스트가 남아있으면 백스페이스 반복
+            # 4) 텍스트가 남아있으면 커서를 끝으로 옮긴 뒤 백스페이스를 한 번에 전송
             if text:
-                for _ in range(min(len(text), max_backspace)):
-                    # Android Backspace: KEYCODE_DEL(67)
-                    self.driver.press_keycode(67)
+                # Android KEYCODE_MOVE_END(123), Backspace: KEYCODE_DEL(67)
+                self.press_keycodes([123] + [67] * min(len(text), max_backspace))
 
             # 5) 최종 확인
             try:
@@ -589,9 +996,10 @@ class BasePage:
         element = self.find(locator, timeout)
         return element.get_attribute("text") == "•" * len(element.get_attribute("text"))
     
-    def wait_with_session_keepalive(self, wait_seconds, check_interval=60):
+    def wait_with_session_keepalive(self, wait_seconds, check_interval=KEEPALIVE_INTERVAL):
         """
         세션 타임아웃을 방지하기 위해 주기적으로 세션을 활성화하면서 대기합니다.
+        세션 활성화에는 디바이스와 통신하지 않는 timeouts 조회를 사용하므로 테스트 중인 화면에 영향을 주지 않습니다.
         
         Args:
             wait_seconds: 대기할 총 시간 (초)
@@ -600,24 +1008,24 @@ class BasePage:
         Returns:
             bool: 대기 중 세션이 유지되면 True, 세션이 종료되면 False
         """
-        elapsed = 0
-        while elapsed < wait_seconds:
-            sleep_time = min(check_interval, wait_seconds - elapsed)
-            time.sleep(sleep_time)
-            elapsed += sleep_time
+        start_time = time.monotonic()
+        deadline = start_time + wait_seconds
+        while (remaining := deadline - time.monotonic()) > 0:
+            time.sleep(min(check_interval, remaining))
+            elapsed = time.monotonic() - start_time
             
             # 세션을 활성화하기 위해 간단한 명령 실행
             try:
-                _ = self.driver.current_package
+                self.driver.execute(Command.GET_TIMEOUTS)
                 # 세션이 정상적으로 활성화되었음을 로그로 기록 (hang up 오류와 구분하기 위함)
-                log.debug(f"세션 활성화 되었습니다. (경과 시간: {elapsed}초 / 총 대기 시간: {wait_seconds}초)")
+                log.debug(f"세션 활성화 되었습니다. (경과 시간: {elapsed:.1f}초 / 총 대기 시간: {wait_seconds}초)")
             except Exception as e:
-                log.warning(f"세션 체크 중 오류 발생 (경과 시간: {elapsed}초): {e}")
+                log.warning(f"세션 체크 중 오류 발생 (경과 시간: {elapsed:.1f}초): {e}")
                 return False
         
         return True
     
-    def logout_in_main_home_page(self, main_home_page, timeout=20):
+    def logout_in_main_home_page(self, main_home_page, timeout=20, deep_link=False):
         """
         오늘의집 메인 홈페이지에서 로그아웃을 수행하는 공통 함수입니다.
         하단 footer의 [마이페이지] 버튼 클릭 후 우측 상단의 [설정] 아이콘 버튼 탭하여 설정 페이지로 이동하고, 설정 페이지에서 로그아웃 버튼을 클릭합니다.
@@ -625,6 +1033,7 @@ class BasePage:
         Args:
             main_home_page: MainHomePage 객체
             timeout: 각 단계별 최대 대기 시간 (초, 기본값: 20)
+            deep_link: True이면 설정 페이지로 deep link를 사용해 바로 이동 (로그아웃이 전처리인 테스트용)
             
         Returns:
             bool: 로그아웃이 성공적으로 완료되었으면 True, 실패 시 False
@@ -632,36 +1041,15 @@ class BasePage:
         """
         try:
             # 순환 import 방지를 위해 함수 내부에서 import
-            from src.pages.my_page import MyPage
+            from src.navigation import Navigator
+            from src.pages.main_home_page import MainHomePage
             from src.pages.setting_page import SettingPage
             
-            # Step 1: 메인 홈 페이지 하단 footer의 [마이페이지] 버튼 클릭
-            try:
-                main_home_page.click(main_home_page.MYPAGE_BOTTOM_BUTTON, timeout=timeout)
-                time.sleep(0.5)  # 마이페이지 전환 대기
-            except Exception as e:
-                log.warning(f"마이페이지 버튼 클릭 실패: {e}")
-                return False, f"마이페이지 버튼 클릭 실패: {e}"
-
-            # Step 1: 마이페이지 로드 확인
-            my_page = MyPage(self.driver)
-            if not my_page.is_my_page_loaded(timeout=timeout):
-                log.warning("마이페이지가 로드되지 않았습니다.")
-                return False, "마이페이지가 로드되지 않았습니다."
-            
-            # Step 2: 설정 아이콘 버튼 클릭
-            try:
-                my_page.click(my_page.GEAR_ICON_BUTTON)
-                time.sleep(0.5)  # 페이지 전환 대기
-            except Exception as e:
-                log.warning(f"설정 아이콘 버튼 클릭 실패: {e}")
-                return False, f"설정 아이콘 버튼 클릭 실패: {e}"
-            
-            # Step 3: 설정 페이지 로드 확인
-            setting_page = SettingPage(self.driver)
-            if not setting_page.is_setting_page_loaded(timeout=timeout):
-                log.warning("설정 페이지가 로드되지 않았습니다.")
-                return False, "설정 페이지가 로드되지 않았습니다."
+            # Step 1 ~ 3: [마이페이지] 버튼 → [설정] 아이콘 버튼 탭, 화면별 로드 확인 (deep_link이면 설정 페이지로 바로 이동)
+            navigator = Navigator.for_driver(self.driver)
+            setting_page = navigator.go_to(SettingPage, timeout=timeout, start=MainHomePage, deep_link=deep_link)
+            if setting_page is None:
+                return False, navigator.last.error
             
             # Step 4: 페이지 최하단으로 스크롤
             try:
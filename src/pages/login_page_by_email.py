@@ -1,6 +1,9 @@
 from appium.webdriver.common.appiumby import AppiumBy
-from src.config.settings import load_config
-from src.pages.base_page import BasePage
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException, TimeoutException, WebDriverException,
+)
+from src.pages.base_page import BasePage, ElementSpec
+from dataclasses import dataclass
 import pytest_check as check
 import logging
 import time
@@ -9,6 +12,21 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+@dataclass(frozen=True)
+class LoginAttemptTiming:
+    """
+    로그인 시도 한 번의 소요 시간 기록
+
+    Attributes:
+        index: 시도 순번 (1부터 시작)
+        seconds: 입력란 채우기부터 로그인 버튼 클릭까지 걸린 시간 (초)
+        refinds: 캐시된 요소가 stale되어 다시 찾은 횟수
+    """
+    index: int
+    seconds: float
+    refinds: int = 0
+
+
 class LoginPageByEmail(BasePage):
     """이메일로 로그인 페이지를 제어하는 클래스"""
     
@@ -28,220 +46,56 @@ class LoginPageByEmail(BasePage):
     LOGIN_LOADING_POPUP_WIDGET = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("로그인 중입니다.")')
     LOGIN_FAILED_TEXT_WIDGET = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("10번 실패하면 10분간 로그인이 제한돼요.")')
 
-    def __init__(self, driver):
-        super().__init__(driver)
+    # 이메일로 로그인 페이지 UI 검증 명세 (BasePage.verify_elements에서 사용)
+    EMAIL_LOGIN_ELEMENT_SPECS = (
+        ElementSpec("BACK_BUTTON", (
+            BACK_BUTTON,
+            (AppiumBy.XPATH, '//android.widget.ImageView[@resource-id="net.bucketplace:id/backIcon"]'),
+        )),
+        ElementSpec("TITLE_TEXT", (
+            TITLE_TEXT,
+            (AppiumBy.XPATH, '//android.widget.TextView[@resource-id="net.bucketplace:id/title"]'),
+        ), expected_text="이메일 로그인"),
+        ElementSpec("ID_INPUT_FIELD", (
+            ID_INPUT_FIELD,
+            (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("이메일")'),
+            (AppiumBy.XPATH, '//android.widget.AutoCompleteTextView[@resource-id="net.bucketplace:id/inputField" and @text="이메일"]'),
+        ), expected_text="이메일"),
+        ElementSpec("PASSWORD_INPUT_FIELD", (
+            PASSWORD_INPUT_FIELD,
+            (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("비밀번호")'),
+            (AppiumBy.XPATH, '//android.widget.AutoCompleteTextView[@resource-id="net.bucketplace:id/inputField" and @text="비밀번호"]'),
+        ), expected_text="비밀번호"),
+        ElementSpec("LOGIN_BUTTON", (
+            LOGIN_BUTTON,
+            (AppiumBy.XPATH, '//android.widget.TextView[@resource-id="net.bucketplace:id/loginButton"]'),
+        ), expected_text="로그인하기"),
+        ElementSpec("PASSWORD_FINDING_BUTTON", (
+            PASSWORD_FINDING_BUTTON,
+            (AppiumBy.XPATH, '//android.widget.TextView[@resource-id="net.bucketplace:id/passwordFindingButton"]'),
+        ), expected_text="비밀번호 재설정"),
+    )
+
+    def __init__(self, driver, config=None):
+        super().__init__(driver, config)
+        # 로그인 폼 요소 캐시 (반복 로그인 시도 시 요소를 다시 찾지 않음)
+        self._form_elements = {}
+        # attempt_login_multiple_times의 시도별 소요 시간
+        self.attempt_timings = []
     
     def are_email_login_elements_present(self, timeout=5):
         """
         이메일로 로그인 페이지의 필수 요소들이 모두 있는지 확인합니다.
+        EMAIL_LOGIN_ELEMENT_SPECS를 한 번의 page_source 스냅샷으로 검증하며,
         check 방식을 사용하여 실패해도 다음 step을 수행할 수 있습니다.
         
         Args:
-            timeout: 각 요소를 찾기 위한 최대 대기 시간 (초)
+            timeout: 스냅샷에서 찾지 못한 요소를 다시 확인할 때의 최대 대기 시간 (초)
             
         Returns:
             bool: 모든 필수 요소가 있으면 True, 하나라도 없으면 False
         """
-        
-        # 먼저 앱이 실행 중인지 확인 (앱이 종료되지 않았는지 확인)
-        try:
-            config = load_config()
-            app_package = config.app_package
-            current_package = self.driver.current_package
-            if current_package != app_package:
-                check.fail(f"앱이 실행 중이 아닙니다. 현재 패키지: {current_package}, 예상 패키지: {app_package}")
-                return False
-        except Exception as e:
-            check.fail(f"앱 실행 상태 확인 실패: {e}")
-            return False
-        
-        # 각 요소에 대한 여러 locator 옵션 정의
-        elements_to_check = [
-            ("BACK_BUTTON", [
-                self.BACK_BUTTON,
-                (AppiumBy.XPATH, '//android.widget.ImageView[@resource-id="net.bucketplace:id/backIcon"]'),
-            ]),
-            ("TITLE_TEXT", [
-                self.TITLE_TEXT,
-                (AppiumBy.XPATH, '//android.widget.TextView[@resource-id="net.bucketplace:id/title"]'),
-            ]),
-            ("ID_INPUT_FIELD", [
-                self.ID_INPUT_FIELD,
-                (AppiumBy.XPATH, '(//android.widget.AutoCompleteTextView[@resource-id="net.bucketplace:id/inputField"])[1]'),
-                (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("이메일")'),
-                (AppiumBy.XPATH, '//android.widget.AutoCompleteTextView[@resource-id="net.bucketplace:id/inputField" and @text="이메일"]'),
-            ]),
-            ("PASSWORD_INPUT_FIELD", [
-                self.PASSWORD_INPUT_FIELD,
-                (AppiumBy.XPATH, '(//android.widget.AutoCompleteTextView[@resource-id="net.bucketplace:id/inputField"])[2]'),
-                (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("비밀번호")'),
-                (AppiumBy.XPATH, '//android.widget.AutoCompleteTextView[@resource-id="net.bucketplace:id/inputField" and @text="비밀번호"]'),
-            ]),
-            ("LOGIN_BUTTON", [
-                self.LOGIN_BUTTON,
-                (AppiumBy.XPATH, '//android.widget.TextView[@resource-id="net.bucketplace:id/loginButton"]'),
-            ]),
-            ("PASSWORD_FINDING_BUTTON", [
-                self.PASSWORD_FINDING_BUTTON,
-                (AppiumBy.XPATH, '//android.widget.TextView[@resource-id="net.bucketplace:id/passwordFindingButton"]'),
-            ]),
-        ]
-        
-        all_passed = True
-        
-        # 각 요소를 여러 locator 옵션으로 시도하여 확인
-        for element_name, locator_options in elements_to_check:
-            element_found = False
-            found_element = None
-            
-            # 여러 locator 옵션을 순차적으로 시도
-            for locator in locator_options:
-                try:
-                    # 먼저 is_element_present로 빠르게 확인
-                    if self.is_element_present(locator, timeout=1):
-                        # wait_for_visible로 다시 확인하여 확실하게 검증
-                        found_element = self.wait_for_visible(locator, timeout=2)
-                        element_found = True
-                        break
-                except Exception:
-                    continue
-            
-            # 요소를 찾았는지 확인
-            check.is_true(element_found, f"{element_name} 요소가 존재하지 않습니다.")
-            if not element_found:
-                all_passed = False
-
-        # TITLE_TEXT의 텍스트가 "이메일 로그인"인지 확인
-        title_text_found = False
-        title_text_value = None
-        title_text_locators = [
-            self.TITLE_TEXT,
-            (AppiumBy.XPATH, '//android.widget.TextView[@resource-id="net.bucketplace:id/title"]')
-        ]
-        
-        for locator in title_text_locators:
-            try:
-                element = self.wait_for_visible(locator, timeout=2)
-                title_text_value = element.text or element.get_attribute("content-desc") or ""
-                if title_text_value:
-                    title_text_found = True
-                    break
-            except Exception:
-                continue
-        
-        if title_text_found:
-            check.equal(title_text_value, "이메일 로그인", f"TITLE_TEXT의 텍스트가 '이메일 로그인'이 아닙니다. 실제 텍스트: '{title_text_value}'")
-            if title_text_value != "이메일 로그인":
-                all_passed = False
-        else:
-            check.fail("TITLE_TEXT 요소를 찾을 수 없습니다.")
-            all_passed = False
-        
-        # ID_INPUT_FIELD의 텍스트가 "이메일"인지 확인
-        id_input_field_found = False
-        id_input_field_text = None
-        id_input_field_locators = [
-            self.ID_INPUT_FIELD,
-            (AppiumBy.XPATH, '//android.widget.AutoCompleteTextView[@resource-id="net.bucketplace:id/inputField" and @text="이메일"]')
-        ]
-        
-        for locator in id_input_field_locators:
-            try:
-                element = self.wait_for_visible(locator, timeout=2)
-                email_login_text = element.text or element.get_attribute("content-desc") or ""
-                if email_login_text:
-                    email_login_found = True
-                    break
-            except Exception:
-                continue
-        
-        if email_login_found:
-            check.equal(email_login_text, "이메일", f"ID_INPUT_FIELD의 텍스트가 '이메일'이 아닙니다. 실제 텍스트: '{email_login_text}'")
-            if email_login_text != "이메일":
-                all_passed = False
-        else:
-            check.fail("ID_INPUT_FIELD 요소를 찾을 수 없습니다.")
-            all_passed = False
-
-        #PASSWORD_INPUT_FIELD의 텍스트가 "비밀번호"인지 확인
-        password_input_field_found = False
-        password_input_field_text = None
-        password_input_field_locators = [
-            self.PASSWORD_INPUT_FIELD,
-            (AppiumBy.XPATH, '//android.widget.AutoCompleteTextView[@resource-id="net.bucketplace:id/inputField" and @text="비밀번호"]')
-        ]
-        
-        for locator in password_input_field_locators:
-            try:
-                element = self.wait_for_visible(locator, timeout=2)
-                password_input_field_text = element.text or element.get_attribute("content-desc") or ""
-                if password_input_field_text:
-                    password_input_field_found = True
-                    break
-            except Exception:
-                continue
-        
-        if password_input_field_found:
-            check.equal(password_input_field_text, "비밀번호", f"PASSWORD_INPUT_FIELD의 텍스트가 '비밀번호'가 아닙니다. 실제 텍스트: '{password_input_field_text}'")
-            if password_input_field_text != "비밀번호":
-                all_passed = False
-        else:
-            check.fail("PASSWORD_INPUT_FIELD 요소를 찾을 수 없습니다.")
-            all_passed = False
-        
-        # LOGIN_BUTTON의 텍스트가 "로그인하기"인지 확인
-        login_button_found = False
-        login_button_text = None
-        login_button_locators = [
-            self.LOGIN_BUTTON,
-            (AppiumBy.XPATH, '//android.widget.TextView[@resource-id="net.bucketplace:id/loginButton"]')
-        ]
-        
-        for locator in login_button_locators:
-            try:
-                element = self.wait_for_visible(locator, timeout=2)
-                login_button_text = element.text or element.get_attribute("content-desc") or ""
-                if login_button_text:
-                    login_button_found = True
-                    break
-            except Exception:
-                continue
-        
-        if login_button_found:
-            check.equal(login_button_text, "로그인하기", f"LOGIN_BUTTON의 텍스트가 '로그인하기'가 아닙니다. 실제 텍스트: '{login_button_text}'")
-            if login_button_text != "로그인하기":
-                all_passed = False
-        else:
-            check.fail("LOGIN_BUTTON 요소를 찾을 수 없습니다.")
-            all_passed = False
-
-        # PASSWORD_FINDING_BUTTON의 텍스트가 "비밀번호 재설정"인지 확인
-        password_finding_button_found = False
-        password_finding_button_text = None
-        password_finding_button_locators = [
-            self.PASSWORD_FINDING_BUTTON,
-            (AppiumBy.XPATH, '//android.widget.TextView[@resource-id="net.bucketplace:id/passwordFindingButton"]')
-        ]
-        
-        for locator in password_finding_button_locators:
-            try:
-                element = self.wait_for_visible(locator, timeout=2)
-                password_finding_button_text = element.text or element.get_attribute("content-desc") or ""
-                if password_finding_button_text:
-                    password_finding_button_found = True
-                    break
-            except Exception:
-                continue
-        
-        if password_finding_button_found:
-            check.equal(password_finding_button_text, "비밀번호 재설정", f"ANONYMOUS_ORDER_CHECK_BUTTON의 텍스트가 '비밀번호 재설정'이 아닙니다. 실제 텍스트: '{password_finding_button_text}'")
-            if password_finding_button_text != "비밀번호 재설정":
-                all_passed = False
-        else:
-            check.fail("PASSWORD_FINDING_BUTTON 요소를 찾을 수 없습니다.")
-            all_passed = False
-        
-        return all_passed
+        return self.verify_elements(self.EMAIL_LOGIN_ELEMENT_SPECS, timeout=timeout, app_package=self.config.app_package)
     
     def is_email_login_page_loaded(self, timeout=10):
         """
@@ -255,6 +109,10 @@ class LoginPageByEmail(BasePage):
             bool: 이메일로 로그인 페이지가 로드되었으면 True
         """
         
+        # 마지막 스냅샷에서 이미 이 화면으로 식별되었고 그 뒤로 화면을 바꾸는 동작이 없었으면 바로 반환
+        if self.is_current_screen():
+            return True
+
         try:
             # 이메일로 로그인 페이지의 핵심 요소들
             key_elements = [
@@ -265,38 +123,10 @@ class LoginPageByEmail(BasePage):
                 ("PASSWORD_FINDING_BUTTON", self.PASSWORD_FINDING_BUTTON),
             ]
             
-            # 먼저 이메일로 로그인 페이지가 이미 로드되어 있는지 빠르게 확인
-            all_elements = key_elements
-            for element_name, locator in all_elements:
-                try:
-                    if self.is_element_present(locator, timeout=1):
-                        return True
-                except Exception:
-                    continue
-            
-            # 이메일로 로그인 페이지의 핵심 요소들이 나타날 때까지 대기
             # 여러 요소 중 하나라도 나타나면 이메일로 로그인 페이지가 로드된 것으로 간주
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                found_elements = []
-                # 모든 요소 확인 (key_elements)
-                for element_name, locator in all_elements:
-                    try:
-                        # 먼저 is_element_present로 빠르게 확인
-                        if self.is_element_present(locator, timeout=0.5):
-                            found_elements.append(element_name)
-                            # wait_for_visible로 다시 확인하여 확실하게 검증
-                            try:
-                                self.wait_for_visible(locator, timeout=2)
-                                return True
-                            except Exception:
-                                pass
-                    except Exception:
-                        continue
-                
-                time.sleep(0.5)  # 0.5초마다 확인하여 더 빠르게 반응
-            
-            return False
+            # 매 polling마다 page_source 스냅샷 한 번으로 모든 요소를 확인
+            all_elements = key_elements
+            return self.wait_for_any_present(all_elements, timeout=timeout, name="is_email_login_page_loaded") is not None
         except Exception:
             return False
     
@@ -313,10 +143,109 @@ class LoginPageByEmail(BasePage):
         """
         return self.is_element_present(locator, timeout=timeout)
     
+    def is_login_loading_popup_displayed(self, timeout=2):
+        """
+        "로그인 중입니다." 로딩 팝업이 나타나는지 화면 요소로 확인합니다.
+        로딩 팝업은 토스트가 아니므로 토스트 리스너(logcat)에는 수집되지 않습니다.
+        
+        Args:
+            timeout: 최대 대기 시간 (초, 팝업이 나타나면 즉시 반환)
+            
+        Returns:
+            bool: timeout 안에 로딩 팝업이 나타났으면 True
+        """
+        return self.is_element_present(self.LOGIN_LOADING_POPUP_WIDGET, timeout=timeout)
+    
+    def wait_for_login_loading_popup_to_disappear(self, timeout=10):
+        """
+        "로그인 중입니다." 로딩 팝업이 사라질 때까지 대기합니다.
+        
+        Args:
+            timeout: 최대 대기 시간 (초)
+            
+        Returns:
+            bool: timeout 안에 로딩 팝업이 사라졌으면 True
+        """
+        return self.wait_for_absent(self.LOGIN_LOADING_POPUP_WIDGET, timeout=timeout, name="login_loading_popup_disappear")
+    
+    def _form_element(self, locator):
+        """로그인 폼 요소를 캐시에서 가져오고, 없으면 찾아서 캐시합니다."""
+        element = self._form_elements.get(locator)
+        if element is None:
+            element = self._form_elements[locator] = self.find(locator)
+        return element
+    
+    def _with_form_element(self, locator, action):
+        """
+        캐시된 요소로 action을 실행합니다. 요소가 stale되면 캐시를 비우고 한 번 다시 찾아 실행합니다.
+        
+        Returns:
+            int: 요소를 다시 찾은 횟수 (0 또는 1)
+        """
+        try:
+            action(self._form_element(locator))
+            return 0
+        except (StaleElementReferenceException, NoSuchElementException):
+            log.debug(f"로그인 폼 요소가 stale되어 다시 찾습니다: {locator}")
+            self._form_elements.pop(locator, None)
+            action(self._form_element(locator))
+            return 1
+    
+    def _replace_value(self, element, text):
+        """
+        입력란의 기존 텍스트를 text로 한 번에 교체합니다.
+        mobile: replaceElementValue(명령 1회)를 사용하고, 지원하지 않으면 clear 후 send_keys로 입력합니다.
+        """
+        try:
+            self.driver.execute_script('mobile: replaceElementValue', {'elementId': element.id, 'text': text})
+        except (StaleElementReferenceException, NoSuchElementException):
+            raise
+        except WebDriverException as e:
+            log.debug(f"mobile: replaceElementValue 실패, clear/send_keys로 입력합니다: {e}")
+            element.clear()
+            element.send_keys(text)
+    
+    def fill_login_form(self, email, password):
+        """
+        이메일과 비밀번호 입력란을 기존 텍스트와 관계없이 주어진 값으로 채웁니다.
+        캐시된 요소에 입력란별로 명령 한 번씩만 보내므로 clear_text_android + type보다 훨씬 적은 명령으로 입력됩니다.
+        
+        Args:
+            email: 입력할 이메일 주소
+            password: 입력할 비밀번호
+        
+        Returns:
+            int: stale되어 요소를 다시 찾은 횟수
+        """
+        refinds = 0
+        for locator, value in ((self.ID_INPUT_FIELD, email), (self.PASSWORD_INPUT_FIELD, password)):
+            refinds += self._with_form_element(locator, lambda element, value=value: self._replace_value(element, value))
+        return refinds
+    
+    def _click_when_enabled(self, element, timeout=10):
+        """
+        캐시된 요소가 표시되고 활성화될 때까지 기다린 뒤 클릭합니다.
+        stale 예외는 무시하지 않고 그대로 올려서 _with_form_element가 요소를 다시 찾도록 합니다.
+        
+        Raises:
+            TimeoutException: timeout 안에 요소가 활성화되지 않은 경우 (클릭이 누락되지 않도록 실패 처리)
+        """
+        enabled = self.waits.until(
+            lambda: element.is_displayed() and element.is_enabled(),
+            timeout, name="login_button_enabled", ignored_exceptions=(),
+        )
+        if not enabled:
+            raise TimeoutException(f"로그인 버튼이 {timeout}초 안에 활성화되지 않았습니다.")
+        element.click()
+    
     def attempt_login_multiple_times(self, email, password, count=1):
         """
         로그인을 여러 번 시도하는 함수입니다.
         이메일과 비밀번호를 입력하고 로그인 버튼을 클릭하는 과정을 반복합니다.
+        로그인 폼 요소는 첫 시도에서만 찾고 이후 시도에서는 캐시된 요소를 사용하며,
+        두 번째 시도부터는 "로그인 중입니다." 로딩 팝업이 사라질 때까지 기다리고,
+        로그인 버튼은 활성화된 뒤에 클릭하므로 클릭이 누락되지 않습니다.
+        시도별 소요 시간은 attempt_timings에 기록됩니다.
 
         Args:
             email: 입력할 이메일 주소
@@ -324,25 +253,32 @@ class LoginPageByEmail(BasePage):
             count: 로그인 시도 횟수 (기본값: 1)
 
         Returns:
-            None
+            list[LoginAttemptTiming]: 이번 호출의 시도별 소요 시간
+
+        Raises:
+            TimeoutException: 로딩 팝업이 사라지지 않거나 로그인 버튼이 활성화되지 않은 경우
         """
-        import time
-        
+        timings = []
         for i in range(count):
-            # 이메일 입력란 초기화 및 입력
-            self.clear_text_android(self.ID_INPUT_FIELD)
-            self.type(self.ID_INPUT_FIELD, email)
-            
-            # 비밀번호 입력란 초기화 및 입력
-            self.clear_text_android(self.PASSWORD_INPUT_FIELD)
-            self.type(self.PASSWORD_INPUT_FIELD, password)
-            
-            # 로그인 버튼 클릭
-            self.click(self.LOGIN_BUTTON)
+            started = time.monotonic()
+            # 이전 시도의 로딩 팝업이 폼을 가리고 있으면 입력과 클릭이 누락되므로 사라질 때까지 대기
+            if i > 0 and not self.wait_for_login_loading_popup_to_disappear():
+                raise TimeoutException(f"로그인 시도 {i + 1}/{count}: 로그인 로딩 팝업이 사라지지 않았습니다.")
+            refinds = self.fill_login_form(email, password)
+            # 로그인 버튼이 활성화된 뒤 클릭
+            refinds += self._with_form_element(self.LOGIN_BUTTON, self._click_when_enabled)
+            timing = LoginAttemptTiming(i + 1, time.monotonic() - started, refinds)
+            timings.append(timing)
+            log.debug(f"로그인 시도 {timing.index}/{count}: {timing.seconds:.2f}초 (요소 재탐색 {timing.refinds}회)")
             
             # 마지막 시도가 아니면 다음 시도를 위해 짧은 대기
             if i < count - 1:
                 time.sleep(0.5)  # 다음 시도 전 짧은 대기
-
-
-
+        
+        self.attempt_timings.extend(timings)
+        if timings:
+            log.info(
+                f"로그인 {count}회 시도: 평균 {sum(t.seconds for t in timings) / count:.2f}초, "
+                f"최대 {max(t.seconds for t in timings):.2f}초"
+            )
+        return timings
@@ -1,5 +1,5 @@
 from appium.webdriver.common.appiumby import AppiumBy
-from src.config.settings import load_config
+from selenium.common.exceptions import TimeoutException
 from src.pages.base_page import BasePage
 import pytest_check as check
 import logging
@@ -22,8 +22,8 @@ class MainHomePage(BasePage):
     MYPAGE_BOTTOM_BUTTON = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("마이페이지")')
 
     
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, config=None):
+        super().__init__(driver, config)
 
     def are_main_home_page_elements_present(self, timeout=10):
         """
@@ -42,6 +42,10 @@ class MainHomePage(BasePage):
             bool: 메인 홈페이지가 로드되었으면 True
         """
 
+        # 마지막 스냅샷에서 이미 이 화면으로 식별되었고 그 뒤로 화면을 바꾸는 동작이 없었으면 바로 반환
+        if self.is_current_screen():
+            return True
+
         try:
             # 메인 홈페이지의 핵심 요소들 (여러 옵션 포함)
             key_elements = [
@@ -61,38 +65,10 @@ class MainHomePage(BasePage):
                 ("MYPAGE_BOTTOM_BUTTON_TEXT", (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("마이페이지")')),
             ]
 
-            # 먼저 메인 홈페이지가 이미 로드되어 있는지 빠르게 확인
-            all_elements = key_elements + additional_elements
-            for element_name, locator in all_elements:
-                try:
-                    if self.is_element_present(locator, timeout=1):
-                        return True
-                except Exception:
-                    continue
-            
-            # 메인 홈페이지의 핵심 요소들이 나타날 때까지 대기
             # 여러 요소 중 하나라도 나타나면 메인 홈페이지가 로드된 것으로 간주
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                found_elements = []
-                # 모든 요소 확인 (key_elements + additional_elements)
-                for element_name, locator in all_elements:
-                    try:
-                        # 먼저 is_element_present로 빠르게 확인
-                        if self.is_element_present(locator, timeout=0.5):
-                            found_elements.append(element_name)
-                            # wait_for_visible로 다시 확인하여 확실하게 검증
-                            try:
-                                self.wait_for_visible(locator, timeout=2)
-                                return True
-                            except Exception:
-                                pass
-                    except Exception:
-                        continue
-                
-                time.sleep(0.5)  # 0.5초마다 확인하여 더 빠르게 반응
-            
-            return False
+            # 매 polling마다 page_source 스냅샷 한 번으로 모든 요소를 확인
+            all_elements = key_elements + additional_elements
+            return self.wait_for_any_present(all_elements, timeout=timeout, name="is_main_home_page_loaded") is not None
         except Exception:
             return False
     
@@ -115,16 +91,9 @@ class MainHomePage(BasePage):
                 (AppiumBy.XPATH, '//android.widget.TextView[contains(@text, "비밀번호을(를) Google 비밀번호 관리자에 저장하시겠습니까?")]'),
             ]
             
-            for locator in popup_locators:
-                try:
-                    if self.is_element_present(locator, timeout=timeout):
-                        element = self.find(locator, timeout=1)
-                        if element and element.is_displayed():
-                            return True
-                except Exception:
-                    continue
-            
-            return False
+            # 모든 후보를 하나의 deadline 안에서 동시에 확인
+            named_locators = [(str(locator), locator) for locator in popup_locators]
+            return self.wait_for_any_present(named_locators, timeout=timeout, name="is_google_password_manager_popup_present") is not None
         except Exception as e:
             log.debug(f"Google 비밀번호 관리자 팝업 확인 중 오류 발생: {e}")
             return False
@@ -154,21 +123,17 @@ class MainHomePage(BasePage):
                 (AppiumBy.XPATH, '//*[@text="사용 안함"]'),
             ]
             
-            for button_locator in dismiss_button_locators:
-                try:
-                    if self.is_element_present(button_locator, timeout=timeout):
-                        button = self.find(button_locator, timeout=1)
-                        if button and button.is_displayed():
-                            button.click()
-                            import time
-                            time.sleep(0.5)  # 팝업이 사라질 때까지 짧은 대기
-                            log.info("Google 비밀번호 관리자 팝업에서 '나중에' 또는 '사용 안함' 버튼 클릭 완료")
-                            return True
-                except Exception:
-                    continue
-            
-            log.warning("'나중에' 또는 '사용 안함' 버튼을 찾을 수 없습니다.")
-            return False
+            # 모든 후보를 하나의 deadline 안에서 동시에 확인
+            try:
+                button, _ = self.find_first(dismiss_button_locators, timeout=timeout, condition="visible")
+            except TimeoutException:
+                log.warning("'나중에' 또는 '사용 안함' 버튼을 찾을 수 없습니다.")
+                return False
+
+            button.click()
+            time.sleep(0.5)  # 팝업이 사라질 때까지 짧은 대기
+            log.info("Google 비밀번호 관리자 팝업에서 '나중에' 또는 '사용 안함' 버튼 클릭 완료")
+            return True
         except Exception as e:
             log.debug(f"'나중에' 또는 '사용 안함' 버튼 클릭 중 오류 발생: {e}")
             return False
@@ -26,8 +26,8 @@ class PlayStorePage(BasePage):
     # 검색 결과 페이지 확인용 locator
     SEARCH_RESULTS_INDICATOR = (AppiumBy.XPATH, "//android.widget.TextView[contains(@text,'오늘의집')]")
 
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, config=None):
+        super().__init__(driver, config)
 
     def search_app(self, app_name, max_retries=3):
         """
@@ -84,16 +84,9 @@ class PlayStorePage(BasePage):
         Raises:
             TimeoutException: 검색 영역 TextView를 찾을 수 없을 때
         """
-        search_textview = None
-        for locator in self.SEARCH_TEXTVIEW_OPTIONS:
-            try:
-                search_textview = self.wait_for_clickable(locator, timeout=5)
-                if search_textview:
-                    break
-            except (TimeoutException, NoSuchElementException):
-                continue
-        
-        if not search_textview:
+        try:
+            search_textview, _ = self.find_first(self.SEARCH_TEXTVIEW_OPTIONS, timeout=5, condition="clickable")
+        except TimeoutException:
             raise TimeoutException("검색 영역(TextView)을 찾을 수 없습니다.")
         
         search_textview.click()
@@ -111,19 +104,17 @@ class PlayStorePage(BasePage):
         Raises:
             TimeoutException: 검색 입력 필드를 찾을 수 없을 때
         """
-        for locator in self.SEARCH_EDIT_TEXT_OPTIONS:
-            try:
-                search_input = self.wait_for_visible(locator, timeout=5)
-                if search_input:
-                    return search_input
-            except (TimeoutException, NoSuchElementException):
-                continue
+        # 모든 locator 후보를 하나의 deadline 안에서 동시에 확인
+        try:
+            search_input, _ = self.find_first(self.SEARCH_EDIT_TEXT_OPTIONS, timeout=5, condition="visible")
+            return search_input
+        except TimeoutException:
+            pass
         
         # 마지막 시도: 모든 EditText 중 첫 번째 것 사용
         try:
-            edit_texts = self.driver.find_elements(
-                AppiumBy.ANDROID_UIAUTOMATOR, 
-                'new UiSelector().className("android.widget.EditText")'
+            edit_texts = self.probe(
+                (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.EditText")')
             )
             if edit_texts and len(edit_texts) > 0:
                 return edit_texts[0]
@@ -161,15 +152,12 @@ class PlayStorePage(BasePage):
         
         # 방법 2: 검색 버튼 찾아서 클릭
         if not search_executed:
-            for locator in self.SEARCH_SUBMIT_OPTIONS:
-                try:
-                    search_button = self.wait_for_clickable(locator, timeout=2)
-                    if search_button:
-                        search_button.click()
-                        search_executed = True
-                        break
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            try:
+                search_button, _ = self.find_first(self.SEARCH_SUBMIT_OPTIONS, timeout=2, condition="clickable")
+                search_button.click()
+                search_executed = True
+            except TimeoutException:
+                pass
         
         # 방법 3: 엔터 키 재시도
         if not search_executed:
@@ -15,28 +15,17 @@ class SearchResultsPage(BasePage):
         (AppiumBy.XPATH, "//androidx.compose.ui.platform.ComposeView[@resource-id='com.android.vending:id/0_resource_name_obfuscated']/android.view.View/android.view.View[1]/android.view.View/android.view.View/android.view.View/android.view.View[1]/android.view.View[2]/android.widget.Button")
     ]
 
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, config=None):
+        super().__init__(driver, config)
 
     def wait_for_search_results(self, timeout=10):
         """
         검색 결과 페이지가 로드될 때까지 대기합니다.
         """
-        import time
-        for _ in range(timeout):
-            try:
-                # 검색 결과가 나타났는지 확인 (오늘의집 텍스트가 있는지 확인)
-                for locator in self.OHOUS_APP_OPTIONS[:2]:  # 처음 두 개만 빠르게 체크
-                    try:
-                        element = self.driver.find_element(*locator)
-                        if element and element.is_displayed():
-                            return True
-                    except NoSuchElementException:
-                        continue
-            except Exception:
-                pass
-            time.sleep(1)
-        return False
+        # 검색 결과가 나타났는지 확인 (오늘의집 텍스트가 있는지 확인)
+        # 매 polling마다 page_source 스냅샷 한 번으로 모든 후보를 확인
+        named_options = [(str(locator), locator) for locator in self.OHOUS_APP_OPTIONS[:2]]  # 처음 두 개만 빠르게 체크
+        return self.wait_for_any_present(named_options, timeout=timeout, poll_interval=1, name="wait_for_search_results") is not None
 
     def select_ohous(self, max_retries=3):
         """
@@ -52,20 +41,19 @@ class SearchResultsPage(BasePage):
         
         # 오늘의집 앱 찾기 및 클릭
         for attempt in range(max_retries):
-            for locator in self.OHOUS_APP_OPTIONS:
-                try:
-                    ohous_app = self.wait_for_clickable(locator, timeout=5)
-                    if ohous_app:
-                        ohous_app.click()
-                        # 앱 상세 페이지로 이동할 때까지 대기
-                        time.sleep(3)
-                        # 시스템 팝업 처리
-                        self.handle_system_popup()
-                        # 앱 상세 페이지가 로드되었는지 확인 (설치 버튼이 나타날 때까지 대기)
-                        self.wait_for_app_detail_page(timeout=10)
-                        return
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            try:
+                # 모든 후보를 하나의 deadline 안에서 동시에 확인
+                ohous_app, _ = self.find_first(self.OHOUS_APP_OPTIONS, timeout=5, condition="clickable")
+                ohous_app.click()
+                # 앱 상세 페이지로 이동할 때까지 대기
+                time.sleep(3)
+                # 시스템 팝업 처리
+                self.handle_system_popup()
+                # 앱 상세 페이지가 로드되었는지 확인 (설치 버튼이 나타날 때까지 대기)
+                self.wait_for_app_detail_page(timeout=10)
+                return
+            except (TimeoutException, NoSuchElementException):
+                pass
             
             if attempt < max_retries - 1:
                 # 스크롤 후 재시도
@@ -83,20 +71,9 @@ class SearchResultsPage(BasePage):
         앱 상세 페이지가 로드될 때까지 대기합니다.
         설치 버튼이 나타나는지 확인합니다.
         """
-        for _ in range(timeout):
-            try:
-                # 설치 버튼이 나타났는지 확인
-                for locator in self.INSTALL_BUTTON_OPTIONS:
-                    try:
-                        element = self.driver.find_element(*locator)
-                        if element and element.is_displayed():
-                            return True
-                    except NoSuchElementException:
-                        continue
-            except Exception:
-                pass
-            time.sleep(1)
-        return False
+        # 설치 버튼이 나타났는지 확인 (매 polling마다 page_source 스냅샷 한 번으로 모든 후보를 확인)
+        named_options = [(str(locator), locator) for locator in self.INSTALL_BUTTON_OPTIONS]
+        return self.wait_for_any_present(named_options, timeout=timeout, poll_interval=1, name="wait_for_app_detail_page") is not None
 
     def install_app(self, max_retries=3):
         """
@@ -112,15 +89,14 @@ class SearchResultsPage(BasePage):
         
         # 설치 버튼 찾기 및 클릭
         for attempt in range(max_retries):
-            for locator in self.INSTALL_BUTTON_OPTIONS:
-                try:
-                    install_button = self.wait_for_clickable(locator, timeout=5)
-                    if install_button:
-                        install_button.click()
-                        time.sleep(1)  # 설치 시작 대기
-                        return
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            try:
+                # 모든 후보를 하나의 deadline 안에서 동시에 확인
+                install_button, _ = self.find_first(self.INSTALL_BUTTON_OPTIONS, timeout=5, condition="clickable")
+                install_button.click()
+                time.sleep(1)  # 설치 시작 대기
+                return
+            except (TimeoutException, NoSuchElementException):
+                pass
             
             if attempt < max_retries - 1:
                 # 시스템 팝업 처리 후 재시도
@@ -19,8 +19,8 @@ class SettingPage(BasePage):
 
     LOGOUT_TEXT_BUTTON = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("로그아웃")')
     
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, config=None):
+        super().__init__(driver, config)
     
     def are_setting_page_elements_present(self, timeout=5):
         """
@@ -48,6 +48,10 @@ class SettingPage(BasePage):
             bool: 설정 페이지가 로드되었으면 True
         """
         
+        # 마지막 스냅샷에서 이미 이 화면으로 식별되었고 그 뒤로 화면을 바꾸는 동작이 없었으면 바로 반환
+        if self.is_current_screen():
+            return True
+
         try:
             # 설정 페이지의 핵심 요소들 (여러 옵션 포함)
             key_elements = [
@@ -57,38 +61,10 @@ class SettingPage(BasePage):
                 ("SERVICE_INFO_TEXT", self.SERVICE_INFO_TEXT),
             ]
 
-            # 먼저 설정 페이지가 이미 로드되어 있는지 빠르게 확인
-            all_elements = key_elements
-            for element_name, locator in all_elements:
-                try:
-                    if self.is_element_present(locator, timeout=1):
-                        return True
-                except Exception:
-                    continue
-
-            # 설정 페이지의 핵심 요소들이 나타날 때까지 대기
             # 여러 요소 중 하나라도 나타나면 설정 페이지가 로드된 것으로 간주
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                found_elements = []
-                # 모든 요소 확인 (key_elements)
-                for element_name, locator in all_elements:
-                    try:
-                        # 먼저 is_element_present로 빠르게 확인
-                        if self.is_element_present(locator, timeout=0.5):
-                            found_elements.append(element_name)
-                            # wait_for_visible로 다시 확인하여 확실하게 검증
-                            try:
-                                self.wait_for_visible(locator, timeout=2)
-                                return True
-                            except Exception:
-                                pass
-                    except Exception:
-                        continue
-                
-                    time.sleep(0.5)  # 0.5초마다 확인하여 더 빠르게 반응
-            
-            return False
+            # 매 polling마다 page_source 스냅샷 한 번으로 모든 요소를 확인
+            all_elements = key_elements
+            return self.wait_for_any_present(all_elements, timeout=timeout, name="is_setting_page_loaded") is not None
         except Exception:
             return False
 
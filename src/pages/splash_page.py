@@ -10,8 +10,8 @@ class SplashPage(BasePage):
     SPLASH_WHOLE = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("net.bucketplace:id/splash_whole")')
     SPLASH_LOTTIE = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().resourceId("net.bucketplace:id/splash_lottie")')
     
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, config=None):
+        super().__init__(driver, config)
     
     def wait_for_splash_lottie_page_loaded(self, timeout=5):
         """
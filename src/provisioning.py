@@ -0,0 +1,326 @@
+"""
+디바이스 앱 설치(provisioning) 모듈입니다.
+
+플레이 스토어 UI로 앱을 검색하고 설치하면 매번 네트워크에서 내려받아야 하므로 디바이스 준비에서 가장 느리고 불안정한 단계가 됩니다.
+이 모듈은 앱이 설치된 디바이스에서 `pm path` + `adb pull`로 APK(split APK 포함)를 한 번 가져와
+로컬 캐시(<캐시 디렉터리>/<패키지>/<versionCode>/<프로필>/)에 저장하고, 이후에는 `adb install-multiple`로 설치합니다.
+여러 디바이스는 스레드로 동시에 설치합니다.
+
+split APK(split_config.<abi>.apk, split_config.<density>.apk)는 가져온 디바이스에 맞춰져 있으므로
+캐시는 디바이스 프로필(ABI와 화면 밀도, 예: arm64-v8a_420dpi)별로 나누고, 같은 프로필의 디바이스에만 설치합니다.
+base.apk 하나로 된 앱은 모든 디바이스에 설치할 수 있으므로 UNIVERSAL 프로필로 저장합니다.
+
+    python -m src.provisioning [--devices emulator-5554 emulator-5556] [--version-code 123] [--cache-dir DIR]
+
+INSTALL_001은 플레이 스토어 설치 흐름 자체를 검증하므로 이 모듈을 사용하지 않습니다.
+"""
+import argparse
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "appium-apk-cache"
+
+INSTALLED = "installed"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+# split APK 없이 모든 디바이스에 설치할 수 있는 앱의 캐시 프로필
+UNIVERSAL = "universal"
+
+# dumpsys package 출력의 versionCode (예: "versionCode=251201 minSdk=26 targetSdk=34")
+_VERSION_CODE = re.compile(r"versionCode=(\d+)")
+# wm density 출력 (예: "Physical density: 420", 변경한 경우 "Override density: 320"이 추가됨)
+_DENSITY = re.compile(r"(Physical|Override) density: (\d+)")
+
+
+@dataclass(frozen=True)
+class CachedApk:
+    """
+    캐시에 저장된 앱 한 버전
+
+    Attributes:
+        package: 앱 패키지 이름
+        version_code: versionCode
+        profile: APK를 가져온 디바이스 프로필 (split APK가 없으면 UNIVERSAL)
+        paths: APK 파일 경로 (base.apk와 split APK)
+    """
+    package: str
+    version_code: int
+    profile: str
+    paths: tuple
+
+
+@dataclass(frozen=True)
+class ProvisionResult:
+    """
+    디바이스 한 대의 설치 결과
+
+    Attributes:
+        serial: 디바이스 시리얼
+        action: INSTALLED, SKIPPED(이미 같거나 새 버전이 설치됨), FAILED 중 하나
+        version_code: 설치되어 있는 versionCode (실패하면 None일 수 있음)
+        seconds: 확인과 설치에 걸린 시간 (초)
+        message: 실패 원인 등 추가 정보
+    """
+    serial: str
+    action: str
+    version_code: int | None
+    seconds: float
+    message: str = ""
+
+    @property
+    def ok(self):
+        return self.action != FAILED
+
+
+class ApkCache:
+    """
+    versionCode와 디바이스 프로필별 APK 로컬 캐시
+
+    Args:
+        root: 캐시 디렉터리 (None이면 APK_CACHE_DIR 환경 변수 또는 DEFAULT_CACHE_DIR)
+        adb_path: adb 실행 파일 경로
+    """
+
+    def __init__(self, root=None, adb_path='adb'):
+        self.root = Path(root or os.getenv("APK_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.adb_path = adb_path
+        # 시리얼별 디바이스 프로필 (실행 중에는 바뀌지 않음)
+        self._profiles = {}
+
+    def _adb(self, serial, *args, timeout=60):
+        return subprocess.run(
+            [self.adb_path, '-s', serial, *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+
+    def device_profile(self, serial):
+        """
+        split APK 선택 기준이 되는 디바이스 프로필(ABI, 화면 밀도)을 반환합니다.
+
+        Returns:
+            str: 프로필 (예: "arm64-v8a_420dpi")
+        """
+        profile = self._profiles.get(serial)
+        if profile is None:
+            output = self._adb(serial, 'shell', 'getprop ro.product.cpu.abi; wm density').stdout
+            abi = output.splitlines()[0].strip() if output.strip() else "unknown"
+            densities = dict(_DENSITY.findall(output))
+            density = densities.get("Override") or densities.get("Physical") or "unknown"
+            profile = self._profiles[serial] = f"{abi}_{density}dpi"
+        return profile
+
+    def _directory(self, package, version_code, profile):
+        """versionCode의 캐시 중 profile에 설치할 수 있는 디렉터리 (없으면 None)"""
+        for candidate in (profile, UNIVERSAL):
+            directory = self.root / package / str(version_code) / candidate
+            if directory.is_dir() and any(directory.glob("*.apk")):
+                return directory
+        return None
+
+    def versions(self, package, profile):
+        """profile의 디바이스에 설치할 수 있는 캐시된 versionCode 목록을 오름차순으로 반환합니다."""
+        directory = self.root / package
+        if not directory.is_dir():
+            return []
+        return sorted(
+            int(entry.name) for entry in directory.iterdir()
+            if entry.name.isdigit() and self._directory(package, entry.name, profile) is not None
+        )
+
+    def get(self, package, profile, version_code=None):
+        """
+        캐시에서 앱을 찾습니다.
+
+        Args:
+            package: 앱 패키지 이름
+            profile: 설치할 디바이스의 프로필 (device_profile)
+            version_code: 찾을 versionCode (None이면 가장 최신 버전)
+
+        Returns:
+            CachedApk | None: 캐시된 앱, 없으면 None
+        """
+        versions = self.versions(package, profile)
+        if version_code is None:
+            if not versions:
+                return None
+            version_code = versions[-1]
+        elif version_code not in versions:
+            return None
+        directory = self._directory(package, version_code, profile)
+        # base.apk를 먼저 전달해야 install-multiple이 split APK를 올바르게 묶음
+        paths = sorted(directory.glob("*.apk"), key=lambda path: (path.name != "base.apk", path.name))
+        return CachedApk(package, version_code, directory.name, tuple(paths))
+
+    def installed_version(self, serial, package):
+        """
+        디바이스에 설치된 앱의 versionCode를 반환합니다.
+
+        Returns:
+            int | None: versionCode, 설치되어 있지 않으면 None
+        """
+        result = self._adb(serial, 'shell', 'dumpsys', 'package', package)
+        match = _VERSION_CODE.search(result.stdout)
+        return int(match.group(1)) if match else None
+
+    def pull(self, serial, package):
+        """
+        디바이스에 설치된 앱의 APK를 캐시로 가져옵니다. 같은 versionCode가 디바이스 프로필로 이미 캐시에 있으면 가져오지 않습니다.
+
+        Args:
+            serial: 앱이 설치된 디바이스 시리얼
+            package: 앱 패키지 이름
+
+        Returns:
+            CachedApk | None: 캐시된 앱, 디바이스에 앱이 없거나 가져오지 못하면 None
+        """
+        version_code = self.installed_version(serial, package)
+        if version_code is None:
+            return None
+        cached = self.get(package, self.device_profile(serial), version_code)
+        if cached is not None:
+            return cached
+
+        output = self._adb(serial, 'shell', 'pm', 'path', package).stdout
+        remote_paths = [line[len("package:"):].strip() for line in output.splitlines() if line.startswith("package:")]
+        if not remote_paths:
+            return None
+        profile = UNIVERSAL if len(remote_paths) == 1 else self.device_profile(serial)
+
+        # 다른 워커가 같은 버전을 동시에 가져와도 완성된 디렉터리만 보이도록 임시 디렉터리에 받은 뒤 이름을 바꿈
+        (self.root / package / str(version_code)).mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{version_code}-", dir=self.root / package))
+        try:
+            for remote_path in remote_paths:
+                result = self._adb(serial, 'pull', remote_path, str(staging / Path(remote_path).name), timeout=300)
+                if result.returncode != 0:
+                    log.warning(f"[{serial}] APK를 가져오지 못했습니다: {remote_path} - {result.stderr.strip()}")
+                    return None
+            try:
+                staging.rename(self.root / package / str(version_code) / profile)
+            except OSError:
+                # 다른 워커가 먼저 저장한 경우
+                pass
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        log.info(f"[{serial}] {package} {version_code} APK {len(remote_paths)}개를 캐시에 저장했습니다. ({profile})")
+        return self.get(package, profile, version_code)
+
+    def install(self, serial, apk, allow_downgrade=False, timeout=300):
+        """
+        캐시된 APK를 `adb install-multiple`로 설치합니다.
+
+        Returns:
+            tuple: (성공 여부, adb 출력)
+        """
+        args = ['install-multiple', '-r']
+        if allow_downgrade:
+            args.append('-d')
+        result = self._adb(serial, *args, *(str(path) for path in apk.paths), timeout=timeout)
+        output = (result.stdout + result.stderr).strip()
+        return result.returncode == 0 and "Success" in output, output
+
+    def provision(self, serial, package, version_code=None):
+        """
+        디바이스 프로필에 맞는 캐시된 앱을 설치합니다.
+        디바이스에 같은 버전(version_code가 None이면 같거나 새 버전)이 있으면 설치하지 않으며,
+        캐시에 없는 버전이면 디바이스에서 가져와 캐시에 저장합니다.
+
+        Args:
+            serial: 디바이스 시리얼
+            package: 앱 패키지 이름
+            version_code: 설치할 versionCode (None이면 캐시의 최신 버전)
+
+        Returns:
+            ProvisionResult: 설치 결과
+        """
+        started = time.monotonic()
+        installed = self.installed_version(serial, package)
+        profile = self.device_profile(serial)
+        cached = self.get(package, profile, version_code)
+
+        def result(action, version, message=""):
+            return ProvisionResult(serial, action, version, time.monotonic() - started, message)
+
+        if installed is not None and (installed == version_code or (
+            version_code is None and (cached is None or installed >= cached.version_code)
+        )):
+            if cached is None or installed > cached.version_code:
+                self.pull(serial, package)
+            return result(SKIPPED, installed)
+        if cached is None:
+            wanted = "최신 버전" if version_code is None else f"versionCode {version_code}"
+            return result(FAILED, installed, f"캐시에 {profile}용 {package} {wanted} APK가 없습니다: {self.root}")
+
+        ok, output = self.install(serial, cached, allow_downgrade=installed is not None and installed > cached.version_code)
+        if not ok:
+            log.warning(f"[{serial}] {package} {cached.version_code} 설치 실패: {output}")
+            return result(FAILED, installed, output)
+        log.info(f"[{serial}] {package} {cached.version_code} 설치 ({time.monotonic() - started:.1f}초)")
+        return result(INSTALLED, cached.version_code)
+
+    def provision_all(self, serials, package, version_code=None, max_workers=None, sources=None):
+        """
+        여러 디바이스에 캐시된 앱을 동시에 설치합니다.
+        캐시에 디바이스 프로필용 앱이 없으면 같은 프로필이면서 앱이 설치된 디바이스에서 먼저 가져옵니다.
+
+        Args:
+            serials: 디바이스 시리얼 목록
+            package: 앱 패키지 이름
+            version_code: 설치할 versionCode (None이면 최신 버전)
+            max_workers: 동시에 설치할 디바이스 수 (None이면 디바이스 수)
+            sources: 캐시가 비어 있을 때 APK를 가져올 디바이스 시리얼 목록 (None이면 serials)
+
+        Returns:
+            list[ProvisionResult]: 디바이스 순서대로의 설치 결과
+        """
+        serials = list(serials)
+        if not serials:
+            return []
+        for profile in {self.device_profile(serial) for serial in serials}:
+            if self.get(package, profile, version_code) is not None:
+                continue
+            for source in sources or serials:
+                if self.device_profile(source) != profile:
+                    continue
+                pulled = self.pull(source, package)
+                if pulled is not None and version_code in (None, pulled.version_code):
+                    break
+        with ThreadPoolExecutor(max_workers=max_workers or len(serials)) as executor:
+            return list(executor.map(lambda serial: self.provision(serial, package, version_code), serials))
+
+
+def main():
+    from src.config.settings import load_config
+    from src.device_farm import load_device_pool
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", nargs="*", help="설치할 디바이스 시리얼 (생략하면 디바이스 풀 전체)")
+    parser.add_argument("--package", help="앱 패키지 (생략하면 APP_PACKAGE)")
+    parser.add_argument("--version-code", type=int, help="설치할 versionCode (생략하면 캐시의 최신 버전)")
+    parser.add_argument("--cache-dir", help="APK 캐시 디렉터리 (생략하면 APK_CACHE_DIR 또는 ~/.cache/appium-apk-cache)")
+    args = parser.parse_args()
+
+    config = load_config()
+    serials = args.devices or [device.udid for device in load_device_pool(config)]
+    results = ApkCache(args.cache_dir).provision_all(serials, args.package or config.app_package, args.version_code)
+    for result in results:
+        print(f"  {result.serial:<20} {result.action:<9} {result.version_code or '-':>10}  {result.seconds:6.1f}초  {result.message}")
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,174 @@
+"""
+Appium 명령 HTTP 연결 모듈입니다.
+
+기본 AppiumConnection은 keep-alive를 사용하지만 urllib3 연결 풀 크기가 1이어서, 메인 스레드의 명령과
+백그라운드 스레드(SessionKeepalive 등)의 명령이 겹치면 풀에 들어가지 못한 연결을 버리고 매번 새로 연결합니다.
+(urllib3 DEBUG 로그의 "Connection pool is full, discarding connection")
+PooledAppiumConnection은 풀 크기를 늘리고, 연결/응답 timeout을 명령별로 적용하며,
+새로 연결한 요청과 기존 연결을 재사용한 요청 수를 기록합니다.
+
+서로 독립적인 조회 명령(GET)은 execute_parallel로 여러 연결에 동시에 보낼 수 있습니다.
+HTTP/1.1 pipelining은 urllib3가 지원하지 않으므로 같은 연결에 이어 보내는 대신 풀의 연결을 나눠 사용합니다.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import urllib3
+from appium.webdriver.appium_connection import AppiumConnection
+from selenium.webdriver.remote.command import Command
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+# 호스트별 유지할 연결 수 (메인 스레드 + 병렬 조회 스레드)
+POOL_MAXSIZE = 4
+# 연결 timeout (초). 로컬/사내망의 Appium 서버는 즉시 연결되어야 함
+CONNECT_TIMEOUT = 5
+# 응답 timeout 기본값 (초). implicit wait(10초)으로 블로킹되는 find 명령보다 길어야 함
+READ_TIMEOUT = 120
+# 명령별 응답 timeout (초)
+COMMAND_TIMEOUTS = {
+    # 세션 생성은 UiAutomator2 서버 설치/실행을 포함
+    Command.NEW_SESSION: 600,
+    Command.QUIT: 60,
+    # 세션 상태 확인은 빨리 실패해야 DriverPool이 세션을 다시 만들 수 있음
+    Command.GET_TIMEOUTS: 15,
+}
+
+
+@dataclass
+class ConnectionStats:
+    """
+    HTTP 요청 통계
+
+    Attributes:
+        requests: 보낸 요청 수
+        opened: 새 연결을 만든 요청 수
+        reused: 풀의 기존 연결을 재사용한 요청 수
+        parallel: execute_parallel로 동시에 보낸 요청 수
+    """
+    requests: int = 0
+    opened: int = 0
+    reused: int = 0
+    parallel: int = 0
+
+    def snapshot(self):
+        return ConnectionStats(self.requests, self.opened, self.reused, self.parallel)
+
+
+class _CountingPoolManager(urllib3.PoolManager):
+    """요청마다 명령별 timeout을 적용하고 새 연결 여부를 기록하는 PoolManager"""
+
+    def __init__(self, owner, **kwargs):
+        super().__init__(**kwargs)
+        self._owner = owner
+
+    def urlopen(self, method, url, redirect=True, **kw):
+        pool = self.connection_from_url(url)
+        timeout = self._owner._command_timeout()
+        if timeout is not None:
+            kw['timeout'] = timeout
+        opened_before = pool.num_connections
+        try:
+            return super().urlopen(method, url, redirect=redirect, **kw)
+        finally:
+            self._owner._record_request(opened=pool.num_connections > opened_before)
+
+
+class PooledAppiumConnection(AppiumConnection):
+    """
+    연결 풀 크기와 명령별 timeout을 조정한 Appium 명령 연결
+
+    Args:
+        remote_server_addr: Appium 서버 주소
+        pool_maxsize: 호스트별 유지할 연결 수
+        connect_timeout: 연결 timeout (초)
+        read_timeout: 응답 timeout 기본값 (초)
+        command_timeouts: 명령 이름별 응답 timeout (초). COMMAND_TIMEOUTS에 덮어씀
+        keep_alive: False이면 요청마다 연결을 새로 만듦 (비교 측정용)
+    """
+
+    def __init__(self, remote_server_addr, pool_maxsize=POOL_MAXSIZE, connect_timeout=CONNECT_TIMEOUT,
+                 read_timeout=READ_TIMEOUT, command_timeouts=None, keep_alive=True):
+        self.pool_maxsize = pool_maxsize
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.command_timeouts = {**COMMAND_TIMEOUTS, **(command_timeouts or {})}
+        self.stats = ConnectionStats()
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()
+        super().__init__(remote_server_addr, keep_alive=keep_alive)
+
+    def _get_connection_manager(self):
+        # 인증서 검증(ignore_certificates, ca_certs), SOCKS/HTTP 프록시와 프록시 인증은 selenium이 만든 manager를 그대로 사용하고
+        # 연결 풀 설정만 바꿈 (아직 연결 풀이 만들어지기 전이므로 connection_pool_kw를 바꾸면 모든 풀에 적용됨)
+        manager = super()._get_connection_manager()
+        manager.connection_pool_kw.update(
+            maxsize=self.pool_maxsize,
+            # 풀이 가득 차도 연결을 버리지 않도록 block=True (동시에 pool_maxsize개를 넘는 요청은 연결 반환을 기다림)
+            block=True,
+            timeout=urllib3.Timeout(connect=self.connect_timeout, read=self.read_timeout),
+            retries=False,
+        )
+        if type(manager) is urllib3.PoolManager:
+            # 프록시를 사용하지 않으면 명령별 timeout과 연결 재사용 통계를 위해 같은 인자로 교체
+            return _CountingPoolManager(self, headers=manager.headers, **manager.connection_pool_kw)
+        return manager
+
+    def _command_timeout(self):
+        read_timeout = getattr(self._local, 'read_timeout', None)
+        if read_timeout is None:
+            return None
+        return urllib3.Timeout(connect=self.connect_timeout, read=read_timeout)
+
+    def _record_request(self, opened):
+        with self._stats_lock:
+            self.stats.requests += 1
+            if opened:
+                self.stats.opened += 1
+            else:
+                self.stats.reused += 1
+
+    def is_read_only(self, command):
+        """응답만 조회하는(GET) 명령이면 True"""
+        info = self._commands.get(command) or self.extra_commands.get(command)
+        return info is not None and info[0] == 'GET'
+
+    def execute(self, command, params):
+        self._local.read_timeout = self.command_timeouts.get(command, self.read_timeout)
+        try:
+            return super().execute(command, params)
+        finally:
+            self._local.read_timeout = None
+
+
+def execute_parallel(driver, commands):
+    """
+    서로 독립적인 조회 명령(GET)을 풀의 여러 연결로 동시에 보냅니다.
+    PooledAppiumConnection이 아니거나 명령이 하나뿐이면 순서대로 실행합니다.
+
+    Args:
+        driver: Appium WebDriver
+        commands: (명령 이름, params) 목록
+
+    Returns:
+        list: 명령별 응답 (driver.execute의 반환값, 명령 순서와 같음)
+
+    Raises:
+        ValueError: 조회 명령이 아닌 명령이 포함되어 있을 때
+    """
+    executor = driver.command_executor
+    if not isinstance(executor, PooledAppiumConnection) or len(commands) < 2:
+        return [driver.execute(command, params) for command, params in commands]
+    for command, _ in commands:
+        if not executor.is_read_only(command):
+            raise ValueError(f"상태를 바꿀 수 있는 명령은 동시에 보낼 수 없습니다: {command}")
+
+    with executor._stats_lock:
+        executor.stats.parallel += len(commands)
+    workers = min(len(commands), executor.pool_maxsize)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="appium-parallel") as pool:
+        futures = [pool.submit(driver.execute, command, dict(params or {})) for command, params in commands]
+        return [future.result() for future in futures]
@@ -0,0 +1,288 @@
+"""
+현재 화면 식별 모듈입니다.
+
+테스트는 화면이 바뀔 때마다 is_login_page_loaded, is_main_home_page_loaded 등으로 현재 위치를 다시 확인하고,
+각 확인은 page object마다 여러 locator를 polling합니다.
+ScreenTracker는 page_source 스냅샷 한 번에서 화면의 fingerprint(앱 패키지, resource-id 집합)를 만들고,
+화면별 서명(ScreenSignature)과 비교하여 어떤 page object의 화면인지 식별한 뒤 결과를 캐시합니다.
+
+캐시는 화면을 바꿀 수 있는 동작이 실행되면 무효화됩니다.
+- 드라이버 명령: 클릭, 입력, 뒤로 가기, 키 입력, 앱 실행/종료, 화면을 바꿀 수 있는 mobile: 명령 (execute를 감싸서 감지)
+- adb로 실행하는 동작: AppLifecycle의 am start/force-stop, adb shell 키 이벤트 (호출하는 쪽에서 invalidate)
+동작 없이 화면이 바뀌는 경우(스플래시 → 로그인 등)를 위해 캐시는 SCREEN_CACHE_TTL초가 지나면 만료됩니다.
+
+page_source에는 Activity 이름이 없으므로 fingerprint는 Activity 대신 스냅샷의 앱 패키지를 사용합니다.
+(current_activity를 함께 조회하면 식별마다 명령이 하나 더 필요함)
+"""
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+
+from src.hierarchy import PageSnapshot, UnsupportedLocator
+from src.wait import WaitScheduler
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+# 동작 없이 화면이 바뀌는 경우를 위한 캐시 유효 시간 (초)
+SCREEN_CACHE_TTL = 5.0
+
+# 화면을 바꿀 수 있는 드라이버 명령
+INVALIDATING_COMMANDS = frozenset({
+    "clickElement", "sendKeysToElement", "clearElement", "goBack", "actions",
+    "pressKeyCode", "longPressKeyCode", "keyEvent", "hideKeyboard",
+    "activateApp", "terminateApp", "background", "removeApp", "installApp",
+})
+# 화면을 바꾸지 않는 조회용 mobile: 명령 (그 밖의 execute 명령은 캐시를 무효화)
+READ_ONLY_SCRIPTS = frozenset({
+    "mobile: queryAppState", "mobile: getCurrentActivity", "mobile: getCurrentPackage",
+    "mobile: isAppInstalled", "mobile: getAppStrings",
+})
+EXECUTE_COMMANDS = frozenset({"w3cExecuteScript", "executeScript"})
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """
+    스냅샷 한 번으로 만든 화면의 fingerprint
+
+    Attributes:
+        package: 화면의 앱 패키지 (알 수 없으면 None)
+        resource_ids: 화면에 존재하는 resource-id 집합
+    """
+    package: str | None
+    resource_ids: frozenset
+
+    @classmethod
+    def of(cls, snapshot):
+        return cls(snapshot.package, frozenset(snapshot.resource_ids()))
+
+
+@dataclass(frozen=True)
+class ScreenSignature:
+    """
+    page object 화면 하나의 식별 조건
+
+    Attributes:
+        page: page object 클래스
+        package: 화면의 앱 패키지 (None이면 확인하지 않음)
+        resource_ids: 모두 화면에 있어야 하는 resource-id (fingerprint로 바로 확인)
+        locators: 모두 스냅샷에 있어야 하는 locator (resource-id가 없는 요소용, 로컬 평가 가능한 UiSelector/XPath)
+    """
+    page: type
+    package: str | None = None
+    resource_ids: frozenset = frozenset()
+    locators: tuple = ()
+
+    def matches(self, snapshot, fingerprint):
+        if self.package is not None and fingerprint.package != self.package:
+            return False
+        if not self.resource_ids <= fingerprint.resource_ids:
+            return False
+        try:
+            return all(snapshot.find(locator, displayed_only=False) is not None for locator in self.locators)
+        except UnsupportedLocator:
+            return False
+
+
+def default_signatures(app_package):
+    """
+    오늘의집 앱의 화면 서명을 반환합니다. 앞에 있는 서명이 먼저 비교됩니다.
+    마이페이지와 메인 홈은 하단 footer를 공유하므로 마이페이지 고유 요소(설정 아이콘)를 먼저 확인합니다.
+
+    Args:
+        app_package: 오늘의집 앱 패키지
+
+    Returns:
+        list: ScreenSignature 목록
+    """
+    # page object가 BasePage를 통해 이 모듈을 사용하므로 순환 import 방지를 위해 함수 내부에서 import
+    from src.pages.login_page import LoginPage
+    from src.pages.login_page_by_email import LoginPageByEmail
+    from src.pages.main_home_page import MainHomePage
+    from src.pages.my_page import MyPage
+    from src.pages.setting_page import SettingPage
+    from src.pages.splash_page import SplashPage
+
+    def ids(*names):
+        return frozenset(f"{app_package}:id/{name}" for name in names)
+
+    return [
+        ScreenSignature(SplashPage, app_package, ids("splash_whole")),
+        ScreenSignature(LoginPage, app_package, ids("emailLogInText", "kakaoLoginButton")),
+        ScreenSignature(LoginPageByEmail, app_package, ids("loginButton", "passwordFindingButton")),
+        # 아래 화면들은 고유 요소에 resource-id가 없으므로 텍스트/설명 locator로 식별
+        ScreenSignature(SettingPage, app_package, locators=(SettingPage.MY_INFO_MANAGEMENT_TEXT, SettingPage.SERVICE_INFO_TEXT)),
+        ScreenSignature(MyPage, app_package, locators=(MyPage.GEAR_ICON_BUTTON, MyPage.PROFILE_TAP_BUTTON)),
+        ScreenSignature(
+            MainHomePage, app_package,
+            locators=(MainHomePage.COMMUNITY_BOTTOM_BUTTON, MainHomePage.MYPAGE_BOTTOM_BUTTON),
+        ),
+    ]
+
+
+class ScreenTracker:
+    """
+    드라이버 하나의 현재 화면 식별 결과를 캐시하는 서비스
+
+    Args:
+        driver: Appium WebDriver
+        signatures: 화면 서명 목록 (None이면 AppConfig.app_package 기준의 default_signatures)
+        waits: 대기에 사용할 WaitScheduler (None이면 드라이버의 공용 스케줄러)
+    """
+
+    # 드라이버별 tracker
+    _trackers = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver, signatures=None, waits=None):
+        if signatures is None:
+            from src.config.settings import load_config
+            signatures = default_signatures(load_config().app_package)
+        self.driver = driver
+        self.signatures = list(signatures)
+        self.waits = waits or WaitScheduler.for_driver(driver)
+        # 화면을 바꿀 수 있는 동작이 실행될 때마다 증가
+        self.generation = 0
+        self.hits = 0
+        self.snapshots = 0
+        self._cached = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_driver(cls, driver):
+        """
+        드라이버별로 공유되는 tracker를 반환합니다. 처음 호출될 때 드라이버 명령 감지를 연결합니다.
+        weakref를 만들 수 없는 드라이버(가짜 드라이버 등)에는 연결하지 않은 새 tracker를 반환합니다.
+        """
+        try:
+            tracker = cls._trackers.get(driver)
+        except TypeError:
+            return cls(driver)
+        if tracker is None:
+            tracker = cls._trackers[driver] = cls(driver)._wrap_execute()
+        return tracker
+
+    @classmethod
+    def invalidate_driver(cls, driver):
+        """드라이버에 연결된 tracker가 있으면 캐시를 무효화합니다. (adb로 실행한 동작용)"""
+        try:
+            tracker = cls._trackers.get(driver)
+        except TypeError:
+            return
+        if tracker is not None:
+            tracker.invalidate()
+
+    def _wrap_execute(self):
+        original = getattr(self.driver, "execute", None)
+        if original is None:
+            return self
+
+        def execute(driver_command, params=None):
+            if driver_command in INVALIDATING_COMMANDS or (
+                driver_command in EXECUTE_COMMANDS and (params or {}).get("script") not in READ_ONLY_SCRIPTS
+            ):
+                self.invalidate()
+            return original(driver_command, params)
+
+        self.driver.execute = execute
+        return self
+
+    def invalidate(self):
+        """캐시된 화면 식별 결과를 버립니다."""
+        with self._lock:
+            self.generation += 1
+            self._cached = None
+
+    def identify(self, snapshot):
+        """
+        스냅샷의 화면을 식별합니다. (캐시를 사용하거나 갱신하지 않음)
+
+        Returns:
+            type | None: page object 클래스, 알 수 없는 화면이면 None
+        """
+        fingerprint = Fingerprint.of(snapshot)
+        for signature in self.signatures:
+            if signature.matches(snapshot, fingerprint):
+                return signature.page
+        return None
+
+    def observe(self, snapshot, generation=None):
+        """
+        다른 곳에서 가져온 스냅샷(BasePage.take_snapshot 등)으로 캐시를 갱신합니다.
+
+        Args:
+            snapshot: PageSnapshot
+            generation: 스냅샷을 가져오기 전의 generation (그 사이에 동작이 실행되었으면 캐시하지 않음)
+
+        Returns:
+            type | None: 식별한 page object 클래스
+        """
+        page = self.identify(snapshot)
+        with self._lock:
+            if generation is None or generation == self.generation:
+                self._cached = (page, time.monotonic())
+        return page
+
+    def cached(self):
+        """
+        명령 없이 캐시된 화면을 반환합니다.
+
+        Returns:
+            type | None: 캐시된 page object 클래스 (캐시가 없거나 만료되었거나 알 수 없는 화면이면 None)
+        """
+        with self._lock:
+            if self._cached is None:
+                return None
+            page, observed_at = self._cached
+            if time.monotonic() - observed_at > SCREEN_CACHE_TTL:
+                self._cached = None
+                return None
+        if page is not None:
+            self.hits += 1
+        return page
+
+    def current(self):
+        """
+        현재 화면의 page object 클래스를 반환합니다. 캐시가 없을 때만 page_source를 한 번 가져옵니다.
+
+        Returns:
+            type | None: page object 클래스, 알 수 없는 화면이면 None
+        """
+        page = self.cached()
+        if page is not None:
+            return page
+        return self.refresh()
+
+    def refresh(self):
+        """캐시와 관계없이 page_source를 한 번 가져와 화면을 다시 식별합니다."""
+        generation = self.generation
+        try:
+            snapshot = PageSnapshot.capture(self.driver)
+        except Exception as e:
+            log.debug(f"화면 식별용 page_source 조회 실패: {e}")
+            return None
+        self.snapshots += 1
+        return self.observe(snapshot, generation)
+
+    def is_on(self, page_class):
+        """현재 화면이 page_class의 화면인지 확인합니다."""
+        return self.current() is page_class
+
+    def wait_for(self, page_class, timeout=10):
+        """
+        화면이 page_class의 화면으로 바뀔 때까지 대기합니다. polling마다 page_source 한 번으로 확인합니다.
+
+        Args:
+            page_class: 기다릴 page object 클래스
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 시간 안에 화면이 바뀌었으면 True
+        """
+        if self.cached() is page_class:
+            return True
+        return bool(self.waits.until(
+            lambda: self.refresh() is page_class, timeout, name=f"wait_for_screen:{page_class.__name__}",
+        ))
@@ -0,0 +1,182 @@
+"""
+토스트 메시지 수집 모듈입니다.
+
+토스트는 2~3.5초만 노출되므로 `//android.widget.Toast` XPath를 polling하면 느리고, 확인하기 전에 사라지면 놓칩니다.
+ToastListener는 백그라운드에서 `adb logcat`을 계속 읽어 토스트가 나타날 때마다 시각과 함께 링 버퍼에 기록하므로,
+"t0 이후에 X를 포함한 토스트가 나타났는가"를 화면과 경쟁하지 않고 버퍼 조회로 확인할 수 있습니다.
+
+토스트는 UiAutomator2 서버가 접근성 이벤트로 받아 logcat(appium 태그)에 남기는 "Catching toast message" 로그로 수집합니다.
+(`uiautomator events`는 UiAutomator2 서버와 UiAutomation 연결을 두고 충돌하므로 사용하지 않음)
+"""
+import logging
+import re
+import subprocess
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+# UiAutomator2 서버의 토스트 로그 (예: "Catching toast message: [로그인 중입니다.]")
+TOAST_LOG_PATTERN = re.compile(r"Catching toast message:\s*\[?(?P<text>.*?)\]?\s*$")
+# Toast.LENGTH_LONG 노출 시간 (초). 이 시간이 지난 토스트는 화면에서 사라진 것으로 봄
+TOAST_LONG_DURATION = 3.5
+# 토스트를 기다리기 시작한 시각보다 이만큼 앞선 토스트도 인정 (동작 직후 바로 나타난 토스트를 놓치지 않기 위함)
+TOAST_LOOKBACK = 2.0
+
+
+@dataclass
+class ToastEvent:
+    """
+    수집된 토스트 한 건
+
+    Attributes:
+        text: 토스트 메시지
+        timestamp: 수집 시각 (time.time)
+        consumed: wait_for로 이미 확인에 사용되었으면 True (같은 토스트로 두 번 확인하지 않음)
+    """
+    text: str
+    timestamp: float
+    consumed: bool = False
+
+
+class ToastListener:
+    """
+    logcat으로 토스트를 수집하는 백그라운드 리스너
+
+    Args:
+        serial: 디바이스 시리얼
+        capacity: 링 버퍼 크기
+        adb_path: adb 실행 파일 경로
+    """
+
+    # 드라이버별로 연결된 리스너
+    _attached = weakref.WeakKeyDictionary()
+
+    def __init__(self, serial, capacity=256, adb_path='adb'):
+        self.serial = serial
+        self.adb_path = adb_path
+        self.events = deque(maxlen=capacity)
+        self._changed = threading.Condition(threading.RLock())
+        self._process = None
+        self._thread = None
+
+    @classmethod
+    def attach(cls, driver, serial):
+        """드라이버에 리스너를 연결하고 시작합니다. 이미 연결되어 있으면 기존 리스너를 반환합니다."""
+        listener = cls._attached.get(driver)
+        if listener is None:
+            listener = cls._attached[driver] = cls(serial).start()
+        return listener
+
+    @classmethod
+    def for_driver(cls, driver):
+        """드라이버에 연결된 리스너를 반환합니다. 없으면 None"""
+        return cls._attached.get(driver)
+
+    @classmethod
+    def detach_all(cls):
+        """연결된 모든 리스너를 종료합니다."""
+        listeners = list(cls._attached.values())
+        cls._attached.clear()
+        for listener in listeners:
+            listener.stop()
+
+    def start(self):
+        """`adb logcat`을 실행하고 출력을 읽는 스레드를 시작합니다."""
+        # -T 1: 시작 이전의 로그는 건너뛰고 새 로그만 읽음
+        self._process = subprocess.Popen(
+            [self.adb_path, '-s', self.serial, 'logcat', '-T', '1', '-v', 'brief', 'appium:D', '*:S'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+        )
+        self._thread = threading.Thread(target=self._pump, name="toast-listener", daemon=True)
+        self._thread.start()
+        log.debug(f"[{self.serial}] 토스트 리스너 시작")
+        return self
+
+    def stop(self):
+        process, self._process = self._process, None
+        if process is not None:
+            process.kill()
+            process.wait(timeout=5)
+        log.debug(f"[{self.serial}] 토스트 리스너 종료 (수집 {len(self.events)}건)")
+
+    def _pump(self):
+        for line in self._process.stdout:
+            self.feed(line)
+
+    def feed(self, line, timestamp=None):
+        """
+        logcat 한 줄을 처리합니다. 토스트 로그이면 버퍼에 기록합니다.
+
+        Returns:
+            ToastEvent: 기록된 토스트 (토스트 로그가 아니면 None)
+        """
+        match = TOAST_LOG_PATTERN.search(line)
+        if not match:
+            return None
+        event = ToastEvent(match.group('text'), timestamp if timestamp is not None else time.time())
+        with self._changed:
+            self.events.append(event)
+            self._changed.notify_all()
+        log.debug(f"토스트 수집: '{event.text}'")
+        return event
+
+    def find(self, text, since=None, until=None, unconsumed=False, latest=False):
+        """
+        since~until 사이에 text를 포함한 토스트가 나타났는지 버퍼에서 찾습니다.
+
+        Args:
+            text: 토스트 메시지에 포함될 텍스트
+            since: 이 시각 이후의 토스트만 확인 (time.time)
+            until: 이 시각 이전의 토스트만 확인 (time.time)
+            unconsumed: True이면 wait_for에서 아직 사용되지 않은 토스트만 확인
+            latest: True이면 가장 최근 토스트를, False이면 가장 먼저 나타난 토스트를 반환
+
+        Returns:
+            ToastEvent: 찾은 토스트 (없으면 None)
+        """
+        with self._changed:
+            for event in (reversed(self.events) if latest else self.events):
+                if since is not None and event.timestamp < since:
+                    continue
+                if until is not None and event.timestamp > until:
+                    continue
+                if unconsumed and event.consumed:
+                    continue
+                if text in event.text:
+                    return event
+        return None
+
+    def wait_for(self, text, timeout, since=None):
+        """
+        text를 포함한 토스트가 나타날 때까지 대기합니다.
+        이미 확인에 사용된 토스트는 다시 사용하지 않으므로, 같은 문구의 토스트를 연속으로 확인할 수 있습니다.
+
+        Args:
+            text: 토스트 메시지에 포함될 텍스트
+            timeout: 최대 대기 시간 (초)
+            since: 이 시각 이후의 토스트만 인정 (None이면 TOAST_LOOKBACK초 전부터)
+
+        Returns:
+            ToastEvent: 확인된 토스트 (timeout 안에 나타나지 않으면 None)
+        """
+        since = time.time() - TOAST_LOOKBACK if since is None else since
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                event = self.find(text, since=since, unconsumed=True)
+                if event is not None:
+                    event.consumed = True
+                    return event
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._changed.wait(remaining)
@@ -0,0 +1,168 @@
+"""
+page object의 대기 로직이 공통으로 사용하는 polling 스케줄러입니다.
+
+고정 간격(0.5~1초) sleep 루프 대신 첫 확인은 즉시 수행하고, 이후 간격을 지수적으로 늘리되
+상한(max_interval)을 두어 polling합니다. 이미 로드된 화면은 한 번의 확인으로 감지되고,
+오래 걸리는 화면은 불필요한 round-trip 없이 기다립니다.
+
+deadline 블록 안에서 실행되는 대기는 자신의 timeout과 관계없이 블록의 deadline을 넘기지 않으며,
+조건 이름별로 대기 지연 시간 통계를 기록합니다.
+"""
+import logging
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from selenium.common.exceptions import WebDriverException
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+
+@dataclass
+class WaitStats:
+    """
+    조건 이름별 대기 통계
+
+    Attributes:
+        calls: 대기 횟수
+        hits: 조건을 만족한 횟수
+        timeouts: 타임아웃 횟수
+        polls: 조건을 확인한 총 횟수
+        total_seconds: 전체 대기 시간 합계 (초)
+        max_seconds: 가장 오래 걸린 대기 시간 (초)
+    """
+    calls: int = 0
+    hits: int = 0
+    timeouts: int = 0
+    polls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, elapsed, polls, hit):
+        self.calls += 1
+        self.polls += polls
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        if hit:
+            self.hits += 1
+        else:
+            self.timeouts += 1
+
+    @property
+    def mean_seconds(self):
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+class WaitScheduler:
+    """
+    backoff polling 스케줄러
+
+    Args:
+        initial_interval: 첫 번째 확인 이후의 polling 간격 (초)
+        max_interval: polling 간격의 상한 (초)
+        backoff: polling 간격 증가 배수
+    """
+
+    _by_driver = weakref.WeakKeyDictionary()
+
+    def __init__(self, initial_interval=0.1, max_interval=1.0, backoff=2.0):
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.stats = {}
+        self._local = threading.local()
+
+    @classmethod
+    def for_driver(cls, driver):
+        """
+        드라이버별로 하나의 스케줄러를 반환합니다.
+        같은 드라이버를 사용하는 page object들이 deadline과 통계를 공유합니다.
+        """
+        scheduler = cls._by_driver.get(driver)
+        if scheduler is None:
+            scheduler = cls()
+            cls._by_driver[driver] = scheduler
+        return scheduler
+
+    def _deadlines(self):
+        if not hasattr(self._local, "deadlines"):
+            self._local.deadlines = []
+        return self._local.deadlines
+
+    @contextmanager
+    def deadline(self, timeout):
+        """
+        블록 전체에 적용되는 전역 deadline을 설정합니다.
+        블록 안의 모든 대기(중첩된 대기 포함)는 이 deadline을 넘기지 않습니다.
+        중첩된 deadline 블록은 바깥 deadline보다 늦어질 수 없습니다.
+        """
+        deadlines = self._deadlines()
+        deadlines.append(min([time.monotonic() + timeout] + deadlines[-1:]))
+        try:
+            yield
+        finally:
+            deadlines.pop()
+
+    def clamp(self, timeout):
+        """timeout을 현재 전역 deadline까지 남은 시간으로 제한합니다."""
+        deadlines = self._deadlines()
+        if not deadlines:
+            return timeout
+        return max(0.0, min(timeout, deadlines[-1] - time.monotonic()))
+
+    def until(self, condition, timeout, name="condition", max_interval=None,
+              ignored_exceptions=(WebDriverException,)):
+        """
+        condition이 참 값을 반환할 때까지 backoff polling으로 대기합니다.
+        첫 번째 확인은 sleep 없이 즉시 수행합니다.
+
+        Args:
+            condition: 인자 없이 호출되는 함수. 참 값을 반환하면 대기를 종료
+            timeout: 최대 대기 시간 (초). 전역 deadline이 있으면 그보다 길어지지 않음
+            name: 통계를 기록할 조건 이름
+            max_interval: 이번 대기에만 적용할 polling 간격 상한 (초)
+            ignored_exceptions: 조건을 만족하지 않은 것으로 간주할 예외
+
+        Returns:
+            condition의 마지막 반환값 (타임아웃되면 거짓 값)
+        """
+        started = time.monotonic()
+        deadline = started + self.clamp(timeout)
+        cap = self.max_interval if max_interval is None else max_interval
+        interval = min(self.initial_interval, cap)
+        polls = 0
+        result = None
+
+        while True:
+            polls += 1
+            try:
+                result = condition()
+            except ignored_exceptions as e:
+                log.debug(f"[{name}] 확인 중 예외 발생 (무시): {e}")
+                result = None
+            if result:
+                break
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, cap)
+
+        elapsed = time.monotonic() - started
+        self.stats.setdefault(name, WaitStats()).record(elapsed, polls, bool(result))
+        log.debug(f"[{name}] {'감지' if result else '타임아웃'}: {elapsed:.2f}초, {polls}회 확인")
+        return result
+
+    def report(self):
+        """조건별 대기 통계를 평균 대기 시간이 긴 순서로 정리한 문자열을 반환합니다."""
+        lines = []
+        for name, stats in sorted(self.stats.items(), key=lambda item: item[1].mean_seconds, reverse=True):
+            lines.append(
+                f"{name}: {stats.calls}회 (감지 {stats.hits}, 타임아웃 {stats.timeouts}), "
+                f"평균 {stats.mean_seconds:.2f}초, 최대 {stats.max_seconds:.2f}초, 확인 {stats.polls}회"
+            )
+        return "\n".join(lines)
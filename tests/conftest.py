@@ -2,10 +2,28 @@
 pytest 공통 fixture 정의
 이 파일의 fixture는 tests 디렉토리 내의 모든 테스트에서 자동으로 사용 가능합니다.
 """
+import os
+import re
 import time
 import logging
 import pytest
+from src.adb import device_serial
+from src.auth_state import AuthState, AuthStateStore
+from src.config.settings import load_config, override_config
+from src.device_farm import device_overrides, lease_device, load_device_pool
 from src.driver import create_driver
+from src.driver_pool import DriverPool
+from src.implicit_wait import ImplicitWaitMeter
+from src.instrumentation import Tracer, install_hooks, instrument_pages, summary_lines, uninstall_hooks, write_report
+from src.lockout import MODE_FAST, MODE_REAL, LockoutTimer, MockLoginBackend
+from src.logcat import LogcatCollector
+from src.navigation import Navigator
+from src.pages.base_page import BasePage
+from src.provisioning import ApkCache
+from src.toast import ToastListener
+from src.wait import WaitScheduler
+
+log = logging.getLogger(__name__)
 
 # TRACE 레벨 추가 (DEBUG보다 낮은 레벨)
 TRACE_LEVEL = 5
@@ -41,13 +59,304 @@ for logger_name in selenium_loggers:
         logger.removeHandler(handler)
 
 
+# 측정 모드에서 테스트별 (nodeid, 블로킹 시간, 블로킹 횟수)를 모아두는 키
+_implicit_wait_results_key = pytest.StashKey[list]()
+# 테스트별 step 측정 결과(Trace)를 모아두는 키
+_trace_results_key = pytest.StashKey[list]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--measure-implicit-wait",
+        action="store_true",
+        default=False,
+        help="측정하는 동안 이전 기본값(10초)의 implicit wait을 적용하고, 각 테스트가 implicit wait 때문에 블로킹된 시간을 측정합니다. (환경 변수 MEASURE_IMPLICIT_WAIT=1 로도 활성화)",
+    )
+    parser.addoption(
+        "--toast-listener",
+        action="store_true",
+        default=False,
+        help="logcat으로 토스트를 수집하여 토스트 확인에 사용합니다. (환경 변수 TOAST_LISTENER=1 로도 활성화)",
+    )
+    parser.addoption(
+        "--logcat-dir",
+        default=os.getenv("LOGCAT_DIR"),
+        help="테스트별 logcat(앱 pid 및 Activity 로그)을 이 디렉토리에 JSON Lines로 저장합니다. (환경 변수 LOGCAT_DIR)",
+    )
+    parser.addoption(
+        "--lockout-mode",
+        choices=[MODE_REAL, MODE_FAST],
+        default=os.getenv("LOCKOUT_MODE", MODE_REAL),
+        help="로그인 제한 시간 처리 방식. real: 실제 시간만큼 대기, fast: mock 로그인 백엔드의 시계를 앞당김 (환경 변수 LOCKOUT_MODE)",
+    )
+    parser.addoption(
+        "--no-trace",
+        action="store_true",
+        default=False,
+        help="step 단위 시간 측정을 끕니다. (환경 변수 TRACE=0 으로도 비활성화)",
+    )
+    parser.addoption(
+        "--trace-report",
+        default=os.getenv("TRACE_REPORT"),
+        help="테스트별 step 측정 결과를 이 경로에 JSON으로 저장합니다. xdist 워커는 파일 이름에 워커 id가 붙습니다. (환경 변수 TRACE_REPORT)",
+    )
+    parser.addoption(
+        "--apk-cache-dir",
+        default=os.getenv("APK_CACHE_DIR"),
+        help="테스트 전처리에서 설치할 APK 캐시 디렉토리 (환경 변수 APK_CACHE_DIR, 기본값 ~/.cache/appium-apk-cache)",
+    )
+    parser.addoption(
+        "--no-provision",
+        action="store_true",
+        default=False,
+        help="테스트 전 APK 캐시로 앱을 설치하지 않습니다. (환경 변수 PROVISION=0 으로도 비활성화)",
+    )
+
+
+def _is_implicit_wait_measurement_enabled(config):
+    return config.getoption("--measure-implicit-wait") or os.getenv("MEASURE_IMPLICIT_WAIT") == "1"
+
+
+def _attach_implicit_wait_meter(request, driver):
+    """측정 모드가 켜져 있으면 드라이버에 ImplicitWaitMeter를 연결합니다."""
+    if not _is_implicit_wait_measurement_enabled(request.config):
+        return None
+    return ImplicitWaitMeter().attach(driver)
+
+
+def _report_implicit_wait_meter(request, meter):
+    """테스트별 implicit wait 블로킹 시간을 로그로 남기고 세션 요약용으로 기록합니다."""
+    if meter is None:
+        return
+    meter.detach()
+    log.info(f"[{request.node.nodeid}] {meter.summary()}")
+    request.config.stash.setdefault(_implicit_wait_results_key, []).append(
+        (request.node.nodeid, meter.blocked_seconds, meter.blocked_calls)
+    )
+
+
+def _is_tracing_enabled(config):
+    return not config.getoption("--no-trace") and os.getenv("TRACE") != "0"
+
+
+def _begin_trace(request, driver):
+    """드라이버에 Tracer를 연결하고 테스트의 step 기록을 시작합니다."""
+    if not _is_tracing_enabled(request.config):
+        return
+    install_hooks()
+    # 테스트 모듈에서 새로 import된 page object의 메서드도 step으로 기록
+    instrument_pages()
+    # logcat 저장 중이면 step 시작을 logcat에도 기록하여 같은 시간축에서 볼 수 있도록 함
+    on_step = _begin_logcat(request, driver).mark if _logcat_path(request) else None
+    Tracer.attach(driver, on_step=on_step).begin_test(request.node.nodeid)
+
+
+def _end_trace(request, driver):
+    """테스트의 step 기록을 마무리하고 세션 요약용으로 기록합니다."""
+    tracer = Tracer.for_driver(driver)
+    if tracer is None or tracer.trace.name != request.node.nodeid:
+        return
+    trace = tracer.end_test()
+    log.info(
+        f"[{request.node.nodeid}] step {len(trace.steps)}개, 명령 {trace.commands}회 ({trace.command_seconds:.2f}초), "
+        f"sleep {trace.sleep_seconds:.2f}초, 대기 {trace.wait_seconds:.2f}초, adb {trace.adb_seconds:.2f}초, "
+        f"연결 생성 {trace.connections_opened}회 / 재사용 {trace.connections_reused}회"
+    )
+    request.config.stash.setdefault(_trace_results_key, []).append(trace)
+
+
+def _logcat_path(request):
+    """테스트별 logcat 저장 경로 (--logcat-dir이 없으면 None)"""
+    logcat_dir = request.config.getoption("--logcat-dir")
+    if not logcat_dir:
+        return None
+    file_name = re.sub(r"[^\w.\-\[\]]+", "_", request.node.nodeid)
+    return os.path.join(logcat_dir, f"{file_name}.jsonl")
+
+
+def _begin_logcat(request, driver):
+    """테스트의 logcat 저장소를 새로 시작합니다."""
+    collector = LogcatCollector.for_serial(device_serial(driver), load_config().app_package)
+    if collector.store.name != request.node.nodeid:
+        collector.begin_test(request.node.nodeid)
+    return collector
+
+
+def _save_logcat(request, driver):
+    """--logcat-dir이 지정되어 있으면 테스트의 logcat 저장소를 파일로 저장합니다."""
+    path = _logcat_path(request)
+    if path is None:
+        return
+    store = LogcatCollector.for_serial(device_serial(driver), load_config().app_package).store
+    log.info(f"[{request.node.nodeid}] logcat {len(store.entries)}줄 저장: {store.write(path)}")
+
+
+def _finalize_driver(request, driver, meter, driver_pool):
+    """테스트별 측정 결과와 대기 통계를 기록한 뒤 세션을 풀에 반환합니다."""
+    _report_implicit_wait_meter(request, meter)
+    # WaitScheduler 통계가 초기화되기 전에 대기 시간을 집계
+    _end_trace(request, driver)
+    _save_logcat(request, driver)
+    waits = WaitScheduler.for_driver(driver)
+    wait_report = waits.report()
+    if wait_report:
+        log.debug(f"[{request.node.nodeid}] 조건별 대기 통계\n{wait_report}")
+    navigation_report = Navigator.for_driver(driver).report(clear=True)
+    if navigation_report:
+        log.debug(f"[{request.node.nodeid}] 화면 이동 경로\n{navigation_report}")
+    # 세션이 재사용되므로 통계는 테스트 단위로 초기화
+    waits.stats.clear()
+    driver_pool.release(driver, skip_app_launch=True)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    path = session.config.getoption("--trace-report")
+    traces = session.config.stash.get(_trace_results_key, None)
+    if not path or not traces:
+        return
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker:
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{worker}{ext}"
+    log.info(f"step 측정 결과 저장: {write_report(traces, path)}")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    traces = config.stash.get(_trace_results_key, None)
+    if traces:
+        terminalreporter.section("step 시간 측정")
+        for line in summary_lines(traces):
+            terminalreporter.write_line(line)
+    results = config.stash.get(_implicit_wait_results_key, None)
+    if not results:
+        return
+    terminalreporter.section("implicit wait 블로킹 시간")
+    for nodeid, blocked_seconds, blocked_calls in sorted(results, key=lambda r: r[1], reverse=True):
+        terminalreporter.write_line(f"{blocked_seconds:8.2f}s  {blocked_calls:4d}회  {nodeid}")
+    total = sum(r[1] for r in results)
+    terminalreporter.write_line(f"합계: {total:.2f}s")
+
+
+@pytest.fixture(scope="session")
+def device(worker_id):
+    """
+    현재 워커가 사용할 디바이스를 디바이스 풀에서 임대하는 fixture
+    
+    pytest-xdist로 병렬 실행하면 워커마다 서로 다른 디바이스(udid, systemPort, mjpegServerPort)를 할당받습니다.
+    DEVICE_POOL_FILE이 없으면 .env의 디바이스 한 대를 사용합니다.
+    
+    Yields:
+        Device: 임대한 디바이스
+    """
+    lease = lease_device(load_device_pool(load_config()), worker_id=worker_id)
+    
+    yield lease.device
+    
+    lease.release()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(device):
+    """
+    테스트 간에 WebDriver 세션을 재사용하는 세션 풀 fixture
+    
+    세션을 넘겨주기 전에 health-check를 수행하여 죽은 세션만 새로 만들고,
+    _reset_device_state로 이전 테스트가 남긴 상태를 정리합니다.
+    세션은 워커에 할당된 디바이스로 생성되며, 테스트 세션이 끝나면 모든 세션을 종료합니다.
+    """
+    # 워커의 설정에 임대한 디바이스를 반영하여 page object와 create_driver가 같은 설정을 사용
+    cfg = override_config(**device_overrides(device))
+    pool = DriverPool(
+        factory=lambda skip_app_launch: create_driver(cfg, skip_app_launch=skip_app_launch),
+        reset_hooks=[_reset_device_state],
+    )
+    
+    yield pool
+    
+    ToastListener.detach_all()
+    LogcatCollector.stop_all()
+    # 로그인 토큰이 담긴 스냅샷은 세션이 끝나면 디바이스에서 삭제
+    AuthStateStore.discard_all()
+    pool.close()
+    uninstall_hooks()
+
+
+@pytest.fixture(scope="session")
+def provisioned_app(request, device):
+    """
+    워커의 디바이스에 APK 캐시로 앱을 설치하는 fixture
+
+    플레이 스토어 UI 대신 `adb install-multiple`로 설치하며, 이미 같거나 새 버전이 설치되어 있으면 건너뜁니다.
+    캐시에 디바이스 프로필(ABI, 화면 밀도)용 APK가 없으면 디바이스 풀에서 같은 프로필이면서 앱이 설치된 디바이스의 APK를 가져옵니다.
+    플레이 스토어 설치 흐름을 검증하는 INSTALL_001(driver_playstore)은 이 fixture를 사용하지 않습니다.
+
+    Returns:
+        ProvisionResult | None: 설치 결과 (--no-provision이면 None)
+    """
+    return _provision_app(request, device)
+
+
+def _provisioning_enabled(config):
+    return not (config.getoption("--no-provision") or os.getenv("PROVISION") == "0")
+
+
+def _provision_app(request, device):
+    """APK 캐시로 디바이스에 앱을 설치합니다. (provisioned_app 참고)"""
+    if not _provisioning_enabled(request.config):
+        return None
+    cfg = load_config()
+    cache = ApkCache(request.config.getoption("--apk-cache-dir"))
+    sources = [device.udid] + [other.udid for other in load_device_pool(cfg) if other.udid != device.udid]
+    result, = cache.provision_all([device.udid], cfg.app_package, sources=sources)
+    if result.ok:
+        log.info(f"[{device.udid}] 앱 설치 확인: {result.action} {result.version_code} ({result.seconds:.1f}초)")
+    else:
+        # 설치하지 못해도 테스트의 앱 설치 확인 전처리에서 실패하도록 계속 진행
+        log.warning(f"[{device.udid}] APK 캐시로 앱을 설치하지 못했습니다: {result.message}")
+    return result
+
+
+def _reset_device_state(driver, keep_app_state):
+    """
+    세션을 다음 테스트에 넘겨주기 전에 실행되는 reset hook
+    끊긴 네트워크를 복구하고, keep_app_state가 아니면 앱을 종료하고 홈 화면으로 이동합니다.
+    """
+    page = BasePage(driver)
+    if not page.is_network_connected():
+        log.info("이전 테스트에서 끊긴 네트워크를 복구합니다.")
+        page.enable_network()
+    if not keep_app_state:
+        page.terminate_all_apps()
+
+
+def _acquire_driver(request, driver_pool):
+    """
+    테스트의 marker에 따라 세션 풀에서 세션을 가져옵니다.
+    - fresh_session: 기존 세션을 종료하고 새 세션을 생성
+    - keep_app_state: 이전 테스트의 앱 화면을 유지 (앱 종료 없이 이어서 진행하는 테스트)
+    """
+    driver = driver_pool.acquire(
+        skip_app_launch=True,
+        fresh=request.node.get_closest_marker("fresh_session") is not None,
+        keep_app_state=request.node.get_closest_marker("keep_app_state") is not None,
+    )
+    if request.config.getoption("--toast-listener") or os.getenv("TOAST_LISTENER") == "1":
+        # 세션마다 한 번만 시작되며, 재사용되는 세션은 기존 리스너를 계속 사용
+        ToastListener.attach(driver, device_serial(driver))
+    if _logcat_path(request):
+        _begin_logcat(request, driver)
+    _begin_trace(request, driver)
+    return driver
+
+
 @pytest.fixture(scope="function")
-def driver():
+def driver(request, driver_pool, provisioned_app):
     """
-    Appium WebDriver를 생성하고 정리하는 fixture (일반용)
+    Appium WebDriver를 세션 풀에서 가져오고 반환하는 fixture (일반용)
     
-    각 테스트마다 드라이버를 생성하고 테스트 종료 후 정리합니다.
+    세션은 테스트 간에 재사용되며, 테스트 시작 전에 reset hook으로 상태가 정리됩니다.
     앱을 실행하지 않고 드라이버만 생성합니다.
+    앱은 세션 시작 시 provisioned_app fixture가 APK 캐시로 설치합니다.
     
     Yields:
         webdriver.Remote: Appium WebDriver 인스턴스
@@ -57,21 +366,24 @@ def driver():
             # driver를 사용하여 테스트 수행
             driver.find_element(...)
     """
-    # 앱 실행 없이 드라이버 생성
-    driver = create_driver(skip_app_launch=True)
+    # 앱 실행 없이 생성된 세션 가져오기
+    driver = _acquire_driver(request, driver_pool)
+    meter = _attach_implicit_wait_meter(request, driver)
     
     yield driver
     
-    driver.quit()
+    _finalize_driver(request, driver, meter, driver_pool)
 
 
 @pytest.fixture(scope="function")
-def driver_playstore():
+def driver_playstore(request, driver_pool, device):
     """
-    Appium WebDriver를 생성하고 플레이 스토어를 실행하는 fixture
+    Appium WebDriver를 세션 풀에서 가져오고 플레이 스토어를 실행하는 fixture
     
     test_install_app.py에서만 사용합니다.
-    플레이 스토어 앱을 자동으로 실행합니다.
+    --dist loadgroup에서는 같은 워커가 먼저 실행한 테스트의 provisioned_app으로 앱이 이미 설치되어 있을 수 있어
+    ("설치" 대신 "열기" 버튼 표시), 플레이 스토어를 실행하기 전에 앱을 삭제합니다.
+    테스트가 끝났는데 앱이 설치되어 있지 않으면 같은 워커의 이후 테스트를 위해 APK 캐시로 다시 설치합니다.
     
     Yields:
         webdriver.Remote: Appium WebDriver 인스턴스
@@ -81,22 +393,30 @@ def driver_playstore():
             # 플레이 스토어가 이미 실행된 상태
             driver_playstore.find_element(...)
     """
-    # 앱 실행 없이 드라이버 생성
-    driver = create_driver(skip_app_launch=True)
+    # 앱 실행 없이 생성된 세션 가져오기
+    driver = _acquire_driver(request, driver_pool)
+    app_package = load_config().app_package
+    if driver.is_app_installed(app_package):
+        log.info(f"플레이 스토어 설치 흐름을 검증하기 위해 설치된 앱을 삭제합니다: {app_package}")
+        driver.remove_app(app_package)
     # 플레이 스토어 앱 실행
     driver.activate_app("com.android.vending")
     # 플레이 스토어가 완전히 로드될 때까지 대기
     time.sleep(3)
+    meter = _attach_implicit_wait_meter(request, driver)
     
     yield driver
     
-    driver.quit()
+    if _provisioning_enabled(request.config) and not driver.is_app_installed(app_package):
+        log.info(f"플레이 스토어 설치가 완료되지 않아 APK 캐시로 앱을 다시 설치합니다: {app_package}")
+        _provision_app(request, device)
+    _finalize_driver(request, driver, meter, driver_pool)
 
 
 @pytest.fixture(scope="function")
-def driver_without_app_launch():
+def driver_without_app_launch(request, driver_pool, provisioned_app):
     """
-    앱 실행 없이 드라이버만 생성하는 fixture
+    앱 실행 없이 드라이버만 가져오는 fixture
     
     특정 앱을 직접 제어하고 싶을 때 사용합니다.
     
@@ -109,9 +429,66 @@ def driver_without_app_launch():
             driver.activate_app("com.example.app")
             # 테스트 수행
     """
-    driver = create_driver(skip_app_launch=True)
+    driver = _acquire_driver(request, driver_pool)
+    meter = _attach_implicit_wait_meter(request, driver)
     
     yield driver
     
-    driver.quit()
+    _finalize_driver(request, driver, meter, driver_pool)
 
+
+@pytest.fixture(scope="function")
+def lockout(request, driver):
+    """
+    로그인 제한 시간 경과를 처리하는 LockoutTimer fixture
+    
+    --lockout-mode=fast이면 mock 로그인 백엔드(LOCKOUT_BACKEND_PORT, 기본 8787)를 띄우고
+    adb reverse로 디바이스에 노출한 뒤, 대기 대신 백엔드의 시계를 앞당깁니다.
+    앱이 mock 백엔드로 로그인 요청을 보내도록 설정된 빌드에서만 사용해야 합니다.
+    
+    Yields:
+        LockoutTimer: 제한 시간 처리기
+    """
+    if request.config.getoption("--lockout-mode") != MODE_FAST:
+        yield LockoutTimer(MODE_REAL)
+        return
+    
+    cfg = load_config()
+    backend = MockLoginBackend(
+        accounts={cfg.login_id: cfg.login_password},
+        port=int(os.getenv("LOCKOUT_BACKEND_PORT", "8787")),
+    ).start()
+    try:
+        backend.expose_to_device(BasePage(driver)._get_device_serial())
+        yield LockoutTimer(MODE_FAST, backend)
+    finally:
+        backend.stop()
+
+
+@pytest.fixture(scope="function")
+def logcat(request, driver):
+    """
+    현재 디바이스의 LogcatCollector를 반환하는 fixture
+    
+    테스트 시작 시점부터의 앱/Activity 로그를 조회하거나 특정 로그를 기다릴 수 있습니다.
+    
+    Example:
+        def test_example(driver, logcat):
+            ...
+            assert logcat.wait_for_displayed("MainActivity", timeout=10)
+    """
+    return _begin_logcat(request, driver)
+
+
+@pytest.fixture(scope="function")
+def auth_state(driver):
+    """
+    로그아웃 상태를 스냅샷으로 저장하고 복원하는 AuthState fixture
+
+    스냅샷은 디바이스별로 테스트 세션 동안 유지되며, 디버그 빌드가 아니면 저장/복원이 항상 False를 반환하므로
+    테스트는 반환값을 확인하여 UI 흐름으로 대신 진행해야 합니다.
+
+    Returns:
+        AuthState: 드라이버의 로그인 상태 helper
+    """
+    return AuthState.for_driver(driver)
@@ -0,0 +1,184 @@
+"""
+ADB 명령 실행 모듈 테스트
+디바이스 없이 `adb -s <serial> shell` 대신 로컬 sh를 실행하는 가짜 adb로 실행됩니다.
+"""
+import asyncio
+
+import pytest
+
+from src.adb import AdbShell, ShellResult, device_serial
+from src.pages.base_page import CONNECTIVITY_COMMAND, BasePage, default_network_validated
+
+
+@pytest.fixture
+def shell(tmp_path):
+    fake_adb = tmp_path / "adb"
+    fake_adb.write_text("#!/bin/sh\nexec sh\n")
+    fake_adb.chmod(0o755)
+    shell = AdbShell("emulator-5554", adb_path=str(fake_adb))
+    yield shell
+    shell.close()
+
+
+def test_batch_runs_in_one_persistent_shell(shell):
+    results = shell.run_batch(["echo data", "printf no-newline", "false", "echo err >&2"])
+
+    assert results == [
+        ShellResult("data", 0),
+        ShellResult("no-newline", 0),
+        ShellResult("", 1),
+        ShellResult("err", 0),
+    ]
+    assert shell.run("echo again").output == "again"
+    assert (shell.spawns, shell.commands) == (1, 5)
+
+
+def test_timeout_restarts_shell(shell):
+    with pytest.raises(TimeoutError):
+        shell.run("sleep 5", timeout=0.2)
+    # 출력 경계가 어긋난 세션은 버리고 새 세션으로 실행
+    assert shell.run("echo ok").output == "ok"
+    assert shell.spawns == 2
+
+
+def test_async_api(shell):
+    async def main():
+        return await asyncio.gather(shell.run_async("echo a"), shell.run_batch_async(["echo b", "echo c"]))
+
+    single, batch = asyncio.run(main())
+    assert single.output == "a"
+    assert [result.output for result in batch] == ["b", "c"]
+
+
+class FakeDriver:
+    capabilities = {"udid": "R58M123"}
+
+
+# dumpsys connectivity 출력 (CONNECTIVITY_COMMAND의 grep 결과)
+VALIDATED_WIFI = (
+    "Active default network: 100\n"
+    "  NetworkAgentInfo{network{100}  handle{432902426637}  ni{WIFI CONNECTED extra: } "
+    "created everValidated lastValidated  nc{[ Transports: WIFI Capabilities: "
+    "NOT_METERED&INTERNET&NOT_RESTRICTED&TRUSTED&NOT_VPN&VALIDATED&NOT_ROAMING ]}}"
+)
+UNVALIDATED_WIFI = VALIDATED_WIFI.replace("&VALIDATED", "").replace("everValidated lastValidated", "")
+NO_DEFAULT_NETWORK = "Active default network: none\n"
+
+
+class FakeNetworkShell:
+    """
+    svc 명령이 네트워크 설정은 즉시 바꾸지만, 라디오가 다시 연결되어 기본 네트워크가 검증(또는 해제)되기까지는
+    connectivity를 몇 번 조회해야 하는 가짜 shell
+
+    Args:
+        settings: 네트워크 설정 값
+        validated: 처음에 검증된 기본 네트워크가 있는지 여부
+        reads_until_changed: svc 명령 이후 connectivity 상태가 바뀌기까지의 조회 횟수
+    """
+
+    def __init__(self, settings, validated, reads_until_changed=2):
+        self.settings = settings
+        self.validated = validated
+        self.reads_until_changed = reads_until_changed
+        self.pending = None
+        self.batches = []
+
+    def _connectivity(self):
+        if self.pending is not None:
+            self.reads_until_changed -= 1
+            if self.reads_until_changed <= 0:
+                self.validated, self.pending = self.pending, None
+            elif self.pending:
+                # 연결은 되었지만 아직 인터넷 검증 전
+                return UNVALIDATED_WIFI
+        return VALIDATED_WIFI if self.validated else NO_DEFAULT_NETWORK
+
+    def run_batch(self, commands, timeout=5):
+        self.batches.append(commands)
+        results = []
+        for command in commands:
+            words = command.split()
+            if words[0] == "svc":
+                key = "wifi_on" if words[1] == "wifi" else "mobile_data"
+                self.settings[key] = "1" if words[2] == "enable" else "0"
+                self.pending = words[2] == "enable"
+                results.append(ShellResult("", 0))
+            elif words[0] == "settings":
+                results.append(ShellResult(self.settings[words[-1]], 0))
+            elif command == CONNECTIVITY_COMMAND:
+                results.append(ShellResult(self._connectivity(), 0))
+            else:
+                raise AssertionError(f"예상하지 못한 명령: {command}")
+        return results
+
+
+def use_fake_shell(monkeypatch, fake, serial="R58M123"):
+    monkeypatch.setattr(AdbShell, "for_serial", classmethod(lambda cls, serial: fake))
+    driver = FakeDriver()
+    driver.capabilities = {"udid": serial}
+    page = BasePage(driver)
+    page.waits.initial_interval = 0.001
+    return page
+
+
+def test_default_network_validated():
+    assert default_network_validated(VALIDATED_WIFI)
+    assert not default_network_validated(UNVALIDATED_WIFI)
+    assert not default_network_validated(NO_DEFAULT_NETWORK)
+    # 기본 네트워크가 아닌 다른 네트워크의 검증 여부는 무시
+    assert not default_network_validated(VALIDATED_WIFI.replace("default network: 100", "default network: 101"))
+
+
+def test_enable_network_waits_until_default_network_validated(monkeypatch):
+    fake = FakeNetworkShell(
+        {"airplane_mode_on": "0", "wifi_on": "0", "mobile_data": "0"}, validated=False, reads_until_changed=3,
+    )
+    page = use_fake_shell(monkeypatch, fake)
+
+    assert not page.is_network_connected()
+    assert page.enable_network(timeout=2)
+    # 설정 조회 1회 + svc 배치 1회 + 설정은 즉시 바뀌었지만 기본 네트워크가 검증될 때까지 3회 polling
+    assert len(fake.batches) == 5
+    assert fake.batches[-1][-1] == CONNECTIVITY_COMMAND
+    assert fake.validated
+
+
+def test_enable_network_times_out_without_validated_network(monkeypatch):
+    fake = FakeNetworkShell(
+        {"airplane_mode_on": "0", "wifi_on": "0", "mobile_data": "0"}, validated=False, reads_until_changed=10 ** 6,
+    )
+    page = use_fake_shell(monkeypatch, fake)
+
+    assert not page.enable_network(timeout=0.2)
+    # 설정은 켜졌으므로 설정만으로는 연결된 것으로 보임
+    assert page.is_network_connected()
+
+
+def test_disable_network_waits_until_default_network_lost(monkeypatch):
+    fake = FakeNetworkShell(
+        {"airplane_mode_on": "0", "wifi_on": "1", "mobile_data": "1"}, validated=True, reads_until_changed=2,
+    )
+    page = use_fake_shell(monkeypatch, fake)
+
+    assert page.disable_network(timeout=2)
+    assert fake.batches[0] == ["svc data disable", "svc wifi disable"]
+    assert len(fake.batches) == 3
+    assert not fake.validated
+
+
+def test_disable_network_on_emulator_checks_settings_only(monkeypatch):
+    # 에뮬레이터의 가상 WiFi는 svc 명령 후에도 검증된 기본 네트워크로 남음
+    fake = FakeNetworkShell(
+        {"airplane_mode_on": "0", "wifi_on": "1", "mobile_data": "1"}, validated=True, reads_until_changed=10 ** 6,
+    )
+    page = use_fake_shell(monkeypatch, fake, serial="emulator-5554")
+
+    assert page.disable_network(timeout=2)
+    assert len(fake.batches) == 2
+
+
+def test_device_serial_is_cached():
+    driver = FakeDriver()
+    assert device_serial(driver) == "R58M123"
+    driver.capabilities = {"udid": "changed"}
+    assert device_serial(driver) == "R58M123"
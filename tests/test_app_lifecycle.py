@@ -0,0 +1,124 @@
+"""
+앱 실행/종료 서비스 테스트
+디바이스 없이 query_app_state를 흉내내는 가짜 드라이버로 실행됩니다.
+"""
+import subprocess
+import time
+
+import pytest
+from appium.webdriver.applicationstate import ApplicationState
+
+from src.app_lifecycle import AppLifecycle, parse_am_start_output
+from src.pages.base_page import BasePage
+
+APP_PACKAGE = "net.bucketplace"
+
+
+class FakeDriver:
+    """앱 상태를 기록하고, terminate_app이 앱을 종료할지 여부를 설정할 수 있는 드라이버"""
+
+    capabilities = {"udid": "emulator-5554"}
+
+    def __init__(self, state=ApplicationState.RUNNING_IN_FOREGROUND, terminate_stops_app=True):
+        self.app_state = state
+        self.terminate_stops_app = terminate_stops_app
+        self.commands = []
+
+    def query_app_state(self, app_id):
+        self.commands.append("query_app_state")
+        return self.app_state
+
+    def terminate_app(self, app_id):
+        self.commands.append("terminate_app")
+        if self.terminate_stops_app:
+            self.app_state = ApplicationState.NOT_RUNNING
+        return self.terminate_stops_app
+
+    def press_keycode(self, keycode):
+        self.commands.append(f"press_keycode({keycode})")
+
+
+@pytest.fixture
+def adb_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: calls.append(args[4:]))
+    return calls
+
+
+def test_terminate_skips_adb_when_terminate_app_succeeds(adb_calls):
+    driver = FakeDriver()
+    started = time.monotonic()
+    assert BasePage(driver).terminate_all_apps(APP_PACKAGE)
+    assert time.monotonic() - started < 0.1
+    assert adb_calls == []
+    assert driver.commands == ["terminate_app", "query_app_state", "press_keycode(3)"]
+
+
+def test_terminate_escalates_to_force_stop(adb_calls, monkeypatch):
+    driver = FakeDriver(terminate_stops_app=False)
+
+    def force_stop(args, **kwargs):
+        adb_calls.append(args[4:])
+        driver.app_state = ApplicationState.NOT_RUNNING
+
+    monkeypatch.setattr(subprocess, "run", force_stop)
+    assert AppLifecycle(driver).terminate(APP_PACKAGE, timeout=0.2)
+    assert adb_calls == [["am", "force-stop", APP_PACKAGE]]
+
+
+def test_terminate_reports_failure(adb_calls):
+    driver = FakeDriver(terminate_stops_app=False)
+    assert not AppLifecycle(driver).terminate(APP_PACKAGE, timeout=0.1)
+    assert adb_calls == [["am", "force-stop", APP_PACKAGE], ["killall", APP_PACKAGE]]
+
+
+def test_wait_for_foreground_returns_on_state_change():
+    driver = FakeDriver(state=ApplicationState.NOT_RUNNING)
+    lifecycle = AppLifecycle(driver)
+    states = iter([ApplicationState.NOT_RUNNING, ApplicationState.RUNNING_IN_BACKGROUND])
+
+    def query_app_state(app_id):
+        return next(states, ApplicationState.RUNNING_IN_FOREGROUND)
+
+    driver.query_app_state = query_app_state
+    started = time.monotonic()
+    assert lifecycle.wait_for_foreground(APP_PACKAGE, timeout=5)
+    assert time.monotonic() - started < 0.5
+    assert lifecycle.waits.stats["wait_for_app_foreground"].polls == 3
+
+
+def test_parse_am_start_cold_launch():
+    output = (
+        "Starting: Intent { cmp=net.bucketplace/se.ohou.screen.splash.SplashActivity }\n"
+        "Status: ok\n"
+        "LaunchState: COLD\n"
+        "Activity: net.bucketplace/se.ohou.screen.splash.SplashActivity\n"
+        "TotalTime: 1834\n"
+        "WaitTime: 1851\n"
+        "Complete\n"
+    )
+    result = parse_am_start_output(output)
+    assert result.ok
+    assert result.launch_state == "COLD"
+    assert (result.total_time_ms, result.wait_time_ms) == (1834, 1851)
+
+
+def test_parse_am_start_legacy_and_error_output():
+    legacy = parse_am_start_output("Status: ok\nActivity: a/.B\nThisTime: 420\nTotalTime: 420\nWaitTime: 433\nComplete\n")
+    assert legacy.ok and legacy.launch_state is None and legacy.total_time_ms == 420
+
+    error = parse_am_start_output("Error: Activity class {a/.Missing} does not exist.\n")
+    assert not error.ok and error.status is None
+
+
+def test_launch_falls_back_to_activate_app(monkeypatch):
+    driver = FakeDriver(state=ApplicationState.NOT_RUNNING)
+
+    def activate_app(app_id):
+        driver.commands.append("activate_app")
+        driver.app_state = ApplicationState.RUNNING_IN_FOREGROUND
+
+    driver.activate_app = activate_app
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: subprocess.CompletedProcess(args, 0, stdout="Error: no device\n"))
+    assert AppLifecycle(driver).launch(APP_PACKAGE, "se.ohou.screen.splash.SplashActivity")
+    assert "activate_app" in driver.commands
@@ -0,0 +1,117 @@
+"""
+로그인 상태 스냅샷(AuthState) 테스트
+디바이스 없이 run-as/tar 명령을 흉내 내는 가짜 shell로 실행됩니다.
+"""
+from src.adb import AdbShell, ShellResult
+from src.auth_state import LOGGED_OUT, AuthState, AuthStateStore
+
+APP_PACKAGE = "net.bucketplace"
+
+
+class FakeShell:
+    """앱 데이터 디렉터리와 /data/local/tmp의 tar 파일을 dict로 흉내 내는 가짜 shell"""
+
+    def __init__(self, debuggable=True):
+        self.debuggable = debuggable
+        self.app_data = {}
+        self.files = {}
+        self.running = True
+        self.batches = []
+
+    def run(self, command, timeout=5):
+        return self.run_batch([command], timeout)[0]
+
+    def run_batch(self, commands, timeout=5):
+        self.batches.append(commands)
+        return [self._execute(command) for command in commands]
+
+    def _execute(self, command):
+        if command.startswith("run-as") and not self.debuggable:
+            return ShellResult(f"run-as: package not debuggable: {APP_PACKAGE}", 1)
+        if command.startswith("am force-stop"):
+            self.running = False
+        elif "tar -cf -" in command:
+            self.files[command.split("> ")[-1]] = dict(self.app_data)
+        elif "tar -xf -" in command:
+            self.app_data = dict(self.files[command.split("< ")[-1]])
+        elif command.startswith("run-as") and "rm -rf" in command:
+            self.app_data.clear()
+        elif command.startswith("rm -rf"):
+            directory = command.split()[-1]
+            self.files = {path: data for path, data in self.files.items() if not path.startswith(directory)}
+        return ShellResult("", 0)
+
+
+class FakeDriver:
+    capabilities = {"udid": "R58M123"}
+
+
+class FakeLifecycle:
+    def __init__(self, shell):
+        self.shell = shell
+        self.launches = 0
+
+    def launch(self, app_package, app_activity, force_stop=False, timeout=30):
+        self.launches += 1
+        self.shell.running = True
+        return True
+
+
+def make_state(shell):
+    state = AuthState(FakeDriver(), store=AuthStateStore("R58M123", APP_PACKAGE, shell=shell))
+    state.lifecycle = FakeLifecycle(shell)
+    return state
+
+
+def test_restore_logged_out_in_one_batch():
+    shell = FakeShell()
+    state = make_state(shell)
+    # 로그아웃 상태에서 한 번 저장한 뒤 로그인하여 앱 데이터가 바뀜
+    shell.app_data = {"shared_prefs/onboarding.xml": "done"}
+    assert state.capture_logged_out()
+    shell.app_data = {"shared_prefs/onboarding.xml": "done", "shared_prefs/session.xml": "token"}
+
+    shell.batches.clear()
+    assert state.restore_logged_out()
+    assert shell.app_data == {"shared_prefs/onboarding.xml": "done"}
+    # 복원마다 force-stop, 데이터 삭제, tar 해제를 배치 한 번으로 실행
+    assert [len(batch) for batch in shell.batches] == [3]
+    assert shell.running
+    assert state.lifecycle.launches == 2
+
+
+def test_missing_snapshot_falls_back_to_ui():
+    shell = FakeShell()
+    state = make_state(shell)
+
+    assert not state.restore_logged_out()
+    assert shell.batches == []
+    assert state.lifecycle.launches == 0
+
+
+def test_release_build_is_not_supported():
+    shell = FakeShell(debuggable=False)
+    state = make_state(shell)
+    shell.app_data = {"shared_prefs/onboarding.xml": "done"}
+
+    assert not state.capture_logged_out()
+    assert not state.restore_logged_out()
+    # run-as 확인 한 번만 실행되고 앱은 멈추지 않음
+    assert shell.batches == [[f"run-as {APP_PACKAGE} id"]]
+    assert shell.running
+    assert state.lifecycle.launches == 0
+
+
+def test_discard_all_removes_snapshots_from_device(monkeypatch):
+    shell = FakeShell()
+    monkeypatch.setattr(AdbShell, "for_serial", classmethod(lambda cls, serial: shell))
+    monkeypatch.setattr(AuthStateStore, "_stores", {})
+    store = AuthStateStore.for_serial("R58M123", APP_PACKAGE)
+    assert AuthStateStore.for_serial("R58M123", APP_PACKAGE) is store
+    assert store.capture(LOGGED_OUT)
+
+    AuthStateStore.discard_all()
+
+    assert shell.files == {}
+    assert not store.has(LOGGED_OUT)
+    assert AuthStateStore._stores == {}
@@ -0,0 +1,73 @@
+"""
+설정(AppConfig) 레지스트리 테스트
+디바이스 없이 환경 변수만으로 실행됩니다.
+"""
+import dataclasses
+
+import pytest
+
+from src.config.settings import load_config, override_config, read_config, reload_config
+from src.device_farm import Device, device_overrides
+from src.pages.base_page import BasePage
+from src.pages.login_page import LoginPage
+
+
+class FakeDriver:
+    """명령을 보내지 않는 드라이버 (page object 생성용)"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_config(monkeypatch):
+    monkeypatch.setenv("APP_PACKAGE", "com.example.app")
+    reload_config(keep_overrides=False)
+    yield
+    monkeypatch.undo()
+    reload_config(keep_overrides=False)
+
+
+def test_config_is_loaded_once_and_immutable(monkeypatch):
+    config = load_config()
+    monkeypatch.setenv("APP_PACKAGE", "com.example.changed")
+
+    assert load_config() is config
+    assert config.app_package == "com.example.app"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.app_package = "com.example.changed"
+    assert not hasattr(config, "__dict__")
+
+
+def test_reload_reads_environment_again(monkeypatch):
+    page = BasePage(FakeDriver())
+    monkeypatch.setenv("APP_PACKAGE", "com.example.changed")
+
+    assert reload_config().app_package == "com.example.changed"
+    assert load_config().app_package == "com.example.changed"
+    # 이미 만들어진 page object는 생성 시 주입받은 설정을 유지
+    assert page.config.app_package == "com.example.app"
+
+
+def test_worker_overrides_survive_reload(monkeypatch):
+    device = Device("emulator-5556", "http://127.0.0.1:4724", 8201, 7811)
+
+    config = override_config(**device_overrides(device))
+    assert (config.udid, config.system_port, config.app_package) == ("emulator-5556", 8201, "com.example.app")
+
+    monkeypatch.setenv("APP_PACKAGE", "com.example.changed")
+    reloaded = reload_config()
+    assert (reloaded.udid, reloaded.appium_server_url, reloaded.app_package) == (
+        "emulator-5556", "http://127.0.0.1:4724", "com.example.changed",
+    )
+    assert reload_config(keep_overrides=False).udid == read_config().udid
+
+
+def test_unknown_override_is_rejected():
+    with pytest.raises(TypeError):
+        override_config(app_pakage="com.example.typo")
+    assert load_config().app_package == "com.example.app"
+
+
+def test_page_objects_share_injected_config():
+    config = dataclasses.replace(load_config(), app_package="com.example.injected")
+
+    assert LoginPage(FakeDriver(), config).config is config
+    assert LoginPage(FakeDriver()).config is load_config()
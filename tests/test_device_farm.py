@@ -0,0 +1,111 @@
+"""
+병렬 실행용 디바이스 할당 테스트
+디바이스 없이 임시 디렉토리의 lock 파일로 실행됩니다.
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.config.settings import AppConfig, build_capabilities
+from src.device_farm import Device, config_for_device, lease_device, load_device_pool, worker_index
+
+# 디바이스를 임대하고 표준 입력이 닫힐 때까지 유지하는 워커 프로세스
+HOLD_LOCK = """
+import sys
+from tests.test_device_farm import DEVICES
+from src.device_farm import lease_device
+lease = lease_device(DEVICES[:1], timeout=0, lock_dir=sys.argv[1])
+print(lease.device.udid, flush=True)
+sys.stdin.read()
+"""
+
+DEVICES = [
+    Device("emulator-5554", "http://127.0.0.1:4723", 8200, 7810),
+    Device("emulator-5556", "http://127.0.0.1:4723", 8201, 7811),
+]
+
+
+def make_config(**overrides):
+    values = dict(
+        appium_server_url="http://127.0.0.1:4723",
+        platform_name="Android",
+        platform_version="",
+        device_name="emulator-5554",
+        automation_name="UiAutomator2",
+        app_package="net.bucketplace",
+        app_activity="se.ohou.screen.splash.SplashActivity",
+    )
+    values.update(overrides)
+    return AppConfig(**values)
+
+
+def test_workers_lease_different_devices(tmp_path):
+    first = lease_device(DEVICES, worker_id="gw0", lock_dir=tmp_path)
+    second = lease_device(DEVICES, worker_id="gw0", lock_dir=tmp_path)
+
+    assert first.device != second.device
+    with pytest.raises(TimeoutError):
+        lease_device(DEVICES, worker_id="gw1", timeout=0, lock_dir=tmp_path)
+
+    first.release()
+    assert lease_device(DEVICES, worker_id="gw1", timeout=0, lock_dir=tmp_path).device == first.device
+
+
+def test_worker_prefers_its_own_device(tmp_path):
+    assert worker_index("gw1") == 1
+    assert worker_index("master") == 0
+    assert lease_device(DEVICES, worker_id="gw1", lock_dir=tmp_path).device == DEVICES[1]
+
+
+def test_leftover_lock_file_is_reclaimed(tmp_path):
+    # 비정상 종료한 워커가 남긴 lock 파일 (잠금은 프로세스 종료와 함께 해제됨)
+    (tmp_path / "emulator-5554.lock").write_text(str(2 ** 22 + 1))
+    (tmp_path / "emulator-5556.lock").write_text("")
+
+    lease = lease_device(DEVICES, timeout=0, lock_dir=tmp_path)
+    assert lease.device == DEVICES[0]
+    assert (tmp_path / "emulator-5554.lock").read_text().endswith(str(os.getpid()))
+    # 비어 있는 lock 파일도 잠겨 있지 않을 때만 임대
+    assert lease_device(DEVICES, timeout=0, lock_dir=tmp_path).device == DEVICES[1]
+
+
+def test_lock_held_by_other_process(tmp_path):
+    # 다른 워커 프로세스가 pid를 기록하기 전이라도 잠금을 가지고 있으면 임대하지 않음
+    holder = subprocess.Popen(
+        [sys.executable, "-c", HOLD_LOCK, str(tmp_path)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, cwd=Path(__file__).parent.parent,
+    )
+    try:
+        assert holder.stdout.readline().strip() == DEVICES[0].udid
+        with pytest.raises(TimeoutError):
+            lease_device(DEVICES[:1], timeout=0, lock_dir=tmp_path)
+    finally:
+        holder.communicate("")
+
+    assert lease_device(DEVICES[:1], timeout=0, lock_dir=tmp_path).device == DEVICES[0]
+
+
+def test_device_pool_file(tmp_path):
+    pool_file = tmp_path / "devices.json"
+    pool_file.write_text(json.dumps([{"udid": "R58M123"}, {"udid": "emulator-5556", "system_port": 8300}]))
+
+    devices = load_device_pool(make_config(), path=pool_file)
+    assert devices[0] == Device("R58M123", "http://127.0.0.1:4723", 8200, 7810)
+    assert (devices[1].system_port, devices[1].mjpeg_server_port) == (8300, 7811)
+
+
+def test_single_device_pool_from_config(monkeypatch):
+    monkeypatch.delenv("DEVICE_POOL_FILE", raising=False)
+    assert load_device_pool(make_config()) == [Device("emulator-5554", "http://127.0.0.1:4723", 8200, 7810)]
+
+
+def test_capabilities_use_leased_device():
+    caps = build_capabilities(config_for_device(make_config(), DEVICES[1]))
+
+    assert caps["deviceName"] == caps["udid"] == "emulator-5556"
+    assert (caps["systemPort"], caps["mjpegServerPort"]) == (8201, 7811)
+    assert "udid" not in build_capabilities(make_config())
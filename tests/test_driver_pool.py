@@ -0,0 +1,87 @@
+"""
+WebDriver 세션 풀 테스트
+디바이스 없이 가짜 세션 factory로 실행됩니다.
+"""
+from src.driver_pool import DriverPool
+
+
+class FakeSession:
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.alive = True
+        self.quit_called = False
+
+    def execute(self, driver_command, params=None):
+        if not self.alive:
+            raise ConnectionError("session is gone")
+        return {"value": {}}
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeFactory:
+    def __init__(self):
+        self.sessions = []
+
+    def __call__(self, skip_app_launch=True):
+        session = FakeSession(f"session-{len(self.sessions)}")
+        self.sessions.append(session)
+        return session
+
+
+def test_session_is_reused_and_reset():
+    factory = FakeFactory()
+    resets = []
+    pool = DriverPool(factory=factory, reset_hooks=[lambda driver, keep: resets.append((driver.session_id, keep))])
+
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire(keep_app_state=True)
+
+    assert second is first
+    assert len(factory.sessions) == 1
+    # 새로 만든 세션은 reset 없이 사용하고, 재사용할 때만 reset hook 실행
+    assert resets == [("session-0", True)]
+    assert (pool.created, pool.reused) == (1, 1)
+
+
+def test_dead_session_is_recreated():
+    factory = FakeFactory()
+    pool = DriverPool(factory=factory)
+    first = pool.acquire()
+    pool.release(first)
+    first.alive = False
+
+    second = pool.acquire()
+    assert second is not first
+    assert first.quit_called
+    assert pool.recreated == 1
+
+
+def test_fresh_session_replaces_idle_session():
+    factory = FakeFactory()
+    pool = DriverPool(factory=factory)
+    first = pool.acquire()
+    pool.release(first)
+
+    fresh = pool.acquire(fresh=True)
+    assert fresh is not first
+    assert first.quit_called
+
+
+def test_failing_reset_hook_does_not_block_acquire():
+    def broken_hook(driver, keep_app_state):
+        raise RuntimeError("adb offline")
+
+    pool = DriverPool(factory=FakeFactory(), reset_hooks=[broken_hook])
+    pool.release(pool.acquire())
+    assert pool.acquire() is not None
+
+
+def test_close_quits_idle_sessions():
+    factory = FakeFactory()
+    pool = DriverPool(factory=factory)
+    pool.release(pool.acquire())
+    pool.close()
+    assert all(session.quit_called for session in factory.sessions)
@@ -0,0 +1,106 @@
+"""
+fake Appium 서버 테스트
+디바이스 없이 tests/page_sources의 XML 덤프로 구성한 화면에서 실제 WebDriver 클라이언트와 page object를 실행합니다.
+"""
+import time
+
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+from benchmarks.fake_appium import APP_NOT_RUNNING, APP_RUNNING_IN_FOREGROUND, FakeAppiumServer, Scenario
+from src.app_lifecycle import AppLifecycle
+from src.driver import create_driver
+from src.implicit_wait import implicit_wait
+from src.pages.login_page import LoginPage
+from src.pages.login_page_by_email import LoginPageByEmail
+
+APP_PACKAGE = "net.bucketplace"
+EMAIL_LOGIN_TEXT = (AppiumBy.ID, "net.bucketplace:id/emailLogInText")
+
+
+def make_scenario(after_commands=0):
+    return (
+        Scenario.from_directory(activities={"login_page": ".LoginActivity"})
+        .on_launch(APP_PACKAGE, "login_page")
+        .on_click("login_page", EMAIL_LOGIN_TEXT[1], "email_login_page", after_commands=after_commands)
+    )
+
+
+@pytest.fixture
+def fake():
+    servers = []
+
+    def start(scenario=None, **kwargs):
+        server = FakeAppiumServer(scenario or make_scenario(), **kwargs).start()
+        servers.append(server)
+        driver = create_driver(server.config(), skip_app_launch=True)
+        servers.append(driver)
+        return server, driver
+
+    yield start
+    for item in reversed(servers):
+        (item.quit if hasattr(item, "quit") else item.stop)()
+
+
+def test_app_launch_and_page_objects(fake):
+    server, driver = fake()
+    assert driver.query_app_state(APP_PACKAGE) == APP_NOT_RUNNING
+
+    driver.activate_app(APP_PACKAGE)
+    assert (driver.current_package, driver.current_activity) == (APP_PACKAGE, ".LoginActivity")
+    assert LoginPage(driver).is_login_page_loaded()
+
+    driver.find_element(*EMAIL_LOGIN_TEXT).click()
+    assert LoginPageByEmail(driver).is_email_login_page_loaded()
+
+
+def test_elements_become_stale_after_screen_change(fake):
+    server, driver = fake()
+    driver.activate_app(APP_PACKAGE)
+    element = driver.find_element(*EMAIL_LOGIN_TEXT)
+    element.click()
+
+    with pytest.raises(StaleElementReferenceException):
+        element.click()
+    with implicit_wait(driver, 0), pytest.raises(NoSuchElementException):
+        driver.find_element(*EMAIL_LOGIN_TEXT)
+
+    driver.press_keycode(4)  # KEYCODE_BACK
+    assert driver.find_element(*EMAIL_LOGIN_TEXT).text == "이메일로 로그인"
+
+
+def test_late_screen_is_found_by_polling(fake):
+    server, driver = fake(make_scenario(after_commands=3))
+    driver.activate_app(APP_PACKAGE)
+    driver.find_element(*EMAIL_LOGIN_TEXT).click()
+
+    page = LoginPageByEmail(driver)
+    assert page.is_email_login_page_loaded(timeout=5)
+    # 화면이 바뀌기 전의 확인도 요청으로 집계됨
+    assert server.requests["getPageSource"] + server.requests["findElements"] >= 2
+
+
+def test_form_input_is_reflected_in_page_source(fake):
+    server, driver = fake()
+    driver.activate_app(APP_PACKAGE)
+    driver.find_element(*EMAIL_LOGIN_TEXT).click()
+
+    LoginPageByEmail(driver).fill_login_form("tester@example.com", "pw")
+
+    assert 'text="tester@example.com"' in driver.page_source
+
+
+def test_terminate_and_command_latency(fake):
+    server, driver = fake(command_latency={"getPageSource": 0.05})
+    lifecycle = AppLifecycle(driver)
+    driver.activate_app(APP_PACKAGE)
+    assert lifecycle.state(APP_PACKAGE) == APP_RUNNING_IN_FOREGROUND
+
+    assert driver.terminate_app(APP_PACKAGE)
+    assert lifecycle.wait_for_stopped(APP_PACKAGE)
+
+    started = time.monotonic()
+    driver.page_source
+    assert time.monotonic() - started >= 0.05
+    assert server.requests["execute"] >= 3
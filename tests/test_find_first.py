@@ -0,0 +1,104 @@
+"""
+locator 후보 경쟁(BasePage.find_first) 테스트
+디바이스 없이 polling 횟수에 따라 page_source가 바뀌는 가짜 드라이버로 실행됩니다.
+"""
+import time
+from pathlib import Path
+
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import TimeoutException
+
+from src.pages.base_page import BasePage
+
+PAGE_SOURCES = Path(__file__).parent / "page_sources"
+EMPTY = "<hierarchy />"
+LOGIN_PAGE = (PAGE_SOURCES / "login_page.xml").read_text(encoding="utf-8")
+
+NEVER = (AppiumBy.ID, "net.bucketplace:id/never")
+KAKAO_LOGIN_TEXT = (AppiumBy.ID, "net.bucketplace:id/loginText")
+EMAIL_LOGIN_TEXT = (AppiumBy.ID, "net.bucketplace:id/emailLogInText")
+# 스냅샷에서 평가할 수 없어 매 polling마다 live 조회하는 locator
+VIEWTAG = (AppiumBy.ANDROID_VIEWTAG, "never")
+
+
+class FakeElement:
+    def __init__(self, value):
+        self.value = value
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+
+class ChangingDriver:
+    """
+    appear_after번째 page_source 요청부터 로그인 화면을 반환하는 드라이버
+    live 조회는 현재 화면에 resource-id가 있는 요소만 찾습니다.
+    """
+
+    def __init__(self, appear_after):
+        self.appear_after = appear_after
+        self.page_source_calls = 0
+        self.lookups = []
+
+    @property
+    def _source(self):
+        return LOGIN_PAGE if self.page_source_calls >= self.appear_after else EMPTY
+
+    @property
+    def page_source(self):
+        self.page_source_calls += 1
+        return self._source
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def find_elements(self, by, value):
+        self.lookups.append(value)
+        if by == AppiumBy.ID and f'resource-id="{value}"' in self._source:
+            return [FakeElement(value)]
+        return []
+
+
+def test_later_candidate_wins_once_it_appears():
+    driver = ChangingDriver(appear_after=3)
+
+    element, locator = BasePage(driver).find_first([NEVER, KAKAO_LOGIN_TEXT], timeout=5)
+
+    assert locator == KAKAO_LOGIN_TEXT
+    assert element.value == KAKAO_LOGIN_TEXT[1]
+    assert driver.page_source_calls == 3
+    # 스냅샷에서 일치한 후보만 live 조회
+    assert driver.lookups == [KAKAO_LOGIN_TEXT[1]]
+
+
+def test_earlier_candidate_wins_when_both_appear_in_same_poll():
+    driver = ChangingDriver(appear_after=2)
+
+    _, locator = BasePage(driver).find_first([EMAIL_LOGIN_TEXT, KAKAO_LOGIN_TEXT], timeout=5)
+
+    assert locator == EMAIL_LOGIN_TEXT
+
+
+@pytest.mark.parametrize("locators", [
+    [NEVER, VIEWTAG, (AppiumBy.ID, "net.bucketplace:id/alsoNever")],
+    [VIEWTAG] * 5,
+])
+def test_all_candidates_share_single_deadline(locators):
+    driver = ChangingDriver(appear_after=float("inf"))
+    page = BasePage(driver)
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutException):
+        page.find_first(locators, timeout=0.3)
+    elapsed = time.monotonic() - started
+
+    # 후보마다 timeout을 따로 기다리지 않음 (후보 수 x timeout이 아님)
+    assert 0.3 <= elapsed < 0.4
+    # 매 polling마다 모든 후보를 한 번씩 확인
+    polls = page.waits.stats["find_first"].polls
+    assert polls == driver.page_source_calls > 1
+    assert len(driver.lookups) == polls * locators.count(VIEWTAG)
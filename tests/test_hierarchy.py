@@ -0,0 +1,148 @@
+"""
+page_source 스냅샷 로컬 locator 평가기 테스트
+디바이스 없이 tests/page_sources의 XML 덤프를 대상으로 실행됩니다.
+"""
+from pathlib import Path
+
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+
+from src.hierarchy import PageSnapshot, UnsupportedLocator, is_supported
+from src.pages.login_page import LoginPage
+from src.pages.login_page_by_email import LoginPageByEmail
+from src.pages.main_home_page import MainHomePage
+from src.pages.search_results_page import SearchResultsPage
+
+PAGE_SOURCES = Path(__file__).parent / "page_sources"
+
+
+def load_snapshot(name):
+    return PageSnapshot((PAGE_SOURCES / f"{name}.xml").read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def login_snapshot():
+    return load_snapshot("login_page")
+
+
+@pytest.fixture(scope="module")
+def email_login_snapshot():
+    return load_snapshot("email_login_page")
+
+
+@pytest.fixture(scope="module")
+def main_home_snapshot():
+    return load_snapshot("main_home_page")
+
+
+def test_uiselector_resource_id(login_snapshot):
+    node = login_snapshot.find(LoginPage.KAKAO_LOGIN_TEXT)
+    assert PageSnapshot.text_of(node) == "카카오톡으로 계속하기"
+
+
+def test_uiselector_text_and_instance(main_home_snapshot):
+    # 상단 탭의 "홈"이 instance(0), 하단 footer의 "홈"이 instance(1)
+    top = main_home_snapshot.find(MainHomePage.HOME_UP_BUTTON)
+    bottom = main_home_snapshot.find(MainHomePage.HOME_BOTTOM_BUTTON)
+    assert top is not None and bottom is not None
+    assert top.get("bounds") != bottom.get("bounds")
+    assert main_home_snapshot.find((AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("홈").instance(2)')) is None
+
+
+def test_uiselector_text_contains_class_and_scrollable(main_home_snapshot, email_login_snapshot):
+    assert main_home_snapshot.find((AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("인테리어")')) is not None
+    scrollables = main_home_snapshot.find_all((AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().scrollable(true)'))
+    assert len(scrollables) == 2
+    inputs = email_login_snapshot.find_all((AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.AutoCompleteTextView")'))
+    assert [node.get("text") for node in inputs] == ["이메일", "비밀번호"]
+
+
+def test_uiselector_description(login_snapshot):
+    node = login_snapshot.find((AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("네이버로 가입하기")'))
+    assert node.get("resource-id") == "net.bucketplace:id/naverLoginButton"
+
+
+def test_uiselector_argument_with_parentheses():
+    snapshot = PageSnapshot(
+        '<hierarchy><android.widget.TextView text="비밀번호을(를) Google 비밀번호 관리자에 저장하시겠습니까?" /></hierarchy>'
+    )
+    locator = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("비밀번호을(를) Google 비밀번호 관리자에 저장하시겠습니까?")')
+    assert snapshot.find(locator) is not None
+
+
+def test_xpath_grouped_position(email_login_snapshot):
+    email = email_login_snapshot.find(LoginPageByEmail.ID_INPUT_FIELD)
+    password = email_login_snapshot.find(LoginPageByEmail.PASSWORD_INPUT_FIELD)
+    assert email.get("text") == "이메일"
+    assert password.get("text") == "비밀번호"
+
+
+def test_xpath_and_condition_and_contains(email_login_snapshot, main_home_snapshot):
+    locator = (AppiumBy.XPATH, '//android.widget.AutoCompleteTextView[@resource-id="net.bucketplace:id/inputField" and @text="비밀번호"]')
+    assert email_login_snapshot.find(locator).get("password") == "true"
+    assert main_home_snapshot.find((AppiumBy.XPATH, "//android.widget.TextView[contains(@text,'집들이')]")) is not None
+    assert main_home_snapshot.find((AppiumBy.XPATH, '//*[@text="마이페이지"]')) is not None
+
+
+def test_xpath_child_path_with_positions():
+    snapshot = load_snapshot("playstore_app_detail")
+    install_xpath, install_uiselector = SearchResultsPage.INSTALL_BUTTON_OPTIONS[1], SearchResultsPage.INSTALL_BUTTON_OPTIONS[0]
+    by_xpath = snapshot.find(install_xpath)
+    by_uiselector = snapshot.find(install_uiselector)
+    assert by_xpath is not None
+    assert by_xpath is by_uiselector
+
+
+def test_xpath_positional_step_is_per_parent():
+    snapshot = PageSnapshot(
+        "<hierarchy>"
+        "<a><b text='1'/><b text='2'/></a>"
+        "<a><b text='3'/></a>"
+        "</hierarchy>"
+    )
+    assert [node.get("text") for node in snapshot.find_all((AppiumBy.XPATH, "//b[1]"))] == ["1", "3"]
+    assert [node.get("text") for node in snapshot.find_all((AppiumBy.XPATH, "(//b)[2]"))] == ["2"]
+
+
+def test_displayed_filter():
+    snapshot = PageSnapshot("<hierarchy><android.widget.TextView text='숨김' displayed='false' /></hierarchy>")
+    locator = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("숨김")')
+    assert snapshot.find(locator) is None
+    assert snapshot.is_present(locator)
+
+
+def test_indexed_lookup(login_snapshot):
+    assert "net.bucketplace:id/emailLogInText" in login_snapshot.resource_ids()
+    assert len(login_snapshot.lookup("class", "android.widget.ImageView")) == 6
+    assert login_snapshot.package == "net.bucketplace"
+
+
+@pytest.mark.parametrize("locator", [
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("")'),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.EditText").text("")'),
+    (AppiumBy.XPATH, '//android.widget.EditText[@text=""]'),
+    (AppiumBy.ACCESSIBILITY_ID, ""),
+])
+def test_empty_value_matches_empty_fields(locator):
+    # 빈 값은 색인하지 않으므로 전체 노드에서 찾음
+    snapshot = PageSnapshot(
+        "<hierarchy>"
+        "<android.widget.TextView class='android.widget.TextView' text='이메일' content-desc='이메일' />"
+        "<android.widget.EditText class='android.widget.EditText' text='' content-desc='' "
+        "resource-id='net.bucketplace:id/inputField' />"
+        "</hierarchy>"
+    )
+    assert [node.get("resource-id") for node in snapshot.find_all(locator)] == ["net.bucketplace:id/inputField"]
+
+
+@pytest.mark.parametrize("locator", [
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiScrollable(new UiSelector().scrollable(true)).scrollToEnd(800);'),
+    (AppiumBy.ANDROID_UIAUTOMATOR, '(//android.widget.TextView[@text="쇼핑"])[1]'),
+    (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().checked(true)'),
+    (AppiumBy.XPATH, '//android.widget.TextView[last()]'),
+    (AppiumBy.XPATH, 'android.widget.TextView'),
+])
+def test_unsupported_locators(locator, login_snapshot):
+    assert not is_supported(locator)
+    with pytest.raises(UnsupportedLocator):
+        login_snapshot.find_all(locator)
@@ -0,0 +1,129 @@
+"""
+implicit wait 관리 계층 테스트
+디바이스 없이 implicit wait 설정 명령과 find 명령만 기록하는 가짜 드라이버로 실행됩니다.
+"""
+import time
+
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.remote.command import Command
+
+from src.implicit_wait import (
+    MEASURE_IMPLICIT_WAIT, ImplicitWaitMeter, get_implicit_wait, implicit_wait, set_implicit_wait,
+)
+from src.pages.base_page import BasePage
+
+
+class FakeDriver:
+    """implicitly_wait 호출과 find 명령을 기록하고, 요소가 없으면 implicit wait만큼 블로킹하는 드라이버"""
+
+    def __init__(self, present=()):
+        self.present = set(present)
+        self.implicit_wait_calls = []
+        self.implicit_wait = 0
+        self.fail_implicit_wait = False
+
+    def implicitly_wait(self, seconds):
+        if self.fail_implicit_wait:
+            raise WebDriverException("session deleted")
+        self.implicit_wait_calls.append(seconds)
+        self.implicit_wait = seconds
+
+    def execute(self, driver_command, params=None):
+        value = params["value"]
+        if value in self.present:
+            return {"value": [object()] if driver_command == Command.FIND_ELEMENTS else object()}
+        time.sleep(self.implicit_wait / 100)
+        if driver_command == Command.FIND_ELEMENTS:
+            return {"value": []}
+        raise NoSuchElementException(value)
+
+    def find_elements(self, by, value):
+        return self.execute(Command.FIND_ELEMENTS, {"using": by, "value": value})["value"]
+
+    def find_element(self, by, value):
+        return self.execute(Command.FIND_ELEMENT, {"using": by, "value": value})["value"]
+
+
+POPUP = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("대기")')
+
+
+def test_implicit_wait_restores_previous_value():
+    driver = FakeDriver()
+    set_implicit_wait(driver, 10)
+    with implicit_wait(driver, 0):
+        assert get_implicit_wait(driver) == 0
+    assert get_implicit_wait(driver) == 10
+    assert driver.implicit_wait_calls == [10, 0, 10]
+
+
+def test_nested_and_redundant_scopes_send_no_commands():
+    driver = FakeDriver()
+    set_implicit_wait(driver, 10)
+    with implicit_wait(driver, 0):
+        with implicit_wait(driver, 0):
+            pass
+    with implicit_wait(driver, 10):
+        pass
+    assert driver.implicit_wait_calls == [10, 0, 10]
+
+
+def test_implicit_wait_restored_on_exception():
+    driver = FakeDriver()
+    set_implicit_wait(driver, 10)
+    with pytest.raises(RuntimeError):
+        with implicit_wait(driver, 0):
+            raise RuntimeError("boom")
+    assert get_implicit_wait(driver) == 10
+
+
+def test_failed_restore_forgets_tracked_value():
+    driver = FakeDriver()
+    set_implicit_wait(driver, 10)
+    with implicit_wait(driver, 0):
+        driver.fail_implicit_wait = True
+    # 복원에 실패하면 다음 설정 시 반드시 명령을 보내도록 추적 값을 제거
+    assert get_implicit_wait(driver) is None
+
+
+def test_probe_uses_zero_implicit_wait():
+    driver = FakeDriver(present={POPUP[1]})
+    set_implicit_wait(driver, 10)
+    page = BasePage(driver)
+    assert len(page.probe(POPUP)) == 1
+    assert page.is_absent((AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("앱 닫기")'))
+    assert get_implicit_wait(driver) == 10
+
+
+def test_meter_records_blocked_time_only_for_misses_under_implicit_wait():
+    driver = FakeDriver(present={POPUP[1]})
+    set_implicit_wait(driver, 0)
+    meter = ImplicitWaitMeter().attach(driver)
+    # 세션 기본값은 0이므로 측정하는 동안 이전 기본값(10초)을 적용
+    assert get_implicit_wait(driver) == MEASURE_IMPLICIT_WAIT
+
+    driver.find_elements(*POPUP)
+    driver.find_elements(AppiumBy.ID, "missing")
+    with pytest.raises(NoSuchElementException):
+        driver.find_element(AppiumBy.ID, "missing")
+    BasePage(driver).probe((AppiumBy.ID, "missing"))
+    meter.detach()
+
+    assert meter.find_calls == 4
+    assert meter.blocked_calls == 2
+    assert meter.blocked_seconds > 0
+    assert "execute" not in vars(driver)
+    assert get_implicit_wait(driver) == 0
+    assert driver.implicit_wait_calls == [0, MEASURE_IMPLICIT_WAIT, 0, MEASURE_IMPLICIT_WAIT, 0]
+
+
+def test_meter_forgets_implicit_wait_when_restore_fails():
+    driver = FakeDriver()
+    meter = ImplicitWaitMeter().attach(driver)
+    driver.fail_implicit_wait = True
+
+    meter.detach()
+
+    assert get_implicit_wait(driver) is None
+    assert "execute" not in vars(driver)
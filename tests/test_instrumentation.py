@@ -0,0 +1,119 @@
+"""
+step 단위 시간 측정 테스트
+디바이스 없이 명령을 기록하는 가짜 드라이버와 가짜 page object로 실행됩니다.
+"""
+import json
+import time
+
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.command import Command
+
+from src.adb import AdbShell
+from src.instrumentation import Tracer, install_hooks, instrument_pages, summary_lines, uninstall_hooks, write_report
+from src.pages.base_page import BasePage
+
+BUTTON = (AppiumBy.ID, "net.bucketplace:id/button")
+MISSING = (AppiumBy.ID, "net.bucketplace:id/missing")
+
+
+class FakeDriver:
+    """요소 조회와 클릭 명령만 처리하는 드라이버"""
+
+    def __init__(self):
+        self.executed = []
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def execute(self, driver_command, params=None):
+        self.executed.append(driver_command)
+        if driver_command == Command.FIND_ELEMENTS:
+            return {"value": [] if params["value"] == MISSING[1] else [object()]}
+        if driver_command == Command.FIND_ELEMENT and params["value"] == MISSING[1]:
+            raise NoSuchElementException(params["value"])
+        return {"value": None}
+
+    def find_elements(self, by, value):
+        return self.execute(Command.FIND_ELEMENTS, {"using": by, "value": value})["value"]
+
+
+class TracedPage(BasePage):
+    def tap_twice(self, locator):
+        self.driver.execute(Command.CLICK_ELEMENT, {"id": "1"})
+        self.press()
+        time.sleep(0.01)
+
+    def press(self):
+        self.driver.execute(Command.CLICK_ELEMENT, {"id": "1"})
+
+    def look_for_missing(self):
+        self.probe(MISSING)
+        self.probe(BUTTON)
+
+
+@pytest.fixture
+def tracer():
+    instrument_pages()
+    install_hooks()
+    driver = FakeDriver()
+    tracer = Tracer.attach(driver)
+    tracer.begin_test("test_example")
+    yield tracer
+    tracer.end_test()
+    uninstall_hooks()
+
+
+def test_outermost_page_call_is_one_step_with_nested_commands(tracer):
+    page = TracedPage(tracer.driver)
+    page.tap_twice(BUTTON)
+    trace = tracer.end_test()
+
+    step, = trace.steps
+    assert step.name == "TracedPage.tap_twice"
+    assert step.locator == f"id={BUTTON[1]}"
+    assert step.commands == 2
+    assert step.sleep_seconds >= 0.01
+    assert trace.commands_by_name == {Command.CLICK_ELEMENT: 2}
+    assert trace.sleep_seconds == pytest.approx(step.sleep_seconds)
+
+
+def test_missing_elements_are_counted_as_retries(tracer):
+    TracedPage(tracer.driver).look_for_missing()
+
+    step, = tracer.end_test().steps
+    assert (step.commands, step.retries) == (2, 1)
+
+
+def test_errors_and_adb_round_trips_are_recorded(tracer, monkeypatch):
+    monkeypatch.setattr("src.instrumentation._original_run_batch", lambda shell, commands, timeout=5: [None] * len(commands))
+    with pytest.raises(NoSuchElementException):
+        tracer.run_step("manual", None, tracer.driver.execute, Command.FIND_ELEMENT, {"using": "id", "value": MISSING[1]})
+    AdbShell("emulator-5554").run("echo hi")
+
+    trace = tracer.end_test()
+    assert trace.steps[0].error == "NoSuchElementException"
+    assert trace.steps[0].retries == 1
+    assert trace.adb_calls == 1
+
+
+def test_pages_without_tracer_run_unchanged():
+    instrument_pages()
+    driver = FakeDriver()
+    TracedPage(driver).press()
+    assert driver.executed == [Command.CLICK_ELEMENT]
+    assert Tracer.for_driver(driver) is None
+
+
+def test_report_and_summary(tracer, tmp_path):
+    TracedPage(tracer.driver).tap_twice(BUTTON)
+    trace = tracer.end_test()
+
+    path = write_report([trace], tmp_path / "trace.json")
+    report = json.loads(path.read_text(encoding="utf-8"))
+    assert report["totals"]["commands"] == 2
+    assert report["tests"][0]["steps"][0]["name"] == "TracedPage.tap_twice"
+
+    lines = summary_lines([trace])
+    assert any("TracedPage.tap_twice" in line for line in lines)
@@ -0,0 +1,34 @@
+"""
+긴 대기 중 세션 유지 테스트
+디바이스 없이 명령 기록용 가짜 드라이버로 실행됩니다.
+"""
+import time
+
+from src.pages.base_page import BasePage
+
+
+class FakeDriver:
+    def __init__(self, fail_after=None):
+        self.pings = 0
+        self.fail_after = fail_after
+
+    def execute(self, driver_command, params=None):
+        if self.fail_after is not None and self.pings >= self.fail_after:
+            raise ConnectionError("session is gone")
+        self.pings += 1
+        return {"value": {}}
+
+
+def test_wait_returns_full_time_while_session_alive():
+    driver = FakeDriver()
+    started = time.monotonic()
+    assert BasePage(driver).wait_with_session_keepalive(0.1, check_interval=0.02)
+    assert time.monotonic() - started >= 0.1
+    assert driver.pings >= 4
+
+
+def test_wait_returns_early_when_session_dies():
+    # 다음 세션 체크에서 세션이 끊긴 것을 확인하면 남은 대기 시간과 관계없이 반환
+    started = time.monotonic()
+    assert not BasePage(FakeDriver(fail_after=1)).wait_with_session_keepalive(5, check_interval=0.01)
+    assert time.monotonic() - started < 1
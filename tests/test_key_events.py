@@ -0,0 +1,118 @@
+"""
+키 이벤트 일괄 전송 테스트
+디바이스 없이 명령을 기록하는 가짜 드라이버로 실행됩니다.
+"""
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from src.adb import AdbShell, ShellResult
+from src.pages.base_page import BasePage
+
+LOCATOR = ("id", "net.bucketplace:id/inputField")
+
+
+class FakeField:
+    def __init__(self, driver, text):
+        self.driver = driver
+        self.text = text
+
+    def click(self):
+        self.driver.commands.append("click")
+
+    def clear(self):
+        self.driver.commands.append("clear")
+
+    def get_attribute(self, name):
+        self.driver.commands.append("get_attribute")
+        return self.text
+
+
+class FakeDriver:
+    def __init__(self, text, mobile_shell=True, error=None):
+        self.field = FakeField(self, text)
+        self.mobile_shell = mobile_shell
+        self.error = error
+        self.commands = []
+        self.capabilities = {"udid": "emulator-5554"}
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def find_element(self, by, value):
+        self.commands.append("find_element")
+        return self.field
+
+    def execute_script(self, script, args):
+        self.commands.append(script)
+        if not self.mobile_shell:
+            raise WebDriverException("Potentially insecure feature 'uiautomator2:adb_shell' has not been enabled")
+        if self.error is not None:
+            raise self.error
+        keycodes = args["args"][1:]
+        self.field.text = self.field.text[:max(0, len(self.field.text) - keycodes.count("67"))]
+
+    def press_keycode(self, keycode):
+        self.commands.append("press_keycode")
+
+
+def test_clear_sends_constant_number_of_commands():
+    for text in ("a", "x" * 40):
+        driver = FakeDriver(text)
+        assert BasePage(driver).clear_text_android(LOCATOR)
+        assert driver.commands == [
+            "find_element", "click", "clear", "get_attribute", "mobile: shell", "get_attribute"
+        ]
+
+
+def test_falls_back_to_adb_shell_once_mobile_shell_is_rejected(monkeypatch):
+    sent = []
+
+    class FakeShell:
+        def run(self, command, timeout=5):
+            sent.append(command)
+            return ShellResult("", 0)
+
+    monkeypatch.setattr(AdbShell, "for_serial", classmethod(lambda cls, serial: FakeShell()))
+    driver = FakeDriver("abc", mobile_shell=False)
+    page = BasePage(driver)
+
+    assert page.press_keycodes([123, 67, 67]) == "adb_shell"
+    assert page.press_keycodes([67]) == "adb_shell"
+    # 거부된 mobile: shell은 같은 세션에서 다시 시도하지 않음
+    assert driver.commands.count("mobile: shell") == 1
+    assert sent == ["input keyevent 123 67 67", "input keyevent 67"]
+
+
+def test_falls_back_to_press_keycode(monkeypatch):
+    class BrokenShell:
+        def run(self, command, timeout=5):
+            raise ConnectionError("adb not found")
+
+    monkeypatch.setattr(AdbShell, "for_serial", classmethod(lambda cls, serial: BrokenShell()))
+    driver = FakeDriver("abc", mobile_shell=False)
+
+    assert BasePage(driver).press_keycodes([67, 67]) == "press_keycode"
+    assert driver.commands.count("press_keycode") == 2
+
+
+def test_transient_mobile_shell_error_is_not_resent(monkeypatch):
+    sent = []
+
+    class FakeShell:
+        def run(self, command, timeout=5):
+            sent.append(command)
+            return ShellResult("", 0)
+
+    monkeypatch.setattr(AdbShell, "for_serial", classmethod(lambda cls, serial: FakeShell()))
+    driver = FakeDriver("abc", error=WebDriverException("timeout: Read timed out"))
+    page = BasePage(driver)
+
+    # 일부 키 이벤트가 이미 전송되었을 수 있으므로 다른 방법으로 다시 보내지 않음
+    with pytest.raises(WebDriverException):
+        page.press_keycodes([123, 67, 67])
+    assert sent == []
+    assert driver.commands.count("press_keycode") == 0
+
+    # 일시적인 오류였으므로 다음 호출은 다시 mobile: shell을 사용
+    driver.error = None
+    assert page.press_keycodes([67]) == "mobile_shell"
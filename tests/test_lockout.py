@@ -0,0 +1,91 @@
+"""
+로그인 제한(lockout) 시간 추상화 테스트
+디바이스 없이 mock 로그인 백엔드와 가짜 page object로 실행됩니다.
+"""
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.lockout import MODE_FAST, FakeClock, LockoutPolicy, LockoutTimer, MockBackendNotUsed, MockLoginBackend
+
+EMAIL = "tester@example.com"
+PASSWORD = "correct_password"
+
+
+def post(url, body):
+    request = urllib.request.Request(url, data=json.dumps(body).encode(), headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+@pytest.fixture
+def backend():
+    backend = MockLoginBackend({EMAIL: PASSWORD}).start()
+    yield backend
+    backend.stop()
+
+
+def test_policy_locks_after_max_failures_and_unlocks_after_lock_time():
+    clock = FakeClock()
+    policy = LockoutPolicy(clock=clock)
+
+    results = [policy.attempt(EMAIL, False).result for _ in range(10)]
+    assert results == ["failed"] * 9 + ["locked"]
+    # 제한 중에는 올바른 비밀번호도 거부
+    clock.advance(599)
+    assert policy.attempt(EMAIL, True).result == "locked"
+
+    clock.advance(1)
+    assert policy.attempt(EMAIL, True).result == "success"
+
+
+def test_success_resets_failure_count():
+    policy = LockoutPolicy(clock=FakeClock())
+    for _ in range(3):
+        policy.attempt(EMAIL, False)
+    policy.attempt(EMAIL, True)
+    assert policy.attempt(EMAIL, False).failures == 1
+
+
+def test_login_011_flow_runs_in_fast_mode(backend):
+    class Page:
+        def wait_with_session_keepalive(self, seconds):
+            raise AssertionError("fast 모드에서는 실제로 대기하지 않아야 합니다.")
+
+    lockout = LockoutTimer(MODE_FAST, backend)
+    for _ in range(9):
+        assert post(f"{backend.url}/login", {"email": EMAIL, "password": "wrong_password"})[0] == 401
+
+    status, body = post(f"{backend.url}/login", {"email": EMAIL, "password": "wrong_password"})
+    assert (status, body["retry_after"]) == (429, 600)
+
+    lockout.wait(10, Page())
+    assert post(f"{backend.url}/login", {"email": EMAIL, "password": "wrong_password"})[0] == 429
+
+    lockout.wait(590, Page())
+    assert post(f"{backend.url}/login", {"email": EMAIL, "password": PASSWORD}) == (
+        200, {"result": "success", "failures": 0, "max_failures": 10, "retry_after": 0}
+    )
+
+
+def test_fast_mode_fails_when_app_never_used_backend(backend):
+    lockout = LockoutTimer(MODE_FAST, backend)
+
+    with pytest.raises(MockBackendNotUsed):
+        lockout.wait(590, object())
+    # 시계를 앞당기지 않음
+    assert backend.clock() == 0
+
+
+def test_clock_can_be_advanced_over_http(backend):
+    assert post(f"{backend.url}/__clock/advance", {"seconds": 42}) == (200, {"now": 42.0})
+
+
+def test_fast_mode_requires_backend():
+    with pytest.raises(ValueError):
+        LockoutTimer(MODE_FAST)
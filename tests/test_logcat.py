@@ -0,0 +1,70 @@
+"""
+logcat 수집 테스트
+디바이스 없이 logcat 줄을 직접 넣어 실행됩니다.
+"""
+import json
+import threading
+import time
+
+from src.logcat import LogcatCollector, parse_logcat_line
+
+APP_PACKAGE = "net.bucketplace"
+
+
+def line(pid, tag, message, level="I"):
+    return f"  1697612345.123  {pid}  {pid} {level} {tag}: {message}\n"
+
+
+def make_collector():
+    collector = LogcatCollector("emulator-5554", APP_PACKAGE)
+    collector.app_pids.add(1000)
+    collector.begin_test("tests/test_login_flow.py::test_login_flow[LOGIN_001]")
+    return collector
+
+
+def test_parse_epoch_format():
+    entry = parse_logcat_line(line(1000, "OkHttp", "--> POST https://ohou.se/login"), host_time=5.0)
+    assert (entry.pid, entry.level, entry.tag, entry.message) == (1000, "I", "OkHttp", "--> POST https://ohou.se/login")
+    assert entry.device_time == 1697612345.123
+    assert parse_logcat_line("--------- beginning of main") is None
+
+
+def test_only_app_pid_and_system_tags_are_stored():
+    collector = make_collector()
+    assert collector.feed(line(1000, "OkHttp", "200 OK")) is not None
+    assert collector.feed(line(2000, "chatty", "noise")) is None
+    assert collector.feed(line(500, "ActivityTaskManager", f"Displayed {APP_PACKAGE}/.MainActivity: +850ms")) is not None
+
+    # 앱이 다시 시작되면 새 pid의 로그도 수집
+    collector.feed(line(500, "ActivityManager", f"Start proc 3000:{APP_PACKAGE}/u0a123 for pre-top-activity"))
+    assert collector.feed(line(3000, "OkHttp", "200 OK")) is not None
+    assert set(collector.store.by_tag) == {"OkHttp", "ActivityTaskManager", "ActivityManager"}
+
+
+def test_wait_for_displayed_is_push_based():
+    collector = make_collector()
+    since = time.time()
+    threading.Timer(0.05, collector.feed, args=(
+        line(500, "ActivityTaskManager", f"Displayed {APP_PACKAGE}/se.ohou.screen.main.MainActivity: +1s2ms"),
+    )).start()
+
+    started = time.monotonic()
+    entry = collector.wait_for_displayed("MainActivity", timeout=2, since=since)
+    assert entry is not None
+    assert time.monotonic() - started < 1
+    assert collector.wait_for_displayed("SettingActivity", timeout=0) is None
+
+
+def test_store_is_written_per_test_with_steps(tmp_path):
+    collector = make_collector()
+    collector.mark("LOGIN_001-1")
+    collector.feed(line(1000, "OkHttp", "200 OK"))
+
+    previous = collector.begin_test("next")
+    path = previous.write(tmp_path / "LOGIN_001.jsonl")
+
+    header, *records = [json.loads(text) for text in path.read_text(encoding="utf-8").splitlines()]
+    assert header["tags"] == {"STEP": 1, "OkHttp": 1}
+    assert [record["tag"] for record in records] == ["STEP", "OkHttp"]
+    assert records[0]["t"] <= records[1]["t"]
+    assert collector.store.entries == []
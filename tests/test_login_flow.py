@@ -29,7 +29,7 @@ def test_login_flow(test_name, driver):
     assert app_drawer.wait_for_app_installed(timeout=10), "앱이 설치되지 않았습니다."
 
     # LOGIN_001-1: Test Step - 앱 서랍에서 앱 아이콘 탭
-    assert app_drawer.launch_ohous_app(), "오늘의집 앱 실행에 실패했습니다."
+    assert app_drawer.launch_ohous_app(strategy=AppDrawerPage.LAUNCH_BY_DRAWER), "오늘의집 앱 실행에 실패했습니다."
 
     # LOGIN_001-2: Assertion - 앱 로고 페이지가 5초 이내에 노출되었다 사라짐
     # TODO: check fail 원인 분석 필요
@@ -72,7 +72,7 @@ def test_login_flow_no_network(test_name, driver):
     assert not app_drawer.is_network_connected(), "네트워크가 여전히 연결되어 있습니다."
 
     # LOGIN_002-2: Test Step - 앱 서랍에서 앱 아이콘 탭
-    assert app_drawer.launch_ohous_app(), "오늘의집 앱 실행에 실패했습니다."
+    assert app_drawer.launch_ohous_app(strategy=AppDrawerPage.LAUNCH_BY_DRAWER), "오늘의집 앱 실행에 실패했습니다."
 
     # LOGIN_002-3-1: Test Step & Assertion - 앱 정상 실행 확인
     assert app_drawer.wait_for_app_running(timeout=10), "앱이 정상적으로 실행되지 않았습니다."
@@ -116,7 +116,8 @@ def test_login_page_ui(test_name, driver):
 # LOGIN_004: 이메일로 로그인 페이지 전환 확인
 @pytest.mark.parametrize("test_name", ["LOGIN_004"])
 @pytest.mark.p1
-def test_login_page_email_login(test_name, driver):
+@pytest.mark.xdist_group("login_chain")
+def test_login_page_email_login(test_name, driver, auth_state):
     test_id = test_name
 
     # Pre Processing: 앱실행
@@ -125,7 +126,14 @@ def test_login_page_email_login(test_name, driver):
 
     # Pre Processing: 로그인 페이지 초기화 및 로드 대기
     login_page = LoginPage(driver)
-    check.is_true(login_page.is_login_page_loaded(timeout=10), "로그인 페이지가 10초 이내에 로드되지 않았습니다.")
+    loaded = login_page.is_login_page_loaded(timeout=10)
+    check.is_true(loaded, "로그인 페이지가 10초 이내에 로드되지 않았습니다.")
+
+    # Pre Processing: 로그아웃 상태를 저장하여 LOGIN_009/012가 UI 로그아웃 대신 복원할 수 있게 함
+    # 저장 중 앱을 멈췄다가 다시 실행하므로 로그인 페이지를 다시 확인 (저장하지 않았으면 명령 없이 캐시로 확인)
+    if loaded:
+        auth_state.capture_logged_out()
+        check.is_true(login_page.is_login_page_loaded(timeout=10), "로그인 상태 저장 후 로그인 페이지가 10초 이내에 로드되지 않았습니다.")
 
     # LOGIN_004-1: Test Step - [이메일로 로그인] 텍스트 버튼 탭
     login_page.click(login_page.IMAIL_LOGIN_BUTTON)
@@ -140,6 +148,8 @@ def test_login_page_email_login(test_name, driver):
 # LOGIN_005: 이메일로 로그인 페이지의 뒤로가기 아이콘 탭 시 로그인 페이지로 복귀하는지 확인
 @pytest.mark.parametrize("test_name", ["LOGIN_005"])
 @pytest.mark.p2
+@pytest.mark.xdist_group("login_chain")
+@pytest.mark.keep_app_state
 def test_login_page_email_login_back_button(test_name, driver):
     test_id = test_name
 
@@ -160,6 +170,8 @@ def test_login_page_email_login_back_button(test_name, driver):
 # LOGIN_006: 이메일로 로그인 페이지 UI 확인
 @pytest.mark.parametrize("test_name", ["LOGIN_006"])
 @pytest.mark.p3
+@pytest.mark.xdist_group("login_chain")
+@pytest.mark.keep_app_state
 def test_login_page_email_login_ui(test_name, driver):
     test_id = test_name
 
@@ -181,6 +193,8 @@ def test_login_page_email_login_ui(test_name, driver):
 # LOGIN_007: 로그인 버튼 비활성화 동작 및 토스트 위젯 안내문구 확인
 @pytest.mark.parametrize("test_name", ["LOGIN_007"])
 @pytest.mark.p2
+@pytest.mark.xdist_group("login_chain")
+@pytest.mark.keep_app_state
 def test_login_page_email_login_login_button_disabled(test_name, driver):
     test_id = test_name 
 
@@ -246,6 +260,8 @@ def test_login_page_email_login_login_button_disabled(test_name, driver):
 # LOGIN-008: 올바른 계정으로 로그인 시도 시 로그인 성공 동작 확인
 @pytest.mark.parametrize("test_name", ["LOGIN_008"])
 @pytest.mark.p1
+@pytest.mark.xdist_group("login_chain")
+@pytest.mark.keep_app_state
 def test_login_page_email_login_login_success(test_name, driver):
     test_id = test_name
 
@@ -270,10 +286,10 @@ def test_login_page_email_login_login_success(test_name, driver):
     login_page_by_email.click(login_page_by_email.LOGIN_BUTTON)
 
     # LOGIN_008-3: Assertion - "로그인 중입니다." 안내문구의 팝업창 노출되었다 사라짐
-    # Step 1: 팝업이 나타났는지 확인 (매우 짧은 timeout으로 빠르게 확인)
-    check.is_true(login_page_by_email.wait_for_toast_message(toast_text="로그인 중입니다.", timeout=0.5), "로그인 중입니다. 안내문구의 팝업창이 노출되지 않았습니다.")
+    # Step 1: 팝업이 나타났는지 화면 요소로 확인 (토스트가 아니므로 토스트 리스너로는 확인할 수 없음)
+    check.is_true(login_page_by_email.is_login_loading_popup_displayed(timeout=2), "로그인 중입니다. 안내문구의 팝업창이 노출되지 않았습니다.")
     # Step 2: 팝업이 사라졌는지 확인
-    check.is_true(login_page_by_email.wait_for_toast_to_disappear(toast_text="로그인 중입니다.", timeout=10), "로그인 중입니다. 안내문구의 팝업창이 노출되었다 사라지지 않았습니다.")
+    check.is_true(login_page_by_email.wait_for_login_loading_popup_to_disappear(timeout=10), "로그인 중입니다. 안내문구의 팝업창이 노출되었다 사라지지 않았습니다.")
 
     main_home_page = MainHomePage(driver)
     # 만약 Google Password Manager 안내문구 팝업이 노출되었다면 [나중에] 또는 [사용 안함] 버튼 탭
@@ -289,7 +305,9 @@ def test_login_page_email_login_login_success(test_name, driver):
 # LOGIN_009: 잘못된 비밀번호로 로그인 시도 시 로그인 실패 동작 확인
 @pytest.mark.parametrize("test_name", ["LOGIN_009"])    
 @pytest.mark.p2
-def test_login_page_email_login_password_login_failed(test_name, driver):
+@pytest.mark.xdist_group("login_chain")
+@pytest.mark.keep_app_state
+def test_login_page_email_login_password_login_failed(test_name, driver, auth_state):
     test_id = test_name
 
     # Pre Processing: 환경 변수에서 로그인 정보 로드
@@ -298,11 +316,14 @@ def test_login_page_email_login_password_login_failed(test_name, driver):
     assert config.login_password is not None, ".env 파일에 LOGIN_PASSWORD가 설정되어 있지 않습니다."
 
     # Pre Processing: 이메일로 로그인 페이지 노출된 상태
-    # LOGIN-008에서 메인 홈 페이지 노출된 상태므로 로그아웃하여 이메일로 로그인 페이지로 이동
-    main_home_page = MainHomePage(driver)
-    result, error_message = main_home_page.logout_in_main_home_page(main_home_page, timeout=20)
-    check.is_true(result, error_message)
-    
+    # LOGIN_004에서 저장한 로그아웃 상태를 복원하고, 스냅샷이 없으면 LOGIN-008에서 메인 홈 페이지 노출된 상태므로 UI로 로그아웃
+    if not auth_state.restore_logged_out():
+        main_home_page = MainHomePage(driver)
+        result, error_message = main_home_page.logout_in_main_home_page(main_home_page, timeout=20, deep_link=True)
+        check.is_true(result, error_message)
+        if result:
+            auth_state.capture_logged_out()
+
     login_page = LoginPage(driver)
     check.is_true(login_page.is_login_page_loaded(timeout=10), "로그인 페이지가 10초 이내에 노출되지 않았습니다.")
 
@@ -336,6 +357,8 @@ def test_login_page_email_login_password_login_failed(test_name, driver):
 # LOGIN_010: 잘못된 비밀번호로 연속 10회 미만 로그인 시도 후 로그인 성공 시 로그인 실패 횟수 초기화 확인
 @pytest.mark.parametrize("test_name", ["LOGIN_010"])
 @pytest.mark.p3
+@pytest.mark.xdist_group("login_chain")
+@pytest.mark.keep_app_state
 def test_login_page_email_login_lock_count_reset(test_name, driver):
     test_id = test_name
 
@@ -363,8 +386,8 @@ def test_login_page_email_login_lock_count_reset(test_name, driver):
     login_page_by_email.click(login_page_by_email.LOGIN_BUTTON)
 
     # LOGIN_009-1-1: Assertion - "로그인 중입니다." 안내문구의 팝업창 노출되었다 사라짐
-    check.is_true(login_page_by_email.wait_for_toast_message(toast_text="로그인 중입니다.", timeout=0.5), "로그인 중입니다. 안내문구의 팝업창이 노출되지 않았습니다.")
-    check.is_true(login_page_by_email.wait_for_toast_to_disappear(toast_text="로그인 중입니다.", timeout=10), "로그인 중입니다. 안내문구의 팝업창이 노출되었다 사라지지 않았습니다.")
+    check.is_true(login_page_by_email.is_login_loading_popup_displayed(timeout=2), "로그인 중입니다. 안내문구의 팝업창이 노출되지 않았습니다.")
+    check.is_true(login_page_by_email.wait_for_login_loading_popup_to_disappear(timeout=10), "로그인 중입니다. 안내문구의 팝업창이 노출되었다 사라지지 않았습니다.")
 
     # LOGIN_009-1-2: Assertion - "10번 실패하면 10분간 로그인이 제한돼요. (4/10)" 안내문구의 토스트 위젯 노출되었다 사라짐
     check.is_true(login_page_by_email.wait_for_toast_message(toast_text="10번 실패하면 10분간 로그인이 제한돼요. (4/10)", timeout=5), "10번 실패하면 10분간 로그인이 제한돼요. (4/10) 안내문구의 토스트 위젯이 노출되지 않았습니다.")
@@ -417,7 +440,9 @@ def test_login_page_email_login_lock_count_reset(test_name, driver):
 # LOGIN_011: 잘못된 비밀번호로 연속 10회 로그인 시도 시 로그인 재한 동작되어 10분간 로그인 시도 불가한지 확인
 @pytest.mark.parametrize("test_name", ["LOGIN_011"])
 @pytest.mark.p3
-def test_login_page_email_login_lock_blocked(test_name, driver):
+@pytest.mark.xdist_group("login_chain")
+@pytest.mark.keep_app_state
+def test_login_page_email_login_lock_blocked(test_name, driver, lockout):
     test_id = test_name
 
     # Pre Processing: 이메일로 로그인 페이지 노출된 상태
@@ -448,15 +473,15 @@ def test_login_page_email_login_lock_blocked(test_name, driver):
     login_page_by_email.click(login_page_by_email.LOGIN_BUTTON)
 
     # LOGIN_011-3-1: Assertion - 중앙 영역에 "로그인 중입니다." 안내문구의 팝업창 노출되었다 사라짐
-    check.is_true(login_page_by_email.wait_for_toast_message(toast_text="로그인 중입니다.", timeout=0.5), "로그인 중입니다. 안내문구의 팝업창이 노출되지 않았습니다.")
-    check.is_true(login_page_by_email.wait_for_toast_to_disappear(toast_text="로그인 중입니다.", timeout=10), "로그인 중입니다. 안내문구의 팝업창이 노출되었다 사라지지 않았습니다.")
+    check.is_true(login_page_by_email.is_login_loading_popup_displayed(timeout=2), "로그인 중입니다. 안내문구의 팝업창이 노출되지 않았습니다.")
+    check.is_true(login_page_by_email.wait_for_login_loading_popup_to_disappear(timeout=10), "로그인 중입니다. 안내문구의 팝업창이 노출되었다 사라지지 않았습니다.")
 
     # LOGIN_011-3-2: Assertion - 로그인 실패 횟수가 초기화되어 하단 영역에 "로그인이 제한되었어요. 10분 후 다시 시도해주세요." 안내문구의 토스트 위젯 노출되었다 사라짐
     check.is_true(login_page_by_email.wait_for_toast_message(toast_text="로그인이 제한되었어요. 10분 후 다시 시도해주세요.", timeout=5), "로그인이 제한되었어요. 10분 후 다시 시도해주세요. 안내문구의 토스트 위젯이 노출되지 않았습니다.")
     check.is_true(login_page_by_email.wait_for_toast_to_disappear(toast_text="로그인이 제한되었어요. 10분 후 다시 시도해주세요.", timeout=5), "로그인이 제한되었어요. 10분 후 다시 시도해주세요. 안내문구의 토스트 위젯이 노출되었다 사라지지 않았습니다.")
 
     # LOGIN_011-4: Test Step - 마지막 로그인 시도 후 10분 경과 전 가입된 계정과 다른 이메일 또는 비밀번호로 로그인 시도
-    time.sleep(10)
+    lockout.wait(10, login_page_by_email)
     login_page_by_email.clear_text_android(login_page_by_email.ID_INPUT_FIELD)
     login_page_by_email.type(login_page_by_email.ID_INPUT_FIELD, config.login_id)
     login_page_by_email.clear_text_android(login_page_by_email.PASSWORD_INPUT_FIELD)
@@ -464,15 +489,16 @@ def test_login_page_email_login_lock_blocked(test_name, driver):
     login_page_by_email.click(login_page_by_email.LOGIN_BUTTON)
 
     # LOGIN_011-4-1: Assertion - 중앙 영역에 "로그인 중입니다." 안내문구의 팝업창 노출되었다 사라짐
-    check.is_true(login_page_by_email.wait_for_toast_message(toast_text="로그인 중입니다.", timeout=0.5), "로그인 중입니다. 안내문구의 팝업창이 노출되지 않았습니다.")
-    check.is_true(login_page_by_email.wait_for_toast_to_disappear(toast_text="로그인 중입니다.", timeout=10), "로그인 중입니다. 안내문구의 팝업창이 노출되었다 사라지지 않았습니다.")
+    check.is_true(login_page_by_email.is_login_loading_popup_displayed(timeout=2), "로그인 중입니다. 안내문구의 팝업창이 노출되지 않았습니다.")
+    check.is_true(login_page_by_email.wait_for_login_loading_popup_to_disappear(timeout=10), "로그인 중입니다. 안내문구의 팝업창이 노출되었다 사라지지 않았습니다.")
 
     # LOGIN_011-4-2: Assertion - 로그인 실패 횟수가 초기화되어 하단 영역에 "로그인이 제한되었어요. 10분 후 다시 시도해주세요" 안내문구의 토스트 위젯 노출되었다 사라짐
     check.is_true(login_page_by_email.wait_for_toast_message(toast_text="로그인이 제한되었어요. 10분 후 다시 시도해주세요.", timeout=5), "로그인이 제한되었어요. 10분 후 다시 시도해주세요. 안내문구의 토스트 위젯이 노출되지 않았습니다.")
     check.is_true(login_page_by_email.wait_for_toast_to_disappear(toast_text="로그인이 제한되었어요. 10분 후 다시 시도해주세요.", timeout=5), "로그인이 제한되었어요. 10분 후 다시 시도해주세요. 안내문구의 토스트 위젯이 노출되었다 사라지지 않았습니다.")
 
     # LOGIN_011-5: Test Step - 마지막 로그인 시도 후 10분 경과 후 가입된 계정과 일치하는 이메일과 비밀번호로 로그인 시도
-    login_page_by_email.wait_with_session_keepalive(590)  # 10분 대기
+    # 10분 대기 (--lockout-mode=fast이면 mock 로그인 백엔드의 시계만 앞당기고 즉시 진행)
+    lockout.wait(590, login_page_by_email)
     login_page_by_email.clear_text_android(login_page_by_email.ID_INPUT_FIELD)
     login_page_by_email.type(login_page_by_email.ID_INPUT_FIELD, config.login_id)
     login_page_by_email.clear_text_android(login_page_by_email.PASSWORD_INPUT_FIELD)
@@ -489,20 +515,27 @@ def test_login_page_email_login_lock_blocked(test_name, driver):
 # LOGIN_012: 로그인 시도 시 네트워크 연결 해제 상황에서 로그인 불가와 오류 처리 적합성 확인 및 네트워크 연결 재개 시 정상 로그인 가능한지 확인
 @pytest.mark.parametrize("test_name", ["LOGIN_012"])    
 @pytest.mark.p3
-def test_login_page_email_login_network_disconnected(test_name, driver):
+@pytest.mark.xdist_group("login_chain")
+@pytest.mark.keep_app_state
+def test_login_page_email_login_network_disconnected(test_name, driver, auth_state):
     test_id = test_name
 
     # Pre Processing: 이메일로 로그인 페이지 노출된 상태 
-    # LOGIN_011 에서 마지막 페이지가 오늘의집 메인 페이지이므로 로그아웃하여 이메일로 로그인 페이지까지의 step 진행
-    main_home_page = MainHomePage(driver)
-    result, error_message = main_home_page.logout_in_main_home_page(main_home_page, timeout=20)
-    check.is_true(result, error_message)
-    
-    # 로그인 페이지 진입 확인
+    # LOGIN_004에서 저장한 로그아웃 상태를 복원하고, 스냅샷이 없으면 LOGIN_011 에서 마지막 페이지가 오늘의집 메인 페이지이므로 UI로 로그아웃
     login_page = LoginPage(driver)
-    # 로그아웃 토스트 위젯 노출 및 사라짐 확인
-    check.is_true(login_page.wait_for_toast_message(toast_text="로그아웃 되었습니다.", timeout=5), "로그아웃 되었습니다. 토스트 위젯이 노출되지 않았습니다.")
-    check.is_true(login_page.wait_for_toast_to_disappear(toast_text="로그아웃 되었습니다.", timeout=5), "로그아웃 되었습니다. 토스트 위젯이 노출되었다 사라지지 않았습니다.")
+    if not auth_state.restore_logged_out():
+        main_home_page = MainHomePage(driver)
+        result, error_message = main_home_page.logout_in_main_home_page(main_home_page, timeout=20, deep_link=True)
+        check.is_true(result, error_message)
+
+        # 로그아웃 토스트 위젯 노출 및 사라짐 확인
+        check.is_true(login_page.wait_for_toast_message(toast_text="로그아웃 되었습니다.", timeout=5), "로그아웃 되었습니다. 토스트 위젯이 노출되지 않았습니다.")
+        check.is_true(login_page.wait_for_toast_to_disappear(toast_text="로그아웃 되었습니다.", timeout=5), "로그아웃 되었습니다. 토스트 위젯이 노출되었다 사라지지 않았습니다.")
+        if result:
+            auth_state.capture_logged_out()
+
+    # 로그인 페이지 진입 확인
+    check.is_true(login_page.is_login_page_loaded(timeout=10), "로그인 페이지가 10초 이내에 노출되지 않았습니다.")
 
     # [이메일로 로그인] 텍스트 버튼 탭
     login_page.click(login_page.IMAIL_LOGIN_BUTTON)
@@ -533,8 +566,8 @@ def test_login_page_email_login_network_disconnected(test_name, driver):
     login_page_by_email.click(login_page_by_email.LOGIN_BUTTON)
 
     # LOGIN_012-4-2: Assertion - 중앙 영역에 "로그인 중입니다." 안내문구의 팝업창 노출되었다 사라짐
-    check.is_true(login_page_by_email.wait_for_toast_message(toast_text="로그인 중입니다.", timeout=0.5), "로그인 중입니다. 안내문구의 팝업창이 노출되지 않았습니다.")
-    check.is_true(login_page_by_email.wait_for_toast_to_disappear(toast_text="로그인 중입니다.", timeout=10), "로그인 중입니다. 안내문구의 팝업창이 노출되었다 사라지지 않았습니다.")
+    check.is_true(login_page_by_email.is_login_loading_popup_displayed(timeout=2), "로그인 중입니다. 안내문구의 팝업창이 노출되지 않았습니다.")
+    check.is_true(login_page_by_email.wait_for_login_loading_popup_to_disappear(timeout=10), "로그인 중입니다. 안내문구의 팝업창이 노출되었다 사라지지 않았습니다.")
 
     # LOGIN_012-4-2: Assertion - 하단 영역에 "Unable to solve host "ohous.se": No address associated with hostname" 안내문구의 토스트 위젯 노출되었다 사라짐
     check.is_true(login_page_by_email.wait_for_toast_message(toast_text="Unable to solve host \"ohous.se\": No address associated with hostname", timeout=5), "Unable to solve host \"ohous.se\": No address associated with hostname 안내문구의 토스트 위젯이 노출되지 않았습니다.")
@@ -565,6 +598,8 @@ def test_login_page_email_login_network_disconnected(test_name, driver):
 # LOGIN_013: 이미 로그인된 상태에서 앱 재실행 동작 시 메인 홈페이지 노출 확인
 @pytest.mark.parametrize("test_name", ["LOGIN_013"])    
 @pytest.mark.p3
+@pytest.mark.xdist_group("login_chain")
+@pytest.mark.keep_app_state
 def test_login_page_email_login_app_restart(test_name, driver):
     test_id = test_name
 
@@ -576,7 +611,7 @@ def test_login_page_email_login_app_restart(test_name, driver):
     assert app_drawer.terminate_all_apps(), "앱을 종료하지 못했습니다."
 
     # LOGIN_013-2: Test Step - 앱 아이콘 탭하여 앱 실행
-    assert app_drawer.launch_ohous_app(), "오늘의집 앱 실행에 실패했습니다."
+    assert app_drawer.launch_ohous_app(strategy=AppDrawerPage.LAUNCH_BY_DRAWER), "오늘의집 앱 실행에 실패했습니다."
 
     # LOGIN_013-2: Assertion - 오늘의집 메인 페이지가 10초 이내에 노출됨
     main_home_page = MainHomePage(driver)
@@ -0,0 +1,156 @@
+"""
+이메일 로그인 폼 빠른 입력 테스트
+디바이스 없이 명령 수를 기록하는 가짜 드라이버로 실행됩니다.
+"""
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+
+from src.pages.login_page_by_email import LoginPageByEmail
+
+
+class FakeElement:
+    def __init__(self, driver, element_id):
+        self.driver = driver
+        self.id = element_id
+        self.text = ""
+        # is_enabled가 False를 반환할 남은 횟수
+        self.disabled_checks = 0
+
+    def is_displayed(self):
+        self.driver.check_stale(self)
+        return True
+
+    def is_enabled(self):
+        self.driver.check_stale(self)
+        if self.disabled_checks:
+            self.disabled_checks -= 1
+            return False
+        return True
+
+    def click(self):
+        self.driver.check_stale(self)
+        self.driver.commands.append(("click", self.id))
+
+    def clear(self):
+        self.text = ""
+        self.driver.commands.append(("clear", self.id))
+
+    def send_keys(self, text):
+        self.text += text
+        self.driver.commands.append(("send_keys", self.id))
+
+
+LOADING_POPUP = '<hierarchy><android.widget.TextView text="로그인 중입니다." /></hierarchy>'
+NO_POPUP = "<hierarchy />"
+
+
+class FakeDriver:
+    """
+    find_element와 mobile: replaceElementValue 호출을 기록하는 드라이버
+    page_source는 loading_popup_polls번 요청될 때까지 로딩 팝업 화면을 반환합니다.
+    """
+
+    def __init__(self, supports_replace=True, loading_popup_polls=0):
+        self.supports_replace = supports_replace
+        self.loading_popup_polls = loading_popup_polls
+        self.commands = []
+        self.elements = {}
+        self.stale_ids = set()
+        self.finds = 0
+
+    @property
+    def page_source(self):
+        if self.loading_popup_polls:
+            self.loading_popup_polls -= 1
+            return LOADING_POPUP
+        return NO_POPUP
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def find_element(self, by, value):
+        self.finds += 1
+        element = FakeElement(self, f"{value}#{self.finds}")
+        self.elements[value] = element
+        return element
+
+    def check_stale(self, element):
+        if element.id in self.stale_ids:
+            raise StaleElementReferenceException(element.id)
+
+    def execute_script(self, script, args):
+        if not self.supports_replace:
+            raise WebDriverException("Unknown mobile command")
+        element = next(e for e in self.elements.values() if e.id == args["elementId"])
+        self.check_stale(element)
+        element.text = args["text"]
+        self.commands.append(("replace", element.id))
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr("src.pages.login_page_by_email.time.sleep", lambda seconds: None)
+    monkeypatch.setattr("src.wait.time.sleep", lambda seconds: None)
+
+
+def test_repeated_attempts_reuse_form_elements():
+    driver = FakeDriver()
+    page = LoginPageByEmail(driver)
+
+    timings = page.attempt_login_multiple_times("a@b.c", "wrong", count=10)
+
+    # 폼 요소 3개는 첫 시도에서만 찾고, 시도마다 명령 3개(입력 2 + 클릭 1)만 실행
+    assert driver.finds == 3
+    assert len(driver.commands) == 30
+    assert [t.index for t in timings] == list(range(1, 11))
+    assert page.attempt_timings == timings
+    assert driver.elements[LoginPageByEmail.PASSWORD_INPUT_FIELD[1]].text == "wrong"
+
+
+def test_click_waits_for_loading_popup_and_enabled_button():
+    driver = FakeDriver(loading_popup_polls=2)
+    page = LoginPageByEmail(driver)
+    page.attempt_login_multiple_times("a@b.c", "wrong")
+    driver.elements[LoginPageByEmail.LOGIN_BUTTON[1]].disabled_checks = 3
+
+    page.attempt_login_multiple_times("a@b.c", "wrong", count=2)
+
+    # 로딩 팝업이 사라지고 버튼이 활성화될 때까지 기다려 클릭이 누락되지 않음
+    clicks = [command for command, _ in driver.commands if command == "click"]
+    assert len(clicks) == 3
+    assert driver.loading_popup_polls == 0
+    assert page.waits.stats["login_loading_popup_disappear"].polls == 3
+    assert page.waits.stats["login_button_enabled"].polls == 3 + 3
+
+
+def test_disabled_login_button_fails_instead_of_losing_click(monkeypatch):
+    driver = FakeDriver()
+    page = LoginPageByEmail(driver)
+    page.attempt_login_multiple_times("a@b.c", "wrong")
+    driver.elements[LoginPageByEmail.LOGIN_BUTTON[1]].disabled_checks = float("inf")
+    monkeypatch.setattr(page.waits, "clamp", lambda timeout: 0)
+
+    with pytest.raises(TimeoutException):
+        page.attempt_login_multiple_times("a@b.c", "wrong")
+    assert [command for command, _ in driver.commands].count("click") == 1
+
+
+def test_stale_element_is_found_again():
+    driver = FakeDriver()
+    page = LoginPageByEmail(driver)
+    page.attempt_login_multiple_times("a@b.c", "wrong")
+
+    driver.stale_ids.add(driver.elements[LoginPageByEmail.ID_INPUT_FIELD[1]].id)
+    timing, = page.attempt_login_multiple_times("a@b.c", "wrong")
+
+    assert timing.refinds == 1
+    assert driver.finds == 4
+
+
+def test_falls_back_to_clear_and_send_keys():
+    driver = FakeDriver(supports_replace=False)
+    page = LoginPageByEmail(driver)
+    page.fill_login_form("a@b.c", "pw")
+
+    assert [command for command, _ in driver.commands] == ["clear", "send_keys", "clear", "send_keys"]
+    assert driver.elements[LoginPageByEmail.ID_INPUT_FIELD[1]].text == "a@b.c"
@@ -0,0 +1,119 @@
+"""
+화면 이동(Navigator) 테스트
+디바이스 없이 fake Appium 서버에서 실행되며, deep link를 여는 adb 명령은 가짜 함수로 대신합니다.
+"""
+import dataclasses
+
+import pytest
+
+from benchmarks.bench_page_objects import VirtualClock, app_scenario
+from benchmarks.fake_appium import FakeAppiumServer
+from src.app_lifecycle import AppLifecycle
+from src.config.settings import load_config
+from src.driver import create_driver
+from src.navigation import ROUTE_DEEP_LINK, ROUTE_TAP, Navigator
+from src.pages.main_home_page import MainHomePage
+from src.pages.setting_page import SettingPage
+
+UNRESOLVED = "Error: Activity not started, unable to resolve Intent { act=android.intent.action.VIEW }\n"
+
+
+@pytest.fixture
+def fake():
+    scenario = app_scenario()
+    scenario.start = "main_home_page"
+    server = FakeAppiumServer(scenario).start()
+    driver = create_driver(server.config(), skip_app_launch=True)
+    navigator = Navigator(driver, dataclasses.replace(load_config(), app_package="net.bucketplace"))
+    yield server, navigator
+    driver.quit()
+    server.stop()
+
+
+@pytest.fixture
+def adb_calls(monkeypatch):
+    calls = []
+
+    def use(handler):
+        def adb_shell(self, *args, timeout=5):
+            calls.append(args)
+            return handler(*args)
+        monkeypatch.setattr(AppLifecycle, "_adb_shell", adb_shell)
+        return calls
+
+    return use
+
+
+def test_tap_route_from_main_home(fake):
+    server, navigator = fake
+
+    page = navigator.go_to(SettingPage, start=MainHomePage, deep_link=False)
+
+    assert isinstance(page, SettingPage)
+    assert server.device.history[-2:] == ["main_home_page", "my_page"]
+    assert server.requests["click"] == 2
+    assert (navigator.last.destination, navigator.last.route, navigator.last.ok) == ("설정 페이지", ROUTE_TAP, True)
+
+
+def test_deep_link_opens_destination_in_one_command(fake, adb_calls):
+    server, navigator = fake
+
+    def open_settings(*args):
+        server.device.show("setting_page")
+        return "Status: ok\nLaunchState: WARM\nTotalTime: 180\nComplete\n"
+
+    calls = adb_calls(open_settings)
+
+    assert navigator.go_to(SettingPage, start=MainHomePage) is not None
+    assert calls == [("am", "start", "-W", "-a", "android.intent.action.VIEW", "-d", "ohouseapp://settings", "net.bucketplace")]
+    assert server.requests["click"] == 0
+    assert navigator.last.route == ROUTE_DEEP_LINK
+
+
+def test_unsupported_deep_link_falls_back_once(fake, adb_calls):
+    server, navigator = fake
+    calls = adb_calls(lambda *args: UNRESOLVED)
+
+    assert navigator.go_to(SettingPage, start=MainHomePage) is not None
+    server.device.show("main_home_page")
+    assert navigator.go_to(SettingPage, start=MainHomePage) is not None
+
+    # 처리하지 못한 deep link는 다시 시도하지 않음
+    assert len(calls) == 1
+    assert [record.route for record in navigator.history] == [ROUTE_TAP, ROUTE_TAP]
+    assert "설정 페이지" in navigator.report(clear=True)
+    assert navigator.history == []
+
+
+def test_failed_tap_route_reports_error(fake):
+    server, navigator = fake
+    server.scenario.clicks.pop(("main_home_page", "마이페이지"))
+
+    # 클릭 대기 시간(10초)은 가상 시계로 진행
+    with VirtualClock():
+        assert navigator.go_to(SettingPage, timeout=1, start=MainHomePage, deep_link=False) is None
+    assert not navigator.last.ok
+    assert navigator.last.error
+    assert "실패" in navigator.report()
+
+
+def test_deep_link_landing_elsewhere_relaunches_for_tap_route(fake, adb_calls):
+    server, navigator = fake
+
+    def adb_shell(*args):
+        # deep link는 처리되지만 설정 페이지가 아닌 화면이 열리고, 앱을 다시 실행하면 메인 홈이 열림
+        server.device.show("main_home_page" if "-S" in args else "login_page")
+        return "Status: ok\nLaunchState: COLD\nTotalTime: 900\nComplete\n"
+
+    calls = adb_calls(adb_shell)
+
+    with VirtualClock():
+        assert navigator.go_to(SettingPage, timeout=1, start=MainHomePage) is not None
+        server.device.show("main_home_page")
+        assert navigator.go_to(SettingPage, timeout=1, start=MainHomePage) is not None
+
+    # 처음 한 번만 deep link를 열고, 탭 경로는 start 대신 앱 재실행(-S)부터 시작
+    assert [call[1:3] for call in calls] == [("start", "-W"), ("start", "-W")]
+    assert "-d" in calls[0] and "-S" in calls[1]
+    assert [record.route for record in navigator.history] == [ROUTE_TAP, ROUTE_TAP]
+    assert server.device.history[-2:] == ["main_home_page", "my_page"]
@@ -0,0 +1,47 @@
+"""
+page object 메서드별 명령 수 측정 테스트
+디바이스 없이 fake Appium 서버에서 실행되며, 명령 수가 benchmarks/page_objects_baseline.json보다 늘어나면 실패합니다.
+locator 후보를 바꿔 명령 수가 줄었다면 `python -m benchmarks.bench_page_objects --update-baseline`으로 baseline을 갱신합니다.
+"""
+import time
+
+import pytest
+
+from benchmarks.bench_page_objects import CASES, CaseResult, VirtualClock, compare, load_baseline, run_case
+
+BASELINE = load_baseline()
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_command_count_does_not_exceed_baseline(case):
+    result = run_case(case)
+
+    assert case.name in BASELINE, f"baseline에 없는 케이스입니다: {case.name}"
+    assert result.commands <= BASELINE[case.name], (
+        f"{case.name}: 명령 수가 baseline보다 많습니다 ({BASELINE[case.name]}개 → {result.commands}개). "
+        f"명령 이름별: {result.commands_by_name}"
+    )
+
+
+@pytest.mark.parametrize("case", [case for case in CASES if case.scenario == "hit"], ids=lambda case: case.name)
+def test_hit_scenario_succeeds(case):
+    assert run_case(case).outcome in ("True", "None", "(True, None)")
+
+
+def test_compare_reports_regressions_and_improvements():
+    results = [CaseResult("a/hit", 3), CaseResult("b/hit", 5), CaseResult("c/hit", 1)]
+
+    regressions, improvements = compare(results, {"a/hit": 2, "b/hit": 6, "c/hit": 1})
+
+    assert regressions == ["a/hit: 명령 2개 → 3개"]
+    assert improvements == ["b/hit: 명령 6개 → 5개"]
+
+
+def test_virtual_clock_advances_without_sleeping():
+    started = time.perf_counter()
+    with VirtualClock() as clock:
+        before = time.monotonic()
+        time.sleep(30)
+        assert time.monotonic() - before == 30
+    assert time.perf_counter() - started < 1
+    assert time.monotonic() != clock.now
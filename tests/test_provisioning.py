@@ -0,0 +1,165 @@
+"""
+APK 캐시 설치(provisioning) 테스트
+디바이스 없이 실행되며, adb 명령은 subprocess.run을 대신하는 가짜 adb로 처리합니다.
+"""
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.provisioning import FAILED, INSTALLED, SKIPPED, UNIVERSAL, ApkCache
+
+PACKAGE = "net.bucketplace"
+REMOTE_DIR = "/data/app/~~abc==/net.bucketplace-xyz=="
+SPLITS = ("base.apk", "split_config.arm64_v8a.apk", "split_config.xxhdpi.apk")
+ARM64 = ("arm64-v8a", "420")
+X86 = ("x86_64", "240")
+PROFILE = "arm64-v8a_420dpi"
+
+
+class FakeAdb:
+    """디바이스별 설치 버전과 프로필만 기억하는 가짜 adb"""
+
+    def __init__(self, installed, profiles=None, splits=SPLITS):
+        # serial -> versionCode (None이면 미설치)
+        self.installed = dict(installed)
+        # serial -> (ABI, 화면 밀도), 지정하지 않은 디바이스는 ARM64
+        self.profiles = profiles or {}
+        self.splits = splits
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, args, **kwargs):
+        _, _, serial, command, *rest = args
+        with self._lock:
+            self.calls.append((serial, command, *rest))
+        version = self.installed.get(serial)
+        if command == "shell" and rest[0].startswith("getprop"):
+            abi, density = self.profiles.get(serial, ARM64)
+            return subprocess.CompletedProcess(args, 0, stdout=f"{abi}\nPhysical density: {density}\n", stderr="")
+        if command == "shell" and rest[:2] == ["dumpsys", "package"]:
+            output = f"    versionCode={version} minSdk=26 targetSdk=34\n" if version else ""
+            return subprocess.CompletedProcess(args, 0, stdout=output, stderr="")
+        if command == "shell" and rest[:2] == ["pm", "path"]:
+            output = "".join(f"package:{REMOTE_DIR}/{name}\n" for name in self.splits) if version else ""
+            return subprocess.CompletedProcess(args, 0, stdout=output, stderr="")
+        if command == "pull":
+            remote, local = rest
+            Path(local).write_text(f"{version}:{Path(remote).name}")
+            return subprocess.CompletedProcess(args, 0, stdout="1 file pulled.\n", stderr="")
+        if command == "install-multiple":
+            apks = [Path(path) for path in rest if not path.startswith("-")]
+            # 다른 프로필용 split APK는 설치 실패
+            if len(apks) > 1 and apks[0].parent.name != "{}_{}dpi".format(*self.profiles.get(serial, ARM64)):
+                return subprocess.CompletedProcess(args, 1, stdout="", stderr="Failure [INSTALL_FAILED_NO_MATCHING_ABIS]\n")
+            self.installed[serial] = int(apks[0].read_text().split(":")[0])
+            return subprocess.CompletedProcess(args, 0, stdout="Success\n", stderr="")
+        raise AssertionError(f"예상하지 못한 adb 명령: {args}")
+
+    def commands(self, serial, command):
+        return [call for call in self.calls if call[:2] == (serial, command)]
+
+
+@pytest.fixture
+def adb(monkeypatch):
+    def use(profiles=None, splits=SPLITS, **installed):
+        fake = FakeAdb(installed, profiles, splits)
+        monkeypatch.setattr(subprocess, "run", fake)
+        return fake
+
+    return use
+
+
+def test_pull_caches_split_apks_by_version_code(adb, tmp_path):
+    fake = adb(source=251201)
+    cache = ApkCache(tmp_path)
+
+    apk = cache.pull("source", PACKAGE)
+
+    assert (apk.version_code, apk.profile) == (251201, PROFILE)
+    assert [path.name for path in apk.paths] == list(SPLITS)
+    assert cache.versions(PACKAGE, PROFILE) == [251201]
+    assert cache.versions(PACKAGE, "x86_64_240dpi") == []
+    # 같은 버전은 다시 가져오지 않음
+    assert cache.pull("source", PACKAGE) == apk
+    assert len(fake.commands("source", "pull")) == len(SPLITS)
+
+
+def test_provision_all_fills_cache_then_installs_in_parallel(adb, tmp_path):
+    fake = adb(source=251201, empty1=None, empty2=None)
+
+    results = ApkCache(tmp_path).provision_all(["empty1", "source", "empty2"], PACKAGE)
+
+    assert [(result.serial, result.action) for result in results] == [
+        ("empty1", INSTALLED), ("source", SKIPPED), ("empty2", INSTALLED),
+    ]
+    assert all(result.ok and result.version_code == 251201 for result in results)
+    install = fake.commands("empty1", "install-multiple")[0]
+    assert install[2] == "-r"
+    assert [Path(path).name for path in install[3:]] == list(SPLITS)
+
+
+def test_provision_upgrades_and_caches_newer_installed_version(adb, tmp_path):
+    fake = adb(old=100, new=200)
+    cache = ApkCache(tmp_path)
+    cache.pull("old", PACKAGE)
+
+    # 캐시보다 새 버전이 설치된 디바이스는 건너뛰고 그 버전을 캐시에 저장
+    assert cache.provision("new", PACKAGE).action == SKIPPED
+    assert cache.versions(PACKAGE, PROFILE) == [100, 200]
+    assert cache.provision("old", PACKAGE).action == INSTALLED
+    assert fake.installed["old"] == 200
+    assert "-d" not in fake.commands("old", "install-multiple")[0]
+
+
+def test_provision_pinned_version_downgrades(adb, tmp_path):
+    fake = adb(old=100, new=200)
+    cache = ApkCache(tmp_path)
+    cache.pull("old", PACKAGE)
+
+    result = cache.provision("new", PACKAGE, version_code=100)
+
+    assert result.action == INSTALLED
+    assert fake.installed["new"] == 100
+    assert "-d" in fake.commands("new", "install-multiple")[0]
+
+
+def test_provision_without_cache_fails(adb, tmp_path):
+    adb(empty=None)
+
+    result = ApkCache(tmp_path).provision_all(["empty"], PACKAGE)[0]
+
+    assert result.action == FAILED
+    assert not result.ok
+    assert str(tmp_path) in result.message
+
+
+def test_splits_are_installed_only_on_matching_profile(adb, tmp_path):
+    fake = adb(profiles={"x86_source": X86, "x86_empty": X86}, arm_source=300, arm_empty=None, x86_source=300, x86_empty=None)
+
+    # x86 디바이스에는 arm64 디바이스에서 가져온 split APK 대신 x86 디바이스에서 가져온 APK를 설치
+    results = ApkCache(tmp_path).provision_all(["arm_empty", "x86_empty"], PACKAGE, sources=["arm_source", "x86_source"])
+
+    assert [result.action for result in results] == [INSTALLED, INSTALLED]
+    assert sorted(path.name for path in (tmp_path / PACKAGE / "300").iterdir()) == [PROFILE, "x86_64_240dpi"]
+    assert Path(fake.commands("x86_empty", "install-multiple")[0][3]).parent.name == "x86_64_240dpi"
+
+
+def test_split_cache_of_other_profile_is_not_used(adb, tmp_path):
+    adb(profiles={"x86_empty": X86}, arm_source=300, x86_empty=None)
+    cache = ApkCache(tmp_path)
+    cache.pull("arm_source", PACKAGE)
+
+    result = cache.provision_all(["x86_empty"], PACKAGE, sources=["arm_source"])[0]
+
+    assert result.action == FAILED
+    assert "x86_64_240dpi" in result.message
+
+
+def test_single_apk_is_shared_across_profiles(adb, tmp_path):
+    adb(profiles={"x86_empty": X86}, splits=("base.apk",), arm_source=300, x86_empty=None)
+    cache = ApkCache(tmp_path)
+
+    assert cache.pull("arm_source", PACKAGE).profile == UNIVERSAL
+    assert cache.provision("x86_empty", PACKAGE).action == INSTALLED
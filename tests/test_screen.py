@@ -0,0 +1,114 @@
+"""
+현재 화면 식별(ScreenTracker) 테스트
+디바이스 없이 tests/page_sources의 XML 덤프와 fake Appium 서버로 실행됩니다.
+"""
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+
+from benchmarks.bench_page_objects import VirtualClock, app_scenario
+from benchmarks.fake_appium import FakeAppiumServer, Transition
+from src.app_lifecycle import AppLifecycle
+from src.driver import create_driver
+from src.hierarchy import PageSnapshot
+from src.pages.login_page import LoginPage
+from src.pages.login_page_by_email import LoginPageByEmail
+from src.pages.main_home_page import MainHomePage
+from src.pages.my_page import MyPage
+from src.pages.setting_page import SettingPage
+from src.screen import ScreenTracker, default_signatures
+
+PAGE_SOURCES = Path(__file__).parent / "page_sources"
+APP_PACKAGE = "net.bucketplace"
+
+
+class FakeDriver:
+    """page_source를 읽지 않는 드라이버 (식별만 확인)"""
+
+
+@pytest.mark.parametrize("screen, page", [
+    ("login_page", LoginPage),
+    ("email_login_page", LoginPageByEmail),
+    ("main_home_page", MainHomePage),
+    ("my_page", MyPage),
+    ("setting_page", SettingPage),
+    ("playstore_home", None),
+])
+def test_identify_page_sources(screen, page):
+    tracker = ScreenTracker(FakeDriver(), default_signatures(APP_PACKAGE))
+    snapshot = PageSnapshot((PAGE_SOURCES / f"{screen}.xml").read_text(encoding="utf-8"))
+
+    assert tracker.identify(snapshot) is page
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    servers = []
+
+    def start(screen):
+        scenario = app_scenario()
+        scenario.start = screen
+        server = FakeAppiumServer(scenario).start()
+        driver = create_driver(server.config(), skip_app_launch=True)
+        servers.append((server, driver))
+        tracker = ScreenTracker(driver, default_signatures(APP_PACKAGE))._wrap_execute()
+        monkeypatch.setitem(ScreenTracker._trackers, driver, tracker)
+        server.reset_counts()
+        return server, driver, tracker
+
+    yield start
+    for server, driver in servers:
+        driver.quit()
+        server.stop()
+
+
+def test_load_check_is_cached_until_click(fake):
+    server, driver, tracker = fake("login_page")
+    login_page = LoginPage(driver)
+
+    assert login_page.is_login_page_loaded()
+    first = server.total_requests
+    # 스냅샷 이후 동작이 없으면 명령 없이 확인
+    assert login_page.is_login_page_loaded()
+    assert LoginPage(driver).is_current_screen()
+    assert server.total_requests == first
+    assert tracker.hits >= 2
+
+    driver.find_element(AppiumBy.ID, "net.bucketplace:id/emailLogInText").click()
+    assert tracker.cached() is None
+    assert not login_page.is_current_screen()
+    assert LoginPageByEmail(driver).is_email_login_page_loaded()
+    assert tracker.cached() is LoginPageByEmail
+
+
+def test_wait_for_screen_uses_one_query_per_poll(fake):
+    server, driver, tracker = fake("main_home_page")
+    with VirtualClock():
+        server.device.schedule(Transition("my_page", after_commands=3))
+        assert MainHomePage(driver).wait_for_screen(MyPage, timeout=5)
+
+    assert set(server.requests) == {"getPageSource"}
+    assert tracker.is_on(MyPage)
+
+
+def test_adb_actions_invalidate_cache(fake, monkeypatch):
+    server, driver, tracker = fake("main_home_page")
+    assert tracker.current() is MainHomePage
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: subprocess.CompletedProcess(args, 0, stdout="Status: ok\n"))
+
+    AppLifecycle(driver).start_activity(APP_PACKAGE, ".SplashActivity")
+
+    assert tracker.cached() is None
+
+
+def test_cache_expires_without_action(fake):
+    server, driver, tracker = fake("login_page")
+    with VirtualClock():
+        assert tracker.current() is LoginPage
+        server.device.show("main_home_page")
+        assert tracker.current() is LoginPage
+        time.sleep(10)
+        assert tracker.current() is MainHomePage
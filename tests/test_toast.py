@@ -0,0 +1,112 @@
+"""
+토스트 수집 테스트
+디바이스 없이 logcat 줄을 직접 넣어 실행됩니다.
+"""
+import threading
+import time
+
+from selenium.common.exceptions import NoSuchElementException
+
+from src.pages.base_page import BasePage
+from src.pages.login_page_by_email import LoginPageByEmail
+from src.toast import ToastListener
+
+LOG_LINE = "D/appium  ( 1234): Catching toast message: [{}]\n"
+
+
+def test_feed_parses_uiautomator2_toast_log():
+    listener = ToastListener("emulator-5554")
+    assert listener.feed("D/appium  ( 1234): AppiumServlet: GET /session") is None
+
+    event = listener.feed(LOG_LINE.format("10번 실패하면 10분간 로그인이 제한돼요. (4/10)"), timestamp=100)
+    assert event.text == "10번 실패하면 10분간 로그인이 제한돼요. (4/10)"
+    assert listener.find("(4/10)", since=99, until=101) is event
+    assert listener.find("(4/10)", since=101) is None
+
+
+def test_wait_for_consumes_each_toast_once():
+    listener = ToastListener("emulator-5554")
+    listener.feed(LOG_LINE.format("로그인 중입니다."))
+
+    assert listener.wait_for("로그인 중입니다.", timeout=0) is not None
+    # 같은 토스트로 두 번 확인하지 않음
+    assert listener.wait_for("로그인 중입니다.", timeout=0) is None
+
+
+def test_wait_for_wakes_up_when_toast_arrives():
+    listener = ToastListener("emulator-5554")
+    threading.Timer(0.05, listener.feed, args=(LOG_LINE.format("로그아웃 되었습니다."),)).start()
+
+    started = time.monotonic()
+    assert listener.wait_for("로그아웃", timeout=2) is not None
+    assert time.monotonic() - started < 1
+
+
+def test_ring_buffer_keeps_latest_events():
+    listener = ToastListener("emulator-5554", capacity=2)
+    for i in range(3):
+        listener.feed(LOG_LINE.format(f"toast {i}"))
+    assert [event.text for event in listener.events] == ["toast 1", "toast 2"]
+
+
+class NoScreenDriver:
+    """토스트 리스너가 연결된 경우 화면 조회를 하지 않는지 확인하는 드라이버"""
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def find_element(self, by, value):
+        raise AssertionError("화면을 조회하지 않아야 합니다.")
+
+    find_elements = find_element
+
+
+def test_base_page_uses_attached_listener():
+    driver = NoScreenDriver()
+    listener = ToastListener("emulator-5554")
+    ToastListener._attached[driver] = listener
+    page = BasePage(driver)
+
+    event = listener.feed(LOG_LINE.format("이메일을 입력해주세요."))
+    assert page.wait_for_toast_message("이메일을 입력해주세요.", timeout=0.1)
+    event.timestamp -= 3.6
+    # 최대 노출 시간이 지난 토스트는 화면 조회 없이 사라진 것으로 판단
+    assert page.wait_for_toast_to_disappear("이메일을 입력해주세요.", timeout=1)
+    # 리스너가 있으면 타임아웃은 실패
+    assert not page.wait_for_toast_message("비밀번호를 입력해주세요.", timeout=0.1)
+
+
+class ScreenDriver:
+    """page_source로 화면을 반환하고 화면에 토스트 요소는 없는 드라이버"""
+
+    def __init__(self, page_source="<hierarchy />"):
+        self.page_source = page_source
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def find_element(self, by, value):
+        raise NoSuchElementException(value)
+
+    def find_elements(self, by, value):
+        return []
+
+
+def test_toast_timeout_without_listener_fails():
+    # 화면에서 토스트를 찾지 못하면 이미 사라진 것으로 간주하지 않고 실패
+    assert not BasePage(ScreenDriver()).wait_for_toast_message("이메일을 입력해주세요.", timeout=0.1)
+
+
+def test_loading_popup_is_checked_on_screen_with_listener():
+    driver = ScreenDriver(
+        "<hierarchy><android.widget.TextView class='android.widget.TextView' text='로그인 중입니다.' /></hierarchy>"
+    )
+    ToastListener._attached[driver] = ToastListener("emulator-5554")
+    page = LoginPageByEmail(driver)
+
+    # 로딩 팝업은 토스트가 아니므로 logcat에 수집되지 않아도 화면 요소로 확인
+    assert page.is_login_loading_popup_displayed(timeout=0.1)
+    assert not page.wait_for_login_loading_popup_to_disappear(timeout=0.1)
+    driver.page_source = "<hierarchy />"
+    assert page.wait_for_login_loading_popup_to_disappear(timeout=0.1)
+    assert not page.is_login_loading_popup_displayed(timeout=0.1)
@@ -0,0 +1,191 @@
+"""
+페이지 검증 엔진(BasePage.verify_elements) 테스트
+디바이스 없이 tests/page_sources의 XML 덤프를 page_source로 반환하는 가짜 드라이버로 실행됩니다.
+"""
+import time
+from pathlib import Path
+
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException
+
+from src.config.settings import AppConfig
+from src.pages import base_page
+from src.pages.base_page import BasePage, ElementSpec
+from src.pages.login_page import LoginPage
+from src.pages.login_page_by_email import LoginPageByEmail
+
+PAGE_SOURCES = Path(__file__).parent / "page_sources"
+APP_PACKAGE = "net.bucketplace"
+CONFIG = AppConfig(
+    appium_server_url="http://127.0.0.1:4723",
+    platform_name="Android",
+    platform_version="14",
+    device_name="emulator-5554",
+    automation_name="UiAutomator2",
+    app_package=APP_PACKAGE,
+    app_activity=".MainActivity",
+)
+
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+    def is_displayed(self):
+        return True
+
+    def get_attribute(self, name):
+        return None
+
+
+class FakeDriver:
+    """
+    page_source로 XML 덤프를 반환하고, live 조회는 live에 등록된 locator 값만 찾는 드라이버
+
+    Args:
+        page_source: page_source로 반환할 XML
+        live: live 조회에서 찾을 수 있는 locator 값 -> 요소 텍스트
+    """
+
+    def __init__(self, page_source, live=None):
+        self.page_source = page_source
+        self.live = dict(live or {})
+        self.current_package = APP_PACKAGE
+        self.lookups = []
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def find_element(self, by, value):
+        self.lookups.append(value)
+        if value not in self.live:
+            raise NoSuchElementException(value)
+        return FakeElement(self.live[value])
+
+
+class CheckRecorder:
+    """pytest_check 대신 실패 메시지를 기록 (실패 경로를 테스트 실패 없이 확인)"""
+
+    def __init__(self):
+        self.failures = []
+
+    def fail(self, message):
+        self.failures.append(message)
+
+    def is_true(self, value, message):
+        if not value:
+            self.failures.append(message)
+
+    def equal(self, actual, expected, message):
+        if actual != expected:
+            self.failures.append(message)
+
+
+@pytest.fixture
+def checks(monkeypatch):
+    recorder = CheckRecorder()
+    monkeypatch.setattr(base_page, "check", recorder)
+    return recorder
+
+
+def page_source(screen, replace=None):
+    source = (PAGE_SOURCES / f"{screen}.xml").read_text(encoding="utf-8")
+    for old, new in (replace or {}).items():
+        assert old in source
+        source = source.replace(old, new)
+    return source
+
+
+@pytest.mark.parametrize("page_class, screen, method", [
+    (LoginPage, "login_page", "are_login_elements_present"),
+    (LoginPageByEmail, "email_login_page", "are_email_login_elements_present"),
+])
+def test_all_specs_present_in_snapshot(checks, page_class, screen, method):
+    driver = FakeDriver(page_source(screen))
+
+    assert getattr(page_class(driver, CONFIG), method)()
+    assert checks.failures == []
+    # 모든 요소를 스냅샷에서 찾았으므로 live 조회 없음
+    assert driver.lookups == []
+
+
+def test_missing_element_fails_within_timeout(checks):
+    driver = FakeDriver(page_source("login_page", {"net.bucketplace:id/guideImage": "net.bucketplace:id/bannerImage"}))
+
+    started = time.monotonic()
+    assert not LoginPage(driver, CONFIG).are_login_elements_present(timeout=0.3)
+
+    assert checks.failures == ["GUIDE_IMAGE 요소가 존재하지 않습니다."]
+    assert time.monotonic() - started < 1
+    # 스냅샷에서 찾지 못한 요소만 live 조회
+    assert driver.lookups and all("guideImage" in value for value in driver.lookups)
+
+
+def test_wrong_expected_text_fails(checks):
+    driver = FakeDriver(page_source("login_page", {'text="이메일로 가입"': 'text="이메일로 회원가입"'}))
+
+    assert not LoginPage(driver, CONFIG).are_login_elements_present()
+
+    assert checks.failures == [
+        "IMAIL_SIGNUP_BUTTON의 텍스트가 '이메일로 가입'이(가) 아닙니다. 실제 텍스트: '이메일로 회원가입'"
+    ]
+    assert driver.lookups == []
+
+
+def test_element_missing_from_snapshot_is_found_by_live_lookup(checks):
+    # 스냅샷 이후 나타난 요소: 스냅샷에는 없고 live 조회에서 찾음
+    locator = LoginPage.KAKAO_LOGIN_TEXT[1]
+    driver = FakeDriver(
+        page_source("login_page", {"net.bucketplace:id/loginText": "net.bucketplace:id/loadingText"}),
+        live={locator: "카카오톡으로 계속하기"},
+    )
+
+    assert LoginPage(driver, CONFIG).are_login_elements_present()
+
+    assert checks.failures == []
+    assert driver.lookups == [locator]
+
+
+def test_live_lookup_text_is_compared(checks):
+    locator = LoginPage.KAKAO_LOGIN_TEXT[1]
+    driver = FakeDriver(
+        page_source("login_page", {"net.bucketplace:id/loginText": "net.bucketplace:id/loadingText"}),
+        live={locator: "로딩 중"},
+    )
+
+    assert not LoginPage(driver, CONFIG).are_login_elements_present()
+
+    assert checks.failures == [
+        "KAKAO_LOGIN_TEXT의 텍스트가 '카카오톡으로 계속하기'이(가) 아닙니다. 실제 텍스트: '로딩 중'"
+    ]
+
+
+def test_other_app_in_foreground_fails_without_checking_specs(checks):
+    driver = FakeDriver(page_source("playstore_home"))
+    driver.current_package = "com.android.vending"
+
+    assert not LoginPage(driver, CONFIG).are_login_elements_present()
+
+    assert len(checks.failures) == 1
+    assert "com.android.vending" in checks.failures[0]
+    assert driver.lookups == []
+
+
+def test_first_matching_locator_wins_over_later_text_match(checks):
+    # 첫 번째 locator의 노드 텍스트가 비어 있어도 뒤 locator의 노드로 넘어가지 않음
+    driver = FakeDriver(
+        "<hierarchy>"
+        "<android.widget.TextView resource-id='net.bucketplace:id/title' text='' />"
+        "<android.widget.TextView resource-id='net.bucketplace:id/subtitle' text='이메일 로그인' />"
+        "</hierarchy>"
+    )
+    spec = ElementSpec("TITLE_TEXT", (
+        (AppiumBy.ID, "net.bucketplace:id/title"),
+        (AppiumBy.ID, "net.bucketplace:id/subtitle"),
+    ), expected_text="이메일 로그인")
+
+    assert not BasePage(driver, CONFIG).verify_elements([spec])
+
+    assert checks.failures == ["TITLE_TEXT의 텍스트가 '이메일 로그인'이(가) 아닙니다. 실제 텍스트: ''"]
+    assert driver.lookups == []
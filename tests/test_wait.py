@@ -0,0 +1,106 @@
+"""
+backoff polling 스케줄러 테스트
+디바이스 없이 실행됩니다.
+"""
+import time
+from pathlib import Path
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from src.pages.base_page import BasePage
+from src.pages.login_page import LoginPage
+from src.wait import WaitScheduler
+
+PAGE_SOURCES = Path(__file__).parent / "page_sources"
+
+
+class SnapshotDriver:
+    """page_source 요청 횟수만 기록하는 드라이버"""
+
+    def __init__(self, page_source):
+        self._page_source = page_source
+        self.page_source_calls = 0
+
+    @property
+    def page_source(self):
+        self.page_source_calls += 1
+        return self._page_source
+
+    def implicitly_wait(self, seconds):
+        pass
+
+
+def test_first_poll_is_immediate():
+    scheduler = WaitScheduler()
+    started = time.monotonic()
+    assert scheduler.until(lambda: "ok", timeout=5, name="ready") == "ok"
+    assert time.monotonic() - started < 0.05
+    assert scheduler.stats["ready"].polls == 1
+
+
+def test_backoff_intervals_are_capped(monkeypatch):
+    scheduler = WaitScheduler(initial_interval=0.01, max_interval=0.04, backoff=2.0)
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    calls = iter([None] * 5 + ["done"])
+    scheduler.until(lambda: next(calls), timeout=5, name="backoff")
+    assert sleeps == pytest.approx([0.01, 0.02, 0.04, 0.04, 0.04], abs=1e-3)
+
+
+def test_timeout_does_not_overshoot_and_is_recorded():
+    scheduler = WaitScheduler(initial_interval=0.05, max_interval=1.0)
+    started = time.monotonic()
+    assert not scheduler.until(lambda: None, timeout=0.3, name="never")
+    elapsed = time.monotonic() - started
+    assert 0.3 <= elapsed < 0.4
+    stats = scheduler.stats["never"]
+    assert (stats.calls, stats.hits, stats.timeouts) == (1, 0, 1)
+
+
+def test_ignored_exceptions_count_as_not_met():
+    scheduler = WaitScheduler(initial_interval=0.01)
+    attempts = iter([NoSuchElementException("x"), "found"])
+
+    def condition():
+        result = next(attempts)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert scheduler.until(condition, timeout=1) == "found"
+
+
+def test_nested_waits_respect_global_deadline():
+    scheduler = WaitScheduler(initial_interval=0.05)
+    started = time.monotonic()
+    with scheduler.deadline(0.2):
+        scheduler.until(lambda: None, timeout=5, name="inner")
+        # 바깥 deadline이 지나면 중첩된 deadline도 늘어나지 않음
+        with scheduler.deadline(5):
+            assert scheduler.clamp(5) == 0
+            scheduler.until(lambda: None, timeout=5, name="inner")
+    assert time.monotonic() - started < 0.3
+    assert scheduler.clamp(5) == 5
+
+
+def test_loaded_screen_detected_with_single_snapshot():
+    driver = SnapshotDriver((PAGE_SOURCES / "login_page.xml").read_text(encoding="utf-8"))
+    page = LoginPage(driver)
+    started = time.monotonic()
+    assert page.is_login_page_loaded(timeout=10)
+    assert time.monotonic() - started < 0.5
+    assert driver.page_source_calls == 1
+    assert page.waits.stats["is_login_page_loaded"].polls == 1
+
+
+def test_page_objects_share_scheduler_per_driver():
+    driver = SnapshotDriver("<hierarchy />")
+    assert BasePage(driver).waits is LoginPage(driver).waits
+
+
+def test_find_first_timeout_raises():
+    driver = SnapshotDriver("<hierarchy />")
+    page = BasePage(driver)
+    with pytest.raises(TimeoutException):
+        page.find_first([LoginPage.KAKAO_LOGIN_TEXT], timeout=0.2)